@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import math
+import time
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple
+)
+
+import pandas as pd
+
+from hummingbot.backtesting.backtest_order_book_tracker import BacktestOrderBookTracker
+from hummingbot.client.performance import (
+    PerformanceMetrics,
+    PerformanceMetricsAccumulator,
+    TradePerformanceTracker
+)
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    PriceType
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.strategy_base import StrategyBase
+
+
+class BacktestMarket(NamedTuple):
+    exchange_name: str
+    trading_pairs: List[str]
+    exchange: PaperTradeExchange
+    order_book_tracker: BacktestOrderBookTracker
+
+
+class BacktestResult(NamedTuple):
+    start_timestamp: float
+    end_timestamp: float
+    ticks: int
+    messages_replayed: int
+    elapsed: float
+    # Order filled events, with the display name of their market, in fill order.
+    trades: List[Tuple[str, OrderFilledEvent]]
+    # Performance metrics per market display name and trading pair, against the final balances and mid prices.
+    performance_metrics: Dict[Tuple[str, str], PerformanceMetrics]
+    balances: Dict[str, Dict[str, Decimal]]
+
+    def trades_data_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([{
+            "timestamp": fill.timestamp,
+            "market": market,
+            "trading_pair": fill.trading_pair,
+            "order_id": fill.order_id,
+            "trade_type": fill.trade_type.name,
+            "order_type": fill.order_type.name,
+            "price": fill.price,
+            "amount": fill.amount,
+            "fee_percent": fill.trade_fee.percent
+        } for market, fill in self.trades], columns=["timestamp", "market", "trading_pair", "order_id", "trade_type",
+                                                     "order_type", "price", "amount", "fee_percent"])
+
+
+class BacktestEngine:
+    """
+    Back tests a strategy against the market data recorded by MarketDataRecorder.
+
+    Each market is a PaperTradeExchange over a BacktestOrderBookTracker. The strategy runs unchanged, on a back
+    testing clock. Before each tick, the trackers replay the market data recorded until the tick time into the order
+    books. Trades are replayed as order book trade events, so resting paper trade orders are filled the same way as in
+    live paper trading.
+
+    Ticks where nothing can happen are skipped: when no market data is recorded before the next tick, the clock jumps
+    to the first tick after the next recorded message, with at most `max_idle_time` seconds between two ticks so the
+    strategy's timers still run. Set `max_idle_time` to 0 to tick every `tick_size` seconds.
+
+    Usage:
+        engine = BacktestEngine(data_dir, start_timestamp, end_timestamp)
+        exchange = engine.add_market("binance", ["ETH-USDT"], {"ETH": Decimal(10), "USDT": Decimal(20000)})
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(MarketTradingPairTuple(exchange, "ETH-USDT", "ETH", "USDT"), ...)
+        result = engine.run(strategy)
+    """
+    _be_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._be_logger is None:
+            cls._be_logger = logging.getLogger(__name__)
+        return cls._be_logger
+
+    def __init__(self,
+                 data_dir: str,
+                 start_timestamp: float,
+                 end_timestamp: float,
+                 tick_size: float = 1.0,
+                 max_idle_time: float = 60.0):
+        """
+        :param data_dir: root directory of the recorded market data
+        :param start_timestamp: simulation start, the strategy starts ticking once the order books have a snapshot
+        :param end_timestamp: simulation end
+        :param tick_size: seconds between two clock ticks
+        :param max_idle_time: max seconds skipped between two ticks when there is no market data, 0 to never skip
+        """
+        self._data_dir: str = data_dir
+        self._start_timestamp: float = start_timestamp
+        self._end_timestamp: float = end_timestamp
+        self._tick_size: float = tick_size
+        self._max_idle_time: float = max_idle_time
+        self._markets: List[BacktestMarket] = []
+        self._trades: List[Tuple[str, OrderFilledEvent]] = []
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+        self._clock: Optional[Clock] = None
+
+    @property
+    def markets(self) -> List[BacktestMarket]:
+        return self._markets
+
+    @property
+    def clock(self) -> Optional[Clock]:
+        return self._clock
+
+    def add_market(self,
+                   exchange_name: str,
+                   trading_pairs: List[str],
+                   balances: Dict[str, Decimal],
+                   market_config: Optional[MarketConfig] = None) -> PaperTradeExchange:
+        """
+        Adds a paper trade market replaying the market data recorded for the exchange.
+
+        :param exchange_name: name of the recorded exchange, also used to estimate the trading fees
+        :param trading_pairs: trading pairs to replay
+        :param balances: starting balances
+        :return: the market to give to the strategy
+        """
+        tracker: BacktestOrderBookTracker = BacktestOrderBookTracker(self._data_dir, exchange_name, trading_pairs,
+                                                                     self._start_timestamp, self._end_timestamp)
+        exchange: PaperTradeExchange = PaperTradeExchange(tracker, market_config or MarketConfig.default_config(),
+                                                          ExchangeBase)
+        for asset, balance in balances.items():
+            exchange.set_balance(asset, Decimal(balance))
+        tracker.start()
+        self._markets.append(BacktestMarket(exchange_name, trading_pairs, exchange, tracker))
+        return exchange
+
+    def _did_fill_order(self, event_tag: int, market: ExchangeBase, evt: OrderFilledEvent):
+        self._trades.append((market.display_name, evt))
+
+    def _next_tick(self, current_tick: float, last_tick: float) -> float:
+        next_tick: float = current_tick + self._tick_size
+        if self._max_idle_time > 0:
+            next_event: float = min(market.order_book_tracker.next_timestamp for market in self._markets)
+            if next_event > next_tick:
+                event_tick: float = (self._start_timestamp +
+                                     math.ceil((next_event - self._start_timestamp) / self._tick_size) *
+                                     self._tick_size)
+                idle_tick: float = current_tick + max(self._max_idle_time // self._tick_size, 1) * self._tick_size
+                next_tick = min(event_tick, idle_tick)
+        return min(next_tick, last_tick)
+
+    def run(self, strategy: StrategyBase) -> BacktestResult:
+        return asyncio.get_event_loop().run_until_complete(self.run_async(strategy))
+
+    async def run_async(self, strategy: StrategyBase) -> BacktestResult:
+        if len(self._markets) == 0:
+            raise ValueError("Add at least one market to back test.")
+        started: float = time.perf_counter()
+        clock: Clock = Clock(ClockMode.BACKTEST, tick_size=self._tick_size, start_time=self._start_timestamp,
+                             end_time=self._end_timestamp)
+        self._clock = clock
+        self._trades = []
+        performance_tracker: TradePerformanceTracker = TradePerformanceTracker([market.exchange
+                                                                                for market in self._markets])
+        for market in self._markets:
+            clock.add_iterator(market.exchange)
+            market.exchange.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        clock.add_iterator(strategy)
+        performance_tracker.start()
+
+        half_tick: float = self._tick_size / 2
+        last_tick: float = (self._start_timestamp +
+                            math.floor((self._end_timestamp - self._start_timestamp) / self._tick_size + 1e-9) *
+                            self._tick_size)
+        ticks: int = 0
+        try:
+            while clock.current_timestamp < last_tick - half_tick:
+                next_tick: float = self._next_tick(clock.current_timestamp, last_tick)
+                # Ticks before next_tick are skipped, clock.backtest_til() then ticks once, at next_tick.
+                clock.fast_forward(next_tick - self._tick_size - half_tick)
+                for market in self._markets:
+                    market.order_book_tracker.replay_until(next_tick)
+                clock.backtest_til(next_tick - half_tick)
+                ticks += 1
+                # Let the events triggered asynchronously by the exchanges go out.
+                await asyncio.sleep(0)
+        finally:
+            performance_tracker.stop()
+            for market in self._markets:
+                market.exchange.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+        performance_metrics: Dict[Tuple[str, str], PerformanceMetrics] = {}
+        balances: Dict[str, Dict[str, Decimal]] = {}
+        for market in self._markets:
+            exchange: PaperTradeExchange = market.exchange
+            market_balances: Dict[str, Decimal] = exchange.get_all_balances()
+            balances[exchange.display_name] = market_balances
+            for trading_pair in market.trading_pairs:
+                accumulator: PerformanceMetricsAccumulator = performance_tracker.accumulators.get(
+                    (exchange.display_name, trading_pair), PerformanceMetricsAccumulator(trading_pair))
+                mid_price: Decimal = exchange.get_price_by_type(trading_pair, PriceType.MidPrice)
+                performance_metrics[(exchange.display_name, trading_pair)] = accumulator.performance_metrics(
+                    market_balances, mid_price if mid_price.is_finite() else None)
+        for iterator in clock.child_iterators:
+            iterator.stop(clock)
+
+        result: BacktestResult = BacktestResult(self._start_timestamp, self._end_timestamp, ticks,
+                                                sum(market.order_book_tracker.messages_replayed
+                                                    for market in self._markets),
+                                                time.perf_counter() - started, list(self._trades),
+                                                performance_metrics, balances)
+        self.logger().info(f"Back test of {result.ticks} ticks and {result.messages_replayed} market data messages "
+                           f"done in {result.elapsed:.2f}s, {len(result.trades)} trades.")
+        return result
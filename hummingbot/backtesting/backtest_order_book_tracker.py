@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import math
+import os
+from datetime import datetime
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataChunk,
+    MarketDataFileReader,
+    list_market_data_files
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType
+)
+from hummingbot.logger import HummingbotLogger
+
+DIFF: int = OrderBookMessageType.DIFF.value
+SNAPSHOT: int = OrderBookMessageType.SNAPSHOT.value
+TRADE: int = OrderBookMessageType.TRADE.value
+
+
+class BacktestOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of a back testing order book tracker, which has nothing to fetch or listen to, the recorded market
+    data is replayed by the tracker itself.
+    """
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class TradingPairReplay:
+    """
+    Replays the recorded market data files of one trading pair into its order book, a chunk at a time.
+
+    The levels of a chunk are unpacked once into a [price, amount, update_id] array. Consecutive diffs are applied as
+    one numpy diff batch, with the diffs older than the order book snapshot filtered out, like the tracker's diff
+    router does. Diffs recorded before the first snapshot are kept until it comes in.
+    """
+    MAX_PENDING_DIFF_BATCHES: int = 1000
+
+    def __init__(self, trading_pair: str, paths: List[str], end_timestamp: Optional[float] = None):
+        self._trading_pair: str = trading_pair
+        self._chunks: Iterator[MarketDataChunk] = (chunk for path in paths
+                                                   for chunk in MarketDataFileReader(path, trading_pair).iter_chunks(
+                                                       end_timestamp=end_timestamp))
+        self._types: np.ndarray = np.empty(0, dtype=np.uint8)
+        self._effective_timestamps: np.ndarray = np.empty(0, dtype=np.float64)
+        self._timestamps: List[float] = []
+        self._levels: np.ndarray = np.empty((0, 3), dtype=np.float64)
+        self._is_bid: np.ndarray = np.empty(0, dtype=bool)
+        self._level_offsets: np.ndarray = np.zeros(1, dtype=np.int64)
+        self._bid_counts: List[int] = []
+        self._position: int = 0
+        self._exhausted: bool = False
+        self._has_snapshot: bool = False
+        self._pending_diffs: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.messages_replayed: int = 0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def has_snapshot(self) -> bool:
+        return self._has_snapshot
+
+    def _load_next_chunk(self) -> bool:
+        for chunk in self._chunks:
+            if len(chunk.types) == 0:
+                continue
+            counts: np.ndarray = chunk.bid_counts.astype(np.int64) + chunk.ask_counts
+            offsets: np.ndarray = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            message_of_level: np.ndarray = np.repeat(np.arange(len(counts)), counts)
+            self._types = chunk.types
+            # Messages are replayed in recorded order, a message is never replayed before the ones recorded before it.
+            self._effective_timestamps = np.maximum.accumulate(chunk.timestamps)
+            self._timestamps = chunk.timestamps.tolist()
+            self._levels = np.column_stack((chunk.prices, chunk.amounts,
+                                            np.repeat(chunk.update_ids.astype(np.float64), counts)))
+            self._is_bid = (np.arange(offsets[-1]) - offsets[message_of_level]) < chunk.bid_counts[message_of_level]
+            self._level_offsets = offsets
+            self._bid_counts = chunk.bid_counts.tolist()
+            self._position = 0
+            return True
+        self._exhausted = True
+        return False
+
+    @property
+    def next_timestamp(self) -> float:
+        """
+        :return: the timestamp of the next message to replay, inf once all the data is replayed
+        """
+        if self._position >= len(self._types) and (self._exhausted or not self._load_next_chunk()):
+            return math.inf
+        return float(self._effective_timestamps[self._position])
+
+    def replay_until(self, timestamp: float, order_book: OrderBook) -> int:
+        """
+        Applies the messages recorded until the timestamp to the order book.
+
+        :return: the number of messages applied
+        """
+        replayed: int = 0
+        while self.next_timestamp <= timestamp:
+            start: int = self._position
+            end: int = int(np.searchsorted(self._effective_timestamps, timestamp, side="right"))
+            types: np.ndarray = self._types[start:end]
+            boundaries: List[int] = (np.flatnonzero(types[1:] != types[:-1]) + 1 + start).tolist()
+            for run_start, run_end in zip([start] + boundaries, boundaries + [end]):
+                message_type: int = int(self._types[run_start])
+                if message_type == DIFF:
+                    self._apply_diffs(run_start, run_end, order_book)
+                elif message_type == SNAPSHOT:
+                    for position in range(run_start, run_end):
+                        self._apply_snapshot(position, order_book)
+                elif message_type == TRADE:
+                    for position in range(run_start, run_end):
+                        self._apply_trade(position, order_book)
+            self._position = end
+            replayed += end - start
+        self.messages_replayed += replayed
+        return replayed
+
+    def _side_levels(self, level_start: int, level_end: int) -> Tuple[np.ndarray, np.ndarray]:
+        levels: np.ndarray = self._levels[level_start:level_end]
+        is_bid: np.ndarray = self._is_bid[level_start:level_end]
+        return levels[is_bid], levels[~is_bid]
+
+    def _apply_diffs(self, start: int, end: int, order_book: OrderBook):
+        bids, asks = self._side_levels(self._level_offsets[start], self._level_offsets[end])
+        if not self._has_snapshot:
+            self._pending_diffs.append((bids, asks))
+            if len(self._pending_diffs) > self.MAX_PENDING_DIFF_BATCHES:
+                self._pending_diffs.pop(0)
+            return
+        snapshot_uid: float = order_book.snapshot_uid
+        if (len(bids) > 0 and bids[0, 2] < snapshot_uid) or (len(asks) > 0 and asks[0, 2] < snapshot_uid):
+            bids = bids[bids[:, 2] >= snapshot_uid]
+            asks = asks[asks[:, 2] >= snapshot_uid]
+        if len(bids) > 0 or len(asks) > 0:
+            order_book.apply_numpy_diffs(bids, asks)
+
+    def _apply_snapshot(self, position: int, order_book: OrderBook):
+        bids, asks = self._side_levels(self._level_offsets[position], self._level_offsets[position + 1])
+        order_book.apply_numpy_snapshot(np.ascontiguousarray(bids), np.ascontiguousarray(asks))
+        if not self._has_snapshot:
+            self._has_snapshot = True
+            snapshot_uid: float = order_book.snapshot_uid
+            for pending_bids, pending_asks in self._pending_diffs:
+                pending_bids = pending_bids[pending_bids[:, 2] > snapshot_uid]
+                pending_asks = pending_asks[pending_asks[:, 2] > snapshot_uid]
+                if len(pending_bids) > 0 or len(pending_asks) > 0:
+                    order_book.apply_numpy_diffs(pending_bids, pending_asks)
+            self._pending_diffs.clear()
+
+    def _apply_trade(self, position: int, order_book: OrderBook):
+        level: int = self._level_offsets[position]
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=self._trading_pair,
+            timestamp=self._timestamps[position],
+            price=float(self._levels[level, 0]),
+            amount=float(self._levels[level, 1]),
+            type=TradeType.BUY if self._bid_counts[position] > 0 else TradeType.SELL
+        ))
+
+
+class BacktestOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that replays the market data recorded by MarketDataRecorder, instead of listening to the
+    exchange. The back testing runner calls `replay_until()` with the simulated clock time before each tick. The
+    tracker is ready once every trading pair has had its first snapshot.
+    """
+    _botr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._botr_logger is None:
+            cls._botr_logger = logging.getLogger(__name__)
+        return cls._botr_logger
+
+    def __init__(self,
+                 data_dir: str,
+                 exchange_name: str,
+                 trading_pairs: List[str],
+                 start_timestamp: float,
+                 end_timestamp: Optional[float] = None):
+        """
+        :param data_dir: root directory of the recorded market data
+        :param exchange_name: name of the recorded exchange
+        :param start_timestamp: the data is replayed from the start of the UTC day of start_timestamp
+        :param end_timestamp: the data is replayed until the end of the UTC day of end_timestamp if given, or until
+        the last recorded day
+        """
+        super().__init__(BacktestOrderBookTrackerDataSource(trading_pairs), trading_pairs)
+        self._data_dir: str = data_dir
+        self._exchange_name: str = exchange_name
+        self._start_timestamp: float = start_timestamp
+        self._end_timestamp: Optional[float] = end_timestamp
+        self._replays: Dict[str, TradingPairReplay] = {}
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def messages_replayed(self) -> int:
+        return sum(replay.messages_replayed for replay in self._replays.values())
+
+    def _data_files(self, trading_pair: str) -> List[str]:
+        first_day: str = datetime.utcfromtimestamp(self._start_timestamp).strftime("%Y-%m-%d")
+        last_day: Optional[str] = (datetime.utcfromtimestamp(self._end_timestamp).strftime("%Y-%m-%d")
+                                   if self._end_timestamp is not None else None)
+        paths: List[str] = []
+        for path in list_market_data_files(self._data_dir, self._exchange_name, trading_pair):
+            day: str = os.path.basename(path)[:len(first_day)]
+            if day >= first_day and (last_day is None or day <= last_day):
+                paths.append(path)
+        return paths
+
+    def start(self):
+        """
+        Creates the order books and opens the data files. Nothing is fetched from the exchange.
+        """
+        for trading_pair in self._trading_pairs:
+            if trading_pair in self._order_books:
+                continue
+            paths: List[str] = self._data_files(trading_pair)
+            if len(paths) == 0:
+                self.logger().warning(f"No {self._exchange_name} market data recorded for {trading_pair} in "
+                                      f"{self._data_dir}.")
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+            self._replays[trading_pair] = TradingPairReplay(trading_pair, paths, self._end_timestamp)
+
+    def stop(self):
+        pass
+
+    @property
+    def next_timestamp(self) -> float:
+        """
+        :return: the timestamp of the next recorded message, inf once all the data is replayed
+        """
+        return min((replay.next_timestamp for replay in self._replays.values()), default=math.inf)
+
+    def replay_until(self, timestamp: float) -> int:
+        """
+        Applies the market data recorded until the timestamp to the order books.
+
+        :return: the number of messages applied
+        """
+        if len(self._replays) < len(self._trading_pairs):
+            self.start()
+        replayed: int = 0
+        for trading_pair, replay in self._replays.items():
+            replayed += replay.replay_until(timestamp, self._order_books[trading_pair])
+        if not self._order_books_initialized.is_set() and all(replay.has_snapshot
+                                                              for replay in self._replays.values()):
+            self._order_books_initialized.set()
+        return replayed
@@ -0,0 +1,350 @@
+#!/usr/bin/env python
+
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    as_completed
+)
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple
+)
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.backtesting.backtest_engine import (
+    BacktestEngine,
+    BacktestResult
+)
+from hummingbot.client.config.config_helpers import (
+    get_strategy_config_map,
+    get_strategy_starter_file,
+    get_strategy_template_path,
+    load_yml_into_cm,
+    parse_cvar_value,
+    strategy_name_from_file
+)
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.event.events import TradeType
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType
+)
+
+SWEEP_RESULT_COLUMNS: List[str] = [
+    "run_id", "seed", "status", "error", "market", "trading_pair", "ticks", "elapsed", "num_trades", "num_buys",
+    "num_sells", "b_vol_base", "s_vol_base", "avg_b_price", "avg_s_price", "fee_in_quote", "trade_pnl", "total_pnl",
+    "return_pct", "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "cur_base_ratio_pct",
+    "max_base_position", "min_base_position"
+]
+
+
+class SweepRun(NamedTuple):
+    run_id: str
+    seed: int
+    parameters: Dict[str, Any]
+
+
+class SweepRunSettings(NamedTuple):
+    """
+    What the workers need to run a back test, everything but the strategy parameters.
+    """
+    strategy: str
+    config_values: Dict[str, Any]
+    strategy_file_name: str
+    data_dir: str
+    start_timestamp: float
+    end_timestamp: float
+    balances: Dict[str, Decimal]
+    tick_size: float
+    max_idle_time: float
+
+
+class BacktestApplication:
+    """
+    Stands in for HummingbotApplication when a strategy `start()` function is called by a back testing worker. The
+    markets the strategy asks for are the paper trade markets of the back testing engine, the trade fills database is
+    an in-memory one, and the notifications go to the log.
+    """
+    _ba_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ba_logger is None:
+            cls._ba_logger = logging.getLogger(__name__)
+        return cls._ba_logger
+
+    def __init__(self, engine: BacktestEngine, balances: Dict[str, Decimal], strategy_file_name: str):
+        self.engine: BacktestEngine = engine
+        self.balances: Dict[str, Decimal] = balances
+        self.strategy_file_name: str = strategy_file_name
+        self.markets: Dict[str, ExchangeBase] = {}
+        self.market_trading_pair_tuples: List[Any] = []
+        self.assets: Set[str] = set()
+        self.strategy: Optional[Any] = None
+        # Read by start() functions, e.g. for the inventory cost price type of pure market making.
+        self.trade_fill_db: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path="")
+
+    @staticmethod
+    def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
+        return [tuple(trading_pair.split("-")) for trading_pair in trading_pairs]
+
+    def _initialize_wallet(self, token_trading_pairs: List[str]):
+        pass
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        market_trading_pairs: Dict[str, List[str]] = {}
+        for market_name, trading_pairs in market_names:
+            market_trading_pairs.setdefault(market_name, []).extend(trading_pairs)
+        for market_name, trading_pairs in market_trading_pairs.items():
+            if market_name not in self.markets:
+                self.markets[market_name] = self.engine.add_market(market_name, trading_pairs, self.balances)
+
+    def _notify(self, msg: str):
+        self.logger().info(msg)
+
+
+def sweep_run_id(parameters: Dict[str, Any]) -> str:
+    """
+    :return: a stable id of the parameter combination, the same across processes and sweeps
+    """
+    return hashlib.sha1(json.dumps(parameters, sort_keys=True, default=str).encode("utf8")).hexdigest()[:16]
+
+
+def expand_parameter_grid(parameter_grid: Dict[str, List[Any]], seed: int = 0) -> List[SweepRun]:
+    """
+    :return: one run per combination of the parameter values, with its own seed derived from the sweep seed and the
+    run id, so that a run gets the same seed whichever worker runs it and whatever the grid around it
+    """
+    keys: List[str] = sorted(parameter_grid.keys())
+    runs: List[SweepRun] = []
+    for values in itertools.product(*(parameter_grid[key] for key in keys)):
+        parameters: Dict[str, Any] = dict(zip(keys, values))
+        run_id: str = sweep_run_id(parameters)
+        run_seed: int = int(hashlib.sha1(f"{seed}:{run_id}".encode("utf8")).hexdigest()[:8], 16)
+        runs.append(SweepRun(run_id, run_seed, parameters))
+    return runs
+
+
+def _position_range(result: BacktestResult, market: str, trading_pair: str) -> Tuple[Decimal, Decimal]:
+    position: Decimal = Decimal(0)
+    max_position: Decimal = Decimal(0)
+    min_position: Decimal = Decimal(0)
+    for fill_market, fill in result.trades:
+        if fill_market != market or fill.trading_pair != trading_pair:
+            continue
+        position += fill.amount if fill.trade_type is TradeType.BUY else -fill.amount
+        max_position = max(max_position, position)
+        min_position = min(min_position, position)
+    return max_position, min_position
+
+
+def _result_rows(run: SweepRun, result: BacktestResult) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for (market, trading_pair), metrics in result.performance_metrics.items():
+        max_position, min_position = _position_range(result, market, trading_pair)
+        row: Dict[str, Any] = {
+            "run_id": run.run_id,
+            "seed": run.seed,
+            "status": "done",
+            "error": "",
+            "market": market,
+            "trading_pair": trading_pair,
+            "ticks": result.ticks,
+            "elapsed": result.elapsed,
+            "max_base_position": max_position,
+            "min_base_position": min_position
+        }
+        for column in SWEEP_RESULT_COLUMNS:
+            if column not in row:
+                row[column] = getattr(metrics, column)
+        rows.append(row)
+    return rows
+
+
+def run_sweep_backtest(settings: SweepRunSettings, run: SweepRun) -> List[Dict[str, Any]]:
+    """
+    Runs one back test of the sweep, in a worker process. The strategy is built by its own `start()` function from
+    the config values of the template with the run parameters on top.
+
+    :return: the result rows of the run, one per market and trading pair
+    """
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+    random.seed(run.seed)
+    np.random.seed(run.seed)
+    config_map: Dict[str, ConfigVar] = get_strategy_config_map(settings.strategy)
+    for key, value in settings.config_values.items():
+        config_map[key].value = value
+    for key, value in run.parameters.items():
+        config_map[key].value = parse_cvar_value(config_map[key], value)
+
+    engine: BacktestEngine = BacktestEngine(settings.data_dir, settings.start_timestamp, settings.end_timestamp,
+                                            tick_size=settings.tick_size, max_idle_time=settings.max_idle_time)
+    app: BacktestApplication = BacktestApplication(engine, settings.balances, settings.strategy_file_name)
+    # The strategies notify, and some start() functions read settings from, the main application.
+    HummingbotApplication._main_app = app
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    get_strategy_starter_file(settings.strategy)(app)
+    if app.strategy is None:
+        raise ValueError(f"Could not start {settings.strategy} with {run.parameters}.")
+    return _result_rows(run, engine.run(app.strategy))
+
+
+class ParameterSweep:
+    """
+    Back tests a strategy config over a grid of parameter values, on a process pool.
+
+    The config template is a strategy config file, as created by the `create` command. Each run overrides some of its
+    values, given in the config file's units, e.g. a `bid_spread` of 0.5 is 0.5%. The runs replay the market data
+    recorded by MarketDataRecorder, the workers memory map the data files, so they share them in the page cache.
+
+    The result rows are appended to a CSV file as the runs complete, one row per run, market and trading pair. A sweep
+    resumed on the same results file skips the runs already done, failed runs are run again.
+
+    Usage:
+        sweep = ParameterSweep("conf_pure_mm_1.yml", {"bid_spread": [0.1, 0.2], "order_levels": [1, 2, 3]},
+                               data_dir, start_timestamp, end_timestamp, {"ETH": Decimal(10), "USDT": Decimal(20000)},
+                               "sweep.csv")
+        results = sweep.run()
+    """
+    _ps_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ps_logger is None:
+            cls._ps_logger = logging.getLogger(__name__)
+        return cls._ps_logger
+
+    def __init__(self,
+                 config_file_path: str,
+                 parameter_grid: Dict[str, List[Any]],
+                 data_dir: str,
+                 start_timestamp: float,
+                 end_timestamp: float,
+                 balances: Dict[str, Decimal],
+                 results_path: str,
+                 workers: Optional[int] = None,
+                 seed: int = 0,
+                 tick_size: float = 1.0,
+                 max_idle_time: float = 60.0,
+                 progress_callback: Optional[Callable[[int, int], None]] = None):
+        """
+        :param config_file_path: strategy config file, the template of the runs
+        :param parameter_grid: values to back test, per strategy config key
+        :param balances: starting balances of each market
+        :param results_path: CSV file the results are appended to
+        :param workers: number of worker processes, one per CPU by default
+        :param seed: sweep seed, the seed of each run is derived from it
+        :param progress_callback: called with the number of runs done and the total after each run
+        """
+        self._config_file_path: str = config_file_path
+        self._parameter_grid: Dict[str, List[Any]] = parameter_grid
+        self._data_dir: str = data_dir
+        self._start_timestamp: float = start_timestamp
+        self._end_timestamp: float = end_timestamp
+        self._balances: Dict[str, Decimal] = balances
+        self._results_path: str = results_path
+        self._workers: int = workers or os.cpu_count() or 1
+        self._seed: int = seed
+        self._tick_size: float = tick_size
+        self._max_idle_time: float = max_idle_time
+        self._progress_callback: Optional[Callable[[int, int], None]] = progress_callback
+        self._runs: List[SweepRun] = expand_parameter_grid(parameter_grid, seed)
+
+    @property
+    def runs(self) -> List[SweepRun]:
+        return self._runs
+
+    @property
+    def results_path(self) -> str:
+        return self._results_path
+
+    def completed_run_ids(self) -> Set[str]:
+        if not os.path.exists(self._results_path):
+            return set()
+        results: pd.DataFrame = pd.read_csv(self._results_path, usecols=["run_id", "status"], dtype=str)
+        return set(results.loc[results["status"] == "done", "run_id"])
+
+    async def _load_settings(self) -> SweepRunSettings:
+        strategy: Optional[str] = strategy_name_from_file(self._config_file_path)
+        config_map: Optional[Dict[str, ConfigVar]] = get_strategy_config_map(strategy) if strategy else None
+        if config_map is None:
+            raise ValueError(f"{self._config_file_path} is not a strategy config file.")
+        await load_yml_into_cm(self._config_file_path, get_strategy_template_path(strategy), config_map)
+        for key, values in self._parameter_grid.items():
+            cvar: Optional[ConfigVar] = config_map.get(key)
+            if cvar is None:
+                raise ValueError(f"{key} is not a {strategy} config.")
+            for value in values:
+                err_msg: Optional[str] = await cvar.validate(str(parse_cvar_value(cvar, value)))
+                if err_msg is not None:
+                    raise ValueError(f"Invalid {key} value {value}: {err_msg}")
+        return SweepRunSettings(strategy, {key: cvar.value for key, cvar in config_map.items()},
+                                os.path.basename(self._config_file_path), self._data_dir, self._start_timestamp,
+                                self._end_timestamp, self._balances, self._tick_size, self._max_idle_time)
+
+    def _append_rows(self, rows: List[Dict[str, Any]]):
+        parameter_columns: List[str] = sorted(self._parameter_grid.keys())
+        data_frame: pd.DataFrame = pd.DataFrame(rows, columns=SWEEP_RESULT_COLUMNS[:2] + parameter_columns +
+                                                SWEEP_RESULT_COLUMNS[2:])
+        write_header: bool = not os.path.exists(self._results_path)
+        data_frame.to_csv(self._results_path, mode="a", header=write_header, index=False)
+
+    def run(self) -> pd.DataFrame:
+        """
+        Runs the back tests not done yet.
+
+        :return: the results table, of all the runs of the results file
+        """
+        settings: SweepRunSettings = asyncio.get_event_loop().run_until_complete(self._load_settings())
+        completed: Set[str] = self.completed_run_ids()
+        pending: List[SweepRun] = [run for run in self._runs if run.run_id not in completed]
+        total: int = len(self._runs)
+        done: int = total - len(pending)
+        if len(pending) < total:
+            self.logger().info(f"Resuming parameter sweep, {done} of {total} runs already done.")
+        started: float = time.perf_counter()
+        # Spawned, not forked, workers don't inherit the event loop and threads of this process.
+        with ProcessPoolExecutor(max_workers=self._workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures: Dict[Future, SweepRun] = {executor.submit(run_sweep_backtest, settings, run): run
+                                               for run in pending}
+            for future in as_completed(futures):
+                run: SweepRun = futures[future]
+                try:
+                    rows: List[Dict[str, Any]] = future.result()
+                except Exception as e:
+                    self.logger().error(f"Back test {run.run_id} with {run.parameters} failed.", exc_info=True)
+                    rows = [{"run_id": run.run_id, "seed": run.seed, "status": "failed", "error": str(e)}]
+                for row in rows:
+                    row.update(run.parameters)
+                self._append_rows(rows)
+                done += 1
+                run_rate: float = (time.perf_counter() - started) / (done - total + len(pending))
+                self.logger().info(f"Parameter sweep: {done}/{total} runs done, "
+                                   f"{run_rate * (total - done):.0f}s left.")
+                if self._progress_callback is not None:
+                    self._progress_callback(done, total)
+        if not os.path.exists(self._results_path):
+            return pd.DataFrame(columns=SWEEP_RESULT_COLUMNS)
+        return pd.read_csv(self._results_path, dtype={"run_id": str})
@@ -1,7 +1,9 @@
 import asyncio
 from typing import (
+    Dict,
     List,
     Any,
+    Optional,
 )
 from decimal import Decimal
 import pandas as pd
@@ -22,6 +24,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.inventory_cost import InventoryCost
 from hummingbot.strategy.pure_market_making import (
+    MultiPairPureMarketMakingStrategy,
     PureMarketMakingStrategy
 )
 from hummingbot.strategy.perpetual_market_making import (
@@ -118,6 +121,23 @@ class ConfigCommand:
             return True
         return False
 
+    @staticmethod
+    def update_running_multi_pair_mm(multi_pair_strategy, key: str, new_value: Any,
+                                     pair_parameters: Dict[str, Dict[str, Any]]) -> Optional[List[str]]:
+        """
+        Updates the pair strategies whose trading pair doesn't override the key in pair_parameters.
+
+        :return: the trading pairs updated, None if the key can't be updated without a restart
+        """
+        if key not in no_restart_pmm_keys_in_percentage and key not in no_restart_pmm_keys:
+            return None
+        updated_trading_pairs = []
+        for pair_strategy in multi_pair_strategy.pair_strategies:
+            if key not in (pair_parameters.get(pair_strategy.trading_pair) or {}):
+                ConfigCommand.update_running_mm(pair_strategy, key, new_value)
+                updated_trading_pairs.append(pair_strategy.trading_pair)
+        return updated_trading_pairs
+
     async def _config_single_key(self,  # type: HummingbotApplication
                                  key: str,
                                  input_value):
@@ -159,8 +179,25 @@ class ConfigCommand:
             self._notify(f"{key}: {str(config_var.value)}")
             for config in missings:
                 self._notify(f"{config.key}: {str(config.value)}")
-            if isinstance(self.strategy, PureMarketMakingStrategy) or \
-               isinstance(self.strategy, PerpetualMarketMakingStrategy):
+            if isinstance(self.strategy, MultiPairPureMarketMakingStrategy) and config_map is self.strategy_config_map:
+                pair_parameters = self.strategy_config_map["pair_parameters"].value or {}
+                updated_trading_pairs = ConfigCommand.update_running_multi_pair_mm(self.strategy, key,
+                                                                                   config_var.value, pair_parameters)
+                if updated_trading_pairs is None:
+                    self._notify(f"\nRestart the {self.strategy_name} strategy for the new configuration to take "
+                                 f"effect.")
+                else:
+                    if len(updated_trading_pairs) > 0:
+                        self._notify(f"\nThe current {self.strategy_name} strategy has been updated to reflect the "
+                                     f"new configuration on {', '.join(updated_trading_pairs)}.")
+                    overridden_trading_pairs = [pair_strategy.trading_pair
+                                                for pair_strategy in self.strategy.pair_strategies
+                                                if pair_strategy.trading_pair not in updated_trading_pairs]
+                    if len(overridden_trading_pairs) > 0:
+                        self._notify(f"{', '.join(overridden_trading_pairs)} keep the {key} of their "
+                                     f"pair_parameters.")
+            elif isinstance(self.strategy, PureMarketMakingStrategy) or \
+                    isinstance(self.strategy, PerpetualMarketMakingStrategy):
                 updated = ConfigCommand.update_running_mm(self.strategy, key, config_var.value)
                 if updated:
                     self._notify(f"\nThe current {self.strategy_name} strategy has been updated "
@@ -67,6 +67,9 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        if self.markets_recorder is not None:
+            # Wait for the trade fills still queued for writing.
+            await self.markets_recorder.flush_db_writer()
         trades: List[TradeFill] = self._get_trades_from_session(int(self.init_time * 1e3))
         if len(trades) == 0:
             self._notify("No past trades to export.")
@@ -92,6 +95,7 @@ class ExportCommand:
                                  start_timestamp: int,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
+        # Only the committed trade fills are read, async callers await markets_recorder.flush_db_writer() first.
         session: Session = self.trade_fill_db.get_shared_session()
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
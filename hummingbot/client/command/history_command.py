@@ -72,7 +72,12 @@ class HistoryCommand:
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             cur_balances = await self.get_current_balances(market)
-            perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
+            tracker = self.trade_performance_tracker
+            if start_time == self.init_time and tracker is not None and (market, symbol) in tracker.accumulators:
+                # The trades of this session are already accounted for by the performance tracker.
+                perf = await tracker.performance_metrics(market, symbol, cur_balances)
+            else:
+                perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -197,7 +202,16 @@ class HistoryCommand:
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
+        if self.trade_performance_tracker is not None:
+            return_pcts = []
+            for market, symbol in self.trade_performance_tracker.accumulators:
+                cur_balances = await self.get_current_balances(market)
+                perf = await self.trade_performance_tracker.performance_metrics(market, symbol, cur_balances)
+                return_pcts.append(perf.return_pct)
+            return sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+
         start_time = self.init_time
+        await self.markets_recorder.flush_db_writer()
         trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
                                                                 config_file_path=self.strategy_file_name)
         avg_return = await self.history_report(start_time, trades, display_report=False)
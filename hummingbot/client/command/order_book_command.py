@@ -38,10 +38,9 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+            bids_array, asks_array = order_book.to_numpy(depth=lines)
+            bids = pd.DataFrame(data=bids_array[:, :2], columns=['bid_price', 'bid_volume'])
+            asks = pd.DataFrame(data=asks_array[:, :2], columns=['ask_price', 'ask_volume'])
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = ["    " + line for line in joined_df.to_string(index=False).split("\n")]
             header = f"  market: {market_connector.name} {trading_pair}\n"
@@ -120,6 +120,7 @@ class StartCommand:
             self.clock = Clock(ClockMode.REALTIME)
             if self.wallet is not None:
                 self.clock.add_iterator(self.wallet)
+            await self.markets_recorder.flush_db_writer()
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
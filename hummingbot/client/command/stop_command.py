@@ -51,6 +51,11 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        self._stop_market_data_recorders()
+
+        if self.trade_performance_tracker is not None:
+            self.trade_performance_tracker.stop()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
@@ -60,4 +65,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.trade_performance_tracker = None
         self.market_trading_pairs_map.clear()
@@ -127,6 +127,27 @@ main_config_map = {
                   required_if=lambda: False,
                   type_str="json",
                   ),
+    "paper_trade_queue_position_enabled":
+        ConfigVar(key="paper_trade_queue_position_enabled",
+                  prompt="Do you want paper trade limit orders to wait for the volume queued ahead of them before "
+                         "filling? >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  default=False),
+    "market_data_recorder_enabled":
+        ConfigVar(key="market_data_recorder_enabled",
+                  prompt="Do you want to record the order book and trade data of your markets? >>> ",
+                  type_str="bool",
+                  required_if=lambda: False,
+                  validator=validate_bool,
+                  default=False),
+    "market_data_recorder_path":
+        ConfigVar(key="market_data_recorder_path",
+                  prompt="Enter the directory to record market data to >>> ",
+                  type_str="str",
+                  required_if=lambda: False,
+                  default=None),
     "celo_address":
         ConfigVar(key="celo_address",
                   prompt="Enter your Celo account address >>> ",
@@ -3,9 +3,11 @@
 import asyncio
 from collections import deque
 import logging
+import os
 import time
 from typing import List, Dict, Optional, Tuple, Set, Deque
 
+from hummingbot import data_path
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
@@ -34,6 +36,8 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.client.performance import TradePerformanceTracker
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
@@ -96,6 +100,8 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.market_data_recorders: List[MarketDataRecorder] = []
+        self.trade_performance_tracker: Optional[TradePerformanceTracker] = None
         self._script_iterator = None
         self._binance_connector = None
 
@@ -261,6 +267,36 @@ class HummingbotApplication(*commands):
         )
         self.markets_recorder.start()
 
+        if global_config_map.get("market_data_recorder_enabled").value:
+            self._initialize_market_data_recorders()
+
+        # Trades of this session are loaded once, the tracker is kept up to date from the fill events after that.
+        self.trade_performance_tracker = TradePerformanceTracker(list(self.markets.values()))
+        self.trade_performance_tracker.add_trade_fills(
+            self._get_trades_from_session(int(self.init_time * 1e3), config_file_path=self.strategy_file_name))
+        self.trade_performance_tracker.start()
+
+    def _initialize_market_data_recorders(self):
+        data_dir: str = (global_config_map.get("market_data_recorder_path").value or
+                         os.path.join(data_path(), "market_data"))
+        for connector_name, connector in self.markets.items():
+            order_book_tracker = getattr(connector, "order_book_tracker", None)
+            if order_book_tracker is None:
+                order_book_tracker = getattr(connector, "_order_book_tracker", None)
+            if order_book_tracker is None:
+                self.logger().warning(f"Market data of {connector_name} can't be recorded, "
+                                      f"it has no order book tracker.")
+                continue
+            recorder: MarketDataRecorder = MarketDataRecorder(data_dir, connector_name)
+            order_book_tracker.set_market_data_recorder(recorder)
+            recorder.start()
+            self.market_data_recorders.append(recorder)
+
+    def _stop_market_data_recorders(self):
+        for recorder in self.market_data_recorders:
+            recorder.stop()
+        self.market_data_recorders.clear()
+
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
             # TODO: refactor to use single instance
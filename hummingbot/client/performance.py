@@ -1,11 +1,20 @@
 from decimal import Decimal
 from dataclasses import dataclass
+import logging
 from typing import (
     Dict,
     Optional,
     List,
-    Any
+    Any,
+    Tuple
 )
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    PriceType
+)
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.core.utils.market_price import get_last_price
 
@@ -113,6 +122,217 @@ def derivative_pnl(long: list, short: list):
     return pnls
 
 
+def divide(value, divisor):
+    value = Decimal(str(value))
+    divisor = Decimal(str(divisor))
+    if divisor == s_decimal_0:
+        return s_decimal_0
+    return value / divisor
+
+
+def trade_fees(trade: Any, quote: str) -> Dict[str, Decimal]:
+    """
+    Returns the fees paid for a trade per token
+    :param trade: a TradeFill, Trade or OrderFilledEvent object
+    :param quote: the quote token of the trade, in which percent fees are paid
+    """
+    fees: Dict[str, Decimal] = {}
+    if type(trade) is TradeFill:
+        if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
+            fees[quote] = Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
+        for flat_fee in trade.trade_fee.get("flat_fees", []):
+            fees[flat_fee["asset"]] = fees.get(flat_fee["asset"], s_decimal_0) + Decimal(flat_fee["amount"])
+    else:  # assume this is Trade or OrderFilledEvent object
+        if trade.trade_fee.percent > 0:
+            fees[quote] = (Decimal(str(trade.price)) * Decimal(str(trade.amount))) * Decimal(str(trade.trade_fee.percent))
+        for flat_fee in trade.trade_fee.flat_fees:
+            fees[flat_fee[0]] = fees.get(flat_fee[0], s_decimal_0) + Decimal(str(flat_fee[1]))
+    return fees
+
+
+class PositionOrder:
+    """
+    A derivative position order, aggregated over its fills. The price is the average of the fill prices.
+    """
+
+    def __init__(self):
+        self.price_sum: Decimal = s_decimal_0
+        self.fills: int = 0
+        self.amount: Decimal = s_decimal_0
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills
+
+
+class PerformanceMetricsAccumulator:
+    """
+    Streaming version of calculate_performance_metrics for one market. Trades are added once, as they are filled, and
+    the volumes, average prices, fees per token and realized derivative PnL are kept up to date, so computing the
+    metrics against the current balances and price takes constant time.
+
+    Derivative positions are paired the same way as calculate_performance_metrics does: the n-th order opening a long
+    (short) position is closed by the n-th order closing a long (short) position.
+    """
+
+    def __init__(self, trading_pair: str):
+        self._trading_pair: str = trading_pair
+        self._base, self._quote = trading_pair.split("-")
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        self.fees: Dict[str, Decimal] = {}
+        self.num_spot_trades: int = 0
+        self.realized_pnl: Decimal = s_decimal_0
+        # Position orders per (trade type, position), in order of their first fill
+        self._position_orders: Dict[Tuple[str, str], List[PositionOrder]] = {
+            ("BUY", "OPEN"): [], ("SELL", "CLOSE"): [], ("SELL", "OPEN"): [], ("BUY", "CLOSE"): []
+        }
+        self._position_order_index: Dict[str, Tuple[Tuple[str, str], int]] = {}
+        self._pair_pnls: Dict[Tuple[str, int], Decimal] = {}
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def derivative(self) -> bool:
+        return self.num_trades > 0 and self.num_spot_trades == 0
+
+    def add_trade(self, trade: Any):
+        """
+        Adds a trade to the metrics
+        :param trade: a TradeFill, Trade or OrderFilledEvent object
+        """
+        if isinstance(trade, OrderFilledEvent):
+            trade_type = trade.trade_type.name
+            order_id = trade.order_id
+            position = trade.position
+        else:
+            trade_type = trade.trade_type.upper()
+            order_id = getattr(trade, "order_id", None)
+            # Only TradeFill records carry the derivative position of the trade.
+            position = trade.position if type(trade) is TradeFill else "NILL"
+        price = Decimal(str(trade.price))
+        amount = Decimal(str(trade.amount))
+
+        if trade_type == "BUY":
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price
+        else:
+            self.num_sells += 1
+            self.s_vol_base += amount
+            self.s_vol_quote += amount * price
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+        for fee_token, fee_amount in trade_fees(trade, self._quote).items():
+            self.fees[fee_token] = self.fees.get(fee_token, s_decimal_0) + fee_amount
+
+        if position is None or position == "NILL":
+            self.num_spot_trades += 1
+        elif order_id is not None and (trade_type, position) in self._position_orders:
+            self._add_position_fill(trade_type, position, order_id, price, amount)
+
+    def _add_position_fill(self, trade_type: str, position: str, order_id: str, price: Decimal, amount: Decimal):
+        if order_id not in self._position_order_index:
+            orders = self._position_orders[(trade_type, position)]
+            self._position_order_index[order_id] = ((trade_type, position), len(orders))
+            orders.append(PositionOrder())
+        category, index = self._position_order_index[order_id]
+        order = self._position_orders[category][index]
+        order.price_sum += price
+        order.fills += 1
+        order.amount += amount
+        side = "LONG" if category in (("BUY", "OPEN"), ("SELL", "CLOSE")) else "SHORT"
+        self._update_pair_pnl(side, index)
+
+    def _update_pair_pnl(self, side: str, index: int):
+        if side == "LONG":
+            opens, closes = self._position_orders[("BUY", "OPEN")], self._position_orders[("SELL", "CLOSE")]
+        else:
+            opens, closes = self._position_orders[("SELL", "OPEN")], self._position_orders[("BUY", "CLOSE")]
+        if index >= len(opens) or index >= len(closes):
+            return
+        open_order, close_order = opens[index], closes[index]
+        if side == "LONG":
+            pnl = (close_order.price - open_order.price) * close_order.amount
+        else:
+            pnl = (open_order.price - close_order.price) * close_order.amount
+        self.realized_pnl += pnl - self._pair_pnls.get((side, index), s_decimal_0)
+        self._pair_pnls[(side, index)] = pnl
+
+    def performance_metrics(self,
+                            current_balances: Dict[str, Decimal],
+                            cur_price: Optional[Decimal] = None,
+                            fee_token_prices: Optional[Dict[str, Decimal]] = None) -> PerformanceMetrics:
+        """
+        Calculates PnL, fees, Return % and etc... against the current balances and price
+        :param current_balances: current user account balance
+        :param cur_price: the current price of the trading pair, the last trade price is used if not given
+        :param fee_token_prices: prices of the fee tokens other than the quote token, in the quote token
+        :return: A PerformanceMetrics object
+        """
+        perf = PerformanceMetrics()
+        fee_token_prices = fee_token_prices or {}
+        perf.num_buys = self.num_buys
+        perf.num_sells = self.num_sells
+        perf.num_trades = self.num_trades
+
+        perf.b_vol_base = self.b_vol_base
+        perf.s_vol_base = -self.s_vol_base
+        perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
+
+        perf.b_vol_quote = -self.b_vol_quote
+        perf.s_vol_quote = self.s_vol_quote
+        perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
+
+        perf.avg_b_price = abs(divide(perf.b_vol_quote, perf.b_vol_base))
+        perf.avg_s_price = abs(divide(perf.s_vol_quote, perf.s_vol_base))
+        perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
+                                    abs(perf.b_vol_base) + abs(perf.s_vol_base))
+
+        perf.cur_base_bal = current_balances.get(self._base, 0)
+        perf.cur_quote_bal = current_balances.get(self._quote, 0)
+        perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
+        perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
+
+        perf.start_price = self.start_price if self.start_price is not None else s_decimal_0
+        perf.cur_price = cur_price if cur_price is not None else (self.last_price or s_decimal_0)
+        perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
+                                           (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
+        perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
+                                         (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
+
+        perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
+        perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
+        perf.trade_pnl = perf.cur_value - perf.hold_value
+        # Handle trade_pnl differently for derivatives
+        if self.derivative:
+            perf.trade_pnl = self.realized_pnl
+
+        perf.fees = dict(self.fees)
+        for fee_token, fee_amount in perf.fees.items():
+            if fee_token == self._quote:
+                perf.fee_in_quote += fee_amount
+            elif fee_token_prices.get(fee_token) is not None:
+                perf.fee_in_quote += fee_amount * fee_token_prices[fee_token]
+
+        perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
+        perf.return_pct = divide(perf.total_pnl, perf.hold_value)
+        return perf
+
+
 async def calculate_performance_metrics(exchange: str,
                                         trading_pair: str,
                                         trades: List[Any],
@@ -125,109 +345,91 @@ async def calculate_performance_metrics(exchange: str,
     :param current_balances: current user account balance
     :return: A PerformanceMetrics object
     """
-
-    def divide(value, divisor):
-        value = Decimal(str(value))
-        divisor = Decimal(str(divisor))
-        if divisor == s_decimal_0:
-            return s_decimal_0
-        return value / divisor
-
-    base, quote = trading_pair.split("-")
-    perf = PerformanceMetrics()
-    buys = [t for t in trades if t.trade_type.upper() == "BUY"]
-    sells = [t for t in trades if t.trade_type.upper() == "SELL"]
-    derivative = False
-    if trades and type(trades[0]) == TradeFill and "NILL" not in [t.position for t in trades]:
-        derivative = True
-    perf.num_buys = len(buys)
-    perf.num_sells = len(sells)
-    perf.num_trades = perf.num_buys + perf.num_sells
-
-    perf.b_vol_base = Decimal(str(sum(b.amount for b in buys)))
-    perf.s_vol_base = Decimal(str(sum(s.amount for s in sells))) * Decimal("-1")
-    perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
-
-    perf.b_vol_quote = Decimal(str(sum(b.amount * b.price for b in buys))) * Decimal("-1")
-    perf.s_vol_quote = Decimal(str(sum(s.amount * s.price for s in sells)))
-    perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
-
-    perf.avg_b_price = divide(perf.b_vol_quote, perf.b_vol_base)
-    perf.avg_s_price = divide(perf.s_vol_quote, perf.s_vol_base)
-    perf.avg_tot_price = divide(abs(perf.b_vol_quote) + abs(perf.s_vol_quote),
-                                abs(perf.b_vol_base) + abs(perf.s_vol_base))
-    perf.avg_b_price = abs(perf.avg_b_price)
-    perf.avg_s_price = abs(perf.avg_s_price)
-
-    perf.cur_base_bal = current_balances.get(base, 0)
-    perf.cur_quote_bal = current_balances.get(quote, 0)
-    perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
-    perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
-
-    perf.start_price = Decimal(str(trades[0].price))
-    perf.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
-    if perf.cur_price is None:
-        perf.cur_price = Decimal(str(trades[-1].price))
-    perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
-                                       (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
-    perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
-                                     (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
-
-    perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
-    perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
-    perf.trade_pnl = perf.cur_value - perf.hold_value
-
-    # Handle trade_pnl differently for derivatives
-    if derivative:
-        buys_copy, sells_copy = aggregate_position_order(buys.copy(), sells.copy())
-        long = []
-        short = []
-
-        while True:
-            lng = position_order(buys_copy, sells_copy)
-            if lng is not None:
-                long.append(lng)
-
-            sht = position_order(sells_copy, buys_copy)
-            if sht is not None:
-                short.append(sht)
-            if lng is None and sht is None:
-                break
-
-        perf.trade_pnl = Decimal(str(sum(derivative_pnl(long, short))))
-
+    quote = trading_pair.split("-")[1]
+    accumulator = PerformanceMetricsAccumulator(trading_pair)
     for trade in trades:
-        if type(trade) is TradeFill:
-            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
-            for flat_fee in trade.trade_fee.get("flat_fees", []):
-                if flat_fee["asset"] not in perf.fees:
-                    perf.fees[flat_fee["asset"]] = s_decimal_0
-                perf.fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
-        else:  # assume this is Trade object
-            if trade.trade_fee.percent > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += (trade.price * trade.order_amount) * trade.trade_fee.percent
-            for flat_fee in trade.trade_fee.flat_fees:
-                if flat_fee[0] not in perf.fees:
-                    perf.fees[flat_fee[0]] = s_decimal_0
-                perf.fees[flat_fee[0]] += flat_fee[1]
-
-    for fee_token, fee_amount in perf.fees.items():
-        if fee_token == quote:
-            perf.fee_in_quote += fee_amount
-        else:
-            last_price = await get_last_price(exchange, f"{fee_token}-{quote}")
-            if last_price is not None:
-                perf.fee_in_quote += fee_amount * last_price
+        accumulator.add_trade(trade)
+    cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
+    fee_token_prices = {}
+    for fee_token in accumulator.fees:
+        if fee_token != quote:
+            fee_token_prices[fee_token] = await get_last_price(exchange, f"{fee_token}-{quote}")
+    return accumulator.performance_metrics(current_balances, cur_price, fee_token_prices)
 
-    perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
-    perf.return_pct = divide(perf.total_pnl, perf.hold_value)
 
-    return perf
+class TradePerformanceTracker:
+    """
+    Keeps a PerformanceMetricsAccumulator per market and trading pair, fed from the order filled events of the
+    markets, so the trade monitor, kill switch and history command don't have to reload and reprocess all the trades.
+    """
+    _tpt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tpt_logger is None:
+            cls._tpt_logger = logging.getLogger(__name__)
+        return cls._tpt_logger
+
+    def __init__(self, markets: List[Any]):
+        self._markets: Dict[str, Any] = {market.display_name: market for market in markets}
+        self._accumulators: Dict[Tuple[str, str], PerformanceMetricsAccumulator] = {}
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceMetricsAccumulator]:
+        return self._accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def start(self):
+        for market in self._markets.values():
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets.values():
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def add_trade(self, market_name: str, trading_pair: str, trade: Any):
+        key = (market_name, trading_pair)
+        if key not in self._accumulators:
+            self._accumulators[key] = PerformanceMetricsAccumulator(trading_pair)
+        self._accumulators[key].add_trade(trade)
+
+    def add_trade_fills(self, trade_fills: List[TradeFill]):
+        for trade_fill in trade_fills:
+            self.add_trade(trade_fill.market, trade_fill.symbol, trade_fill)
+
+    def _did_fill_order(self, event_tag: int, market: Any, evt: OrderFilledEvent):
+        self.add_trade(market.display_name, evt.trading_pair, evt)
+
+    async def _get_price(self, market_name: str, trading_pair: str) -> Optional[Decimal]:
+        market = self._markets.get(market_name)
+        if market is not None and trading_pair in getattr(market, "order_books", {}):
+            try:
+                price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                if not price.is_nan():
+                    return price
+            except Exception:
+                self.logger().debug(f"Error getting {trading_pair} price from {market_name}.", exc_info=True)
+        return await get_last_price(market_name.replace("_PaperTrade", ""), trading_pair)
+
+    async def performance_metrics(self,
+                                  market_name: str,
+                                  trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        Calculates the performance metrics of the trades of a market, priced off its order book when available.
+        """
+        accumulator = self._accumulators[(market_name, trading_pair)]
+        quote = trading_pair.split("-")[1]
+        cur_price = await self._get_price(market_name, trading_pair)
+        fee_token_prices = {}
+        for fee_token in accumulator.fees:
+            if fee_token != quote:
+                fee_token_prices[fee_token] = await self._get_price(market_name, f"{fee_token}-{quote}")
+        return accumulator.performance_metrics(current_balances, cur_price, fee_token_prices)
 
 
 def smart_round(value: Decimal, precision: Optional[int] = None) -> Decimal:
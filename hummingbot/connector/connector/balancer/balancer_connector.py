@@ -8,7 +8,7 @@ import time
 import ssl
 import copy
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import async_ttl_cache, quote_price_cache_key
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
@@ -171,7 +171,7 @@ class BalancerConnector(ConnectorBase):
             ret_val[token] = Decimal(str(amount))
         return ret_val
 
-    @async_ttl_cache(ttl=5, maxsize=10)
+    @async_ttl_cache(ttl=5, maxsize=100, key=quote_price_cache_key)
     async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Optional[Decimal]:
         """
         Retrieves a quote price.
@@ -1,3 +1,4 @@
+from libc.stdint cimport int64_t
 from hummingbot.core.event.event_reporter cimport EventReporter
 from hummingbot.core.event.event_logger cimport EventLogger
 from hummingbot.core.network_iterator cimport NetworkIterator
@@ -14,11 +15,23 @@ cdef class ConnectorBase(NetworkIterator):
         public double _in_flight_orders_snapshot_timestamp
         public set _current_trade_fills
         public dict _exchange_order_ids
+        dict _snapshot_locked_balances
+        dict _snapshot_filled_balances
+        dict _in_flight_locked_balances
+        dict _in_flight_order_locked
+        object _balance_deltas_snapshot
+        double _balance_deltas_snapshot_timestamp
+        public bint _check_balance_deltas
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef c_cancel(self, str trading_pair, str client_order_id)
     cdef c_stop_tracking_order(self, str order_id)
+    cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_sync_balance_deltas(self)
+    cdef c_update_balance_deltas(self, int64_t event_tag, object arg)
+    cdef c_set_in_flight_order_locked(self, str order_id, object order)
+    cdef c_reconcile_in_flight_order_locked(self)
     cdef object c_get_balance(self, str currency)
     cdef object c_get_available_balance(self, str currency)
     cdef object c_get_price(self, str trading_pair, bint is_buy)
@@ -26,3 +39,5 @@ cdef class ConnectorBase(NetworkIterator):
     cdef object c_get_order_size_quantum(self, str trading_pair, object order_size)
     cdef object c_quantize_order_price(self, str trading_pair, object price)
     cdef object c_quantize_order_amount(self, str trading_pair, object amount, object price=*)
+    cdef list c_quantize_order_prices(self, str trading_pair, list prices)
+    cdef list c_quantize_order_amounts(self, str trading_pair, list amounts)
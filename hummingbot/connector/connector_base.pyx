@@ -1,7 +1,10 @@
 from decimal import Decimal
+from libc.stdint cimport int64_t
 from typing import (
     Dict,
+    Iterator,
     List,
+    Optional,
     Tuple,
     Set,
 )
@@ -11,7 +14,7 @@ from hummingbot.core.event.events import (
     OrderType,
     TradeType
 )
-from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.event_logger import EventLogger, EventLogRetentionPolicy
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import TradeFillOrderDetails
@@ -23,6 +26,18 @@ NaN = float("nan")
 s_decimal_NaN = Decimal("nan")
 s_decimal_0 = Decimal(0)
 
+cdef int64_t ORDER_FILLED_EVENT_TAG = MarketEvent.OrderFilled.value
+ORDER_UPDATE_EVENT_TAGS = {
+    MarketEvent.BuyOrderCreated.value,
+    MarketEvent.SellOrderCreated.value,
+    MarketEvent.OrderFilled.value,
+    MarketEvent.OrderCancelled.value,
+    MarketEvent.OrderFailure.value,
+    MarketEvent.BuyOrderCompleted.value,
+    MarketEvent.SellOrderCompleted.value,
+    MarketEvent.OrderExpired.value,
+}
+
 
 cdef class ConnectorBase(NetworkIterator):
     MARKET_EVENTS = [
@@ -37,12 +52,14 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.SellOrderCreated,
         MarketEvent.OrderExpired
     ]
+    # Fills are kept for the whole session, as the balance accounting and trade history are based on them.
+    EVENT_LOG_RETENTION = EventLogRetentionPolicy(max_events=10000, exempt_event_types=(OrderFilledEvent,))
 
     def __init__(self):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name, retention=self.EVENT_LOG_RETENTION)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
@@ -58,6 +75,16 @@ cdef class ConnectorBase(NetworkIterator):
         self._in_flight_orders_snapshot_timestamp = 0.0
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
+        # Running balance deltas since the last snapshot, maintained from order events so that available balances
+        # don't have to be recomputed from all in-flight orders and event logs on every call.
+        self._snapshot_locked_balances = {}  # Dict[asset_name:str, Decimal]
+        self._snapshot_filled_balances = {}  # Dict[asset_name:str, Decimal]
+        self._in_flight_locked_balances = {}  # Dict[asset_name:str, Decimal]
+        self._in_flight_order_locked = {}  # Dict[order_id:str, Tuple[Optional[asset_name:str], Decimal]]
+        self._balance_deltas_snapshot = None
+        self._balance_deltas_snapshot_timestamp = 0.0
+        # If set, the running balance deltas are cross-checked against a full recomputation on every call.
+        self._check_balance_deltas = False
 
     @property
     def real_time_balance_update(self) -> bool:
@@ -67,6 +94,14 @@ cdef class ConnectorBase(NetworkIterator):
     def real_time_balance_update(self, value: bool):
         self._real_time_balance_update = value
 
+    @property
+    def check_balance_deltas(self) -> bool:
+        return self._check_balance_deltas
+
+    @check_balance_deltas.setter
+    def check_balance_deltas(self, value: bool):
+        self._check_balance_deltas = value
+
     @property
     def in_flight_orders_snapshot(self) -> Dict[str, InFlightOrderBase]:
         return self._in_flight_orders_snapshot
@@ -106,22 +141,27 @@ cdef class ConnectorBase(NetworkIterator):
         asset_balances = {}
         if in_flight_orders is None:
             return asset_balances
-        for order in [o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)]:
-            if order.trade_type is TradeType.BUY:
-                order_value = Decimal(order.amount * order.price)
-                outstanding_value = order_value - order.executed_amount_quote
-                if order.quote_asset not in asset_balances:
-                    asset_balances[order.quote_asset] = s_decimal_0
-                fee = self.estimate_fee_pct(True)
-                outstanding_value *= (Decimal(1) + fee)
-                asset_balances[order.quote_asset] += outstanding_value
-            else:
-                outstanding_value = order.amount - order.executed_amount_base
-                if order.base_asset not in asset_balances:
-                    asset_balances[order.base_asset] = s_decimal_0
-                asset_balances[order.base_asset] += outstanding_value
+        for order in in_flight_orders.values():
+            asset, outstanding_value = self.in_flight_order_balance(order)
+            if asset is not None:
+                asset_balances[asset] = asset_balances.get(asset, s_decimal_0) + outstanding_value
         return asset_balances
 
+    def in_flight_order_balance(self, order: InFlightOrderBase) -> Tuple[Optional[str], Decimal]:
+        """
+        Calculates the asset balance locked in an in-flight order including fee (estimated)
+        :param order: an in-flight order
+        :return The locked token and balance, or None and 0 if the order is no longer open
+        """
+        if order.is_done or order.is_failure or order.is_cancelled:
+            return None, s_decimal_0
+        if order.trade_type is TradeType.BUY:
+            order_value = Decimal(order.amount * order.price)
+            outstanding_value = order_value - order.executed_amount_quote
+            fee = self.estimate_fee_pct(True)
+            return order.quote_asset, outstanding_value * (Decimal(1) + fee)
+        return order.base_asset, order.amount - order.executed_amount_base
+
     def order_filled_balances(self, starting_timestamp = 0) -> Dict[str, Decimal]:
         """
         Calculates total asset balance changes from filled orders since the timestamp
@@ -130,10 +170,8 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
-        for event in order_filled_events:
+        for event in self._event_logger.iter_events(OrderFilledEvent, after=starting_timestamp):
             base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
             if event.trade_type is TradeType.BUY:
                 quote_value = Decimal("-1") * event.price * event.amount
@@ -178,6 +216,14 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    def iter_event_logs(self, event_type: type = None, after: float = None) -> Iterator[any]:
+        """
+        Iterates over the logged events without copying them.
+        :param event_type: only the events of this type
+        :param after: only the events with a timestamp later than this one
+        """
+        return self._event_logger.iter_events(event_type, after)
+
     @property
     def ready(self) -> bool:
         """
@@ -313,13 +359,95 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
-        actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
+        self.c_sync_balance_deltas()
+        self.c_reconcile_in_flight_order_locked()
+        actual_available = (available_balance
+                            + self._snapshot_locked_balances.get(currency, s_decimal_0)
+                            - self._in_flight_locked_balances.get(currency, s_decimal_0)
+                            + self._snapshot_filled_balances.get(currency, s_decimal_0))
+        if self._check_balance_deltas:
+            snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
+            in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+            orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
+                                                                                                          s_decimal_0)
+            expected_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
+            if actual_available != expected_available:
+                self.logger().warning(f"Running {currency} balance deltas are out of sync: available balance is "
+                                      f"{actual_available}, expected {expected_available}.")
+                actual_available = expected_available
         return actual_available
 
+    cdef c_sync_balance_deltas(self):
+        """
+        Resets the running balance deltas when a new in-flight orders snapshot has been taken.
+        """
+        if (self._balance_deltas_snapshot is self._in_flight_orders_snapshot and
+                self._balance_deltas_snapshot_timestamp == self._in_flight_orders_snapshot_timestamp):
+            return
+        self._balance_deltas_snapshot = self._in_flight_orders_snapshot
+        self._balance_deltas_snapshot_timestamp = self._in_flight_orders_snapshot_timestamp
+        self._snapshot_locked_balances = self.in_flight_asset_balances(self._in_flight_orders_snapshot)
+        self._snapshot_filled_balances = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp)
+        self._in_flight_locked_balances = {}
+        self._in_flight_order_locked = {}
+        for order_id, order in self.in_flight_orders.items():
+            self.c_set_in_flight_order_locked(order_id, order)
+
+    cdef c_reconcile_in_flight_order_locked(self):
+        """
+        Picks up the orders that started or stopped being tracked without an order event, e.g. an order tracked
+        before its create order API call returns, or one dropped after a failed submission.
+        """
+        cdef:
+            object in_flight_orders = self.in_flight_orders
+        if in_flight_orders.keys() == self._in_flight_order_locked.keys():
+            return
+        for order_id in [order_id for order_id in self._in_flight_order_locked if order_id not in in_flight_orders]:
+            self.c_set_in_flight_order_locked(order_id, None)
+        for order_id, order in in_flight_orders.items():
+            if order_id not in self._in_flight_order_locked:
+                self.c_set_in_flight_order_locked(order_id, order)
+
+    cdef c_set_in_flight_order_locked(self, str order_id, object order):
+        cdef:
+            object previous = self._in_flight_order_locked.pop(order_id, None)
+        if previous is not None:
+            asset, amount = previous
+            if asset is not None:
+                self._in_flight_locked_balances[asset] -= amount
+        if order is not None:
+            asset, amount = self.in_flight_order_balance(order)
+            # Orders that lock nothing are kept too, so that reconciling only looks at tracked order ids.
+            self._in_flight_order_locked[order_id] = (asset, amount)
+            if asset is not None:
+                self._in_flight_locked_balances[asset] = self._in_flight_locked_balances.get(asset, s_decimal_0) + amount
+
+    cdef c_update_balance_deltas(self, int64_t event_tag, object arg):
+        """
+        Updates the running balance deltas for an order event, in constant time.
+        """
+        if event_tag not in ORDER_UPDATE_EVENT_TAGS:
+            return
+        self.c_sync_balance_deltas()
+        self.c_set_in_flight_order_locked(arg.order_id, self.in_flight_orders.get(arg.order_id))
+        if event_tag == ORDER_FILLED_EVENT_TAG and arg.timestamp > self._balance_deltas_snapshot_timestamp:
+            base, quote = arg.trading_pair.split("-")
+            quote_value = arg.price * arg.amount
+            if arg.trade_type is TradeType.BUY:
+                base_value, quote_value = arg.amount, -quote_value
+            else:
+                base_value = -arg.amount
+            self._snapshot_filled_balances[base] = self._snapshot_filled_balances.get(base, s_decimal_0) + base_value
+            self._snapshot_filled_balances[quote] = self._snapshot_filled_balances.get(quote, s_decimal_0) + quote_value
+
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
+        if not self._real_time_balance_update:
+            try:
+                self.c_update_balance_deltas(event_tag, arg)
+            except Exception:
+                self.logger().error("Unexpected error updating balance deltas.", exc_info=True)
+        NetworkIterator.c_trigger_event(self, event_tag, arg)
+
     cdef object c_get_available_balance(self, str currency):
         return self.get_available_balance(currency)
 
@@ -392,6 +520,24 @@ cdef class ConnectorBase(NetworkIterator):
         """
         return self.c_quantize_order_amount(trading_pair, amount)
 
+    cdef list c_quantize_order_prices(self, str trading_pair, list prices):
+        return [self.c_quantize_order_price(trading_pair, price) for price in prices]
+
+    def quantize_order_prices(self, trading_pair: str, prices: List[Decimal]) -> List[Decimal]:
+        """
+        Applies trading rule to quantize a list of order prices, e.g. the prices of all order levels, in one call.
+        """
+        return self.c_quantize_order_prices(trading_pair, prices)
+
+    cdef list c_quantize_order_amounts(self, str trading_pair, list amounts):
+        return [self.c_quantize_order_amount(trading_pair, amount) for amount in amounts]
+
+    def quantize_order_amounts(self, trading_pair: str, amounts: List[Decimal]) -> List[Decimal]:
+        """
+        Applies trading rule to quantize a list of order amounts, e.g. the amounts of all order levels, in one call.
+        """
+        return self.c_quantize_order_amounts(trading_pair, amounts)
+
     async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         """
         Returns a quote price (or exchange rate) for a given amount, like asking how much does it cost to buy 4 apples?
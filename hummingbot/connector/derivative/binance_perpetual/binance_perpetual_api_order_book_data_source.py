@@ -13,6 +13,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book import BinancePerpetualOrderBook
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_to_exchange_trading_pair
@@ -57,11 +58,11 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain=None) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
-            return float(resp_json["lastPrice"])
+            async with client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}") as resp:
+                resp_json = await resp.json()
+                return float(resp_json["lastPrice"])
 
     """
     async def get_trading_pairs(self) -> List[str]:
@@ -85,7 +86,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair
             BASE_URL = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -118,7 +119,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._base_url)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
@@ -132,7 +133,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     """
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             return_val: Dict[str, OrderBookTrackerEntry] = {}
             for trading_pair in trading_pairs:
@@ -216,7 +217,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 # trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, domain=self._base_url)
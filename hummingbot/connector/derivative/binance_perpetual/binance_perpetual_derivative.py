@@ -17,8 +17,6 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_in_flig
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
 import asyncio
-import hashlib
-import hmac
 import time
 import logging
 import ujson
@@ -26,9 +24,6 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable
-from urllib.parse import urlencode
-
-import aiohttp
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.events import (
@@ -56,6 +51,7 @@ from hummingbot.connector.derivative.binance_perpetual.constants import (
     TESTNET_STREAM_URL
 )
 from hummingbot.connector.derivative_base import DerivativeBase, s_decimal_NaN
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRestClient
 from hummingbot.connector.trading_rule import TradingRule
 
 
@@ -136,6 +132,11 @@ class BinancePerpetualDerivative(DerivativeBase):
         self._funding_info_polling_task = None
         self._last_poll_timestamp = 0
         self._throttler = Throttler((10.0, 1.0))
+        self._rest_client = BinanceRestClient(self._api_key,
+                                              self._api_secret,
+                                              self._base_url,
+                                              throttler=self._throttler,
+                                              recv_window=20000)
         self._funding_payment_span = [0, 15]
 
     @property
@@ -993,34 +994,17 @@ class BinancePerpetualDerivative(DerivativeBase):
     def supported_position_modes(self):
         return [PositionMode.ONEWAY, PositionMode.HEDGE]
 
-    async def request(self, path: str, params: Dict[str, Any] = {}, method: MethodType = MethodType.GET,
+    async def request(self, path: str, params: Optional[Dict[str, Any]] = None, method: MethodType = MethodType.GET,
                       add_timestamp: bool = False, is_signed: bool = False, request_weight: int = 1, return_err: bool = False):
-        async with self._throttler.weighted_task(request_weight):
-            try:
-                # TODO: QUESTION --- SHOULD I ADD AN ASYNC TIMEOUT? (aync with timeout(API_CALL_TIMEOUT)
-                # async with aiohttp.ClientSession() as client:
-                if add_timestamp:
-                    params["timestamp"] = f"{int(time.time()) * 1000}"
-                    params["recvWindow"] = f"{20000}"
-                query = urlencode(sorted(params.items()))
-                if is_signed:
-                    secret = bytes(self._api_secret.encode("utf-8"))
-                    signature = hmac.new(secret, query.encode("utf-8"), hashlib.sha256).hexdigest()
-                    query += f"&signature={signature}"
-
-                async with aiohttp.request(
-                        method=method.value,
-                        url=self._base_url + path + "?" + query,
-                        headers={"X-MBX-APIKEY": self._api_key}) as response:
-                    if response.status != 200:
-                        error_response = await response.json()
-                        if return_err:
-                            return error_response
-                        else:
-                            raise IOError(f"Error fetching data from {path}. HTTP status is {response.status}. "
-                                          f"Request Error: {error_response}")
-                    return await response.json()
-            except Exception as e:
-                self.logger().error(f"Error fetching {path}", exc_info=True)
-                self.logger().warning(f"{e}")
-                raise e
+        try:
+            return await self._rest_client.request(method.value, path, params,
+                                                   is_signed=is_signed,
+                                                   add_timestamp=add_timestamp,
+                                                   request_weight=request_weight,
+                                                   return_err=return_err)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().error(f"Error fetching {path}", exc_info=True)
+            self.logger().warning(f"{e}")
+            raise e
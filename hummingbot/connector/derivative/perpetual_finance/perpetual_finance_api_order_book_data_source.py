@@ -1,22 +1,22 @@
-import aiohttp
 from typing import List
 import json
 from typing import Dict
 
 from hummingbot.connector.derivative.perpetual_finance.perpetual_finance_utils import convert_from_exchange_trading_pair
+from hummingbot.core.utils.http_session_registry import shared_client_session
 
 
 class PerpetualFinanceAPIOrderBookDataSource:
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         url = "https://metadata.perp.exchange/production.json"
-        async with aiohttp.ClientSession() as client:
-            response = await client.get(url)
-            trading_pairs = []
-            parsed_response = json.loads(await response.text())
-            contracts = parsed_response["layers"]["layer2"]["contracts"]
-            trading_pairs = [convert_from_exchange_trading_pair(contract) for contract in contracts.keys() if contracts[contract]["name"] == "Amm"]
-            return trading_pairs
+        async with shared_client_session() as client:
+            async with client.get(url) as response:
+                trading_pairs = []
+                parsed_response = json.loads(await response.text())
+                contracts = parsed_response["layers"]["layer2"]["contracts"]
+                trading_pairs = [convert_from_exchange_trading_pair(contract) for contract in contracts.keys() if contracts[contract]["name"] == "Amm"]
+                return trading_pairs
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
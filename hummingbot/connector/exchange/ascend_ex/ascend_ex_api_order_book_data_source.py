@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 import asyncio
 import logging
-import aiohttp
 import websockets
 import ujson
 import time
@@ -12,6 +11,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_active_order_tracker import AscendExActiveOrderTracker
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_order_book import AscendExOrderBook
@@ -43,64 +43,64 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
 
         for trading_pair in trading_pairs:
-            async with aiohttp.ClientSession() as client:
-                resp = await client.get(f"{REST_URL}/trades?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-                if resp.status != 200:
-                    raise IOError(
-                        f"Error fetching last traded prices at {EXCHANGE_NAME}. "
-                        f"HTTP status is {resp.status}."
-                    )
+            async with shared_client_session() as client:
+                async with client.get(f"{REST_URL}/trades?symbol={convert_to_exchange_trading_pair(trading_pair)}") as resp:
+                    if resp.status != 200:
+                        raise IOError(
+                            f"Error fetching last traded prices at {EXCHANGE_NAME}. "
+                            f"HTTP status is {resp.status}."
+                        )
 
-                resp_json = await resp.json()
-                if resp_json.get("code") != 0:
-                    raise IOError(
-                        f"Error fetching last traded prices at {EXCHANGE_NAME}. "
-                        f"Error is {resp_json.message}."
-                    )
+                    resp_json = await resp.json()
+                    if resp_json.get("code") != 0:
+                        raise IOError(
+                            f"Error fetching last traded prices at {EXCHANGE_NAME}. "
+                            f"Error is {resp_json.message}."
+                        )
 
-                trades = resp_json.get("data").get("data")
-                if (len(trades) == 0):
-                    continue
+                    trades = resp_json.get("data").get("data")
+                    if (len(trades) == 0):
+                        continue
 
-                # last trade is the most recent trade
-                result[trading_pair] = float(trades[-1].get("p"))
+                    # last trade is the most recent trade
+                    result[trading_pair] = float(trades[-1].get("p"))
 
         return result
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{REST_URL}/ticker")
+        async with shared_client_session() as client:
+            async with client.get(f"{REST_URL}/ticker") as resp:
 
-            if resp.status != 200:
-                # Do nothing if the request fails -- there will be no autocomplete for kucoin trading pairs
-                return []
+                if resp.status != 200:
+                    # Do nothing if the request fails -- there will be no autocomplete for kucoin trading pairs
+                    return []
 
-            data: Dict[str, Dict[str, Any]] = await resp.json()
-            return [convert_from_exchange_trading_pair(item["symbol"]) for item in data["data"]]
+                data: Dict[str, Dict[str, Any]] = await resp.json()
+                return [convert_from_exchange_trading_pair(item["symbol"]) for item in data["data"]]
 
     @staticmethod
     async def get_order_book_data(trading_pair: str) -> Dict[str, any]:
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{REST_URL}/depth?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            if resp.status != 200:
-                raise IOError(
-                    f"Error fetching OrderBook for {trading_pair} at {EXCHANGE_NAME}. "
-                    f"HTTP status is {resp.status}."
-                )
+        async with shared_client_session() as client:
+            async with client.get(f"{REST_URL}/depth?symbol={convert_to_exchange_trading_pair(trading_pair)}") as resp:
+                if resp.status != 200:
+                    raise IOError(
+                        f"Error fetching OrderBook for {trading_pair} at {EXCHANGE_NAME}. "
+                        f"HTTP status is {resp.status}."
+                    )
 
-            data: List[Dict[str, Any]] = await safe_gather(resp.json())
-            item = data[0]
-            if item.get("code") != 0:
-                raise IOError(
-                    f"Error fetching OrderBook for {trading_pair} at {EXCHANGE_NAME}. "
-                    f"Error is {item.message}."
-                )
+                data: List[Dict[str, Any]] = await safe_gather(resp.json())
+                item = data[0]
+                if item.get("code") != 0:
+                    raise IOError(
+                        f"Error fetching OrderBook for {trading_pair} at {EXCHANGE_NAME}. "
+                        f"Error is {item.message}."
+                    )
 
-            return item["data"]
+                return item["data"]
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair)
@@ -18,6 +18,7 @@ from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.ssl_client_request import SSLClientRequest
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bamboo_relay.bamboo_relay_order_book import BambooRelayOrderBook
@@ -106,7 +107,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     async with client.get(f"https://rest.bamboorelay.com/main/0x/markets?perPage=1000&page={page_count}",
                                           timeout=5) as response:
                         if response.status == 200:
@@ -148,7 +149,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return await self.fetch_trading_pairs()
 
     async def get_new_order_book(self, trading_pair: str) -> BambooRelayOrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, self._api_endpoint,
                                                                self._api_prefix)
             snapshot_timestamp: float = time.time()
@@ -13,6 +13,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -47,58 +48,58 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
     async def get_active_exchange_markets(cls) -> pd.DataFrame:
-        async with aiohttp.ClientSession() as client:
-
-            symbols_response: aiohttp.ClientResponse = await client.get(BeaxyConstants.PublicApi.SYMBOLS_URL)
-            rates_response: aiohttp.ClientResponse = await client.get(BeaxyConstants.PublicApi.RATES_URL)
-
-            if symbols_response.status != 200:
-                raise IOError(f'Error fetching Beaxy markets information. '
-                              f'HTTP status is {symbols_response.status}.')
-            if rates_response.status != 200:
-                raise IOError(f'Error fetching Beaxy exchange information. '
-                              f'HTTP status is {symbols_response.status}.')
-
-            symbols_data = await symbols_response.json()
-            rates_data = await rates_response.json()
-
-            market_data: List[Dict[str, Any]] = [{'pair': pair, **rates_data[pair], **item}
-                                                 for pair in rates_data
-                                                 for item in symbols_data
-                                                 if item['suspendedForTrading'] is False
-                                                 if pair in item['symbol']]
-
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index='pair')
-
-            btc_price: float = float(all_markets.loc['BTCUSDC'].price)
-            eth_price: float = float(all_markets.loc['ETHUSDC'].price)
-
-            usd_volume: List[float] = [
-                (
-                    volume * quote_price if trading_pair.endswith(('USDC')) else
-                    volume * quote_price * btc_price if trading_pair.endswith('BTC') else
-                    volume * quote_price * eth_price if trading_pair.endswith('ETH') else
-                    volume
-                )
-                for trading_pair, volume, quote_price in zip(
-                    all_markets.index,
-                    all_markets.volume24.astype('float'),
-                    all_markets.price.astype('float')
-                )
-            ]
-
-            all_markets.loc[:, 'USDVolume'] = usd_volume
-            del all_markets['volume']
-            all_markets.rename(columns={'baseCurrency': 'baseAsset',
-                                        'termCurrency': 'quoteAsset',
-                                        'volume24': 'volume'}, inplace=True)
-
-            return all_markets.sort_values('USDVolume', ascending=False)
+        async with shared_client_session() as client:
+
+            async with client.get(BeaxyConstants.PublicApi.SYMBOLS_URL) as symbols_response:
+                async with client.get(BeaxyConstants.PublicApi.RATES_URL) as rates_response:
+
+                    if symbols_response.status != 200:
+                        raise IOError(f'Error fetching Beaxy markets information. '
+                                      f'HTTP status is {symbols_response.status}.')
+                    if rates_response.status != 200:
+                        raise IOError(f'Error fetching Beaxy exchange information. '
+                                      f'HTTP status is {symbols_response.status}.')
+
+                    symbols_data = await symbols_response.json()
+                    rates_data = await rates_response.json()
+
+                    market_data: List[Dict[str, Any]] = [{'pair': pair, **rates_data[pair], **item}
+                                                         for pair in rates_data
+                                                         for item in symbols_data
+                                                         if item['suspendedForTrading'] is False
+                                                         if pair in item['symbol']]
+
+                    all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index='pair')
+
+                    btc_price: float = float(all_markets.loc['BTCUSDC'].price)
+                    eth_price: float = float(all_markets.loc['ETHUSDC'].price)
+
+                    usd_volume: List[float] = [
+                        (
+                            volume * quote_price if trading_pair.endswith(('USDC')) else
+                            volume * quote_price * btc_price if trading_pair.endswith('BTC') else
+                            volume * quote_price * eth_price if trading_pair.endswith('ETH') else
+                            volume
+                        )
+                        for trading_pair, volume, quote_price in zip(
+                            all_markets.index,
+                            all_markets.volume24.astype('float'),
+                            all_markets.price.astype('float')
+                        )
+                    ]
+
+                    all_markets.loc[:, 'USDVolume'] = usd_volume
+                    del all_markets['volume']
+                    all_markets.rename(columns={'baseCurrency': 'baseAsset',
+                                                'termCurrency': 'quoteAsset',
+                                                'volume24': 'volume'}, inplace=True)
+
+                    return all_markets.sort_values('USDVolume', ascending=False)
 
     @staticmethod
     async def fetch_trading_pairs() -> Optional[List[str]]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(BeaxyConstants.PublicApi.SYMBOLS_URL, timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: List[Dict[str, Any]] = await response.json()
@@ -114,7 +115,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         async def last_price_for_pair(trading_pair):
             symbol = trading_pair_to_symbol(trading_pair)
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(BeaxyConstants.PublicApi.RATE_URL.format(symbol=symbol)) as response:
                     response: aiohttp.ClientResponse
                     if response.status != 200:
@@ -153,7 +154,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 20)
             snapshot_timestamp = snapshot['timestamp']
             snapshot_msg: OrderBookMessage = BeaxyOrderBook.snapshot_message_from_exchange(
@@ -168,7 +169,7 @@ class BeaxyAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return order_book
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: Optional[List[str]] = await self.get_trading_pairs()
             assert trading_pairs is not None
             retval: Dict[str, OrderBookTrackerEntry] = {}
@@ -19,6 +19,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -60,31 +61,31 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain: str = "com") -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
-            resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
-            return float(resp_json["lastPrice"])
+            async with client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}") as resp:
+                resp_json = await resp.json()
+                return float(resp_json["lastPrice"])
 
     @staticmethod
     @async_ttl_cache(ttl=2, maxsize=1)
     async def get_all_mid_prices(domain="com") -> Optional[Decimal]:
         from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
-            resp = await client.get(url)
-            resp_json = await resp.json()
-            ret_val = {}
-            for record in resp_json:
-                pair = convert_from_exchange_trading_pair(record["symbol"])
-                ret_val[pair] = (Decimal(record.get("bidPrice", "0")) + Decimal(record.get("askPrice", "0"))) / Decimal("2")
-            return ret_val
+            async with client.get(url) as resp:
+                resp_json = await resp.json()
+                ret_val = {}
+                for record in resp_json:
+                    pair = convert_from_exchange_trading_pair(record["symbol"])
+                    ret_val[pair] = (Decimal(record.get("bidPrice", "0")) + Decimal(record.get("askPrice", "0"))) / Decimal("2")
+                return ret_val
 
     @staticmethod
     async def fetch_trading_pairs(domain="com") -> List[str]:
         try:
             from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
@@ -124,7 +125,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._domain)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
@@ -204,7 +205,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair,
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-import aiohttp
 import logging
 import time
 from typing import (
@@ -13,11 +12,10 @@ import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from binance.client import Client as BinanceClient
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRestClient
 from hummingbot.logger import HummingbotLogger
 
-BINANCE_API_ENDPOINT = "https://api.binance.{}/api/v1/"
-BINANCE_USER_STREAM_ENDPOINT = "userDataStream"
+BINANCE_USER_STREAM_ENDPOINT = "/api/v1/userDataStream"
 BINANCE_WSS_USER_STREAM = "wss://stream.binance.{}:9443/ws/"
 
 
@@ -34,8 +32,8 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             cls._bausds_logger = logging.getLogger(__name__)
         return cls._bausds_logger
 
-    def __init__(self, binance_client: BinanceClient, domain: str = "com"):
-        self._binance_client: BinanceClient = binance_client
+    def __init__(self, rest_client: BinanceRestClient, domain: str = "com"):
+        self._rest_client: BinanceRestClient = rest_client
         self._current_listen_key = None
         self._listen_for_user_stream_task = None
         self._last_recv_time: float = 0
@@ -47,27 +45,19 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         return self._last_recv_time
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
-            url = BINANCE_API_ENDPOINT.format(self._domain)
-            async with client.post(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
-                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching user stream listen key. HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
-                return data["listenKey"]
+        try:
+            data: Dict[str, str] = await self._rest_client.post(BINANCE_USER_STREAM_ENDPOINT)
+        except IOError as e:
+            raise IOError(f"Error fetching user stream listen key. {e}")
+        return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
-            url = BINANCE_API_ENDPOINT.format(self._domain)
-            async with client.put(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
-                                  headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
-                                  params={"listenKey": listen_key}) as response:
-                data: [str, any] = await response.json()
-                if "code" in data:
-                    self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
-                    return False
-                return True
+        data: Dict[str, any] = await self._rest_client.request("PUT", BINANCE_USER_STREAM_ENDPOINT,
+                                                               {"listenKey": listen_key}, return_err=True)
+        if "code" in data:
+            self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
+            return False
+        return True
 
     async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
         # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
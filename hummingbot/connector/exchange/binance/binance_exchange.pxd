@@ -6,7 +6,8 @@ from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 cdef class BinanceExchange(ExchangeBase):
     cdef:
         object _user_stream_tracker
-        object _binance_client
+        object _rest_client
+        object _open_orders_reconciler
         object _ev_loop
         object _poll_notifier
         double _last_timestamp
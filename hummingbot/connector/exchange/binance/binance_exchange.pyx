@@ -8,11 +8,7 @@ from aiokafka import (
 )
 import asyncio
 from async_timeout import timeout
-from binance.client import Client as BinanceClient
-from binance import client as binance_client_module
-from binance.exceptions import BinanceAPIException
 from decimal import Decimal
-from functools import partial
 import logging
 import pandas as pd
 import time
@@ -28,7 +24,10 @@ from typing import (
 import conf
 from hummingbot.core.utils.asyncio_throttle import Throttler
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler,
+)
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.async_utils import (
@@ -60,9 +59,19 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from .binance_order_book_tracker import BinanceOrderBookTracker
+from .binance_rest_client import (
+    BINANCE_REQUEST_WEIGHT_LIMIT,
+    BINANCE_REST_URL,
+    BinanceAPIError,
+    BinanceRestClient,
+)
 from .binance_user_stream_tracker import BinanceUserStreamTracker
 from .binance_time import BinanceTime
 from .binance_in_flight_order import BinanceInFlightOrder
+from hummingbot.connector.open_orders_reconciler import (
+    OpenOrdersReconciler,
+    OpenOrdersReconciliation,
+)
 from .binance_utils import (
     convert_from_exchange_trading_pair,
     convert_to_exchange_trading_pair)
@@ -115,6 +124,9 @@ cdef class BinanceExchange(ExchangeBase):
     BINANCE_USER_STREAM_TOPIC_NAME = "binance-user-stream.serialized"
 
     ORDER_NOT_EXIST_CONFIRMATION_COUNT = 3
+    # Rate limit weights of the open orders request, for one trading pair and for all trading pairs.
+    OPEN_ORDERS_TRADING_PAIR_WEIGHT = 3
+    OPEN_ORDERS_ALL_TRADING_PAIRS_WEIGHT = 40
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -131,12 +143,21 @@ cdef class BinanceExchange(ExchangeBase):
                  domain="com"
                  ):
         self._domain = domain
-        self.monkey_patch_binance_time()
+        self.start_binance_time()
         super().__init__()
         self._trading_required = trading_required
         self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs, domain=domain)
-        self._binance_client = BinanceClient(binance_api_key, binance_api_secret, tld=domain)
-        self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client, domain=domain)
+        self._throttler = Throttler(BINANCE_REQUEST_WEIGHT_LIMIT)
+        self._rest_client = BinanceRestClient(binance_api_key,
+                                              binance_api_secret,
+                                              BINANCE_REST_URL.format(domain),
+                                              throttler=self._throttler,
+                                              time_provider=BinanceTime.get_instance().time,
+                                              request_timeout=self.API_CALL_TIMEOUT)
+        self._user_stream_tracker = BinanceUserStreamTracker(rest_client=self._rest_client, domain=domain)
+        self._open_orders_reconciler = OpenOrdersReconciler(lambda order: order.get("clientOrderId"),
+                                                            self.OPEN_ORDERS_TRADING_PAIR_WEIGHT,
+                                                            self.OPEN_ORDERS_ALL_TRADING_PAIRS_WEIGHT)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
@@ -151,7 +172,6 @@ cdef class BinanceExchange(ExchangeBase):
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
 
     @property
     def name(self) -> str:
@@ -165,8 +185,8 @@ cdef class BinanceExchange(ExchangeBase):
         return self._order_book_tracker.order_books
 
     @property
-    def binance_client(self) -> BinanceClient:
-        return self._binance_client
+    def rest_client(self) -> BinanceRestClient:
+        return self._rest_client
 
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
@@ -207,9 +227,8 @@ cdef class BinanceExchange(ExchangeBase):
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await BinanceAPIOrderBookDataSource.get_active_exchange_markets()
 
-    def monkey_patch_binance_time(self):
-        if binance_client_module.time != BinanceTime.get_instance():
-            binance_client_module.time = BinanceTime.get_instance()
+    def start_binance_time(self):
+        if not BinanceTime.get_instance().started:
             BinanceTime.get_instance().start()
 
     async def schedule_async_call(
@@ -221,24 +240,33 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def query_api(
             self,
-            func,
-            *args,
+            method: str,
+            path: str,
+            params: Optional[Dict[str, Any]] = None,
+            is_signed: bool = False,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
-            **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
-            try:
-                return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
-                                                              timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
-            except Exception as ex:
-                if "Timestamp for this request" in str(ex):
-                    self.logger().warning("Got Binance timestamp error. "
-                                          "Going to force update Binance server time offset...")
-                    binance_time = BinanceTime.get_instance()
-                    binance_time.clear_time_offset_ms_samples()
-                    await binance_time.schedule_update_server_time_offset()
-                raise ex
+            priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> Any:
+        """
+        Sends a request to the Binance REST API. Requests are sent concurrently, on the client's keep-alive connections.
+        When the rate limit is reached, requests wait in priority order.
+        """
+        try:
+            return await self._rest_client.request(method, path, params,
+                                                   is_signed=is_signed,
+                                                   request_weight=request_weight,
+                                                   priority=priority)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().debug(f"{app_warning_msg} [[Got exception: {str(ex)}]]", exc_info=True)
+            if "Timestamp for this request" in str(ex):
+                self.logger().warning("Got Binance timestamp error. "
+                                      "Going to force update Binance server time offset...")
+                binance_time = BinanceTime.get_instance()
+                binance_time.clear_time_offset_ms_samples()
+                await binance_time.schedule_update_server_time_offset()
+            raise ex
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
@@ -258,7 +286,7 @@ cdef class BinanceExchange(ExchangeBase):
             set remote_asset_names = set()
             set asset_names_to_remove
 
-        account_info = await self.query_api(self._binance_client.get_account)
+        account_info = await self.query_api("GET", "/api/v3/account", is_signed=True)
         balances = account_info["balances"]
         for balance_entry in balances:
             asset_name = balance_entry["asset"]
@@ -279,7 +307,7 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_timestamp - self._last_update_trade_fees_timestamp > 60.0 * 60.0 or len(self._trade_fees) < 1:
             try:
-                res = await self.query_api(self._binance_client.get_trade_fee)
+                res = await self.query_api("GET", "/wapi/v3/tradeFee.html", is_signed=True)
                 for fee in res["tradeFee"]:
                     self._trade_fees[fee["symbol"]] = (Decimal(fee["maker"]), Decimal(fee["taker"]))
                 self._last_update_trade_fees_timestamp = current_timestamp
@@ -324,7 +352,7 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t last_tick = <int64_t>(self._last_timestamp / 60.0)
             int64_t current_tick = <int64_t>(self._current_timestamp / 60.0)
         if current_tick > last_tick or len(self._trading_rules) < 1:
-            exchange_info = await self.query_api(self._binance_client.get_exchange_info)
+            exchange_info = await self.query_api("GET", "/api/v3/exchangeInfo")
             trading_rules_list = self._format_trading_rules(exchange_info)
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
@@ -400,7 +428,10 @@ cdef class BinanceExchange(ExchangeBase):
                     trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
                 trading_pairs = list(trading_pairs_to_order_map.keys())
-                tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
+                tasks = [self.query_api("GET", "/api/v3/myTrades",
+                                       {"symbol": convert_to_exchange_trading_pair(trading_pair)},
+                                       is_signed=True,
+                                       priority=AsyncCallPriority.POLLING)
                          for trading_pair in trading_pairs]
                 self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
                 results = await safe_gather(*tasks, return_exceptions=True)
@@ -446,7 +477,10 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_tick > last_tick:
             trading_pairs = self._order_book_tracker._trading_pairs
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
+            tasks = [self.query_api("GET", "/api/v3/myTrades",
+                                       {"symbol": convert_to_exchange_trading_pair(trading_pair)},
+                                       is_signed=True,
+                                       priority=AsyncCallPriority.POLLING)
                      for trading_pair in trading_pairs]
             self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
             exchange_history = await safe_gather(*tasks, return_exceptions=True)
@@ -481,6 +515,46 @@ cdef class BinanceExchange(ExchangeBase):
                                                  ))
                             self.logger().info(f"Recreating missing trade in TradeFill: {trade}")
 
+    async def _fetch_open_orders(self, tracked_orders: List[BinanceInFlightOrder]) -> OpenOrdersReconciliation:
+        """
+        Fetches the open orders, per trading pair or for all trading pairs, whichever weighs less, and reconciles them
+        with the tracked orders. The orders of the trading pairs that could not be fetched are reported as missing, so
+        they are queried one by one.
+        """
+        trading_pairs = self._open_orders_reconciler.trading_pairs_to_fetch(tracked_orders)
+        if trading_pairs is None:
+            try:
+                open_orders = await self.query_api("GET", "/api/v3/openOrders", is_signed=True,
+                                                   request_weight=self.OPEN_ORDERS_ALL_TRADING_PAIRS_WEIGHT,
+                                                   priority=AsyncCallPriority.POLLING)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().network(f"Error fetching open orders: {e}.",
+                                      app_warning_msg="Failed to fetch open orders.")
+                return OpenOrdersReconciliation([], tracked_orders, [])
+            return self._open_orders_reconciler.reconcile(tracked_orders, open_orders)
+
+        tasks = [self.query_api("GET", "/api/v3/openOrders",
+                                {"symbol": convert_to_exchange_trading_pair(trading_pair)},
+                                is_signed=True,
+                                request_weight=self.OPEN_ORDERS_TRADING_PAIR_WEIGHT,
+                                priority=AsyncCallPriority.POLLING)
+                 for trading_pair in trading_pairs]
+        results = await safe_gather(*tasks, return_exceptions=True)
+        open_orders = []
+        fetched_trading_pairs = []
+        for result, trading_pair in zip(results, trading_pairs):
+            if isinstance(result, Exception):
+                self.logger().network(f"Error fetching open orders of {trading_pair}: {result}.",
+                                      app_warning_msg=f"Failed to fetch open orders of {trading_pair}.")
+                continue
+            open_orders.extend(result)
+            fetched_trading_pairs.append(trading_pair)
+        reconciliation = self._open_orders_reconciler.reconcile(tracked_orders, open_orders, fetched_trading_pairs)
+        reconciliation.missing_orders.extend(o for o in tracked_orders if o.trading_pair not in fetched_trading_pairs)
+        return reconciliation
+
     async def _update_order_status(self):
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
@@ -490,9 +564,19 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
-                                    symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id)
+            # The open orders give the status of all the orders still open in a few requests. Only the orders that
+            # are not open anymore, or not acknowledged yet, are queried one by one.
+            reconciliation = await self._fetch_open_orders(list(self._in_flight_orders.values()))
+            for tracked_order, order_update in reconciliation.open_orders:
+                if tracked_order.client_order_id in self._in_flight_orders:
+                    self._process_order_update(tracked_order, order_update)
+
+            tracked_orders = reconciliation.missing_orders
+            tasks = [self.query_api("GET", "/api/v3/order",
+                                    {"symbol": convert_to_exchange_trading_pair(o.trading_pair),
+                                     "origClientOrderId": o.client_order_id},
+                                    is_signed=True,
+                                    priority=AsyncCallPriority.POLLING)
                      for o in tracked_orders]
             self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
             results = await safe_gather(*tasks, return_exceptions=True)
@@ -504,7 +588,8 @@ cdef class BinanceExchange(ExchangeBase):
                     continue
 
                 if isinstance(order_update, Exception):
-                    if order_update.code == 2013 or order_update.message == "Order does not exist.":
+                    if getattr(order_update, "code", None) in (2013, -2013) or \
+                            getattr(order_update, "message", None) == "Order does not exist.":
                         self._order_not_found_records[client_order_id] = \
                             self._order_not_found_records.get(client_order_id, 0) + 1
                         if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
@@ -523,61 +608,70 @@ cdef class BinanceExchange(ExchangeBase):
                         )
                     continue
 
-                # Update order execution status
-                tracked_order.last_state = order_update["status"]
-                order_type = BinanceExchange.to_hb_order_type(order_update["type"])
-                executed_amount_base = Decimal(order_update["executedQty"])
-                executed_amount_quote = Decimal(order_update["cummulativeQuoteQty"])
-
-                if tracked_order.is_done:
-                    if not tracked_order.is_failure:
-                        if tracked_order.trade_type is TradeType.BUY:
-                            self.logger().info(f"The market buy order {tracked_order.client_order_id} has completed "
-                                               f"according to order status API.")
-                            self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
-                                                 BuyOrderCompletedEvent(self._current_timestamp,
-                                                                        client_order_id,
-                                                                        tracked_order.base_asset,
-                                                                        tracked_order.quote_asset,
-                                                                        (tracked_order.fee_asset
-                                                                         or tracked_order.base_asset),
-                                                                        executed_amount_base,
-                                                                        executed_amount_quote,
-                                                                        tracked_order.fee_paid,
-                                                                        order_type))
-                        else:
-                            self.logger().info(f"The market sell order {client_order_id} has completed "
-                                               f"according to order status API.")
-                            self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
-                                                 SellOrderCompletedEvent(self._current_timestamp,
-                                                                         client_order_id,
-                                                                         tracked_order.base_asset,
-                                                                         tracked_order.quote_asset,
-                                                                         (tracked_order.fee_asset
-                                                                          or tracked_order.quote_asset),
-                                                                         executed_amount_base,
-                                                                         executed_amount_quote,
-                                                                         tracked_order.fee_paid,
-                                                                         order_type))
-                    else:
-                        # check if its a cancelled order
-                        # if its a cancelled order, issue cancel and stop tracking order
-                        if tracked_order.is_cancelled:
-                            self.logger().info(f"Successfully cancelled order {client_order_id}.")
-                            self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
-                                                 OrderCancelledEvent(
-                                                     self._current_timestamp,
-                                                     client_order_id))
-                        else:
-                            self.logger().info(f"The market order {client_order_id} has failed according to "
-                                               f"order status API.")
-                            self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
-                                                 MarketOrderFailureEvent(
-                                                     self._current_timestamp,
-                                                     client_order_id,
-                                                     order_type
-                                                 ))
-                    self.c_stop_tracking_order(client_order_id)
+                self._process_order_update(tracked_order, order_update)
+
+    def _process_order_update(self, tracked_order: BinanceInFlightOrder, order_update: Dict[str, Any]):
+        """
+        Updates a tracked order from its order record, and emits the completion, cancellation or failure event if the
+        order is done.
+        """
+        client_order_id = tracked_order.client_order_id
+
+        # Update order execution status
+        tracked_order.last_state = order_update["status"]
+        order_type = BinanceExchange.to_hb_order_type(order_update["type"])
+        executed_amount_base = Decimal(order_update["executedQty"])
+        executed_amount_quote = Decimal(order_update["cummulativeQuoteQty"])
+
+        if tracked_order.is_done:
+            if not tracked_order.is_failure:
+                if tracked_order.trade_type is TradeType.BUY:
+                    self.logger().info(f"The market buy order {tracked_order.client_order_id} has completed "
+                                       f"according to order status API.")
+                    self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
+                                         BuyOrderCompletedEvent(self._current_timestamp,
+                                                                client_order_id,
+                                                                tracked_order.base_asset,
+                                                                tracked_order.quote_asset,
+                                                                (tracked_order.fee_asset
+                                                                 or tracked_order.base_asset),
+                                                                executed_amount_base,
+                                                                executed_amount_quote,
+                                                                tracked_order.fee_paid,
+                                                                order_type))
+                else:
+                    self.logger().info(f"The market sell order {client_order_id} has completed "
+                                       f"according to order status API.")
+                    self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
+                                         SellOrderCompletedEvent(self._current_timestamp,
+                                                                 client_order_id,
+                                                                 tracked_order.base_asset,
+                                                                 tracked_order.quote_asset,
+                                                                 (tracked_order.fee_asset
+                                                                  or tracked_order.quote_asset),
+                                                                 executed_amount_base,
+                                                                 executed_amount_quote,
+                                                                 tracked_order.fee_paid,
+                                                                 order_type))
+            else:
+                # check if its a cancelled order
+                # if its a cancelled order, issue cancel and stop tracking order
+                if tracked_order.is_cancelled:
+                    self.logger().info(f"Successfully cancelled order {client_order_id}.")
+                    self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                         OrderCancelledEvent(
+                                             self._current_timestamp,
+                                             client_order_id))
+                else:
+                    self.logger().info(f"The market order {client_order_id} has failed according to "
+                                       f"order status API.")
+                    self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                         MarketOrderFailureEvent(
+                                             self._current_timestamp,
+                                             client_order_id,
+                                             order_type
+                                         ))
+            self.c_stop_tracking_order(client_order_id)
 
     async def _iter_kafka_messages(self, topic: str) -> AsyncIterable[ConsumerRecord]:
         while True:
@@ -763,7 +857,7 @@ cdef class BinanceExchange(ExchangeBase):
         """
         :return: The current server time in milliseconds since UNIX epoch.
         """
-        result = await self.query_api(self._binance_client.get_server_time)
+        result = await self.query_api("GET", "/api/v3/time")
         return result["serverTime"]
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -800,7 +894,7 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            await self.query_api(self._binance_client.ping)
+            await self.query_api("GET", "/api/v3/ping")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -866,7 +960,7 @@ cdef class BinanceExchange(ExchangeBase):
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         type_str = BinanceExchange.binance_order_type(order_type)
-        side_str = BinanceClient.SIDE_BUY if trade_type is TradeType.BUY else BinanceClient.SIDE_SELL
+        side_str = "BUY" if trade_type is TradeType.BUY else "SELL"
         api_params = {"symbol": convert_to_exchange_trading_pair(trading_pair),
                       "side": side_str,
                       "quantity": amount_str,
@@ -874,7 +968,7 @@ cdef class BinanceExchange(ExchangeBase):
                       "newClientOrderId": order_id,
                       "price": price_str}
         if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = BinanceClient.TIME_IN_FORCE_GTC
+            api_params["timeInForce"] = "GTC"
         self.c_start_tracking_order(order_id,
                                     "",
                                     trading_pair,
@@ -884,7 +978,8 @@ cdef class BinanceExchange(ExchangeBase):
                                     order_type
                                     )
         try:
-            order_result = await self.query_api(self._binance_client.create_order, **api_params)
+            order_result = await self.query_api("POST", "/api/v3/order", api_params, is_signed=True,
+                                                priority=AsyncCallPriority.CREATE)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
@@ -936,10 +1031,12 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def execute_cancel(self, trading_pair: str, order_id: str):
         try:
-            cancel_result = await self.query_api(self._binance_client.cancel_order,
-                                                 symbol=convert_to_exchange_trading_pair(trading_pair),
-                                                 origClientOrderId=order_id)
-        except BinanceAPIException as e:
+            cancel_result = await self.query_api("DELETE", "/api/v3/order",
+                                                 {"symbol": convert_to_exchange_trading_pair(trading_pair),
+                                                  "origClientOrderId": order_id},
+                                                 is_signed=True,
+                                                 priority=AsyncCallPriority.CANCEL)
+        except BinanceAPIError as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
                 self.logger().debug(f"The order {order_id} does not exist on Binance. No cancellation needed.")
@@ -974,7 +1071,7 @@ cdef class BinanceExchange(ExchangeBase):
             async with timeout(timeout_seconds):
                 cancellation_results = await safe_gather(*tasks, return_exceptions=True)
                 for cr in cancellation_results:
-                    if isinstance(cr, BinanceAPIException):
+                    if isinstance(cr, BinanceAPIError):
                         continue
                     if isinstance(cr, dict) and "origClientOrderId" in cr:
                         client_order_id = cr.get("origClientOrderId")
@@ -1029,12 +1126,12 @@ cdef class BinanceExchange(ExchangeBase):
     cdef object c_get_order_price_quantum(self, str trading_pair, object price):
         cdef:
             TradingRule trading_rule = self._trading_rules[trading_pair]
-        return trading_rule.min_price_increment
+        return trading_rule.price_quantum
 
     cdef object c_get_order_size_quantum(self, str trading_pair, object order_size):
         cdef:
             TradingRule trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_base_amount_increment)
+        return trading_rule.size_quantum
 
     cdef object c_quantize_order_amount(self, str trading_pair, object amount, object price=s_decimal_0):
         cdef:
@@ -1059,6 +1156,26 @@ cdef class BinanceExchange(ExchangeBase):
 
         return quantized_amount
 
+    cdef list c_quantize_order_prices(self, str trading_pair, list prices):
+        cdef:
+            TradingRule trading_rule = self._trading_rules[trading_pair]
+        return trading_rule.c_quantize_prices(prices)
+
+    cdef list c_quantize_order_amounts(self, str trading_pair, list amounts):
+        cdef:
+            TradingRule trading_rule
+            object current_price
+            object min_notional_size
+        if len(amounts) == 0:
+            return []
+        # The trading rule and the current price are looked up once for all the amounts.
+        trading_rule = self._trading_rules[trading_pair]
+        current_price = self.c_get_price(trading_pair, False)
+        min_notional_size = trading_rule.min_notional_size * Decimal("1.01")
+        return [s_decimal_0 if amount < trading_rule.min_order_size or current_price * amount < min_notional_size
+                else amount
+                for amount in trading_rule.c_quantize_amounts(amounts)]
+
     def get_price(self, trading_pair: str, is_buy: bool) -> Decimal:
         return self.c_get_price(trading_pair, is_buy)
 
@@ -1086,7 +1203,8 @@ cdef class BinanceExchange(ExchangeBase):
         return self.c_get_order_book(trading_pair)
 
     async def get_open_orders(self) -> List[OpenOrder]:
-        orders = await self.query_api(self._binance_client.get_open_orders)
+        orders = await self.query_api("GET", "/api/v3/openOrders", is_signed=True,
+                                      request_weight=self.OPEN_ORDERS_ALL_TRADING_PAIRS_WEIGHT)
         ret_val = []
         for order in orders:
             if BROKER_ID not in order["clientOrderId"]:
@@ -1110,8 +1228,9 @@ cdef class BinanceExchange(ExchangeBase):
     @async_ttl_cache(ttl=30, maxsize=1000)
     async def get_all_my_trades(self, trading_pair: str) -> List[Trade]:
         # Ths Binance API call rate is 5, so we cache to make sure we don't go over rate limit
-        trades = await self.query_api(self._binance_client.get_my_trades,
-                                      symbol=convert_to_exchange_trading_pair(trading_pair))
+        trades = await self.query_api("GET", "/api/v3/myTrades",
+                                      {"symbol": convert_to_exchange_trading_pair(trading_pair)},
+                                      is_signed=True)
         from hummingbot.connector.exchange.binance.binance_helper import format_trades
         return format_trades(trades)
 
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import hashlib
+import hmac
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional
+)
+from urllib.parse import urlencode
+
+import aiohttp
+import ujson
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallPriority
+from hummingbot.core.utils.asyncio_throttle import (
+    RequestWeight,
+    Throttler,
+)
+from hummingbot.core.utils.http_session_registry import HttpSessionRegistry
+from hummingbot.logger import HummingbotLogger
+
+BINANCE_REST_URL = "https://api.binance.{}"
+# Request weight the Binance API allows per minute, the heaviest requests, e.g. all the open orders, weigh 40.
+BINANCE_REQUEST_WEIGHT_LIMIT = (1200.0, 60.0)
+
+
+class BinanceAPIError(IOError):
+    """
+    Error response of the Binance REST API. `code` and `message` are the Binance error code and message of the
+    response, or 0 and the response text if the response body is not a Binance error.
+    """
+
+    def __init__(self, status_code: int, code: int, message: str, response: Any = None):
+        super().__init__(f"APIError(code={code}): {message}")
+        self.status_code: int = status_code
+        self.code: int = code
+        self.message: str = message
+        self.response: Any = response
+
+
+class BinanceRestClient:
+    """
+    Signed REST client for the Binance spot and futures APIs.
+
+    Requests are sent on a pooled session of the HttpSessionRegistry, so connections to the API host are kept alive and
+    reused, and any number of requests can be in flight at the same time. Signed requests are signed in-process with
+    HMAC-SHA256. Request weights are rate limited by the given throttler, which can be shared with other users of the
+    same API key.
+    """
+    _brc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._brc_logger is None:
+            cls._brc_logger = logging.getLogger(__name__)
+        return cls._brc_logger
+
+    def __init__(self,
+                 api_key: Optional[str],
+                 api_secret: Optional[str],
+                 base_url: str,
+                 throttler: Optional[Throttler] = None,
+                 time_provider: Callable[[], float] = time.time,
+                 recv_window: Optional[int] = None,
+                 request_timeout: float = 10.0,
+                 session_name: str = HttpSessionRegistry.DEFAULT_SESSION):
+        """
+        :param base_url: scheme and host of the API, e.g. https://api.binance.com
+        :param throttler: rate limiter of the request weights, a new one with the Binance default limit if None
+        :param time_provider: clock of the request timestamps, in seconds, e.g. synchronized with the server time
+        :param recv_window: milliseconds after the timestamp a request is valid for, the API default if None
+        :param request_timeout: seconds before a request times out
+        :param session_name: name of the shared session of the HttpSessionRegistry to send the requests on
+        """
+        self._api_key: Optional[str] = api_key
+        self._hmac: Optional[hmac.HMAC] = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256) \
+            if api_secret is not None else None
+        self._base_url: str = base_url.rstrip("/")
+        self._throttler: Throttler = throttler if throttler is not None else Throttler(BINANCE_REQUEST_WEIGHT_LIMIT)
+        self._time_provider: Callable[[], float] = time_provider
+        self._recv_window: Optional[int] = recv_window
+        self._request_timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=request_timeout)
+        self._session_name: str = session_name
+        self._headers: Dict[str, str] = {"X-MBX-APIKEY": api_key} if api_key is not None else {}
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def throttler(self) -> Throttler:
+        return self._throttler
+
+    def sign(self, query: str) -> str:
+        """
+        :return: the HMAC-SHA256 signature of the query string, as a hex string
+        """
+        if self._hmac is None:
+            raise ValueError("An API secret is required to sign Binance requests.")
+        signature: hmac.HMAC = self._hmac.copy()
+        signature.update(query.encode("utf-8"))
+        return signature.hexdigest()
+
+    def build_query(self, params: Optional[Dict[str, Any]] = None, is_signed: bool = False,
+                    add_timestamp: Optional[bool] = None) -> str:
+        params = dict(params) if params is not None else {}
+        if add_timestamp if add_timestamp is not None else is_signed:
+            params["timestamp"] = int(self._time_provider() * 1e3)
+            if self._recv_window is not None:
+                params["recvWindow"] = self._recv_window
+        query: str = urlencode(sorted(params.items()))
+        if is_signed:
+            query = f"{query}&signature={self.sign(query)}" if len(query) > 0 else f"signature={self.sign(query)}"
+        return query
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      params: Optional[Dict[str, Any]] = None,
+                      is_signed: bool = False,
+                      add_timestamp: Optional[bool] = None,
+                      request_weight: int = 1,
+                      return_err: bool = False,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> Any:
+        """
+        Sends a request, and returns its decoded JSON response.
+
+        :param method: HTTP method, e.g. GET
+        :param path: path of the endpoint, e.g. /api/v3/order
+        :param params: request parameters, sent in the query string
+        :param is_signed: whether the request needs the API key signature
+        :param add_timestamp: whether to add the timestamp parameter, defaults to is_signed
+        :param request_weight: weight of the endpoint, for the rate limit
+        :param return_err: return the decoded error response instead of raising a BinanceAPIError
+        :param limit_weights: weights of the request on the throttler's non global rate limits
+        :param priority: throttler lane of the request
+        """
+        async with self._throttler.weighted_task(request_weight, limit_weights=limit_weights, priority=priority):
+            # The query is built after the throttler wait, so that the timestamp is the time the request is sent.
+            url: str = f"{self._base_url}{path}"
+            query: str = self.build_query(params, is_signed=is_signed, add_timestamp=add_timestamp)
+            if len(query) > 0:
+                url = f"{url}?{query}"
+            return await self._send(method, path, url, return_err)
+
+    async def _send(self, method: str, path: str, url: str, return_err: bool) -> Any:
+        session: aiohttp.ClientSession = HttpSessionRegistry.get_instance().get_session(self._session_name)
+        async with session.request(method, url, headers=self._headers, timeout=self._request_timeout) as response:
+            text: str = await response.text()
+            try:
+                data: Any = ujson.loads(text) if len(text) > 0 else {}
+            except ValueError:
+                data = None
+            if response.status != 200:
+                if return_err and data is not None:
+                    return data
+                if isinstance(data, dict) and "code" in data:
+                    raise BinanceAPIError(response.status, data["code"], data.get("msg", ""), data)
+                raise BinanceAPIError(response.status, 0,
+                                      f"Error fetching data from {path}. HTTP status is {response.status}. "
+                                      f"Request Error: {text}", data)
+            if data is None:
+                raise BinanceAPIError(response.status, 0, f"Invalid JSON response from {path}: {text}")
+            return data
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        return await self.request("GET", path, params, **kwargs)
+
+    async def post(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        return await self.request("POST", path, params, **kwargs)
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        return await self.request("DELETE", path, params, **kwargs)
@@ -2,7 +2,6 @@
 import asyncio
 import logging
 import time
-import aiohttp
 import traceback
 import pandas as pd
 import hummingbot.connector.exchange.digifinex.digifinex_constants as constants
@@ -12,6 +11,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 from . import digifinex_utils
 from .digifinex_active_order_tracker import DigifinexActiveOrderTracker
@@ -41,19 +41,19 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{constants.REST_URL}/ticker")
-            resp_json = await resp.json()
-            for t_pair in trading_pairs:
-                last_trade = [o["last"] for o in resp_json["ticker"] if o["symbol"] ==
-                              digifinex_utils.convert_to_exchange_trading_pair(t_pair)]
-                if last_trade and last_trade[0] is not None:
-                    result[t_pair] = last_trade[0]
+        async with shared_client_session() as client:
+            async with client.get(f"{constants.REST_URL}/ticker") as resp:
+                resp_json = await resp.json()
+                for t_pair in trading_pairs:
+                    last_trade = [o["last"] for o in resp_json["ticker"] if o["symbol"] ==
+                                  digifinex_utils.convert_to_exchange_trading_pair(t_pair)]
+                    if last_trade and last_trade[0] is not None:
+                        result[t_pair] = last_trade[0]
         return result
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}/ticker", timeout=10) as response:
                 if response.status == 200:
                     from hummingbot.connector.exchange.digifinex.digifinex_utils import \
@@ -71,20 +71,20 @@ class DigifinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
-            orderbook_response = await client.get(
+        async with shared_client_session() as client:
+            async with client.get(
                 f"{constants.REST_URL}/order_book?limit=150&symbol="
                 f"{digifinex_utils.convert_to_exchange_trading_pair(trading_pair)}"
-            )
+            ) as orderbook_response:
 
-            if orderbook_response.status != 200:
-                raise IOError(
-                    f"Error fetching OrderBook for {trading_pair} at {constants.EXCHANGE_NAME}. "
-                    f"HTTP status is {orderbook_response.status}."
-                )
+                if orderbook_response.status != 200:
+                    raise IOError(
+                        f"Error fetching OrderBook for {trading_pair} at {constants.EXCHANGE_NAME}. "
+                        f"HTTP status is {orderbook_response.status}."
+                    )
 
-            orderbook_data: List[Dict[str, Any]] = await safe_gather(orderbook_response.json())
-            orderbook_data = orderbook_data[0]
+                orderbook_data: List[Dict[str, Any]] = await safe_gather(orderbook_response.json())
+                orderbook_data = orderbook_data[0]
         return orderbook_data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
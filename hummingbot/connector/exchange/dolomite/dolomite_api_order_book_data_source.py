@@ -16,6 +16,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.connector.exchange.dolomite.dolomite_active_order_tracker import DolomiteActiveOrderTracker
 from hummingbot.connector.exchange.dolomite.dolomite_order_book import DolomiteOrderBook
 from hummingbot.connector.exchange.dolomite.dolomite_order_book_tracker_entry import DolomiteOrderBookTrackerEntry
@@ -59,40 +60,40 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             # Hard coded to use the live exchange api for auto completing markets (opposed to using testnet)
-            markets_response: aiohttp.ClientResponse = await client.get(
+            async with client.get(
                 f"https://exchange-api.dolomite.io{MARKETS_URL}"
-            )
-
-            if markets_response.status != 200:
-                raise IOError(f"Error fetching active Dolomite markets. HTTP status is {markets_response.status}.")
-
-            markets_data = await markets_response.json()
-            markets_data = markets_data["data"]
-
-            field_mapping = {
-                "market": "market",
-                "primary_token": "baseAsset",
-                "primary_ticker_decimal_places": "int",
-                "secondary_token": "quoteAsset",
-                "secondary_ticker_price_decimal_places": "int",
-                "period_volume": "volume",
-                "period_volume_usd": "USDVolume",
-            }
-
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(
-                data=markets_data, index="market", columns=list(field_mapping.keys())
-            )
+            ) as markets_response:
+
+                if markets_response.status != 200:
+                    raise IOError(f"Error fetching active Dolomite markets. HTTP status is {markets_response.status}.")
+
+                markets_data = await markets_response.json()
+                markets_data = markets_data["data"]
+
+                field_mapping = {
+                    "market": "market",
+                    "primary_token": "baseAsset",
+                    "primary_ticker_decimal_places": "int",
+                    "secondary_token": "quoteAsset",
+                    "secondary_ticker_price_decimal_places": "int",
+                    "period_volume": "volume",
+                    "period_volume_usd": "USDVolume",
+                }
+
+                all_markets: pd.DataFrame = pd.DataFrame.from_records(
+                    data=markets_data, index="market", columns=list(field_mapping.keys())
+                )
 
-            def obj_to_decimal(c):
-                return Decimal(c["amount"]) / Decimal(math.pow(10, c["currency"]["precision"]))
+                def obj_to_decimal(c):
+                    return Decimal(c["amount"]) / Decimal(math.pow(10, c["currency"]["precision"]))
 
-            all_markets.rename(field_mapping, axis="columns", inplace=True)
-            all_markets["USDVolume"] = all_markets["USDVolume"].map(obj_to_decimal)
-            all_markets["volume"] = all_markets["volume"].map(obj_to_decimal)
+                all_markets.rename(field_mapping, axis="columns", inplace=True)
+                all_markets["USDVolume"] = all_markets["USDVolume"].map(obj_to_decimal)
+                all_markets["volume"] = all_markets["volume"].map(obj_to_decimal)
 
-            return all_markets.sort_values("USDVolume", ascending=False)
+                return all_markets.sort_values("USDVolume", ascending=False)
 
     @property
     def order_book_class(self) -> DolomiteOrderBook:
@@ -102,7 +103,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             from hummingbot.connector.exchange.dolomite.dolomite_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get("https://exchange-api.dolomite.io/v1/markets", timeout=10) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -143,7 +144,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: List[str] = await self.get_trading_pairs()
             retval: Dict[str, DolomiteOrderBookTrackerEntry] = {}
             number_of_pairs: int = len(trading_pairs)
@@ -18,6 +18,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_registry import shared_client_session
 
 
 MARKETS_URL = "/markets"
@@ -68,13 +69,13 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{DYDX_V1_API_URL}{TICKER_URL}")
-            resp_json = await resp.json()
-            retval = {}
-            for pair in trading_pairs:
-                retval[pair] = float(resp_json["markets"][convert_v2_pair_to_v1(pair)]["last"])
-            return retval
+        async with shared_client_session() as client:
+            async with client.get(f"{DYDX_V1_API_URL}{TICKER_URL}") as resp:
+                resp_json = await resp.json()
+                retval = {}
+                for pair in trading_pairs:
+                    retval[pair] = float(resp_json["markets"][convert_v2_pair_to_v1(pair)]["last"])
+                return retval
 
     @property
     def order_book_class(self) -> DydxOrderBook:
@@ -96,7 +97,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = DydxOrderBook.snapshot_message_from_exchange(
@@ -133,7 +134,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(DYDX_MARKET_INFO_URL.format(""), timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -20,6 +20,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.eterbase.eterbase_order_book import EterbaseOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.connector.exchange.eterbase.eterbase_active_order_tracker import EterbaseActiveOrderTracker
@@ -53,12 +54,12 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{constants.REST_URL}/tickers")
-            resp_json = await resp.json()
-            for trading_pair in trading_pairs:
-                resp_record = [o for o in resp_json if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
-                results[trading_pair] = float(resp_record["price"])
+        async with shared_client_session() as client:
+            async with client.get(f"{constants.REST_URL}/tickers") as resp:
+                resp_json = await resp.json()
+                for trading_pair in trading_pairs:
+                    resp_record = [o for o in resp_json if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
+                    results[trading_pair] = float(resp_record["price"])
         return results
 
     @classmethod
@@ -68,7 +69,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         *required
         Returns all currently active BTC trading pairs from Eterbase, sorted by volume in descending order.
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -156,7 +157,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         """
         tp_map_mid: Dict[str, str] = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{constants.REST_URL}/markets") as products_response:
                 products_response: aiohttp.ClientResponse = products_response
                 if products_response.status != 200:
@@ -171,7 +172,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.exchange.eterbase.eterbase_utils import convert_from_exchange_trading_pair
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get("https://api.eterbase.exchange/api/markets", timeout=10) as response:
                     if response.status == 200:
                         markets = await response.json()
@@ -207,7 +208,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             td_map_id: Dict[str, str] = await self.get_map_marketid()
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
@@ -315,7 +316,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
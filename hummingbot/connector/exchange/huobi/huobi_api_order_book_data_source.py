@@ -23,6 +23,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.huobi.huobi_order_book import HuobiOrderBook
 from hummingbot.connector.exchange.huobi.huobi_utils import convert_to_exchange_trading_pair
+from hummingbot.core.utils.http_session_registry import shared_client_session
 
 HUOBI_SYMBOLS_URL = "https://api.huobi.pro/v1/common/symbols"
 HUOBI_TICKER_URL = "https://api.huobi.pro/market/tickers"
@@ -49,12 +50,12 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(HUOBI_TICKER_URL)
-            resp_json = await resp.json()
-            for trading_pair in trading_pairs:
-                resp_record = [o for o in resp_json["data"] if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
-                results[trading_pair] = float(resp_record["close"])
+        async with shared_client_session() as client:
+            async with client.get(HUOBI_TICKER_URL) as resp:
+                resp_json = await resp.json()
+                for trading_pair in trading_pairs:
+                    resp_record = [o for o in resp_json["data"] if o["symbol"] == convert_to_exchange_trading_pair(trading_pair)][0]
+                    results[trading_pair] = float(resp_record["close"])
         return results
 
     @staticmethod
@@ -62,7 +63,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.exchange.huobi.huobi_utils import convert_from_exchange_trading_pair
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(HUOBI_SYMBOLS_URL, timeout=10) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -98,7 +99,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
                 snapshot,
@@ -203,7 +204,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -30,6 +30,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.kucoin.kucoin_order_book import KucoinOrderBook
 from hummingbot.connector.exchange.kucoin.kucoin_active_order_tracker import KucoinActiveOrderTracker
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_registry import shared_client_session
 
 SNAPSHOT_REST_URL = "https://api.kucoin.com/api/v2/market/orderbook/level2"
 DIFF_STREAM_URL = ""
@@ -92,7 +93,7 @@ class KucoinWSConnectionIterator:
 
     @staticmethod
     async def get_ws_connection_context() -> WSConnectionContext:
-        async with aiohttp.ClientSession() as session:
+        async with shared_client_session() as session:
             async with session.post('https://api.kucoin.com/api/v1/bullet-public', data=b'') as resp:
                 response: aiohttp.ClientResponse = resp
                 if response.status != 200:
@@ -295,12 +296,12 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(TICKER_PRICE_CHANGE_URL)
-            resp_json = await resp.json()
-            for trading_pair in trading_pairs:
-                resp_record = [o for o in resp_json["data"]["ticker"] if o["symbolName"] == trading_pair][0]
-                results[trading_pair] = float(resp_record["last"])
+        async with shared_client_session() as client:
+            async with client.get(TICKER_PRICE_CHANGE_URL) as resp:
+                resp_json = await resp.json()
+                for trading_pair in trading_pairs:
+                    resp_record = [o for o in resp_json["data"]["ticker"] if o["symbolName"] == trading_pair][0]
+                    results[trading_pair] = float(resp_record["last"])
         return results
 
     async def get_trading_pairs(self) -> List[str]:
@@ -318,7 +319,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(EXCHANGE_INFO_URL, timeout=5) as response:
                 if response.status == 200:
                     try:
@@ -342,7 +343,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
@@ -517,7 +518,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
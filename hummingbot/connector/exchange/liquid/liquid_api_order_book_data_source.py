@@ -9,6 +9,7 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -37,13 +38,13 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(Constants.GET_EXCHANGE_MARKETS_URL)
-            resp_json = await resp.json()
-            for record in resp_json:
-                trading_pair = f"{record['base_currency']}-{record['quoted_currency']}"
-                if trading_pair in trading_pairs:
-                    results[trading_pair] = float(record["last_traded_price"])
+        async with shared_client_session() as client:
+            async with client.get(Constants.GET_EXCHANGE_MARKETS_URL) as resp:
+                resp_json = await resp.json()
+                for record in resp_json:
+                    trading_pair = f"{record['base_currency']}-{record['quoted_currency']}"
+                    if trading_pair in trading_pairs:
+                        results[trading_pair] = float(record["last_traded_price"])
         return results
 
     @staticmethod
@@ -136,16 +137,15 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         |-- cfd_enabled: bool
         |-- last_event_timestamp: str
         """
-        async with aiohttp.ClientSession() as client:
-            exchange_markets_response: aiohttp.ClientResponse = await client.get(
-                Constants.GET_EXCHANGE_MARKETS_URL)
+        async with shared_client_session() as client:
+            async with client.get(Constants.GET_EXCHANGE_MARKETS_URL) as exchange_markets_response:
 
-            if exchange_markets_response.status != 200:
-                raise IOError(f"Error fetching Liquid markets information. "
-                              f"HTTP status is {exchange_markets_response.status}.")
+                if exchange_markets_response.status != 200:
+                    raise IOError(f"Error fetching Liquid markets information. "
+                                  f"HTTP status is {exchange_markets_response.status}.")
 
-            exchange_markets_data = await exchange_markets_response.json()
-            return exchange_markets_data
+                exchange_markets_data = await exchange_markets_response.json()
+                return exchange_markets_data
 
     @classmethod
     def filter_market_data(cls, exchange_markets_data) -> (List[dict]):
@@ -163,7 +163,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             # Returns a List of str, representing each active trading pair on the exchange.
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"{Constants.BASE_URL}{Constants.PRODUCTS_URI}", timeout=10) as response:
                     if response.status == 200:
                         products: List[Dict[str, Any]] = await response.json()
@@ -237,7 +237,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         await self.get_trading_pairs()
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
@@ -256,7 +256,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         active markets
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
 
             trading_pairs: List[str] = await self.get_trading_pairs()
 
@@ -397,7 +397,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
@@ -22,6 +22,7 @@ from hummingbot.logger import HummingbotLogger
 # from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_registry import shared_client_session
 
 
 MARKETS_URL = "/api/v3/exchange/markets"
@@ -55,10 +56,10 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
-            resp_json = await resp.json()
-            return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
+        async with shared_client_session() as client:
+            async with client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs))) as resp:
+                resp_json = await resp.json()
+                return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
 
     @property
     def order_book_class(self) -> LoopringOrderBook:
@@ -80,7 +81,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot["data"] = {"bids": snapshot["bids"], "asks": snapshot["asks"]}
             snapshot_timestamp: float = time.time()
@@ -117,7 +118,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"https://api3.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
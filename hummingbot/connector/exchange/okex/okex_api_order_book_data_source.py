@@ -21,6 +21,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.okex.okex_order_book import OkexOrderBook
 from hummingbot.connector.exchange.okex.constants import (
@@ -64,7 +65,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Refer to Calling a Class method for an example on how to test this particular function.
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(OKEX_SYMBOLS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -81,7 +82,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         # Returns a List of str, representing each active trading pair on the exchange.
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(OKEX_SYMBOLS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -98,7 +99,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return trading_pairs
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
 
             snapshot_msg: OrderBookMessage = OkexOrderBook.snapshot_message_from_exchange(
@@ -113,7 +114,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     # Move this to OrderBookTrackerDataSource or this needs a whole refactor?
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(OKEX_SYMBOLS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -266,7 +267,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
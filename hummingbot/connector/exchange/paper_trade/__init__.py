@@ -1,5 +1,6 @@
 from typing import List, Callable
 from hummingbot.client.config.config_helpers import get_connector_class
+from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.client.settings import CONNECTOR_SETTINGS
@@ -23,6 +24,9 @@ def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
     obt_class = get_order_book_tracker_class(exchange_name)
     conn_setting = CONNECTOR_SETTINGS[exchange_name]
     obt_params = {"trading_pairs": trading_pairs}
+    market_config = MarketConfig.default_config()
+    if global_config_map.get("paper_trade_queue_position_enabled").value:
+        market_config = market_config._replace(queue_position_enabled=True)
     return PaperTradeExchange(obt_class(**conn_setting.add_domain_parameter(obt_params)),
-                              MarketConfig.default_config(),
+                              market_config,
                               get_connector_class(exchange_name))
@@ -13,11 +13,16 @@ class AssetType(Enum):
 class MarketConfig(namedtuple("_MarketConfig", "buy_fees_asset,"
                                                "buy_fees_amount,"
                                                "sell_fees_asset,"
-                                               "sell_fees_amount,")):
+                                               "sell_fees_amount,"
+                                               "queue_position_enabled",
+                              defaults=(False,))):
     buy_fees_asset: AssetType
     buy_fees_amount: Decimal
     sell_fees_asset: AssetType
     sell_fees_amount: Decimal
+    # Fill limit orders only once the volume queued ahead of them at their price has traded, possibly partially,
+    # rather than as soon as the market touches their price.
+    queue_position_enabled: bool
 
     @classmethod
     def default_config(cls) -> "MarketConfig":
@@ -37,6 +37,13 @@ cdef class PaperTradeExchange(ExchangeBase):
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
+        bint _queue_position_enabled
+        dict _queue_positions
+        dict _queue_levels
+        dict _best_order_prices
+        dict _checked_book_prices
+        object _limit_orders_cache
+        object _available_balances_cache
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -70,8 +77,23 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
+    cdef bint c_limit_orders_may_cross(self, bint is_buy, LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef c_invalidate_limit_orders(self, str trading_pair, bint is_buy)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_add_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object amount)
+    cdef c_remove_queue_position(self, str order_id)
+    cdef c_update_queue_positions(self)
+    cdef c_match_trade_to_queue_positions(self,
+                                          bint is_maker_buy,
+                                          LimitOrders *limit_orders_map_ptr,
+                                          object order_book_trade_event)
+    cdef c_partially_fill_limit_order(self,
+                                      bint is_buy,
+                                      LimitOrders *limit_orders_map_ptr,
+                                      LimitOrdersIterator *map_it_ptr,
+                                      SingleTradingPairLimitOrdersIterator orders_it,
+                                      object amount)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
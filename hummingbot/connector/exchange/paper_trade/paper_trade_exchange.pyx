@@ -14,6 +14,7 @@ import random
 from typing import (
     Dict,
     List,
+    Optional,
     Tuple)
 from cython.operator cimport(
     postincrement as inc,
@@ -131,6 +132,38 @@ cdef class QueuedOrder:
                 f"{self.amount})")
 
 
+cdef class QueuePosition:
+    """
+    Estimated place of a paper limit order in the queue of its price level, in queue position mode. The order fills
+    once the volume ahead of it has traded.
+    """
+    cdef:
+        readonly str order_id
+        readonly str trading_pair
+        readonly bint is_buy
+        readonly object price
+        # Amounts in base asset, as Decimals.
+        public object remaining
+        public object queue_ahead
+        public object filled_base
+        public object filled_quote
+
+    def __init__(self, order_id: str, trading_pair: str, is_buy: bool, price: Decimal, amount: Decimal,
+                 queue_ahead: Decimal):
+        self.order_id = order_id
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.remaining = amount
+        self.queue_ahead = queue_ahead
+        self.filled_base = s_decimal_0
+        self.filled_quote = s_decimal_0
+
+    def __repr__(self) -> str:
+        return (f"QueuePosition('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"remaining={self.remaining}, queue_ahead={self.queue_ahead}, filled_base={self.filled_base})")
+
+
 cdef class OrderBookTradeListener(EventListener):
     cdef:
         ExchangeBase _market
@@ -187,6 +220,17 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._queue_position_enabled = config.queue_position_enabled
+        # order id -> QueuePosition
+        self._queue_positions = {}
+        # (trading pair, is buy) -> price -> order id -> QueuePosition, in order placement order within a price level
+        self._queue_levels = {}
+        # (trading pair, is buy) -> price of the best limit order, and the opposite top of book it was last checked
+        # against for crossing, as doubles.
+        self._best_order_prices = {}
+        self._checked_book_prices = {}
+        self._limit_orders_cache = None
+        self._available_balances_cache = None
 
     @classmethod
     def random_order_id(cls, order_side: str, trading_pair: str) -> str:
@@ -207,6 +251,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         return self._target_market.split_trading_pair(trading_pair)
 
     #  <editor-fold desc="Property">
+    @property
+    def order_book_tracker(self) -> OrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def trading_pair(self) -> Dict[str, TradingPair]:
         return self._trading_pairs
@@ -245,8 +293,18 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def queue_position_enabled(self) -> bool:
+        return self._queue_position_enabled
+
+    def get_queue_position(self, order_id: str) -> Optional[QueuePosition]:
+        return self._queue_positions.get(order_id)
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
+        """
+        Cached until a limit order is placed, filled or removed.
+        """
         cdef:
             LimitOrdersIterator map_it
             SingleTradingPairLimitOrders *single_trading_pair_collection_ptr
@@ -255,6 +313,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             const CPPLimitOrder *cpp_limit_order_ptr
             list retval = []
 
+        if self._limit_orders_cache is not None:
+            return list(self._limit_orders_cache)
+
         map_it = self._bid_limit_orders.begin()
         while map_it != self._bid_limit_orders.end():
             single_trading_pair_collection_ptr = address(deref(map_it).second)
@@ -275,7 +336,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 inc(collection_it)
             inc(map_it)
 
-        return retval
+        self._limit_orders_cache = retval
+        return list(retval)
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
@@ -289,10 +351,16 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
-        _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
-        return _available_balances
+        """
+        Cached until a balance changes or a limit order is placed, filled or removed.
+        """
+        if self._available_balances_cache is None:
+            on_hold_balances = self.on_hold_balances
+            _available_balances = self._account_balances.copy()
+            for trading_pair_str, balance in _available_balances.items():
+                _available_balances[trading_pair_str] -= on_hold_balances[trading_pair_str]
+            self._available_balances_cache = _available_balances
+        return self._available_balances_cache.copy()
 
     # </editor-fold>
 
@@ -311,6 +379,7 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     cdef c_set_balance(self, str currency, object balance):
         self._account_balances[currency.upper()] = Decimal(balance)
+        self._available_balances_cache = None
 
     cdef object c_get_balance(self, str currency):
         if currency.upper() not in self._account_balances:
@@ -322,6 +391,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
         self.c_process_crossed_limit_orders()
+        if self._queue_position_enabled:
+            self.c_update_queue_positions()
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -368,6 +439,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_invalidate_limit_orders(trading_pair_str, True)
+            if self._queue_position_enabled:
+                self.c_add_queue_position(order_id, trading_pair_str, True, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -422,6 +496,9 @@ cdef class PaperTradeExchange(ExchangeBase):
                 <PyObject *> quantized_price,
                 <PyObject *> quantized_amount
             ))
+            self.c_invalidate_limit_orders(trading_pair_str, False)
+            if self._queue_position_enabled:
+                self.c_add_queue_position(order_id, trading_pair_str, False, quantized_price, quantized_amount)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -567,10 +644,18 @@ cdef class PaperTradeExchange(ExchangeBase):
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            str trading_pair
+            bint is_buy
         try:
+            trading_pair = deref(orders_it).getTradingPair().decode("utf8")
+            is_buy = deref(orders_it).getIsBuy()
+            self.c_invalidate_limit_orders(trading_pair, is_buy)
+            if self._queue_position_enabled:
+                self.c_remove_queue_position(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
+                self._checked_book_prices.pop((trading_pair, is_buy), None)
             return True
         except Exception as err:
             self.logger().error("Error deleting limit order.", exc_info=True)
@@ -590,6 +675,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
                                         <object> cpp_limit_order_ptr.getQuantity()
             object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            QueuePosition queue_position = self._queue_positions.get(order_id)
+            object total_base_traded = base_asset_traded
+            object total_quote_traded = quote_asset_traded
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if quote_asset_balance < quote_asset_traded:
@@ -611,6 +699,12 @@ cdef class PaperTradeExchange(ExchangeBase):
         # add fee
         fees = estimate_fee(self.name, True)
 
+        if queue_position is not None:
+            # The order was partially filled before.
+            total_base_traded += queue_position.filled_base
+            total_quote_traded += queue_position.filled_quote
+            queue_position.remaining = s_decimal_0
+
         # Emit the trade and order completed events.
         config = self._config
         self.c_trigger_event(
@@ -634,8 +728,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                total_base_traded,
+                total_quote_traded,
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -655,6 +749,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
                                         <object> cpp_limit_order_ptr.getQuantity()
             object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+            QueuePosition queue_position = self._queue_positions.get(order_id)
+            object total_base_traded = base_asset_traded
+            object total_quote_traded = quote_asset_traded
 
         # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
         if base_asset_balance < base_asset_traded:
@@ -675,6 +772,12 @@ cdef class PaperTradeExchange(ExchangeBase):
         # add fee
         fees = estimate_fee(self.name, True)
 
+        if queue_position is not None:
+            # The order was partially filled before.
+            total_base_traded += queue_position.filled_base
+            total_quote_traded += queue_position.filled_quote
+            queue_position.remaining = s_decimal_0
+
         # Emit the trade and order completed events.
         config = self._config
         self.c_trigger_event(
@@ -698,8 +801,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 base_asset,
                 quote_asset,
                 base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
+                total_base_traded,
+                total_quote_traded,
                 s_decimal_0,
                 OrderType.LIMIT
             ))
@@ -726,23 +829,36 @@ cdef class PaperTradeExchange(ExchangeBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        In queue position mode, an opposite price equal to the limit order's price doesn't fill it, the order waits
+        for its turn in the queue of its price level instead.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
         """
         cdef:
             str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double opposite_order_book_price
+            double order_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        try:
+            opposite_order_book_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            return
+
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                if opposite_order_book_price > order_price:
+                    break
+                if self._queue_position_enabled and opposite_order_book_price == order_price:
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -750,7 +866,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
+                order_price = float(<object>cpp_limit_order_ptr.getPrice())
+                if opposite_order_book_price < order_price:
+                    break
+                if self._queue_position_enabled and opposite_order_book_price == order_price:
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
@@ -758,29 +877,79 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
-    cdef c_process_crossed_limit_orders(self):
+    cdef bint c_limit_orders_may_cross(self, bint is_buy, LimitOrdersIterator *map_it_ptr):
+        """
+        Checks the best limit order of a trading pair side against the opposite top of book, as doubles. The order
+        book keeps its top of book as doubles, a side is only looked at again once its top of book moved or its limit
+        orders changed.
+
+        :return: whether the best limit order is crossed
+        """
         cdef:
-            LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
-            LimitOrdersIterator map_it = limit_orders_ptr.begin()
+            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
+            tuple key = (trading_pair, is_buy)
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double opposite_order_book_price
+            double best_order_price
+            object cached_price = self._best_order_prices.get(key)
 
-        while map_it != limit_orders_ptr.end():
-            self.c_process_crossed_limit_orders_for_trading_pair(True, limit_orders_ptr, address(map_it))
-            if map_it != limit_orders_ptr.end():
-                inc(map_it)
+        try:
+            opposite_order_book_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            return False
 
-        limit_orders_ptr = address(self._ask_limit_orders)
-        map_it = limit_orders_ptr.begin()
+        if cached_price is None:
+            if is_buy:
+                best_order_price = float(<object>deref(orders_collection_ptr.rbegin()).getPrice())
+            else:
+                best_order_price = float(<object>deref(orders_collection_ptr.begin()).getPrice())
+            self._best_order_prices[key] = best_order_price
+        else:
+            if self._checked_book_prices.get(key) == opposite_order_book_price:
+                return False
+            best_order_price = cached_price
+        self._checked_book_prices[key] = opposite_order_book_price
 
-        while map_it != limit_orders_ptr.end():
-            self.c_process_crossed_limit_orders_for_trading_pair(False, limit_orders_ptr, address(map_it))
-            if map_it != limit_orders_ptr.end():
-                inc(map_it)
+        if is_buy:
+            return (opposite_order_book_price < best_order_price or
+                    (opposite_order_book_price == best_order_price and not self._queue_position_enabled))
+        return (opposite_order_book_price > best_order_price or
+                (opposite_order_book_price == best_order_price and not self._queue_position_enabled))
+
+    cdef c_process_crossed_limit_orders(self):
+        cdef:
+            LimitOrders *limit_orders_ptr
+            LimitOrdersIterator map_it
+            LimitOrdersIterator next_map_it
+
+        for is_buy in (True, False):
+            limit_orders_ptr = address(self._bid_limit_orders) if is_buy else address(self._ask_limit_orders)
+            map_it = limit_orders_ptr.begin()
+            while map_it != limit_orders_ptr.end():
+                # Processing the trading pair may erase it from the map, which leaves the other iterators valid.
+                next_map_it = map_it
+                inc(next_map_it)
+                if self.c_limit_orders_may_cross(is_buy, address(map_it)):
+                    self.c_process_crossed_limit_orders_for_trading_pair(is_buy, limit_orders_ptr, address(map_it))
+                map_it = next_map_it
+
+    cdef c_invalidate_limit_orders(self, str trading_pair, bint is_buy):
+        """
+        Called when the limit orders of a trading pair side change.
+        """
+        self._best_order_prices.pop((trading_pair, is_buy), None)
+        self._limit_orders_cache = None
+        self._available_balances_cache = None
 
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
 
+        In queue position mode, the trade also fills the limit orders at its price, in queue order, with what is left
+        of it after the volume queued ahead of them.
+
         :param order_book_trade_event: trade event from order book
         """
         cdef:
@@ -823,10 +992,220 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+        if self._queue_position_enabled:
+            self.c_match_trade_to_queue_positions(is_maker_buy, limit_orders_map_ptr, order_book_trade_event)
+
+    cdef c_add_queue_position(self, str order_id, str trading_pair, bint is_buy, object price, object amount):
+        """
+        Queues a new limit order behind the volume resting at its price in the order book, and behind the paper
+        orders already at that price.
+        """
+        cdef:
+            OrderBook order_book = self.order_books[trading_pair]
+            dict levels = self._queue_levels.setdefault((trading_pair, is_buy), {})
+            dict level = levels.setdefault(price, {})
+            object queue_ahead = Decimal(str(order_book.c_get_amount_at_price(is_buy, float(price))))
+            QueuePosition queue_position
+
+        for queue_position in level.values():
+            queue_ahead += queue_position.remaining
+        queue_position = QueuePosition(order_id, trading_pair, is_buy, price, amount, queue_ahead)
+        level[order_id] = queue_position
+        self._queue_positions[order_id] = queue_position
+
+    cdef c_remove_queue_position(self, str order_id):
+        """
+        Takes a limit order out of the queue of its price level. What was left of the order no longer is ahead of
+        the orders queued behind it.
+        """
+        cdef:
+            QueuePosition queue_position = self._queue_positions.pop(order_id, None)
+            QueuePosition other_position
+            dict levels
+            dict level
+            bint is_behind = False
+
+        if queue_position is None:
+            return
+        levels = self._queue_levels[(queue_position.trading_pair, queue_position.is_buy)]
+        level = levels[queue_position.price]
+        for other_position in level.values():
+            if is_behind:
+                other_position.queue_ahead = max(other_position.queue_ahead - queue_position.remaining, s_decimal_0)
+            elif other_position is queue_position:
+                is_behind = True
+        del level[order_id]
+        if len(level) == 0:
+            del levels[queue_position.price]
+
+    cdef c_update_queue_positions(self):
+        """
+        Brings the queue of each price level with paper orders down to the volume left at that price in the order
+        book. The volume removed from a level is assumed to have been ahead of the paper orders.
+        """
+        cdef:
+            OrderBook order_book
+            QueuePosition queue_position
+            object book_amount
+            object paper_ahead
+
+        for (trading_pair, is_buy), levels in self._queue_levels.items():
+            order_book = self.order_books[trading_pair]
+            for price, level in levels.items():
+                book_amount = Decimal(str(order_book.c_get_amount_at_price(is_buy, float(price))))
+                paper_ahead = s_decimal_0
+                for queue_position in level.values():
+                    if queue_position.queue_ahead > book_amount + paper_ahead:
+                        queue_position.queue_ahead = book_amount + paper_ahead
+                    paper_ahead += queue_position.remaining
+
+    cdef c_match_trade_to_queue_positions(self,
+                                          bint is_maker_buy,
+                                          LimitOrders *limit_orders_map_ptr,
+                                          object order_book_trade_event):
+        """
+        Fills the limit orders at the price of a trade, with the trade volume left after the volume queued ahead of
+        each order. The orders are looked up through the price level index, not by walking the order collection.
+        """
+        cdef:
+            str trading_pair = order_book_trade_event.trading_pair
+            string cpp_trading_pair = trading_pair.encode("utf8")
+            dict levels = self._queue_levels.get((trading_pair, is_maker_buy))
+            dict level
+            object trade_amount
+            object fill_amount
+            object order_price
+            object order_remaining
+            QueuePosition queue_position
+            LimitOrdersIterator map_it
+            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
+            SingleTradingPairLimitOrdersIterator orders_it
+
+        if levels is None:
+            return
+        level = levels.get(Decimal(str(order_book_trade_event.price)))
+        if level is None:
+            return
+        trade_amount = Decimal(str(order_book_trade_event.amount))
+        for queue_position in list(level.values()):
+            fill_amount = min(trade_amount - queue_position.queue_ahead, queue_position.remaining)
+            queue_position.queue_ahead = max(queue_position.queue_ahead - trade_amount, s_decimal_0)
+            if fill_amount <= s_decimal_0:
+                continue
+            map_it = limit_orders_map_ptr.find(cpp_trading_pair)
+            if map_it == limit_orders_map_ptr.end():
+                return
+            orders_collection_ptr = address(deref(map_it).second)
+            order_price = queue_position.price
+            order_remaining = queue_position.remaining
+            # The orders are sorted by price then order id, the other fields are not part of the key.
+            orders_it = orders_collection_ptr.find(CPPLimitOrder(
+                queue_position.order_id.encode("utf8"),
+                cpp_trading_pair,
+                is_maker_buy,
+                b"",
+                b"",
+                <PyObject *> order_price,
+                <PyObject *> order_remaining
+            ))
+            if orders_it == orders_collection_ptr.end():
+                continue
+            self.c_partially_fill_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it,
+                                              fill_amount)
+
+    cdef c_partially_fill_limit_order(self,
+                                      bint is_buy,
+                                      LimitOrders *limit_orders_map_ptr,
+                                      LimitOrdersIterator *map_it_ptr,
+                                      SingleTradingPairLimitOrdersIterator orders_it,
+                                      object amount):
+        """
+        Fills part of a limit order. The order stays in the order collection with its remaining quantity, unless the
+        fill completes it.
+        """
+        cdef:
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            string cpp_order_id = cpp_limit_order_ptr.getClientOrderID()
+            string cpp_trading_pair = cpp_limit_order_ptr.getTradingPair()
+            string cpp_base_asset = cpp_limit_order_ptr.getBaseCurrency()
+            string cpp_quote_asset = cpp_limit_order_ptr.getQuoteCurrency()
+            str order_id = cpp_order_id.decode("utf8")
+            str trading_pair = cpp_trading_pair.decode("utf8")
+            str base_asset = cpp_base_asset.decode("utf8")
+            str quote_asset = cpp_quote_asset.decode("utf8")
+            object price = <object> cpp_limit_order_ptr.getPrice()
+            object remaining = <object> cpp_limit_order_ptr.getQuantity()
+            object quote_asset_traded = price * amount
+            object new_remaining = remaining - amount
+            QueuePosition queue_position = self._queue_positions.get(order_id)
+
+        if amount >= remaining:
+            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            return
+
+        try:
+            # Check if there's enough balance for the fill. If not, remove the limit order without doing anything.
+            if ((is_buy and self.c_get_balance(quote_asset) < quote_asset_traded) or
+                    (not is_buy and self.c_get_balance(base_asset) < amount)):
+                self.logger().warning(f"Not enough {quote_asset if is_buy else base_asset} balance to fill limit "
+                                      f"{'buy' if is_buy else 'sell'} order on {trading_pair}.")
+                self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                     OrderCancelledEvent(self._current_timestamp, order_id))
+                return
+
+            # Adjust the market balances according to the trade done.
+            if is_buy:
+                self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) - quote_asset_traded)
+                self.c_set_balance(base_asset, self.c_get_balance(base_asset) + amount)
+            else:
+                self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) + quote_asset_traded)
+                self.c_set_balance(base_asset, self.c_get_balance(base_asset) - amount)
+
+            if queue_position is not None:
+                queue_position.remaining = new_remaining
+                queue_position.filled_base += amount
+                queue_position.filled_quote += quote_asset_traded
+
+            # The order goes back in with its remaining quantity, at the same place since the collection is sorted by
+            # price then order id.
+            orders_collection_ptr.erase(orders_it)
+            self.c_invalidate_limit_orders(trading_pair, is_buy)
+            orders_collection_ptr.insert(CPPLimitOrder(
+                cpp_order_id,
+                cpp_trading_pair,
+                is_buy,
+                cpp_base_asset,
+                cpp_quote_asset,
+                <PyObject *> price,
+                <PyObject *> new_remaining
+            ))
+
+            # add fee
+            fees = estimate_fee(self.name, True)
+
+            self.c_trigger_event(
+                self.ORDER_FILLED_EVENT_TAG,
+                OrderFilledEvent(
+                    self._current_timestamp,
+                    order_id,
+                    trading_pair,
+                    TradeType.BUY if is_buy else TradeType.SELL,
+                    OrderType.LIMIT,
+                    price,
+                    amount,
+                    fees
+                ))
+        except Exception:
+            self.logger().error("Error partially filling limit order.", exc_info=True)
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        if self._available_balances_cache is None:
+            return self.available_balances.get(currency.upper(), s_decimal_0)
+        return self._available_balances_cache.get(currency.upper(), s_decimal_0)
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await self._order_book_tracker.data_source.get_active_exchange_markets()
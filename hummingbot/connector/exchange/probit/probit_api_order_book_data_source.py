@@ -1,5 +1,4 @@
 #!/usr/bin/env python
-import aiohttp
 import asyncio
 import logging
 import pandas as pd
@@ -22,6 +21,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.probit import probit_utils
 from hummingbot.connector.exchange.probit.probit_order_book import ProbitOrderBook
+from hummingbot.core.utils.http_session_registry import shared_client_session
 
 
 class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -47,7 +47,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str], domain: str = "com") -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{CONSTANTS.TICKER_URL.format(domain)}") as response:
                 if response.status == 200:
                     resp_json = await response.json()
@@ -60,7 +60,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs(domain: str = "com") -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(f"{CONSTANTS.MARKETS_URL.format(domain)}") as response:
                 if response.status == 200:
                     resp_json: Dict[str, Any] = await response.json()
@@ -72,7 +72,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(url=f"{CONSTANTS.ORDER_BOOK_URL.format(domain)}",
                                   params={"market_id": trading_pair}) as response:
                 if response.status != 200:
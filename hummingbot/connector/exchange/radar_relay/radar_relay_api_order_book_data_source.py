@@ -21,6 +21,7 @@ from hummingbot.connector.exchange.radar_relay.radar_relay_order_book import Rad
 from hummingbot.connector.exchange.radar_relay.radar_relay_active_order_tracker import RadarRelayActiveOrderTracker
 from hummingbot.connector.exchange.radar_relay.radar_relay_order_book_message import RadarRelayOrderBookMessage
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_session_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -104,7 +105,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     async with client.get(f"{MARKETS_URL}?perPage=100&page={page_count}", timeout=10) \
                             as response:
                         if response.status == 200:
@@ -137,7 +138,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return await response.json()
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.snapshot_message_from_exchange(
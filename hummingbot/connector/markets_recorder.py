@@ -1,15 +1,18 @@
 #!/usr/bin/env python
 import os.path
 import pandas as pd
-from shutil import move
 import asyncio
+import logging
 from sqlalchemy.orm import (
     Session,
     Query
 )
 import time
 import threading
+from collections import deque
 from typing import (
+    Any,
+    Deque,
     Dict,
     List,
     Optional,
@@ -32,22 +35,35 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trade_csv_writer import TradeCsvWriter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.model.funding_payment import FundingPayment
 
 
 class MarketsRecorder:
+    _mr_logger: Optional[HummingbotLogger] = None
+    # Max seconds flush_db_writer() waits for pending records to be committed
+    DB_FLUSH_TIMEOUT = 5.0
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
@@ -61,6 +77,11 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._csv_writers: Dict[str, TradeCsvWriter] = {}
+        # Trade fills committed by the database writer thread, written to the CSVs on the event loop thread
+        self._committed_trade_fills: Deque[TradeFill] = deque()
+        # Order, trade fill and market state records are committed off the event loop by the write-behind queue.
+        self._db_writer: SQLWriteBehindQueue = SQLWriteBehindQueue(sql)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -99,6 +120,10 @@ class MarketsRecorder:
     def session(self) -> Session:
         return self._sql.get_shared_session()
 
+    @property
+    def db_writer(self) -> SQLWriteBehindQueue:
+        return self._db_writer
+
     @property
     def config_file_path(self) -> str:
         return self._config_file_path
@@ -112,6 +137,7 @@ class MarketsRecorder:
         return int(time.time() * 1e3)
 
     def start(self):
+        self._db_writer.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -120,6 +146,19 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self._db_writer.stop()
+        self._write_committed_trade_fills()
+        for csv_writer in self._csv_writers.values():
+            csv_writer.close()
+
+    async def flush_db_writer(self):
+        """
+        Waits, without blocking the event loop, for the records queued so far to be committed. The read methods only
+        see committed records, await this first to read the records just queued.
+        """
+        if not await self._db_writer.async_flush(timeout=self.DB_FLUSH_TIMEOUT):
+            self.logger().warning(f"Pending database records were not committed within {self.DB_FLUSH_TIMEOUT} "
+                                  f"seconds, reading without them ({self._db_writer.queue_depth} still queued).")
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -132,7 +171,8 @@ class MarketsRecorder:
         query: Query = (session
                         .query(Order)
                         .filter(*filters)
-                        .order_by(Order.creation_timestamp))
+                        .order_by(Order.creation_timestamp)
+                        .populate_existing())
         if number_of_rows is None:
             return query.all()
         else:
@@ -143,30 +183,51 @@ class MarketsRecorder:
         query: Query = (session
                         .query(TradeFill)
                         .filter(TradeFill.config_file_path == config_file_path)
-                        .order_by(TradeFill.timestamp.desc()))
+                        .order_by(TradeFill.timestamp.desc())
+                        .populate_existing())
         if number_of_rows is None:
             return query.all()
         else:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
-        session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        """
+        Queues the current tracking states of the market to be saved. With `no_commit`, the states are saved in the
+        given session, for use inside another mutation.
+        """
+        tracking_states: Dict[str, Any] = dict(market.tracking_states)
         timestamp: int = self.db_timestamp
+        if no_commit:
+            self._save_market_states(self.session, config_file_path, market.display_name, tracking_states, timestamp)
+        else:
+            self._db_writer.put(lambda session: self._save_market_states(session,
+                                                                         config_file_path,
+                                                                         market.display_name,
+                                                                         tracking_states,
+                                                                         timestamp))
+
+    @staticmethod
+    def _save_market_states(session: Session,
+                            config_file_path: str,
+                            market_name: str,
+                            tracking_states: Dict[str, Any],
+                            timestamp: int):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
-        if not no_commit:
-            session.commit()
-
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
 
@@ -178,7 +239,8 @@ class MarketsRecorder:
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
-                                MarketState.market == market.display_name))
+                                MarketState.market == market.display_name)
+                        .populate_existing())
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
@@ -190,7 +252,6 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
@@ -213,11 +274,16 @@ class MarketsRecorder:
         order_status: OrderStatus = OrderStatus(order=order_record,
                                                 timestamp=timestamp,
                                                 status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = dict(market.tracking_states)
+
+        def add_order(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            self._save_market_states(session, self._config_file_path, market_name, tracking_states, timestamp)
+
         market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._db_writer.put(add_order)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -227,18 +293,11 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
         # Order status and trade fill record should be added even if the order record is not found, because it's
         # possible for fill event to come in before the order created event for market orders.
         order_status: OrderStatus = OrderStatus(order_id=order_id,
@@ -260,12 +319,41 @@ class MarketsRecorder:
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id,
                                                  position=evt.position if evt.position else "NILL",)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = dict(market.tracking_states)
+
+        def add_trade_fill(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            self._save_market_states(session, self._config_file_path, market_name, tracking_states, timestamp)
+
         market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market, trade_fill_record.exchange_trade_id, trade_fill_record.symbol)})
-        self.append_to_csv(trade_fill_record)
+        # The CSV row is written once the record is committed, as it includes the record id.
+        self._db_writer.put(add_trade_fill, on_commit=lambda: self._trade_fill_committed(trade_fill_record))
+
+    def _trade_fill_committed(self, trade_fill: TradeFill):
+        """
+        Commit callback of trade fills, called on the database writer thread. The CSV writers are only used from the
+        event loop thread, where their buffered rows are flushed on a timer.
+        """
+        self._committed_trade_fills.append(trade_fill)
+        if threading.current_thread() != threading.main_thread():
+            try:
+                self._ev_loop.call_soon_threadsafe(self._write_committed_trade_fills)
+            except RuntimeError:
+                # The event loop is closed, stop() writes the committed trade fills.
+                pass
+        else:
+            self._write_committed_trade_fills()
+
+    def _write_committed_trade_fills(self):
+        while len(self._committed_trade_fills) > 0:
+            self.append_to_csv(self._committed_trade_fills.popleft())
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -275,21 +363,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_complete_funding_payment, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: float = evt.timestamp
-
-        # Try to find the funding payment has been recorded already.
-        payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(FundingPayment.timestamp == timestamp).one_or_none()
-        if payment_record is None:
-            funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                    config_file_path=self.config_file_path,
-                                                                    market=market.display_name,
-                                                                    rate=evt.funding_rate,
-                                                                    symbol=evt.trading_pair,
-                                                                    amount=float(evt.amount))
-            session.add(funding_payment_record)
-            session.commit()
-            # self.append_to_csv(funding_payment_record)
+        market_name: str = market.display_name
+
+        def add_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+                # self.append_to_csv(funding_payment_record)
+
+        self._db_writer.put(add_funding_payment)
 
     @staticmethod
     def _is_primitive_type(obj: object) -> bool:
@@ -299,11 +389,6 @@ class MarketsRecorder:
     def _is_protected_method(method_name: str) -> bool:
         return method_name.startswith('_')
 
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
-
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
@@ -321,14 +406,9 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if(os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        if csv_path not in self._csv_writers:
+            self._csv_writers[csv_path] = TradeCsvWriter(csv_path)
+        self._csv_writers[csv_path].append(field_names, field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -342,23 +422,24 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = dict(market.tracking_states)
+
+        def update_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                self._save_market_states(session, self._config_file_path, market_name, tracking_states, timestamp)
+
+        self._db_writer.put(update_order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+
+
+class OpenOrdersReconciliation(NamedTuple):
+    # Tracked orders found in the open orders, with their exchange order record.
+    open_orders: List[Tuple[InFlightOrderBase, Any]]
+    # Tracked orders that are not open anymore, or not open yet, to be queried one by one.
+    missing_orders: List[InFlightOrderBase]
+    # Open orders of the fetched trading pairs that are not tracked.
+    untracked_orders: List[Any]
+
+
+class OpenOrdersReconciler:
+    """
+    Reconciles the tracked in-flight orders of a connector with the exchange's open orders, so their status can be
+    polled with one open orders request per trading pair, or one for all trading pairs, instead of one request per
+    order.
+
+    Connectors fetch the open orders of the trading pairs returned by `trading_pairs_to_fetch()`, and pass them to
+    `reconcile()`. The order records of the tracked orders found in the open orders are processed like the per order
+    query responses. Only the missing orders, i.e. the orders that were filled, cancelled or rejected since the last
+    poll, and the orders not acknowledged by the exchange yet, need to be queried one by one.
+    """
+
+    def __init__(self,
+                 client_order_id_getter: Callable[[Any], Optional[str]],
+                 trading_pair_request_weight: int = 1,
+                 all_trading_pairs_request_weight: Optional[int] = None):
+        """
+        :param client_order_id_getter: returns the client order id of an exchange order record
+        :param trading_pair_request_weight: rate limit weight of the open orders request for one trading pair
+        :param all_trading_pairs_request_weight: rate limit weight of the open orders request for all trading pairs,
+        None if the exchange has no such request
+        """
+        self._client_order_id_getter: Callable[[Any], Optional[str]] = client_order_id_getter
+        self._trading_pair_request_weight: int = trading_pair_request_weight
+        self._all_trading_pairs_request_weight: Optional[int] = all_trading_pairs_request_weight
+
+    def trading_pairs_to_fetch(self, tracked_orders: Iterable[InFlightOrderBase]) -> Optional[List[str]]:
+        """
+        :return: the trading pairs to fetch the open orders of, or None to fetch the open orders of all the trading
+        pairs in one request, if it weighs less
+        """
+        trading_pairs: List[str] = sorted({order.trading_pair for order in tracked_orders})
+        if (self._all_trading_pairs_request_weight is not None and
+                len(trading_pairs) * self._trading_pair_request_weight >= self._all_trading_pairs_request_weight):
+            return None
+        return trading_pairs
+
+    def reconcile(self,
+                  tracked_orders: Iterable[InFlightOrderBase],
+                  open_orders: Iterable[Any],
+                  fetched_trading_pairs: Optional[Iterable[str]] = None) -> OpenOrdersReconciliation:
+        """
+        Matches the tracked orders with the open orders by client order id.
+
+        :param tracked_orders: the orders tracked when the open orders were requested
+        :param open_orders: the exchange order records of the open orders
+        :param fetched_trading_pairs: the trading pairs the open orders were fetched for, None for all. The tracked
+        orders of the other trading pairs are left out of the reconciliation.
+        """
+        open_orders_by_id: Dict[str, Any] = {}
+        for order_record in open_orders:
+            client_order_id: Optional[str] = self._client_order_id_getter(order_record)
+            if client_order_id is not None:
+                open_orders_by_id[client_order_id] = order_record
+        fetched: Optional[set] = set(fetched_trading_pairs) if fetched_trading_pairs is not None else None
+
+        found: List[Tuple[InFlightOrderBase, Any]] = []
+        missing: List[InFlightOrderBase] = []
+        for tracked_order in tracked_orders:
+            if fetched is not None and tracked_order.trading_pair not in fetched:
+                continue
+            order_record: Any = open_orders_by_id.pop(tracked_order.client_order_id, None)
+            if order_record is not None:
+                found.append((tracked_order, order_record))
+            else:
+                missing.append(tracked_order)
+        return OpenOrdersReconciliation(found, missing, list(open_orders_by_id.values()))
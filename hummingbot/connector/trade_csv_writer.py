@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+import asyncio
+import csv
+import logging
+import os.path
+from shutil import move
+from typing import (
+    List,
+    Optional,
+    TextIO,
+    Tuple
+)
+
+import pandas as pd
+
+from hummingbot.logger import HummingbotLogger
+
+
+class TradeCsvWriter:
+    """
+    Append-only, buffered writer for one trades CSV file.
+
+    The header of an existing file is validated once, when the file is opened. Rows are buffered and written out when
+    the buffer reaches `flush_size` rows, or `flush_interval` seconds after the first buffered row, whichever comes
+    first. If the row fields change, the buffered rows are flushed and the file is rotated to a `_old_<timestamp>`
+    file before a new one is started with the new header.
+    """
+    _tcw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tcw_logger is None:
+            cls._tcw_logger = logging.getLogger(__name__)
+        return cls._tcw_logger
+
+    def __init__(self, csv_path: str, flush_interval: float = 5.0, flush_size: int = 100):
+        self._csv_path: str = csv_path
+        self._flush_interval: float = flush_interval
+        self._flush_size: int = flush_size
+        self._field_names: Optional[Tuple[str, ...]] = None
+        self._file: Optional[TextIO] = None
+        self._writer = None
+        self._buffer: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def csv_path(self) -> str:
+        return self._csv_path
+
+    @property
+    def field_names(self) -> Optional[Tuple[str, ...]]:
+        return self._field_names
+
+    @property
+    def pending_rows(self) -> int:
+        return len(self._buffer)
+
+    @staticmethod
+    def _read_header(file_path: str) -> Optional[Tuple[str, ...]]:
+        with open(file_path, newline="") as fd:
+            for row in csv.reader(fd):
+                return tuple(row)
+        return None
+
+    def _open(self, field_names: Tuple[str, ...]):
+        if os.path.exists(self._csv_path) and self._read_header(self._csv_path) != field_names:
+            move(self._csv_path,
+                 self._csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+        write_header: bool = not os.path.exists(self._csv_path)
+        self._file = open(self._csv_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(field_names)
+            self._file.flush()
+        self._field_names = field_names
+
+    def append(self, field_names: Tuple[str, ...], field_data: tuple):
+        if field_names != self._field_names:
+            self.close()
+            self._open(field_names)
+        self._buffer.append(field_data)
+        if len(self._buffer) >= self._flush_size:
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                self._flush_handle = asyncio.get_event_loop().call_later(self._flush_interval, self.flush)
+            except RuntimeError:
+                # No event loop to schedule the timed flush on, write the row right away.
+                self.flush()
+
+    def flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if len(self._buffer) == 0 or self._file is None:
+            return
+        try:
+            self._writer.writerows(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+        except Exception:
+            self.logger().error(f"Error writing trades to {self._csv_path}.", exc_info=True)
+
+    def close(self):
+        """
+        Flushes the buffered rows and closes the file. The writer reopens the file on the next append.
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._writer = None
+        self._field_names = None
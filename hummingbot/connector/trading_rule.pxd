@@ -11,3 +11,8 @@ cdef class TradingRule:
         public object min_order_value                  # Calculated min base asset value based on the minimum accepted trade value (e.g. 0.078LTC is ~50,000 Satoshis)
         public bint supports_limit_orders              # if limit order is allowed for this trading pair
         public bint supports_market_orders             # if market order is allowed for this trading pair
+        readonly object price_quantum                  # min_price_increment as a Decimal, computed once
+        readonly object size_quantum                   # min_base_amount_increment as a Decimal, computed once
+
+    cdef list c_quantize_prices(self, list prices)
+    cdef list c_quantize_amounts(self, list amounts)
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import List
 
 s_decimal_0 = Decimal(0)
 s_decimal_max = Decimal("1e56")
@@ -29,6 +30,30 @@ cdef class TradingRule:
         self.max_price_significant_digits = max_price_significant_digits
         self.supports_limit_orders = supports_limit_orders
         self.supports_market_orders = supports_market_orders
+        self.price_quantum = Decimal(min_price_increment)
+        self.size_quantum = Decimal(min_base_amount_increment)
+
+    cdef list c_quantize_prices(self, list prices):
+        cdef:
+            object quantum = self.price_quantum
+        return [price if price.is_nan() else round(price / quantum) * quantum for price in prices]
+
+    cdef list c_quantize_amounts(self, list amounts):
+        cdef:
+            object quantum = self.size_quantum
+        return [(amount // quantum) * quantum for amount in amounts]
+
+    def quantize_prices(self, prices: List[Decimal]) -> List[Decimal]:
+        """
+        Rounds the prices to the nearest multiple of the price increment.
+        """
+        return self.c_quantize_prices(prices)
+
+    def quantize_amounts(self, amounts: List[Decimal]) -> List[Decimal]:
+        """
+        Rounds the amounts down to a multiple of the base amount increment.
+        """
+        return self.c_quantize_amounts(amounts)
 
     def __repr__(self) -> str:
         return f"TradingRule(trading_pair='{self.trading_pair}', " \
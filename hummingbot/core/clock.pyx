@@ -154,5 +154,17 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def fast_forward(self, timestamp: float):
+        """
+        (back testing mode only) Moves the clock forward to the last tick at or before timestamp, without ticking the
+        child iterators, e.g. to skip a stretch of simulated time where nothing happens.
+        """
+        cdef double ticks
+        if self._clock_mode is not ClockMode.BACKTEST:
+            raise EnvironmentError("fast_forward() can only be used in back testing mode.")
+        ticks = (timestamp - self._current_tick) // self._tick_size
+        if ticks > 0:
+            self._current_tick += ticks * self._tick_size
+
     def backtest(self):
         self.backtest_til(self._end_time)
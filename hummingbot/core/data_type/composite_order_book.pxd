@@ -5,4 +5,6 @@ cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef c_build_depth_index(self, bint is_buy)
+    cdef Py_ssize_t c_copy_levels(self, bint is_bid, double[:, ::1] out, Py_ssize_t max_levels) except -1
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -32,6 +32,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book.c_invalidate_depth_index()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +77,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_depth_index()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -179,6 +182,52 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_build_depth_index(self, bint is_buy):
+        """
+        Builds the depth index from the composite entries, so depth queries see the book net of the recorded fills.
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            vector[double] *cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            double base_total = 0
+            double quote_total = 0
+
+        deref(prices).clear()
+        deref(cum_base).clear()
+        deref(cum_quote).clear()
+        for order_book_row in (self.ask_entries() if is_buy else self.bid_entries()):
+            base_total += order_book_row.amount
+            quote_total += order_book_row.amount * order_book_row.price
+            deref(prices).push_back(order_book_row.price)
+            deref(cum_base).push_back(base_total)
+            deref(cum_quote).push_back(quote_total)
+        if is_buy:
+            self._ask_index_valid = True
+        else:
+            self._bid_index_valid = True
+
+    cdef Py_ssize_t c_copy_levels(self, bint is_bid, double[:, ::1] out, Py_ssize_t max_levels) except -1:
+        """
+        Exports the composite entries, so snapshots see the book net of the recorded fills.
+        """
+        cdef:
+            Py_ssize_t row = 0
+
+        if out.shape[1] < 3:
+            raise ValueError(f"Output buffer must have 3 columns [price, amount, update_id], got {out.shape[1]}.")
+        max_levels = min(max_levels, out.shape[0])
+        if max_levels <= 0:
+            return 0
+        for order_book_row in (self.bid_entries() if is_bid else self.ask_entries()):
+            out[row, 0] = order_book_row.price
+            out[row, 1] = order_book_row.amount
+            out[row, 2] = order_book_row.update_id
+            row += 1
+            if row >= max_levels:
+                break
+        return row
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
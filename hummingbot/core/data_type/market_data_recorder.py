@@ -0,0 +1,667 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.event.events import TradeType
+from hummingbot.logger import HummingbotLogger
+
+MARKET_DATA_FILE_EXTENSION = ".hbmd"
+MARKET_DATA_INDEX_EXTENSION = ".idx"
+MARKET_DATA_FILE_VERSION = 1
+
+# File header: magic, format version.
+FILE_HEADER = struct.Struct("<4sH")
+FILE_MAGIC = b"HBMD"
+# Chunk header: magic, compressed payload size, raw payload size, message count, level count, first and last message
+# timestamps, first and last order book update ids.
+CHUNK_HEADER = struct.Struct("<4sIIIIddqq")
+CHUNK_MAGIC = b"HBMC"
+# Seek index entry: chunk offset in the data file, message count, first and last message timestamps, first and last
+# order book update ids.
+INDEX_ENTRY = struct.Struct("<QIddqq")
+
+EMPTY_LEVELS: np.ndarray = np.empty((0, 2), dtype=np.float64)
+
+
+def market_data_file_path(data_dir: str, exchange_name: str, trading_pair: str, day: str) -> str:
+    """
+    :param day: UTC day of the data, YYYY-MM-DD
+    """
+    return os.path.join(data_dir, exchange_name, trading_pair, f"{day}{MARKET_DATA_FILE_EXTENSION}")
+
+
+def list_market_data_files(data_dir: str, exchange_name: str, trading_pair: str) -> List[str]:
+    """
+    :return: the data files recorded for a trading pair, in day order
+    """
+    pair_dir: str = os.path.join(data_dir, exchange_name, trading_pair)
+    if not os.path.isdir(pair_dir):
+        return []
+    return [os.path.join(pair_dir, file_name) for file_name in sorted(os.listdir(pair_dir))
+            if file_name.endswith(MARKET_DATA_FILE_EXTENSION)]
+
+
+def _timestamp_seconds(timestamp: float) -> float:
+    # Some connectors time stamp their messages in milliseconds.
+    return timestamp * 1e-3 if timestamp > 1e11 else timestamp
+
+
+def _utc_day(timestamp: float) -> str:
+    return datetime.utcfromtimestamp(_timestamp_seconds(timestamp)).strftime("%Y-%m-%d")
+
+
+def _int_or_default(value: Any, default: int = -1) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _levels_array(levels: Any) -> np.ndarray:
+    """
+    Converts the bids or asks of a message, rows of [price, amount, ...] as strings or numbers, to a (n, 2) float64
+    array.
+    """
+    if levels is None or len(levels) == 0:
+        return EMPTY_LEVELS
+    if isinstance(levels, np.ndarray) and levels.ndim == 2:
+        return levels[:, :2].astype(np.float64, copy=False)
+    try:
+        array: np.ndarray = np.array(levels, dtype=np.float64)
+        if array.ndim == 2 and array.shape[1] >= 2:
+            return array[:, :2]
+    except (TypeError, ValueError):
+        pass
+    return np.array([(float(row[0]), float(row[1])) for row in levels], dtype=np.float64).reshape(-1, 2)
+
+
+class MarketDataIndexEntry(NamedTuple):
+    offset: int
+    message_count: int
+    first_timestamp: float
+    last_timestamp: float
+    first_update_id: int
+    last_update_id: int
+
+
+class MarketDataChunk(NamedTuple):
+    """
+    One chunk of recorded messages, as columns. The message columns have one row per message, and the price and
+    amount columns one row per level: the bids then the asks of each message, in message order.
+
+    A trade is recorded as a single level, on the bid side for a buy and on the ask side for a sell, with the trade
+    id in the update id column.
+    """
+    types: np.ndarray
+    timestamps: np.ndarray
+    update_ids: np.ndarray
+    first_update_ids: np.ndarray
+    bid_counts: np.ndarray
+    ask_counts: np.ndarray
+    prices: np.ndarray
+    amounts: np.ndarray
+
+    @property
+    def level_offsets(self) -> np.ndarray:
+        """
+        :return: the offset of the first level of each message in the level columns
+        """
+        counts: np.ndarray = self.bid_counts.astype(np.int64) + self.ask_counts
+        offsets: np.ndarray = np.zeros(len(counts), dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        return offsets
+
+    def to_bytes(self) -> bytes:
+        # Widest columns first.
+        return b"".join(column.tobytes() for column in (self.timestamps, self.update_ids, self.first_update_ids,
+                                                        self.prices, self.amounts, self.bid_counts, self.ask_counts,
+                                                        self.types))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, message_count: int, level_count: int) -> "MarketDataChunk":
+        columns: List[np.ndarray] = []
+        offset: int = 0
+        for dtype, length in ((np.float64, message_count), (np.int64, message_count), (np.int64, message_count),
+                              (np.float64, level_count), (np.float64, level_count), (np.uint32, message_count),
+                              (np.uint32, message_count), (np.uint8, message_count)):
+            columns.append(np.frombuffer(payload, dtype=dtype, count=length, offset=offset))
+            offset += length * np.dtype(dtype).itemsize
+        timestamps, update_ids, first_update_ids, prices, amounts, bid_counts, ask_counts, types = columns
+        return MarketDataChunk(types, timestamps, update_ids, first_update_ids, bid_counts, ask_counts, prices,
+                               amounts)
+
+    def messages(self, trading_pair: str) -> Iterator[OrderBookMessage]:
+        """
+        Rebuilds the order book messages of the chunk, with the levels as [price, amount] lists.
+        """
+        prices: List[float] = self.prices.tolist()
+        amounts: List[float] = self.amounts.tolist()
+        level: int = 0
+        for message_type, timestamp, update_id, first_update_id, bid_count, ask_count in zip(
+                self.types.tolist(), self.timestamps.tolist(), self.update_ids.tolist(),
+                self.first_update_ids.tolist(), self.bid_counts.tolist(), self.ask_counts.tolist()):
+            bids_end: int = level + bid_count
+            asks_end: int = bids_end + ask_count
+            if message_type == OrderBookMessageType.TRADE.value:
+                trade_type: TradeType = TradeType.BUY if bid_count > 0 else TradeType.SELL
+                yield OrderBookMessage(OrderBookMessageType.TRADE, {
+                    "trading_pair": trading_pair,
+                    "trade_type": float(trade_type.value),
+                    "trade_id": update_id,
+                    "update_id": update_id,
+                    "price": prices[level],
+                    "amount": amounts[level]
+                }, timestamp=timestamp)
+            else:
+                content: Dict[str, Any] = {
+                    "trading_pair": trading_pair,
+                    "update_id": update_id,
+                    "bids": [[prices[i], amounts[i]] for i in range(level, bids_end)],
+                    "asks": [[prices[i], amounts[i]] for i in range(bids_end, asks_end)]
+                }
+                if message_type == OrderBookMessageType.DIFF.value:
+                    content["first_update_id"] = first_update_id
+                yield OrderBookMessage(OrderBookMessageType(message_type), content, timestamp=timestamp)
+            level = asks_end
+
+
+class MarketDataFileReader:
+    """
+    Reads the chunks of a market data file, using its seek index to skip the chunks out of the requested time range.
+    Chunks appended after the last index entry, e.g. when the recorder was killed between the two writes, are found
+    by scanning the chunk headers.
+    """
+
+    def __init__(self, path: str, trading_pair: Optional[str] = None):
+        """
+        :param trading_pair: trading pair of the messages, the name of the file's directory by default
+        """
+        self._path: str = path
+        self._trading_pair: str = trading_pair or os.path.basename(os.path.dirname(os.path.abspath(path)))
+        self._index: Optional[List[MarketDataIndexEntry]] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def index(self) -> List[MarketDataIndexEntry]:
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _load_index(self) -> List[MarketDataIndexEntry]:
+        entries: List[MarketDataIndexEntry] = []
+        index_path: str = self._path + MARKET_DATA_INDEX_EXTENSION
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as index_file:
+                data: bytes = index_file.read()
+            for position in range(0, len(data) - INDEX_ENTRY.size + 1, INDEX_ENTRY.size):
+                entries.append(MarketDataIndexEntry(*INDEX_ENTRY.unpack_from(data, position)))
+
+        with open(self._path, "rb") as data_file:
+            magic, version = FILE_HEADER.unpack(data_file.read(FILE_HEADER.size))
+            if magic != FILE_MAGIC:
+                raise ValueError(f"{self._path} is not a market data file.")
+            if version > MARKET_DATA_FILE_VERSION:
+                raise ValueError(f"Unsupported market data file version {version} in {self._path}.")
+            file_size: int = os.fstat(data_file.fileno()).st_size
+            offset: int = FILE_HEADER.size
+            if len(entries) > 0:
+                data_file.seek(entries[-1].offset)
+                header: Tuple = CHUNK_HEADER.unpack(data_file.read(CHUNK_HEADER.size))
+                offset = entries[-1].offset + CHUNK_HEADER.size + header[1]
+            while offset + CHUNK_HEADER.size <= file_size:
+                data_file.seek(offset)
+                (magic, compressed_size, _, message_count, _, first_timestamp, last_timestamp, first_update_id,
+                 last_update_id) = CHUNK_HEADER.unpack(data_file.read(CHUNK_HEADER.size))
+                if magic != CHUNK_MAGIC or offset + CHUNK_HEADER.size + compressed_size > file_size:
+                    # Partially written chunk.
+                    break
+                entries.append(MarketDataIndexEntry(offset, message_count, first_timestamp, last_timestamp,
+                                                    first_update_id, last_update_id))
+                offset += CHUNK_HEADER.size + compressed_size
+        return entries
+
+    def read_chunk(self, entry: MarketDataIndexEntry, data_file: Optional[BinaryIO] = None) -> MarketDataChunk:
+        if data_file is None:
+            with open(self._path, "rb") as data_file:
+                return self.read_chunk(entry, data_file)
+        data_file.seek(entry.offset)
+        _, compressed_size, raw_size, message_count, level_count, _, _, _, _ = CHUNK_HEADER.unpack(
+            data_file.read(CHUNK_HEADER.size))
+        payload: bytes = zlib.decompress(data_file.read(compressed_size), bufsize=raw_size)
+        return MarketDataChunk.from_bytes(payload, message_count, level_count)
+
+    def iter_chunks(self,
+                    start_timestamp: Optional[float] = None,
+                    end_timestamp: Optional[float] = None) -> Iterator[MarketDataChunk]:
+        """
+        Yields the chunks that have messages between the start and end timestamps. The chunks at the edges of the
+        range may have messages out of it.
+
+        The file is memory mapped, so the processes replaying the same file, e.g. the workers of a parameter sweep,
+        share its pages instead of each reading its own copy.
+        """
+        entries: List[MarketDataIndexEntry] = self.index
+        with open(self._path, "rb") as data_file, \
+                mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            for entry in entries:
+                if start_timestamp is not None and entry.last_timestamp < start_timestamp:
+                    continue
+                if end_timestamp is not None and entry.first_timestamp > end_timestamp:
+                    break
+                yield self.read_chunk(entry, mapped_file)
+
+    def iter_messages(self,
+                      start_timestamp: Optional[float] = None,
+                      end_timestamp: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        for chunk in self.iter_chunks(start_timestamp, end_timestamp):
+            for message in chunk.messages(self._trading_pair):
+                if start_timestamp is not None and message.timestamp < start_timestamp:
+                    continue
+                if end_timestamp is not None and message.timestamp > end_timestamp:
+                    return
+                yield message
+
+
+class _PairChunkBuffer:
+    """
+    Columns of the messages of one trading pair waiting to be written, and the open files of the pair's current day.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair: str = trading_pair
+        self.day: Optional[str] = None
+        self.data_file: Optional[BinaryIO] = None
+        self.index_file: Optional[BinaryIO] = None
+        self.first_message_time: float = 0.0
+        self.types: List[int] = []
+        self.timestamps: List[float] = []
+        self.update_ids: List[int] = []
+        self.first_update_ids: List[int] = []
+        self.bid_counts: List[int] = []
+        self.ask_counts: List[int] = []
+        self.levels: List[np.ndarray] = []
+        self.level_count: int = 0
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def append(self,
+               message_type: int,
+               timestamp: float,
+               update_id: int,
+               first_update_id: int,
+               bids: np.ndarray,
+               asks: np.ndarray):
+        if len(self.types) == 0:
+            self.first_message_time = time.monotonic()
+        self.types.append(message_type)
+        self.timestamps.append(timestamp)
+        self.update_ids.append(update_id)
+        self.first_update_ids.append(first_update_id)
+        self.bid_counts.append(len(bids))
+        self.ask_counts.append(len(asks))
+        if len(bids) > 0:
+            self.levels.append(bids)
+        if len(asks) > 0:
+            self.levels.append(asks)
+        self.level_count += len(bids) + len(asks)
+
+    def to_chunk(self) -> MarketDataChunk:
+        levels: np.ndarray = np.concatenate(self.levels) if len(self.levels) > 0 else EMPTY_LEVELS
+        return MarketDataChunk(np.array(self.types, dtype=np.uint8),
+                               np.array(self.timestamps, dtype=np.float64),
+                               np.array(self.update_ids, dtype=np.int64),
+                               np.array(self.first_update_ids, dtype=np.int64),
+                               np.array(self.bid_counts, dtype=np.uint32),
+                               np.array(self.ask_counts, dtype=np.uint32),
+                               np.ascontiguousarray(levels[:, 0]),
+                               np.ascontiguousarray(levels[:, 1]))
+
+    def clear(self):
+        self.types.clear()
+        self.timestamps.clear()
+        self.update_ids.clear()
+        self.first_update_ids.clear()
+        self.bid_counts.clear()
+        self.ask_counts.clear()
+        self.levels.clear()
+        self.level_count = 0
+
+    def close_files(self):
+        for opened_file in (self.data_file, self.index_file):
+            if opened_file is not None:
+                opened_file.close()
+        self.data_file = None
+        self.index_file = None
+
+
+class MarketDataRecorderStats:
+    """
+    Queue depth and write counters of a market data recorder.
+    """
+
+    def __init__(self):
+        self.recorded_messages: int = 0
+        self.dropped_messages: int = 0
+        self.max_queue_depth: int = 0
+        self.written_messages: int = 0
+        self.written_levels: int = 0
+        self.failed_messages: int = 0
+        self.chunks: int = 0
+        self.raw_bytes: int = 0
+        self.compressed_bytes: int = 0
+        self.max_chunk_write_time: float = 0.0
+        self.total_chunk_write_time: float = 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.raw_bytes / self.compressed_bytes if self.compressed_bytes > 0 else 0.0
+
+    @property
+    def avg_chunk_write_time(self) -> float:
+        return self.total_chunk_write_time / self.chunks if self.chunks > 0 else 0.0
+
+
+class MarketDataRecorder:
+    """
+    Records the order book snapshots, diffs and trades of one exchange to append-only binary files, one file per
+    trading pair and UTC day: <data_dir>/<exchange>/<trading pair>/<YYYY-MM-DD>.hbmd.
+
+    Messages are written in zlib compressed chunks of columns, float64 prices and amounts and int64 update ids, see
+    MarketDataChunk. A chunk is written once `chunk_size` messages of a pair are buffered, or `max_chunk_latency`
+    seconds after its first message. Each chunk also gets an entry in the file's seek index, <file>.idx, with its
+    offset and time and update id range.
+
+    `record()` only queues the message, so it is cheap enough to call from the event loop for every message. The
+    levels are parsed, packed, compressed and written on a dedicated writer thread. Messages recorded while more than
+    `max_queue_size` messages are pending are dropped rather than blocking the event loop.
+    """
+    _mdr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdr_logger is None:
+            cls._mdr_logger = logging.getLogger(__name__)
+        return cls._mdr_logger
+
+    def __init__(self,
+                 data_dir: str,
+                 exchange_name: str,
+                 chunk_size: int = 1000,
+                 max_chunk_latency: float = 10.0,
+                 compression_level: int = 1,
+                 max_queue_size: int = 1000000):
+        """
+        :param data_dir: root directory of the market data files
+        :param exchange_name: name of the recorded exchange, used as directory name
+        :param chunk_size: number of messages of a trading pair written in one chunk
+        :param max_chunk_latency: max seconds a message waits in the buffer before its chunk is written
+        :param compression_level: zlib compression level of the chunks
+        :param max_queue_size: number of pending messages above which new messages are dropped
+        """
+        self._data_dir: str = data_dir
+        self._exchange_name: str = exchange_name
+        self._chunk_size: int = chunk_size
+        self._max_chunk_latency: float = max_chunk_latency
+        self._compression_level: int = compression_level
+        self._max_queue_size: int = max_queue_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._buffers: Dict[str, _PairChunkBuffer] = {}
+        self._stats: MarketDataRecorderStats = MarketDataRecorderStats()
+        self._writer_thread: Optional[threading.Thread] = None
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def stats(self) -> MarketDataRecorderStats:
+        return self._stats
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def file_path(self, trading_pair: str, day: str) -> str:
+        return market_data_file_path(self._data_dir, self._exchange_name, trading_pair, day)
+
+    def start(self):
+        if self.started:
+            return
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketDataRecorder", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes the buffered messages, closes the files and stops the writer thread.
+        """
+        if not self.started:
+            return
+        self._queue.put(None)
+        self._writer_thread.join(timeout)
+        if self._writer_thread.is_alive():
+            self.logger().warning(f"Market data writer did not stop within {timeout} seconds, "
+                                  f"{self.queue_depth} messages are still pending.")
+        self._writer_thread = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the messages recorded before this call are written to the files.
+
+        :return: False if the timeout expired first, True otherwise
+        """
+        if not self.started:
+            return True
+        flushed: threading.Event = threading.Event()
+        self._queue.put(flushed)
+        return flushed.wait(timeout)
+
+    def record(self, message: OrderBookMessage):
+        """
+        Queues a snapshot, diff or trade message to be written.
+        """
+        queue_depth: int = self._queue.qsize()
+        if queue_depth >= self._max_queue_size:
+            if self._stats.dropped_messages % 10000 == 0:
+                self.logger().warning(f"Market data writer is {queue_depth} messages behind, dropping messages.")
+            self._stats.dropped_messages += 1
+            return
+        self._queue.put(message)
+        self._stats.recorded_messages += 1
+        if queue_depth >= self._stats.max_queue_depth:
+            self._stats.max_queue_depth = queue_depth + 1
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: Optional[float] = None):
+        """
+        Records the current state of an order book as a snapshot, e.g. an initial snapshot fetched outside of the
+        tracker's streams.
+        """
+        bids, asks = order_book.to_numpy()
+        self.record(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": order_book.snapshot_uid,
+            "bids": bids[:, :2],
+            "asks": asks[:, :2]
+        }, timestamp=timestamp if timestamp is not None else time.time()))
+
+    def _writer_loop(self):
+        try:
+            running: bool = True
+            next_latency_check: float = time.monotonic() + self._max_chunk_latency
+            while running:
+                try:
+                    item: Union[None, OrderBookMessage, threading.Event] = self._queue.get(
+                        timeout=max(next_latency_check - time.monotonic(), 0.001))
+                    if item is None:
+                        running = False
+                    elif isinstance(item, threading.Event):
+                        self._write_buffers()
+                        item.set()
+                    else:
+                        self._add_message(item)
+                except queue.Empty:
+                    pass
+                now: float = time.monotonic()
+                if now >= next_latency_check:
+                    self._write_buffers(older_than=now - self._max_chunk_latency)
+                    next_latency_check = now + min(self._max_chunk_latency, 1.0)
+            # Write whatever was queued after the stop request.
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is not None:
+                    self._add_message(item)
+            self._write_buffers()
+        except Exception:
+            self.logger().error("Unexpected error in the market data writer thread.", exc_info=True)
+        finally:
+            for buffer in self._buffers.values():
+                buffer.close_files()
+
+    def _add_message(self, message: OrderBookMessage):
+        try:
+            trading_pair: str = message.trading_pair
+            timestamp: float = (_timestamp_seconds(message.timestamp) if message.timestamp is not None
+                                else time.time())
+            buffer: Optional[_PairChunkBuffer] = self._buffers.get(trading_pair)
+            if buffer is None:
+                buffer = self._buffers[trading_pair] = _PairChunkBuffer(trading_pair)
+            day: str = _utc_day(timestamp)
+            if day != buffer.day:
+                # Day rollover, the messages of the previous day go to its file.
+                self._write_buffer(buffer)
+                buffer.close_files()
+                buffer.day = day
+
+            content: Dict[str, Any] = message.content
+            if message.type is OrderBookMessageType.TRADE:
+                level: np.ndarray = np.array([[float(content["price"]), float(content["amount"])]],
+                                             dtype=np.float64)
+                is_sell: bool = float(content["trade_type"]) == float(TradeType.SELL.value)
+                trade_id: int = _int_or_default(content.get("trade_id"))
+                buffer.append(OrderBookMessageType.TRADE.value, timestamp, trade_id, trade_id,
+                              EMPTY_LEVELS if is_sell else level, level if is_sell else EMPTY_LEVELS)
+            else:
+                update_id: int = _int_or_default(content.get("update_id"))
+                first_update_id: int = _int_or_default(content.get("first_update_id"), update_id)
+                buffer.append(message.type.value, timestamp, update_id, first_update_id,
+                              _levels_array(content.get("bids")), _levels_array(content.get("asks")))
+        except Exception:
+            self._stats.failed_messages += 1
+            self.logger().debug(f"Could not record market data message {message}.", exc_info=True)
+            return
+        if len(buffer) >= self._chunk_size:
+            self._write_buffer(buffer)
+
+    def _write_buffers(self, older_than: Optional[float] = None):
+        for buffer in self._buffers.values():
+            if len(buffer) > 0 and (older_than is None or buffer.first_message_time <= older_than):
+                self._write_buffer(buffer)
+
+    def _open_files(self, buffer: _PairChunkBuffer):
+        path: str = self.file_path(buffer.trading_pair, buffer.day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        buffer.data_file = open(path, "ab")
+        if buffer.data_file.tell() == 0:
+            buffer.data_file.write(FILE_HEADER.pack(FILE_MAGIC, MARKET_DATA_FILE_VERSION))
+        buffer.index_file = open(path + MARKET_DATA_INDEX_EXTENSION, "ab")
+
+    def _write_buffer(self, buffer: _PairChunkBuffer):
+        if len(buffer) == 0:
+            return
+        start: float = time.perf_counter()
+        try:
+            chunk: MarketDataChunk = buffer.to_chunk()
+            payload: bytes = chunk.to_bytes()
+            compressed: bytes = zlib.compress(payload, self._compression_level)
+            book_updates: np.ndarray = chunk.update_ids[chunk.types != OrderBookMessageType.TRADE.value]
+            first_update_id: int = int(book_updates.min()) if len(book_updates) > 0 else -1
+            last_update_id: int = int(book_updates.max()) if len(book_updates) > 0 else -1
+            first_timestamp: float = float(chunk.timestamps[0])
+            last_timestamp: float = float(chunk.timestamps[-1])
+
+            if buffer.data_file is None:
+                self._open_files(buffer)
+            offset: int = buffer.data_file.tell()
+            buffer.data_file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, len(compressed), len(payload), len(chunk.types),
+                                                     len(chunk.prices), first_timestamp, last_timestamp,
+                                                     first_update_id, last_update_id))
+            buffer.data_file.write(compressed)
+            buffer.data_file.flush()
+            # The index entry goes after the chunk, readers scan for the chunks missing from the index.
+            buffer.index_file.write(INDEX_ENTRY.pack(offset, len(chunk.types), first_timestamp, last_timestamp,
+                                                     first_update_id, last_update_id))
+            buffer.index_file.flush()
+
+            elapsed: float = time.perf_counter() - start
+            self._stats.chunks += 1
+            self._stats.written_messages += len(chunk.types)
+            self._stats.written_levels += len(chunk.prices)
+            self._stats.raw_bytes += len(payload)
+            self._stats.compressed_bytes += len(compressed)
+            self._stats.max_chunk_write_time = max(self._stats.max_chunk_write_time, elapsed)
+            self._stats.total_chunk_write_time += elapsed
+        except Exception:
+            self._stats.failed_messages += len(buffer)
+            self.logger().error(f"Error writing market data of {buffer.trading_pair}.", exc_info=True)
+            buffer.close_files()
+        finally:
+            buffer.clear()
+
+
+class MarketDataRecordingQueue(asyncio.Queue):
+    """
+    Order book tracker stream that hands every message put in it to a market data recorder.
+    """
+
+    def __init__(self, recorder: MarketDataRecorder, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._recorder: MarketDataRecorder = recorder
+
+    def put_nowait(self, item: OrderBookMessage):
+        # Queue.put() goes through put_nowait() too.
+        super().put_nowait(item)
+        self._recorder.record(item)
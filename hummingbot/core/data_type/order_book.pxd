@@ -20,6 +20,14 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef vector[double] _bid_index_prices
+    cdef vector[double] _bid_index_cum_base
+    cdef vector[double] _bid_index_cum_quote
+    cdef vector[double] _ask_index_prices
+    cdef vector[double] _ask_index_cum_base
+    cdef vector[double] _ask_index_cum_quote
+    cdef bint _bid_index_valid
+    cdef bint _ask_index_valid
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,7 +38,16 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_numpy_levels_to_entries(self,
+                                   np.ndarray[np.float64_t, ndim=2] levels_array,
+                                   vector[OrderBookEntry] *entries,
+                                   int64_t *last_update_id)
+    cdef c_invalidate_depth_index(self)
+    cdef c_build_depth_index(self, bint is_buy)
+    cdef c_ensure_depth_index(self, bint is_buy)
+    cdef Py_ssize_t c_copy_levels(self, bint is_bid, double[:, ::1] out, Py_ssize_t max_levels) except -1
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef double c_get_amount_at_price(self, bint is_bid, double price)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
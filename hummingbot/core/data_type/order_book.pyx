@@ -33,6 +33,40 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline size_t first_greater_or_equal(vector[double] *values, double target):
+    # Binary search over a non-decreasing cumulative volume array. Returns values.size() if no element qualifies,
+    # which includes a NaN target.
+    cdef:
+        size_t low = 0
+        size_t high = deref(values).size()
+        size_t mid
+    while low < high:
+        mid = (low + high) >> 1
+        if deref(values)[mid] >= target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline size_t first_worse_than(vector[double] *prices, double price, bint is_buy):
+    # Binary search over index prices ordered from the best price outwards. Returns the number of levels priced at or
+    # better than the given price.
+    cdef:
+        size_t low = 0
+        size_t high = deref(prices).size()
+        size_t mid
+        double level_price
+    while low < high:
+        mid = (low + high) >> 1
+        level_price = deref(prices)[mid]
+        if (level_price > price) if is_buy else (level_price < price):
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -52,6 +86,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._bid_index_valid = False
+        self._ask_index_valid = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -92,6 +128,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -132,6 +169,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -168,12 +206,84 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.snapshot_with_depth()
+
+    def snapshot_with_depth(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        bids_array, asks_array = self.to_numpy(depth)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=False)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=False)
         return bids_df, asks_df
 
+    cdef Py_ssize_t c_copy_levels(self, bint is_bid, double[:, ::1] out, Py_ssize_t max_levels) except -1:
+        """
+        Copies up to max_levels [price, amount, update_id] rows of one side of the book into out, from the best price
+        outwards. Returns the number of rows written.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            Py_ssize_t row = 0
+
+        if out.shape[1] < 3:
+            raise ValueError(f"Output buffer must have 3 columns [price, amount, update_id], got {out.shape[1]}.")
+        max_levels = min(max_levels, out.shape[0])
+        if is_bid:
+            while row < max_levels and bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                out[row, 0] = entry.getPrice()
+                out[row, 1] = entry.getAmount()
+                out[row, 2] = <double>entry.getUpdateId()
+                row += 1
+                inc(bid_it)
+        else:
+            while row < max_levels and ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                out[row, 0] = entry.getPrice()
+                out[row, 1] = entry.getAmount()
+                out[row, 2] = <double>entry.getUpdateId()
+                row += 1
+                inc(ask_it)
+        return row
+
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the bids and asks as contiguous float64 arrays with 3 columns, [price, amount, update_id], ordered
+        from the best price outwards.
+
+        :param depth: if given, only the top depth levels of each side are exported
+        """
+        cdef:
+            Py_ssize_t bid_levels = self._bid_book.size()
+            Py_ssize_t ask_levels = self._ask_book.size()
+            Py_ssize_t bid_rows
+            Py_ssize_t ask_rows
+
+        if depth is not None:
+            bid_levels = min(bid_levels, max(depth, 0))
+            ask_levels = min(ask_levels, max(depth, 0))
+        bids_array = np.empty((bid_levels, 3), dtype=np.float64)
+        asks_array = np.empty((ask_levels, 3), dtype=np.float64)
+        bid_rows = self.c_copy_levels(True, bids_array, bid_levels)
+        ask_rows = self.c_copy_levels(False, asks_array, ask_levels)
+        return bids_array[:bid_rows], asks_array[:ask_rows]
+
+    def to_numpy_into(self,
+                      bids_out: np.ndarray,
+                      asks_out: np.ndarray,
+                      depth: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Allocation-free variant of to_numpy(), for callers that poll the order book on every tick. Fills the given
+        C-contiguous float64 buffers with [price, amount, update_id] rows, up to depth levels or the buffer length.
+
+        :return: the number of bid and ask rows written
+        """
+        cdef:
+            Py_ssize_t max_levels = max(bids_out.shape[0], asks_out.shape[0])
+        if depth is not None:
+            max_levels = min(max_levels, max(depth, 0))
+        return self.c_copy_levels(True, bids_out, max_levels), self.c_copy_levels(False, asks_out, max_levels)
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -184,6 +294,24 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_diffs_batch(self, diffs: List[OrderBookMessage]):
+        """
+        Applies a sequence of diff messages, in order. Each message is applied as its own C++ update, so that crossed
+        levels are truncated as they would be by applying the messages one by one, but the levels of each message are
+        parsed only once, via the message's cached bids and asks, and the entry vectors are reused across messages.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        for diff in diffs:
+            cpp_bids.clear()
+            cpp_asks.clear()
+            for row in diff.cached_bids:
+                cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            for row in diff.cached_asks:
+                cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            self.c_apply_diffs(cpp_bids, cpp_asks, diff.update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -205,6 +333,24 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
+    cdef c_numpy_levels_to_entries(self,
+                                   np.ndarray[np.float64_t, ndim=2] levels_array,
+                                   vector[OrderBookEntry] *entries,
+                                   int64_t *last_update_id):
+        """
+        Appends the [price, amount, update_id] rows of a levels array to an entry vector, with typed indexing rather
+        than one row object per level.
+        """
+        cdef:
+            Py_ssize_t i
+            int64_t update_id
+        entries.reserve(entries.size() + levels_array.shape[0])
+        for i in range(levels_array.shape[0]):
+            update_id = <int64_t>levels_array[i, 2]
+            entries.push_back(OrderBookEntry(levels_array[i, 0], levels_array[i, 1], update_id))
+            if update_id > last_update_id[0]:
+                last_update_id[0] = update_id
+
     def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
@@ -224,12 +370,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        self.c_numpy_levels_to_entries(bids_array, &cpp_bids, &last_update_id)
+        self.c_numpy_levels_to_entries(asks_array, &cpp_asks, &last_update_id)
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -251,12 +393,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        self.c_numpy_levels_to_entries(bids_array, &cpp_bids, &last_update_id)
+        self.c_numpy_levels_to_entries(asks_array, &cpp_asks, &last_update_id)
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -315,142 +453,212 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef double c_get_amount_at_price(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_amount_at_price(self, is_bid: bool, price: float) -> float:
+        """
+        :return: the amount resting at exactly the price on one side of the book, 0 if there is no such level
+        """
+        return self.c_get_amount_at_price(is_bid, price)
+
+    cdef c_invalidate_depth_index(self):
+        self._bid_index_valid = False
+        self._ask_index_valid = False
+
+    cdef c_build_depth_index(self, bint is_buy):
+        """
+        Rebuilds the cumulative depth index for one side of the book, ordered from the best price outwards.
+
+        For level i, the index stores the level price, the cumulative base amount and the cumulative quote amount of
+        levels 0..i, so depth queries can be answered with a binary search instead of walking the order book rows.
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            vector[double] *cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            double base_total = 0
+            double quote_total = 0
+
+        deref(prices).clear()
+        deref(cum_base).clear()
+        deref(cum_quote).clear()
+        if is_buy:
+            deref(prices).reserve(self._ask_book.size())
+            deref(cum_base).reserve(self._ask_book.size())
+            deref(cum_quote).reserve(self._ask_book.size())
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                base_total += entry.getAmount()
+                quote_total += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cum_base).push_back(base_total)
+                deref(cum_quote).push_back(quote_total)
+                inc(ask_it)
+            self._ask_index_valid = True
+        else:
+            deref(prices).reserve(self._bid_book.size())
+            deref(cum_base).reserve(self._bid_book.size())
+            deref(cum_quote).reserve(self._bid_book.size())
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                base_total += entry.getAmount()
+                quote_total += entry.getAmount() * entry.getPrice()
+                deref(prices).push_back(entry.getPrice())
+                deref(cum_base).push_back(base_total)
+                deref(cum_quote).push_back(quote_total)
+                inc(bid_it)
+            self._bid_index_valid = True
+
+    cdef c_ensure_depth_index(self, bint is_buy):
+        if is_buy and not self._ask_index_valid:
+            self.c_build_depth_index(True)
+        elif not is_buy and not self._bid_index_valid:
+            self.c_build_depth_index(False)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+
+        index = first_greater_or_equal(cum_base, volume)
+        if index < deref(cum_base).size():
+            cumulative_volume = deref(cum_base)[index]
+            result_price = deref(prices)[index]
+        elif deref(cum_base).size() > 0:
+            cumulative_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+
+        index = first_greater_or_equal(cum_base, volume)
+        if index < deref(cum_base).size():
+            if index > 0:
+                total_cost = deref(cum_quote)[index - 1]
+                total_volume = deref(cum_base)[index - 1]
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(prices)[index]
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif deref(cum_base).size() > 0:
+            total_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+
+        index = first_greater_or_equal(cum_quote, quote_volume)
+        if index < deref(cum_quote).size():
+            cumulative_volume = deref(cum_quote)[index]
+            result_price = deref(prices)[index]
+        elif deref(cum_quote).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+
+        index = first_greater_or_equal(cum_base, base_amount)
+        if index < deref(cum_base).size():
+            if index > 0:
+                cumulative_volume = deref(cum_quote)[index - 1]
+                cumulative_base_amount = deref(cum_base)[index - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[index]
+        elif deref(cum_quote).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+
+        # Number of levels priced at or better than the query price.
+        levels = first_worse_than(prices, price, is_buy)
+        if levels > 0:
+            cumulative_volume = deref(cum_base)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_ensure_depth_index(is_buy)
+        prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+        cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+
+        levels = first_worse_than(prices, price, is_buy)
+        if levels > 0:
+            cumulative_volume = deref(cum_quote)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -496,5 +704,5 @@ cdef class OrderBook(PubSub):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
-        for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+        if len(replay_diffs) > 0:
+            self.apply_diffs_batch(replay_diffs)
@@ -70,6 +70,26 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def cached_asks(self) -> List[OrderBookRow]:
+        """
+        Same as asks, but the levels are parsed only once and cached on the message.
+        """
+        asks: Optional[List[OrderBookRow]] = self.__dict__.get("_cached_asks")
+        if asks is None:
+            asks = self.__dict__["_cached_asks"] = self.asks
+        return asks
+
+    @property
+    def cached_bids(self) -> List[OrderBookRow]:
+        """
+        Same as bids, but the levels are parsed only once and cached on the message.
+        """
+        bids: Optional[List[OrderBookRow]] = self.__dict__.get("_cached_bids")
+        if bids is None:
+            bids = self.__dict__["_cached_bids"] = self.bids
+        return bids
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import deque, defaultdict
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
 from typing import (
@@ -15,8 +16,13 @@ from typing import (
 import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataRecorder,
+    MarketDataRecordingQueue
+)
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -32,8 +38,47 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookTrackerPairStats:
+    """
+    Per trading pair counters for the diff ingestion path of the order book tracker.
+    """
+
+    def __init__(self):
+        self.messages_applied: int = 0
+        self.batches_applied: int = 0
+        self.max_batch_size: int = 0
+        self.last_queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.last_apply_latency: float = 0.0
+        self.max_apply_latency: float = 0.0
+        self.total_apply_latency: float = 0.0
+
+    @property
+    def avg_apply_latency(self) -> float:
+        return self.total_apply_latency / self.batches_applied if self.batches_applied > 0 else 0.0
+
+    def record_batch(self, batch_size: int, queue_depth: int, apply_latency: float):
+        self.messages_applied += batch_size
+        self.batches_applied += 1
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.last_queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        self.last_apply_latency = apply_latency
+        self.max_apply_latency = max(self.max_apply_latency, apply_latency)
+        self.total_apply_latency += apply_latency
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # When enabled, all diffs pending in a trading pair's message queue are drained and applied to the order book in
+    # one batch, instead of one message per queue get().
+    DIFF_BATCH_MODE: bool = True
+    MAX_DIFF_BATCH_SIZE: int = 1000
+    # Order book bootstrap budget: max snapshots fetched at once, and (weight, seconds) of the snapshot rate limit.
+    SNAPSHOT_BOOTSTRAP_CONCURRENCY: int = 5
+    SNAPSHOT_RATE_LIMIT: Tuple[int, float] = (5, 1.0)
+    SNAPSHOT_REQUEST_WEIGHT: int = 1
+    SAVED_MESSAGES_QUEUE_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -51,10 +96,15 @@ class OrderBookTracker(ABC):
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._pair_stats: Dict[str, OrderBookTrackerPairStats] = {}
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.SAVED_MESSAGES_QUEUE_SIZE)
+        )
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -77,6 +127,16 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order books are synced and tracked, which is all of them once the tracker is ready.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if trading_pair in self._tracking_tasks]
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._tracking_tasks
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,6 +144,45 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def pair_stats(self) -> Dict[str, OrderBookTrackerPairStats]:
+        return self._pair_stats
+
+    @property
+    def tracking_queue_depths(self) -> Dict[str, int]:
+        return {
+            trading_pair: message_queue.qsize()
+            for trading_pair, message_queue in self._tracking_message_queues.items()
+        }
+
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    def set_market_data_recorder(self, recorder: MarketDataRecorder):
+        """
+        Records the snapshots, diffs and trades received by the tracker, and the initial order book snapshots. The
+        tracker's streams are replaced with recording queues, so this must be called before start().
+        """
+        self._market_data_recorder = recorder
+        for stream_name in ("_order_book_diff_stream", "_order_book_snapshot_stream", "_order_book_trade_stream"):
+            stream: asyncio.Queue = getattr(self, stream_name)
+            recording_stream: MarketDataRecordingQueue = MarketDataRecordingQueue(recorder)
+            while not stream.empty():
+                recording_stream.put_nowait(stream.get_nowait())
+            setattr(self, stream_name, recording_stream)
+
+    def numpy_snapshot(self, depth: Optional[int] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the bids and asks of every tracked order book as float64 arrays of [price, amount, update_id] rows.
+
+        :param depth: if given, only the top depth levels of each side are exported
+        """
+        return {
+            trading_pair: order_book.to_numpy(depth)
+            for trading_pair, order_book in self._order_books.items()
+        }
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -172,32 +271,58 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books, fetching the snapshots concurrently within the snapshot concurrency and rate limit
+        budget. Each order book starts being tracked as soon as its snapshot is applied; diffs received before that
+        are buffered by the diff router.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
+        throttler: Throttler = Throttler(rate_limit=self.SNAPSHOT_RATE_LIMIT)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.SNAPSHOT_BOOTSTRAP_CONCURRENCY)
+        completed: List[str] = []
+
+        async def init_order_book(trading_pair: str):
+            while True:
+                try:
+                    async with semaphore:
+                        async with throttler.weighted_task(self.SNAPSHOT_REQUEST_WEIGHT):
+                            order_book: OrderBook = await self._data_source.get_new_order_book(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(f"Unexpected error fetching order book snapshot for {trading_pair}.",
+                                          exc_info=True,
+                                          app_warning_msg=f"Could not fetch order book snapshot for {trading_pair}. "
+                                                          f"Retrying after 5 seconds.")
+                    await asyncio.sleep(5.0)
+            self._order_books[trading_pair] = order_book
+            if self._market_data_recorder is not None:
+                self._market_data_recorder.record_order_book(trading_pair, order_book)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            completed.append(trading_pair)
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+                               f"{len(completed)}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
     async def _order_book_diff_router(self):
         """
-        Route the real-time order book diff messages to the correct order book.
+        Route the real-time order book diff messages to the correct order book. Diffs for order books that are still
+        being initialized are saved, and applied once their snapshot is in.
         """
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    messages_queued += 1
+                    self._saved_message_queues[trading_pair].append(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -212,9 +337,11 @@ class OrderBookTracker(ABC):
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
+                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -227,7 +354,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -242,6 +368,53 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _drain_message_queue(self, message: OrderBookMessage, message_queue: asyncio.Queue) -> List[OrderBookMessage]:
+        """
+        Returns the given message followed by the messages already waiting in the queue, if diff batch mode is on.
+        """
+        messages: List[OrderBookMessage] = [message]
+        if self.DIFF_BATCH_MODE:
+            while len(messages) < self.MAX_DIFF_BATCH_SIZE and not message_queue.empty():
+                messages.append(message_queue.get_nowait())
+        return messages
+
+    def _apply_order_book_messages(self,
+                                   trading_pair: str,
+                                   order_book: OrderBook,
+                                   messages: List[OrderBookMessage],
+                                   past_diffs_window: Deque[OrderBookMessage],
+                                   queue_depth: int = 0) -> int:
+        """
+        Applies diff and snapshot messages to an order book, in order. Consecutive diffs are applied in one batch
+        call, one order book update per diff. Returns the number of diff messages applied.
+        """
+        stats: OrderBookTrackerPairStats = self._pair_stats.setdefault(trading_pair, OrderBookTrackerPairStats())
+        pending_diffs: List[OrderBookMessage] = []
+        diffs_applied: int = 0
+
+        def flush_diffs():
+            start: float = time.perf_counter()
+            order_book.apply_diffs_batch(pending_diffs)
+            stats.record_batch(len(pending_diffs), queue_depth, time.perf_counter() - start)
+            past_diffs_window.extend(pending_diffs)
+            while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
+                past_diffs_window.popleft()
+            pending_diffs.clear()
+
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                pending_diffs.append(message)
+                diffs_applied += 1
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                if len(pending_diffs) > 0:
+                    flush_diffs()
+                past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+        if len(pending_diffs) > 0:
+            flush_diffs()
+        return diffs_applied
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[trading_pair] = past_diffs_window
@@ -253,24 +426,29 @@ class OrderBookTracker(ABC):
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+                messages: List[OrderBookMessage]
+                queue_depth: int
+                saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+
+                # Process the diffs saved while the order book was being initialized first, if there are any.
+                if len(saved_messages) > 0:
+                    messages = [m for m in saved_messages if m.update_id >= order_book.snapshot_uid]
+                    saved_messages.clear()
+                    queue_depth = len(messages)
+                else:
+                    message: OrderBookMessage = await message_queue.get()
+                    queue_depth = message_queue.qsize()
+                    messages = self._drain_message_queue(message, message_queue)
+                diff_messages_accepted += self._apply_order_book_messages(
+                    trading_pair, order_book, messages, past_diffs_window, queue_depth
+                )
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -281,7 +459,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -11,6 +11,10 @@ from typing import (
     List,
 )
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.utils.http_session_registry import (
+    HostConnectionStats,
+    HttpSessionRegistry
+)
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
@@ -28,6 +32,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def http_connection_stats() -> Dict[str, HostConnectionStats]:
+        """
+        Connection reuse statistics per host of the REST requests sent through the shared HTTP sessions, see
+        hummingbot.core.utils.http_session_registry.shared_client_session().
+        """
+        return HttpSessionRegistry.get_instance().host_stats
+
     @property
     def order_book_create_function(self) -> Callable[[], OrderBook]:
         return self._order_book_create_function
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+from bisect import bisect_right
+from typing import (
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+
+class EventLogRetentionPolicy(NamedTuple):
+    """
+    How many events an EventLogger keeps.
+
+    max_events: max number of retained events, excluding the exempt event types. None for no limit.
+    max_age: seconds, by event timestamp, an event is kept after the latest logged event. None for no limit.
+    exempt_event_types: event types that are never evicted, e.g. fills needed for balance accounting.
+    """
+    max_events: Optional[int] = None
+    max_age: Optional[float] = None
+    exempt_event_types: Tuple[type, ...] = ()
+
+
+class EventTypeLog:
+    """
+    Events of one type in logging order, with their sequence numbers and timestamps. Evicted events are dropped from
+    the front by moving the head, and the lists are compacted once half of them is evicted. Compaction replaces the
+    lists, so the views already handed out keep iterating over the old ones.
+    """
+
+    def __init__(self):
+        self.seqs: List[int] = []
+        self.timestamps: List[float] = []
+        self.events: List[object] = []
+        self.head: int = 0
+        self.ordered: bool = True
+
+    def __len__(self) -> int:
+        return len(self.events) - self.head
+
+    def append(self, seq: int, timestamp: float, event_object: object):
+        if self.ordered and len(self.timestamps) > self.head and timestamp < self.timestamps[-1]:
+            self.ordered = False
+        self.seqs.append(seq)
+        self.timestamps.append(timestamp)
+        self.events.append(event_object)
+
+    def evict_first(self):
+        self.head += 1
+        if self.head > 64 and self.head * 2 > len(self.events):
+            self.seqs = self.seqs[self.head:]
+            self.timestamps = self.timestamps[self.head:]
+            self.events = self.events[self.head:]
+            self.head = 0
+
+    def first_timestamp(self) -> float:
+        return self.timestamps[self.head]
+
+    def iter_entries(self, after: Optional[float] = None) -> Iterator[Tuple[int, object]]:
+        """
+        Returns an iterator over the (sequence number, event) entries retained at the time of the call.
+        """
+        start, end = self.head, len(self.events)
+        if after is not None and self.ordered:
+            start = bisect_right(self.timestamps, after, start, end)
+            after = None
+        return self._iter_range(self.seqs, self.timestamps, self.events, start, end, after)
+
+    @staticmethod
+    def _iter_range(seqs: List[int],
+                    timestamps: List[float],
+                    events: List[object],
+                    start: int,
+                    end: int,
+                    after: Optional[float]) -> Iterator[Tuple[int, object]]:
+        for i in range(start, end):
+            if after is None or timestamps[i] > after:
+                yield seqs[i], events[i]
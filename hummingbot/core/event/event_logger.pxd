@@ -4,7 +4,12 @@ from .event_listener cimport EventListener
 cdef class EventLogger(EventListener):
     cdef:
         str _event_source
-        object _logged_events
+        object _retention
+        dict _logged_events
+        object _eviction_order
+        long long _next_seq
+        double _latest_timestamp
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
+    cdef c_log_event(self, object event_type, object event_object)
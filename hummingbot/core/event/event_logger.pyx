@@ -2,32 +2,78 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import deque
+import heapq
 from typing import (
+    Iterator,
     List,
     Optional,
 )
 
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.event.event_log_store import (
+    EventLogRetentionPolicy,
+    EventTypeLog,
+)
 
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, retention: Optional[EventLogRetentionPolicy] = None):
         super().__init__()
         self._event_source = event_source
-        self._logged_events = []
+        self._retention = retention if retention is not None else EventLogRetentionPolicy()
+        self._logged_events = {}  # Dict[event_type, EventTypeLog]
+        self._eviction_order = deque()  # Types of the evictable events, in logging order
+        self._next_seq = 0
+        self._latest_timestamp = float("-inf")
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+        """
+        A copy of all retained events in logging order. Use iter_events() to go through them without copying.
+        """
+        return list(self.iter_events())
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def retention(self) -> EventLogRetentionPolicy:
+        return self._retention
+
+    def __len__(self) -> int:
+        return sum(len(type_log) for type_log in self._logged_events.values())
+
+    def count(self, event_type: type) -> int:
+        type_log = self._logged_events.get(event_type)
+        return len(type_log) if type_log is not None else 0
+
+    def iter_events(self, event_type: Optional[type] = None, after: Optional[float] = None) -> Iterator[any]:
+        """
+        Iterates over the retained events in logging order, without copying them.
+        :param event_type: only the events of this type, looked up by index
+        :param after: only the events with a timestamp later than this one
+        """
+        if event_type is not None:
+            type_log = self._logged_events.get(event_type)
+            if type_log is None:
+                return iter(())
+            entries = type_log.iter_entries(after)
+        else:
+            type_logs = list(self._logged_events.values())
+            if len(type_logs) == 1:
+                entries = type_logs[0].iter_entries(after)
+            else:
+                entries = heapq.merge(*[type_log.iter_entries(after) for type_log in type_logs],
+                                      key=lambda entry: entry[0])
+        return (event_object for _, event_object in entries)
+
     def clear(self):
-        self._logged_events.clear()
+        self._logged_events = {}
+        self._eviction_order.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -45,8 +91,8 @@ cdef class EventLogger(EventListener):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.append(event_object)
         event_object_type = type(event_object)
+        self.c_log_event(event_object_type, event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
@@ -55,3 +101,31 @@ cdef class EventLogger(EventListener):
                 self._wait_returns[notifier] = event_object
         for notifier in should_notify:
             notifier.set()
+
+    cdef c_log_event(self, object event_type, object event_object):
+        cdef:
+            object timestamp = getattr(event_object, "timestamp", None)
+            object type_log = self._logged_events.get(event_type)
+            object retention = self._retention
+
+        if not isinstance(timestamp, (int, float)):
+            timestamp = self._latest_timestamp
+        if type_log is None:
+            type_log = EventTypeLog()
+            self._logged_events[event_type] = type_log
+        type_log.append(self._next_seq, timestamp, event_object)
+        self._next_seq += 1
+        if timestamp > self._latest_timestamp:
+            self._latest_timestamp = timestamp
+
+        if event_type in retention.exempt_event_types:
+            return
+        self._eviction_order.append(event_type)
+        if retention.max_events is not None:
+            while len(self._eviction_order) > retention.max_events:
+                self._logged_events[self._eviction_order.popleft()].evict_first()
+        if retention.max_age is not None:
+            cutoff = self._latest_timestamp - retention.max_age
+            while (len(self._eviction_order) > 0 and
+                   self._logged_events[self._eviction_order[0]].first_timestamp() < cutoff):
+                self._logged_events[self._eviction_order.popleft()].evict_first()
@@ -1,19 +1,54 @@
+import asyncio
 import cachetools
 import functools
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional
+)
 
 
-def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
+def async_ttl_cache(ttl: int = 3600, maxsize: int = 1, key: Optional[Callable[..., Any]] = None):
+    """
+    Caches the results of a coroutine function for ttl seconds. Concurrent calls with the same key share a single
+    call of the function while it is in flight.
+    :param ttl: how long a result is cached for, in seconds
+    :param maxsize: the maximum number of results cached
+    :param key: makes the cache key out of the call arguments, the arguments as a string by default
+    """
     cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+    in_flight: Dict[Any, asyncio.Future] = {}
+
+    def on_done(cache_key: Any, future: asyncio.Future):
+        in_flight.pop(cache_key, None)
+        if not future.cancelled() and future.exception() is None:
+            cache[cache_key] = future.result()
 
     def decorator(fn):
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
-            key = str((args, kwargs))
+            cache_key = key(*args, **kwargs) if key is not None else str((args, kwargs))
             try:
-                return cache[key]
+                return cache[cache_key]
             except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                pass
+            future = in_flight.get(cache_key)
+            if future is None:
+                future = asyncio.ensure_future(fn(*args, **kwargs))
+                in_flight[cache_key] = future
+                future.add_done_callback(functools.partial(on_done, cache_key))
+            # A caller being cancelled doesn't cancel the call the other callers are waiting on.
+            return await asyncio.shield(future)
         return memoize
 
     return decorator
+
+
+def quote_price_cache_key(connector: Any, trading_pair: str, is_buy: bool, amount: Any) -> Any:
+    """
+    Cache key of a connector quote price call, the amount is normalized so that e.g. 1, 1.0 and Decimal("1.00") share
+    a cache entry.
+    """
+    return id(connector), trading_pair, is_buy, Decimal(str(amount)).normalize()
@@ -2,12 +2,19 @@
 
 import asyncio
 from async_timeout import timeout
+from enum import IntEnum
+import itertools
 import logging
+import time
 from typing import (
-    Optional,
-    Coroutine,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
     NamedTuple,
-    Callable
+    Optional,
+    Set,
+    Union
 )
 
 import hummingbot
@@ -15,21 +22,66 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
+class AsyncCallPriority(IntEnum):
+    """
+    Scheduling lanes, in the order they are served. A call waits for every queued call of the more urgent lanes.
+    """
+    CANCEL = 0
+    CREATE = 1
+    NORMAL = 2
+    POLLING = 3
+
+
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
-    coroutine: Coroutine
+    coroutine: Union[Awaitable, Callable[[], Awaitable]]
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    priority: AsyncCallPriority = AsyncCallPriority.NORMAL
+    enqueue_time: float = 0.0
+
+
+class AsyncCallLaneStats:
+    """
+    Queue wait and execution time counters of the calls scheduled on one lane.
+    """
+
+    def __init__(self):
+        self.calls: int = 0
+        self.failures: int = 0
+        self.expired: int = 0
+        self.total_wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        self.total_execution_time: float = 0.0
+        self.max_execution_time: float = 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.total_wait_time / self.calls if self.calls > 0 else 0.0
+
+    @property
+    def avg_execution_time(self) -> float:
+        return self.total_execution_time / self.calls if self.calls > 0 else 0.0
 
 
 class AsyncCallScheduler:
+    """
+    Runs scheduled API calls, at most `max_concurrency` at a time, and starts a call at most every `call_interval`
+    seconds. Calls are started in priority lane order, and in scheduling order within a lane, so urgent calls like
+    cancels go ahead of queued background polls.
+
+    A lane can have a queue timeout: its calls fail with asyncio.TimeoutError if they are still queued after that many
+    seconds, instead of being started late.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
     @classmethod
     def shared_instance(cls):
         if cls._acs_shared_instance is None:
-            cls._acs_shared_instance = AsyncCallScheduler()
+            # Callers of the shared instance, e.g. the web3 wallet nonce and sendRawTransaction calls, rely on their
+            # calls being serialized.
+            cls._acs_shared_instance = AsyncCallScheduler(max_concurrency=1)
         return cls._acs_shared_instance
 
     @classmethod
@@ -38,14 +90,30 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
+    def __init__(self,
+                 call_interval: float = 0.01,
+                 max_concurrency: int = 4,
+                 lane_queue_timeouts: Optional[Dict[AsyncCallPriority, float]] = None):
+        """
+        :param call_interval: min seconds between the starts of two calls
+        :param max_concurrency: max number of calls running at the same time
+        :param lane_queue_timeouts: max seconds a call of the lane can wait in the queue, no limit for missing lanes
+        """
+        self._coro_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
+        self._lane_queue_timeouts: Dict[AsyncCallPriority, float] = dict(lane_queue_timeouts or {})
+        self._lane_stats: Dict[AsyncCallPriority, AsyncCallLaneStats] = {
+            priority: AsyncCallLaneStats() for priority in AsyncCallPriority
+        }
+        self._running_tasks: Set[asyncio.Task] = set()
+        self._call_slots: Optional[asyncio.Semaphore] = None
+        self._sequence: Iterator[int] = itertools.count()
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
+    def coro_queue(self) -> asyncio.PriorityQueue:
         return self._coro_queue
 
     @property
@@ -56,9 +124,22 @@ class AsyncCallScheduler:
     def started(self) -> bool:
         return self._coro_scheduler_task is not None
 
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def running_calls(self) -> int:
+        return len(self._running_tasks)
+
+    @property
+    def lane_stats(self) -> Dict[AsyncCallPriority, AsyncCallLaneStats]:
+        return self._lane_stats
+
     def start(self):
         if self._coro_scheduler_task is not None:
             self.stop()
+        self._call_slots = asyncio.Semaphore(self._max_concurrency)
         self._coro_scheduler_task = safe_ensure_future(
             self._coro_scheduler(
                 self._coro_queue,
@@ -70,33 +151,29 @@ class AsyncCallScheduler:
         if self._coro_scheduler_task is not None:
             self._coro_scheduler_task.cancel()
             self._coro_scheduler_task = None
+        for task in list(self._running_tasks):
+            task.cancel()
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    async def _coro_scheduler(self, coro_queue: asyncio.PriorityQueue, interval: float = 0.01):
+        # Calls release the slots they were started with, calls cancelled by stop() can release theirs after start()
+        # replaced the semaphore.
+        call_slots: asyncio.Semaphore = self._call_slots
         while True:
-            app_warning_msg = "API call error."
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
-            except asyncio.CancelledError:
+                await call_slots.acquire()
                 try:
-                    fut.cancel()
-                except Exception:
-                    pass
+                    _, _, item = await coro_queue.get()
+                except BaseException:
+                    call_slots.release()
+                    raise
+                if not self._start_call(item, call_slots):
+                    call_slots.release()
+                    continue
+            except asyncio.CancelledError:
                 raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
+            except Exception:
+                self.logger().error("Unexpected error in the call scheduler.", exc_info=True)
+                continue
 
             try:
                 await asyncio.sleep(interval)
@@ -105,13 +182,78 @@ class AsyncCallScheduler:
             except Exception:
                 self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
+    def _start_call(self, item: AsyncCallSchedulerItem, call_slots: asyncio.Semaphore) -> bool:
+        """
+        Starts the call of a dequeued item, unless its future is already done or its queue timeout expired.
+
+        :return: True if the call was started
+        """
+        wait_time: float = time.perf_counter() - item.enqueue_time
+        stats: AsyncCallLaneStats = self._lane_stats[item.priority]
+        queue_timeout: Optional[float] = self._lane_queue_timeouts.get(item.priority)
+        if item.future.done() or (queue_timeout is not None and wait_time > queue_timeout):
+            if not item.future.done():
+                stats.expired += 1
+                item.future.set_exception(asyncio.TimeoutError(
+                    f"Call waited {wait_time:.3f}s in the {item.priority.name} lane, longer than its "
+                    f"{queue_timeout}s queue timeout."))
+            if asyncio.iscoroutine(item.coroutine):
+                item.coroutine.close()
+            return False
+        stats.calls += 1
+        stats.total_wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
+        task: asyncio.Task = safe_ensure_future(self._run_call(item, stats, call_slots))
+        self._running_tasks.add(task)
+        task.add_done_callback(self._running_tasks.discard)
+        return True
+
+    async def _run_call(self, item: AsyncCallSchedulerItem, stats: AsyncCallLaneStats,
+                        call_slots: asyncio.Semaphore):
+        fut, coro, timeout_seconds, app_warning_msg, _, _ = item
+        start: float = time.perf_counter()
+        try:
+            awaitable: Awaitable = coro() if callable(coro) else coro
+            async with timeout(timeout_seconds):
+                result = await awaitable
+            if not fut.done():
+                fut.set_result(result)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            stats.failures += 1
+            # Add exception information.
+            app_warning_msg += f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            if not fut.done():
+                fut.set_exception(e)
+        finally:
+            execution_time: float = time.perf_counter() - start
+            stats.total_execution_time += execution_time
+            stats.max_execution_time = max(stats.max_execution_time, execution_time)
+            call_slots.release()
+
     async def schedule_async_call(self,
-                                  coro: Coroutine,
+                                  coro: Union[Awaitable, Callable[[], Awaitable]],
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> any:
+        """
+        Schedules a call and waits for its result.
+
+        :param coro: the coroutine to run, or a function returning the awaitable to run, called when the call starts
+        :param timeout_seconds: max seconds the call can run for, not counting the time it waits in the queue
+        :param priority: the lane to schedule the call on
+        """
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
+        self._coro_queue.put_nowait((priority, next(self._sequence),
+                                     AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                            app_warning_msg=app_warning_msg,
+                                                            priority=priority,
+                                                            enqueue_time=time.perf_counter())))
         if self._coro_scheduler_task is None:
             self.start()
         return await fut
@@ -119,10 +261,13 @@ class AsyncCallScheduler:
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> any:
+        """
+        Schedules a blocking function call, which is run on the executor when the call starts.
+        """
+        def run_in_executor() -> Awaitable:
+            return self._ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+        return await self.schedule_async_call(run_in_executor, timeout_seconds,
+                                              app_warning_msg=app_warning_msg,
+                                              priority=priority)
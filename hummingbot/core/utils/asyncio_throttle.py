@@ -1,44 +1,99 @@
+import asyncio
+import heapq
+import itertools
 import logging
 import time
-import asyncio
 from collections import deque
 from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
     Optional,
-    Tuple,
-    Deque
+    Tuple
 )
 
+from hummingbot.core.utils.async_call_scheduler import AsyncCallPriority
+
 RequestWeight = int
 Seconds = float
 Timestamp_s = float
 TaskLog = Tuple[Timestamp_s, RequestWeight]
 
+DEFAULT_LIMIT_ID = "default"
 
-class Throttler:
-    def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
-                 period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+
+class RateLimit(NamedTuple):
+    """
+    At most `limit` weight can be used in any `time_interval` seconds. A global limit applies to every request,
+    with the request weight. Other limits only apply to the requests that give a weight for them, e.g. the weight
+    of an endpoint or the order count.
+    """
+    limit_id: str
+    limit: RequestWeight
+    time_interval: Seconds
+    is_global: bool = True
+
+
+class RateLimitWindow:
+    """
+    Log of the weights used in the last window of one rate limit.
+    """
+
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds):
+        self.rate_limit: RateLimit = rate_limit
+        self.window: Seconds = rate_limit.time_interval + period_safety_margin
+        self.task_logs: Deque[TaskLog] = deque()
+        self.used: RequestWeight = 0
+
+    def flush(self, now: Timestamp_s):
         """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
+        Removes the task logs that have left the window.
         """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
+        cutoff: float = now - self.window
+        while self.task_logs and self.task_logs[0][0] <= cutoff:
+            self.used -= self.task_logs.popleft()[1]
 
-    def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+    def available_at(self, now: Timestamp_s, weight: RequestWeight) -> Timestamp_s:
+        """
+        :return: the time at which the weight becomes available, assuming nothing else is used in the meantime
+        """
+        self.flush(now)
+        excess: RequestWeight = self.used + weight - self.rate_limit.limit
+        if excess <= 0:
+            return now
+        for task_ts, task_weight in self.task_logs:
+            excess -= task_weight
+            if excess <= 0:
+                return task_ts + self.window
+        return now
 
+    def add(self, now: Timestamp_s, weight: RequestWeight):
+        self.task_logs.append((now, weight))
+        self.used += weight
 
-class ThrottlerContextManager:
+    def utilisation(self, now: Timestamp_s) -> float:
+        self.flush(now)
+        return self.used / self.rate_limit.limit
+
+
+class ThrottlerWaiter(NamedTuple):
+    priority: AsyncCallPriority
+    sequence: int
+    weights: Tuple[Tuple[str, RequestWeight], ...]
+    future: asyncio.Future
+
+
+class Throttler:
+    """
+    Rate limits requests by weight, over one or more rate limits at the same time.
+
+    Requests that can't go right away wait in priority order, and in arrival order within a priority. Only the first
+    waiter is checked: the exact time its weights become available is computed from the task logs, and one timer is
+    set to wake it up at that time, so waiting requests are not polled.
+    """
     throttler_logger: Optional[logging.Logger] = None
 
     @classmethod
@@ -48,54 +103,144 @@ class ThrottlerContextManager:
         return cls.throttler_logger
 
     def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
-                 request_weight: RequestWeight = 1,
+                 rate_limit: Optional[Tuple[RequestWeight, Seconds]] = None,
                  period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
+                 retry_interval: Seconds = 0.1,
+                 rate_limits: Optional[Iterable[RateLimit]] = None):
         """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
-        :param request_weight: Weight of the request of the added task
-        :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
+        :param rate_limit: Max weight allowed in the given period, for all requests
+        :param period_safety_margin: estimate for the network latency, added to the rate limit periods
+        :param retry_interval: Unused, waiting requests are woken up when their weight becomes available
+        :param rate_limits: Other rate limits
         """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
-        self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
+        limits: List[RateLimit] = list(rate_limits) if rate_limits is not None else []
+        if rate_limit is not None:
+            limits.insert(0, RateLimit(DEFAULT_LIMIT_ID, rate_limit[0], rate_limit[1]))
+        if len(limits) == 0:
+            raise ValueError("A throttler needs at least one rate limit.")
+        self._windows: Dict[str, RateLimitWindow] = {
+            limit.limit_id: RateLimitWindow(limit, period_safety_margin) for limit in limits
+        }
+        self._global_limit_ids: Tuple[str, ...] = tuple(limit.limit_id for limit in limits if limit.is_global)
+        self._waiters: List[ThrottlerWaiter] = []
+        self._sequence: Iterator[int] = itertools.count()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [window.rate_limit for window in self._windows.values()]
+
+    @property
+    def waiting_requests(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
+    def utilisation(self, limit_id: Optional[str] = None) -> float:
+        """
+        :return: the share of the limit used in the current window, or of the most used limit if no limit is given
+        """
+        now: float = time.monotonic()
+        if limit_id is not None:
+            return self._windows[limit_id].utilisation(now)
+        return max(window.utilisation(now) for window in self._windows.values())
 
-    def flush(self):
+    def weighted_task(self,
+                      request_weight: RequestWeight = 1,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: AsyncCallPriority = AsyncCallPriority.NORMAL) -> "ThrottlerContextManager":
         """
-        Remove task logs that have passed rate limit periods
-        :return:
+        :param request_weight: weight of the request on the global limits
+        :param limit_weights: weights of the request on other limits, by limit id
+        :param priority: lane of the request, cancels go ahead of everything else
         """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
-            else:
-                break
+        return ThrottlerContextManager(self, request_weight, limit_weights, priority)
+
+    def _request_weights(self,
+                         request_weight: RequestWeight,
+                         limit_weights: Optional[Dict[str, RequestWeight]]) -> Tuple[Tuple[str, RequestWeight], ...]:
+        weights: Dict[str, RequestWeight] = {limit_id: request_weight for limit_id in self._global_limit_ids}
+        if limit_weights is not None:
+            for limit_id, weight in limit_weights.items():
+                if limit_id not in self._windows:
+                    raise ValueError(f"Unknown rate limit {limit_id}.")
+                weights[limit_id] = weight
+        for limit_id, weight in weights.items():
+            if weight > self._windows[limit_id].rate_limit.limit:
+                raise ValueError(f"Request weight {weight} is over the {limit_id} rate limit "
+                                 f"{self._windows[limit_id].rate_limit.limit}.")
+        return tuple(weights.items())
+
+    def _available_at(self, now: Timestamp_s, weights: Tuple[Tuple[str, RequestWeight], ...]) -> Timestamp_s:
+        return max(self._windows[limit_id].available_at(now, weight) for limit_id, weight in weights)
+
+    def _use(self, now: Timestamp_s, weights: Tuple[Tuple[str, RequestWeight], ...]):
+        for limit_id, weight in weights:
+            self._windows[limit_id].add(now, weight)
+
+    async def acquire(self,
+                      request_weight: RequestWeight = 1,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: AsyncCallPriority = AsyncCallPriority.NORMAL):
+        weights: Tuple[Tuple[str, RequestWeight], ...] = self._request_weights(request_weight, limit_weights)
+        now: float = time.monotonic()
+        if self.waiting_requests == 0 and self._available_at(now, weights) <= now:
+            self._use(now, weights)
+            return
+        waiter: ThrottlerWaiter = ThrottlerWaiter(priority, next(self._sequence), weights,
+                                                  asyncio.get_event_loop().create_future())
+        heapq.heappush(self._waiters, waiter)
+        self._wake_up()
+        try:
+            await waiter.future
+        finally:
+            if waiter.future.cancelled():
+                # The next waiter may be able to go now.
+                self._wake_up()
+
+    def _wake_up(self):
+        """
+        Lets the waiters go in order while their weights are available, and sets a timer for the time the weights of
+        the first remaining waiter become available.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+        while self._waiters:
+            waiter: ThrottlerWaiter = self._waiters[0]
+            if waiter.future.done():
+                heapq.heappop(self._waiters)
+                continue
+            now: float = time.monotonic()
+            available_at: float = self._available_at(now, waiter.weights)
+            if available_at > now:
+                self._wake_up_handle = asyncio.get_event_loop().call_later(available_at - now, self._wake_up)
+                return
+            heapq.heappop(self._waiters)
+            self._use(now, waiter.weights)
+            waiter.future.set_result(None)
+
+
+class ThrottlerContextManager:
+    def __init__(self,
+                 throttler: Throttler,
+                 request_weight: RequestWeight = 1,
+                 limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                 priority: AsyncCallPriority = AsyncCallPriority.NORMAL):
+        """
+        :param throttler: Throttler of the shared rate limits
+        :param request_weight: Weight of the request of the added task
+        :param limit_weights: Weights of the request on the non global rate limits
+        :param priority: Lane of the request
+        """
+        self._throttler: Throttler = throttler
+        self._request_weight: RequestWeight = request_weight
+        self._limit_weights: Optional[Dict[str, RequestWeight]] = limit_weights
+        self._priority: AsyncCallPriority = priority
 
     async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+        await self._throttler.acquire(self._request_weight, self._limit_weights, self._priority)
 
     async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+        await self.acquire()
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
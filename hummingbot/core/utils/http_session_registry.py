@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+import time
+from types import SimpleNamespace
+from typing import (
+    AsyncIterator,
+    Dict,
+    Optional
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+class HostConnectionStats:
+    """
+    Connection reuse and latency counters of the REST requests sent to one host.
+    """
+
+    def __init__(self):
+        self.requests: int = 0
+        self.connections_created: int = 0
+        self.connections_reused: int = 0
+        self.total_request_time: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        connections: int = self.connections_created + self.connections_reused
+        return self.connections_reused / connections if connections > 0 else 0.0
+
+    @property
+    def avg_request_time(self) -> float:
+        return self.total_request_time / self.requests if self.requests > 0 else 0.0
+
+
+class HttpSessionRegistry:
+    """
+    Process wide registry of pooled aiohttp client sessions, so REST calls reuse keep-alive connections instead of
+    opening a new TCP + TLS connection per request. Connections are pooled per host by the sessions' connectors.
+    """
+    DEFAULT_SESSION = "default"
+    _hsr_logger: Optional[HummingbotLogger] = None
+    _hsr_shared_instance: Optional["HttpSessionRegistry"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hsr_logger is None:
+            cls._hsr_logger = logging.getLogger(__name__)
+        return cls._hsr_logger
+
+    @classmethod
+    def get_instance(cls) -> "HttpSessionRegistry":
+        if cls._hsr_shared_instance is None:
+            cls._hsr_shared_instance = HttpSessionRegistry()
+        return cls._hsr_shared_instance
+
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 20,
+                 keepalive_timeout: float = 30.0,
+                 ttl_dns_cache: int = 300):
+        """
+        :param limit: max simultaneous connections per session
+        :param limit_per_host: max simultaneous connections to one host per session
+        :param keepalive_timeout: seconds an idle connection is kept open for reuse
+        :param ttl_dns_cache: seconds DNS resolutions are cached for
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._ttl_dns_cache: int = ttl_dns_cache
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._session_loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self._host_stats: Dict[str, HostConnectionStats] = {}
+        self._trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        self._trace_config.on_request_start.append(self._on_request_start)
+        self._trace_config.on_request_end.append(self._on_request_end)
+        self._trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self._trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+    @property
+    def host_stats(self) -> Dict[str, HostConnectionStats]:
+        return self._host_stats
+
+    def get_session(self, name: str = DEFAULT_SESSION) -> aiohttp.ClientSession:
+        """
+        Returns the named shared session, creating it on first use, or if it was closed or belongs to another event
+        loop. Callers must not close the returned session.
+        """
+        session: Optional[aiohttp.ClientSession] = self._sessions.get(name)
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        if session is None or session.closed or self._session_loops.get(name) is not ev_loop:
+            if session is not None and not session.closed:
+                self._close_session_of_other_loop(name, session, self._session_loops.get(name))
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self._limit,
+                                                                   limit_per_host=self._limit_per_host,
+                                                                   keepalive_timeout=self._keepalive_timeout,
+                                                                   use_dns_cache=True,
+                                                                   ttl_dns_cache=self._ttl_dns_cache)
+            session = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config])
+            self._sessions[name] = session
+            self._session_loops[name] = ev_loop
+        return session
+
+    def _close_session_of_other_loop(self,
+                                     name: str,
+                                     session: aiohttp.ClientSession,
+                                     session_loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Closes a session replaced because it belongs to another event loop. It can only be closed on its own loop, so
+        if that loop is not running anymore, its connections are left to be dropped with it.
+        """
+        if session_loop is not None and session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        else:
+            self.logger().warning(f"Replacing the {name} HTTP session of an event loop that is not running, its "
+                                  f"pooled connections are not closed.")
+
+    async def close(self):
+        """
+        Closes all the shared sessions and their pooled connections.
+        """
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._session_loops.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def _stats_for(self, url) -> HostConnectionStats:
+        host: str = url.host or ""
+        if host not in self._host_stats:
+            self._host_stats[host] = HostConnectionStats()
+        return self._host_stats[host]
+
+    async def _on_request_start(self, session, trace_config_ctx: SimpleNamespace, params):
+        trace_config_ctx.start = time.perf_counter()
+        trace_config_ctx.stats = self._stats_for(params.url)
+        trace_config_ctx.stats.requests += 1
+
+    async def _on_request_end(self, session, trace_config_ctx: SimpleNamespace, params):
+        trace_config_ctx.stats.total_request_time += time.perf_counter() - trace_config_ctx.start
+
+    async def _on_connection_create_end(self, session, trace_config_ctx: SimpleNamespace, params):
+        trace_config_ctx.stats.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, trace_config_ctx: SimpleNamespace, params):
+        trace_config_ctx.stats.connections_reused += 1
+
+
+@asynccontextmanager
+async def shared_client_session(
+        name: str = HttpSessionRegistry.DEFAULT_SESSION) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Drop-in replacement for `async with aiohttp.ClientSession() as client:` that yields a pooled shared session and
+    leaves it open on exit.
+    """
+    yield HttpSessionRegistry.get_instance().get_session(name)
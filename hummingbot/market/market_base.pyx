@@ -104,10 +104,8 @@ cdef class MarketBase(NetworkIterator):
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
         balances = {}
-        for event in order_filled_events:
+        for event in self._event_logger.iter_events(OrderFilledEvent, after=starting_timestamp):
             hb_trading_pair = self.convert_from_exchange_trading_pair(event.trading_pair)
             base, quote = hb_trading_pair.split("-")[0], hb_trading_pair.split("-")[1]
             if event.trade_type is TradeType.BUY:
@@ -148,6 +146,12 @@ cdef class MarketBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    def iter_event_logs(self, event_type: type = None, after: float = None) -> Iterator[any]:
+        """
+        Iterates over the logged events without copying them.
+        """
+        return self._event_logger.iter_events(event_type, after)
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         raise NotImplementedError
@@ -150,6 +150,13 @@ class SQLConnectionManager:
     def get_shared_session(self) -> Session:
         return self._shared_session
 
+    def get_new_session(self, **kwargs) -> Session:
+        """
+        Returns a new session bound to the database engine, for use by a thread other than the one using the shared
+        session. Keyword arguments are passed on to the session class.
+        """
+        return self._session_cls(**kwargs)
+
     def get_local_db_version(self):
         query: Query = (self._shared_session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
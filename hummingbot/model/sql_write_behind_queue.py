@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import (
+    Callable,
+    List,
+    Optional,
+    Tuple
+)
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+SQLMutation = Callable[[Session], None]
+SQLCommitCallback = Callable[[], None]
+
+
+class SQLWriteBehindStats:
+    """
+    Queue depth and commit time counters of a write-behind queue.
+    """
+
+    def __init__(self):
+        self.max_queue_depth: int = 0
+        self.backpressure_waits: int = 0
+        self.commits: int = 0
+        self.committed_mutations: int = 0
+        self.failed_mutations: int = 0
+        self.last_commit_time: float = 0.0
+        self.max_commit_time: float = 0.0
+        self.total_commit_time: float = 0.0
+
+    @property
+    def avg_commit_time(self) -> float:
+        return self.total_commit_time / self.commits if self.commits > 0 else 0.0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.committed_mutations / self.commits if self.commits > 0 else 0.0
+
+
+class SQLWriteBehindQueue:
+    """
+    Applies database mutations on a dedicated writer thread, so the event loop thread never waits on a commit.
+
+    A mutation is a callable that takes the writer's session and adds or updates records. Queued mutations are applied
+    in order and committed in grouped transactions of up to `max_batch_size` mutations. A mutation is committed at most
+    `max_commit_latency` seconds after the writer picks it up. When `max_queue_size` mutations are pending, `put()`
+    blocks until the writer catches up. `flush()` waits until everything queued so far is committed, `async_flush()`
+    does so without blocking the event loop, and `stop()` flushes the queue before the writer thread exits.
+
+    The writer session does not expire records on commit, so records created by a mutation can still be read by its
+    commit callback. Commit callbacks are called on the writer thread.
+    """
+    _swbq_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._swbq_logger is None:
+            cls._swbq_logger = logging.getLogger(__name__)
+        return cls._swbq_logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 max_queue_size: int = 10000,
+                 max_batch_size: int = 500,
+                 max_commit_latency: float = 0.1):
+        """
+        :param sql: connection manager of the database to write to
+        :param max_queue_size: number of pending mutations above which producers are blocked
+        :param max_batch_size: max number of mutations committed in one transaction
+        :param max_commit_latency: max seconds a picked up mutation waits for others to be grouped with
+        """
+        self._sql: SQLConnectionManager = sql
+        self._max_batch_size: int = max_batch_size
+        self._max_commit_latency: float = max_commit_latency
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._stats: SQLWriteBehindStats = SQLWriteBehindStats()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._session: Optional[Session] = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def stats(self) -> SQLWriteBehindStats:
+        return self._stats
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def start(self):
+        if self.started:
+            return
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="SQLWriteBehindQueue", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Commits the pending mutations and stops the writer thread.
+        """
+        if not self.started:
+            return
+        self._queue.put(None)
+        self._writer_thread.join(timeout)
+        if self._writer_thread.is_alive():
+            self.logger().warning(f"Database writer did not stop within {timeout} seconds, "
+                                  f"{self.queue_depth} mutations are still pending.")
+        self._writer_thread = None
+
+    def put(self, mutation: SQLMutation, on_commit: Optional[SQLCommitCallback] = None):
+        """
+        Queues a mutation, and the callback to call once it is committed. If the writer thread is not running, the
+        mutation is committed right away on the calling thread.
+
+        Records must not be dropped, so when the queue is full this blocks the calling thread, i.e. the event loop,
+        until the writer catches up. The default `max_queue_size` holds minutes of order and trade records, so this
+        only happens when the database stalls.
+        """
+        if not self.started:
+            self._commit_batch([(mutation, on_commit)])
+            return
+        try:
+            self._queue.put_nowait((mutation, on_commit))
+        except queue.Full:
+            self._stats.backpressure_waits += 1
+            self.logger().warning(f"Database write queue is full ({self._queue.maxsize} mutations), waiting for the "
+                                  f"writer to catch up.")
+            self._queue.put((mutation, on_commit))
+        self._stats.max_queue_depth = max(self._stats.max_queue_depth, self._queue.qsize())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the mutations queued before this call are committed.
+
+        :return: False if the timeout expired first, True otherwise
+        """
+        if not self.started:
+            return True
+        flushed: threading.Event = threading.Event()
+        self._queue.put(flushed)
+        return flushed.wait(timeout)
+
+    async def async_flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits on an executor thread until the mutations queued before this call are committed, so the event loop keeps
+        running meanwhile.
+
+        :return: False if the timeout expired first, True otherwise
+        """
+        if not self.started:
+            return True
+        return await asyncio.get_event_loop().run_in_executor(None, self.flush, timeout)
+
+    def _writer_loop(self):
+        self._session = self._sql.get_new_session(expire_on_commit=False)
+        try:
+            running: bool = True
+            while running:
+                batch: List[Tuple[SQLMutation, Optional[SQLCommitCallback]]] = []
+                flush_events: List[threading.Event] = []
+                item = self._queue.get()
+                deadline: float = time.monotonic() + self._max_commit_latency
+                while True:
+                    if item is None:
+                        running = False
+                        break
+                    elif isinstance(item, threading.Event):
+                        flush_events.append(item)
+                        break
+                    batch.append(item)
+                    if len(batch) >= self._max_batch_size:
+                        break
+                    remaining: float = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if len(batch) > 0:
+                    self._commit_batch(batch)
+                for flushed in flush_events:
+                    flushed.set()
+            # Commit whatever was queued after the stop request.
+            pending: List[Tuple[SQLMutation, Optional[SQLCommitCallback]]] = []
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is not None:
+                    pending.append(item)
+            if len(pending) > 0:
+                self._commit_batch(pending)
+        except Exception:
+            self.logger().error("Unexpected error in the database writer thread.", exc_info=True)
+        finally:
+            self._session.close()
+            self._session = None
+
+    def _commit_batch(self, batch: List[Tuple[SQLMutation, Optional[SQLCommitCallback]]]):
+        session: Session = self._session if self._session is not None else self._sql.get_shared_session()
+        start: float = time.perf_counter()
+        try:
+            for mutation, _ in batch:
+                mutation(session)
+            session.commit()
+            committed = batch
+        except Exception:
+            # Fall back to one transaction per mutation, so that one bad record does not drop the rest of the group.
+            session.rollback()
+            committed = []
+            for mutation, on_commit in batch:
+                try:
+                    mutation(session)
+                    session.commit()
+                    committed.append((mutation, on_commit))
+                except Exception:
+                    session.rollback()
+                    self._stats.failed_mutations += 1
+                    self.logger().error("Error committing database record.", exc_info=True)
+        elapsed: float = time.perf_counter() - start
+        self._stats.commits += 1
+        self._stats.committed_mutations += len(committed)
+        self._stats.last_commit_time = elapsed
+        self._stats.max_commit_time = max(self._stats.max_commit_time, elapsed)
+        self._stats.total_commit_time += elapsed
+        for _, on_commit in committed:
+            if on_commit is not None:
+                try:
+                    on_commit()
+                except Exception:
+                    self.logger().error("Error in database commit callback.", exc_info=True)
@@ -1,6 +1,8 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
+from libc.stdint cimport int64_t
 
 
 pmm_logger = None
@@ -13,29 +15,89 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._updates_since_resync = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        """
+        Adds a value, updating the mean and the sum of squared deviations of the values held (Welford's algorithm).
+        Once full, the value evicted is taken out of them in the same step.
+        """
+        cdef:
+            int64_t count
+            double old_val
+            double delta
+            double old_mean = self._mean
+            bint was_full = self._is_full
+
+        if was_full:
+            old_val = self._buffer[self._stop_index]
+            delta = val - old_val
+            self._mean += delta / self._length
+            self._m2 += delta * (val - self._mean + old_val - old_mean)
+            if self._m2 < 0:
+                self._m2 = 0
+        else:
+            count = self.c_count() + 1
+            delta = val - old_mean
+            self._mean += delta / count
+            self._m2 += delta * (val - self._mean)
+
         self._buffer[self._stop_index] = val
         self.c_increment_index()
 
+        # Sliding updates accumulate rounding errors, the statistics are recomputed from the buffer when it gets full
+        # and then once per length of updates, i.e. in O(1) amortized.
+        if self._is_full:
+            self._updates_since_resync += 1
+            if self._updates_since_resync >= self._length or not was_full:
+                self.c_resync_statistics()
+
     cdef void c_increment_index(self):
         self._stop_index = (self._stop_index + 1) % self._length
-        if(self._start_index == self._stop_index):
+        # Once full, the oldest value is the next one overwritten, i.e. the one at the stop index.
+        if self._is_full or self._start_index == self._stop_index:
             self._is_full = True
-            self._start_index = (self._start_index + 1) % self._length
+            self._start_index = self._stop_index
+
+    cdef void c_resync_statistics(self):
+        cdef:
+            int64_t i
+            double total = 0
+            double m2 = 0
+
+        # Only called when full, so the whole buffer is the window.
+        for i in range(self._length):
+            total += self._buffer[i]
+        self._mean = total / self._length
+        for i in range(self._length):
+            m2 += (self._buffer[i] - self._mean) * (self._buffer[i] - self._mean)
+        self._m2 = m2
+        self._updates_since_resync = 0
+
+    cdef int64_t c_count(self):
+        if self._is_full:
+            return self._length
+        return self._stop_index - self._start_index
 
     cdef bint c_is_empty(self):
         return (not self._is_full) and (self._start_index==self._stop_index)
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._start_index]
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
@@ -44,33 +106,55 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef double c_window_mean(self):
+        """
+        The mean of the values held, full or not.
+        """
+        if self.c_is_empty():
+            return np.nan
+        return self._mean
+
+    cdef double c_window_variance(self):
+        """
+        The (population) variance of the values held, full or not.
+        """
+        if self.c_is_empty():
+            return np.nan
+        return self._m2 / self.c_count()
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self._m2 / self._length
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self._m2 / self._length)
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef tuple c_get_views(self):
+        """
+        The values held, from the oldest, as two numpy views on the buffer: no copy is made.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(self._start_index, stop=self._stop_index, dtype=np.int16)
-        else:
-            indexes = np.arange(self._start_index, stop=self._start_index + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[self._start_index:self._stop_index], buffer[:0]
+        return buffer[self._start_index:], buffer[:self._start_index]
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        older, newer = self.c_get_views()
+        if len(newer) == 0:
+            return older.copy()
+        return np.concatenate((older, newer))
 
     def __init__(self, length):
         self._length = length
@@ -78,6 +162,9 @@ cdef class RingBuffer:
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._updates_since_resync = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,6 +172,12 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_views(self):
+        return self.c_get_views()
+
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -92,6 +185,14 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def window_mean(self):
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self):
+        return self.c_window_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -0,0 +1,75 @@
+from collections import deque
+from typing import (
+    Deque,
+    List,
+    Tuple
+)
+
+
+class RollingVolatility:
+    """
+    Volatility of a price series as the average relative price range, (max - min) / min, of its last window_count
+    windows of window_length samples, the latest window ending at the latest sample.
+
+    Each sample is processed in O(1) amortized: the max and min of the latest window are tracked with monotonic deques,
+    the ranges of the windows are kept in a ring buffer and their sums per window offset are updated as ranges are
+    added and evicted.
+    """
+    def __init__(self, window_length: int, window_count: int):
+        self._window_length = window_length
+        self._window_count = window_count
+        # (sample index, price), with decreasing prices for the max and increasing prices for the min
+        self._max_deque: Deque[Tuple[int, float]] = deque()
+        self._min_deque: Deque[Tuple[int, float]] = deque()
+        # Range of the window ending at each of the last window_length * window_count samples
+        self._ranges: List[float] = [0.0] * (window_length * window_count)
+        # Sum of the ranges of the windows ending at sample indexes that are equal modulo window_length
+        self._range_sums: List[float] = [0.0] * window_length
+        self._sample_count = 0
+
+    @property
+    def sample_count(self) -> int:
+        return self._sample_count
+
+    def add_sample(self, price: float):
+        index = self._sample_count
+        self._sample_count += 1
+
+        while len(self._max_deque) > 0 and self._max_deque[-1][1] <= price:
+            self._max_deque.pop()
+        self._max_deque.append((index, price))
+        while len(self._min_deque) > 0 and self._min_deque[-1][1] >= price:
+            self._min_deque.pop()
+        self._min_deque.append((index, price))
+
+        oldest_index = index - self._window_length
+        while self._max_deque[0][0] <= oldest_index:
+            self._max_deque.popleft()
+        while self._min_deque[0][0] <= oldest_index:
+            self._min_deque.popleft()
+
+        if index >= self._window_length - 1:
+            price_range = self._current_range()
+            slot = index % len(self._ranges)
+            offset = index % self._window_length
+            if index - len(self._ranges) >= self._window_length - 1:
+                self._range_sums[offset] -= self._ranges[slot]
+            self._ranges[slot] = price_range
+            self._range_sums[offset] += price_range
+
+    def _current_range(self) -> float:
+        min_price = self._min_deque[0][1]
+        return (self._max_deque[0][1] - min_price) / min_price
+
+    @property
+    def value(self) -> float:
+        """
+        The volatility, NaN before the first sample. Until the first window is complete, this is the range of the
+        samples so far.
+        """
+        if self._sample_count == 0:
+            return float("nan")
+        if self._sample_count < self._window_length:
+            return self._current_range()
+        window_count = min(self._window_count, self._sample_count // self._window_length)
+        return self._range_sums[(self._sample_count - 1) % self._window_length] / window_count
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import numpy as np
 import logging
 from ..ring_buffer import RingBuffer
 
@@ -34,7 +33,7 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return self._processing_buffer.window_mean
 
     @property
     def current_value(self) -> float:
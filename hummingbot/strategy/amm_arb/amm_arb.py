@@ -3,7 +3,7 @@ import logging
 import asyncio
 import pandas as pd
 from typing import List, Dict, Tuple, Optional
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -252,8 +252,8 @@ class AmmArbStrategy(StrategyPyBase):
         data = []
         for market_info in [self._market_info_1, self._market_info_2]:
             market, trading_pair, base_asset, quote_asset = market_info
-            buy_price = await market.get_quote_price(trading_pair, True, self._order_amount)
-            sell_price = await market.get_quote_price(trading_pair, False, self._order_amount)
+            buy_price, sell_price = await safe_gather(market.get_quote_price(trading_pair, True, self._order_amount),
+                                                      market.get_quote_price(trading_pair, False, self._order_amount))
 
             # check for unavailable price data
             buy_price = smart_round(Decimal(str(buy_price)), 8) if buy_price is not None else '-'
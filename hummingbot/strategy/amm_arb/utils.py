@@ -1,5 +1,6 @@
 from decimal import Decimal
 from typing import List
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import ArbProposal, ArbProposalSide
 
@@ -18,12 +19,20 @@ async def create_arb_proposals(market_info_1: MarketTradingPairTuple,
     """
     order_amount = Decimal(str(order_amount))
     results = []
+    # Fetches all the prices at once, for gateway connectors each of them is a request to the gateway.
+    price_tasks = []
     for index in range(0, 2):
         is_buy = not bool(index)  # bool(0) is False, so start with buy first
-        m_1_q_price = await market_info_1.market.get_quote_price(market_info_1.trading_pair, is_buy, order_amount)
-        m_1_o_price = await market_info_1.market.get_order_price(market_info_1.trading_pair, is_buy, order_amount)
-        m_2_q_price = await market_info_2.market.get_quote_price(market_info_2.trading_pair, not is_buy, order_amount)
-        m_2_o_price = await market_info_2.market.get_order_price(market_info_2.trading_pair, not is_buy, order_amount)
+        price_tasks.extend([
+            market_info_1.market.get_quote_price(market_info_1.trading_pair, is_buy, order_amount),
+            market_info_1.market.get_order_price(market_info_1.trading_pair, is_buy, order_amount),
+            market_info_2.market.get_quote_price(market_info_2.trading_pair, not is_buy, order_amount),
+            market_info_2.market.get_order_price(market_info_2.trading_pair, not is_buy, order_amount)
+        ])
+    prices = await safe_gather(*price_tasks)
+    for index in range(0, 2):
+        is_buy = not bool(index)
+        m_1_q_price, m_1_o_price, m_2_q_price, m_2_o_price = prices[index * 4:(index + 1) * 4]
         if any(p is None for p in (m_1_o_price, m_1_q_price, m_2_o_price, m_2_q_price)):
             continue
         first_side = ArbProposalSide(
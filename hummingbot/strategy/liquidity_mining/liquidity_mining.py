@@ -1,10 +1,10 @@
 from decimal import Decimal
 import logging
+import math
 import asyncio
 from typing import Dict, List, Set
 import pandas as pd
 import numpy as np
-from statistics import mean
 import time
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
@@ -12,6 +12,7 @@ from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import Proposal, PriceSize
+from hummingbot.strategy.__utils__.rolling_volatility import RollingVolatility
 from hummingbot.core.event.events import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -78,8 +79,10 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        self._mid_prices = {market: RollingVolatility(volatility_interval, avg_volatility_period)
+                            for market in market_infos}
+        # Volatility as floats, converted to Decimal only when applied to proposals.
+        self._volatility = {market: float("nan") for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -185,7 +188,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 float(mid_price),
                 f"{best_bid_pct:.2%}",
                 f"{best_ask_pct:.2%}",
-                "" if self._volatility[market].is_nan() else f"{self._volatility[market]:.2%}",
+                "" if math.isnan(self._volatility[market]) else f"{self._volatility[market]:.2%}",
             ])
         df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
         df.sort_values(by=["Market"], inplace=True)
@@ -251,9 +254,10 @@ class LiquidityMiningStrategy(StrategyPyBase):
         proposals = []
         for market, market_info in self._market_infos.items():
             spread = self._spread
-            if not self._volatility[market].is_nan():
+            if not math.isnan(self._volatility[market]):
                 # volatility applies only when it is higher than the spread setting.
-                spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
+                volatility = Decimal(str(self._volatility[market]))
+                spread = max(spread, volatility * self._volatility_to_spread_multiplier)
             if self._max_spread > s_decimal_zero:
                 spread = min(spread, self._max_spread)
             mid_price = market_info.get_mid_price()
@@ -378,8 +382,8 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     price=proposal.sell.price
                 )
             if proposal.buy.size > 0 or proposal.sell.size > 0:
-                if not self._volatility[proposal.market].is_nan() and spread > self._spread:
-                    adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
+                if not math.isnan(self._volatility[proposal.market]) and spread > self._spread:
+                    adjusted_vol = self._volatility[proposal.market] * float(self._volatility_to_spread_multiplier)
                     if adjusted_vol > self._spread:
                         self.logger().info(f"({proposal.market}) Spread is widened to {spread:.2%} due to high "
                                            f"market volatility")
@@ -466,29 +470,19 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
     def update_mid_prices(self):
         for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+            mid_price = float(self._market_infos[market].get_mid_price())
+            if not math.isnan(mid_price):
+                self._mid_prices[market].add_sample(mid_price)
 
     def update_volatility(self):
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        """
+        Volatility is the average of the price ranges, (max - min) / min, of the last avg_volatility_period windows of
+        volatility_interval mid prices, kept up to date incrementally as mid prices are added.
+        """
+        self._volatility = {market: mid_prices.value for market, mid_prices in self._mid_prices.items()}
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
-                if not vol.is_nan():
+                if not math.isnan(vol):
                     self.logger().info(f"{market} volatility: {vol:.2%}")
             self._last_vol_reported = self.current_timestamp
 
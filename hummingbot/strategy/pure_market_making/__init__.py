@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 
 from .pure_market_making import PureMarketMakingStrategy
+from .multi_pair_pure_market_making import MultiPairPureMarketMakingStrategy
 from .asset_price_delegate import AssetPriceDelegate
 from .order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 from .api_asset_price_delegate import APIAssetPriceDelegate
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
 __all__ = [
     PureMarketMakingStrategy,
+    MultiPairPureMarketMakingStrategy,
     AssetPriceDelegate,
     OrderBookAssetPriceDelegate,
     APIAssetPriceDelegate,
@@ -0,0 +1,14 @@
+# distutils: language=c++
+
+from hummingbot.strategy.strategy_base cimport StrategyBase
+
+
+cdef class MultiPairPureMarketMakingStrategy(StrategyBase):
+    cdef:
+        list _pair_strategies
+        set _markets
+        bint _all_markets_ready
+        double _last_timestamp
+        double _status_report_interval
+
+    cdef list c_allocate_budgets(self, list proposals)
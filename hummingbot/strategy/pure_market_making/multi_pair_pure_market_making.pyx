@@ -0,0 +1,186 @@
+from decimal import Decimal
+import logging
+from typing import (
+    Dict,
+    List,
+    Tuple
+)
+
+from libc.stdint cimport int64_t
+
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+from .pure_market_making cimport PureMarketMakingStrategy
+from .pure_market_making import PureMarketMakingStrategy
+
+
+s_decimal_zero = Decimal(0)
+mpmm_logger = None
+
+
+cdef class MultiPairPureMarketMakingStrategy(StrategyBase):
+    """
+    Pure market making on many trading pairs from a single strategy instance. Each trading pair is made by its own
+    PureMarketMakingStrategy, with its own parameters, over connectors shared by all the pairs, so that the order books,
+    websocket connections, user streams and trade records of a connector are shared as well.
+
+    The pair strategies aren't ticked by the clock, on each tick this strategy creates the proposals of all the pairs,
+    allocates the balances of assets shared by several pairs between them, and then runs the cancels of all the pairs
+    before creating their orders.
+    """
+
+    @classmethod
+    def logger(cls):
+        global mpmm_logger
+        if mpmm_logger is None:
+            mpmm_logger = logging.getLogger(__name__)
+        return mpmm_logger
+
+    def __init__(self, pair_strategies: List[PureMarketMakingStrategy], status_report_interval: float = 900):
+        if len(pair_strategies) == 0:
+            raise ValueError("At least one trading pair strategy is required.")
+        super().__init__()
+        self._pair_strategies = list(pair_strategies)
+        self._markets = set(pair_strategy.market_info.market for pair_strategy in pair_strategies)
+        self._all_markets_ready = False
+        self._last_timestamp = 0
+        self._status_report_interval = status_report_interval
+
+    @property
+    def pair_strategies(self) -> List[PureMarketMakingStrategy]:
+        return list(self._pair_strategies)
+
+    @property
+    def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        result = {}
+        for pair_strategy in self._pair_strategies:
+            result.update(pair_strategy.market_info_to_active_orders)
+        return result
+
+    @property
+    def active_orders(self) -> List[LimitOrder]:
+        return [order for pair_strategy in self._pair_strategies for order in pair_strategy.active_orders]
+
+    def format_status(self) -> str:
+        if not self._all_markets_ready:
+            return "Market connectors are not ready."
+        lines = []
+        for pair_strategy in self._pair_strategies:
+            lines.extend(["", f"  {pair_strategy.market_info.market.display_name} {pair_strategy.trading_pair}:"])
+            lines.append(pair_strategy.format_status())
+        return "\n".join(lines)
+
+    cdef c_start(self, Clock clock, double timestamp):
+        StrategyBase.c_start(self, clock, timestamp)
+        self._last_timestamp = timestamp
+        cdef PureMarketMakingStrategy pair_strategy
+        for pair_strategy in self._pair_strategies:
+            pair_strategy.c_start(clock, timestamp)
+
+    cdef c_stop(self, Clock clock):
+        cdef PureMarketMakingStrategy pair_strategy
+        for pair_strategy in self._pair_strategies:
+            pair_strategy.c_stop(clock)
+        StrategyBase.c_stop(self, clock)
+
+    cdef c_tick(self, double timestamp):
+        StrategyBase.c_tick(self, timestamp)
+        cdef:
+            int64_t current_tick = <int64_t>(timestamp // self._status_report_interval)
+            int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
+            bint should_report_warnings = current_tick > last_tick
+            PureMarketMakingStrategy pair_strategy
+            list proposals = []
+            list budgets
+
+        for pair_strategy in self._pair_strategies:
+            StrategyBase.c_tick(pair_strategy, timestamp)
+        try:
+            if not self._all_markets_ready:
+                self._all_markets_ready = all([market.ready for market in self._markets])
+                if not self._all_markets_ready:
+                    # Markets not ready yet. Don't do anything.
+                    if should_report_warnings:
+                        self.logger().warning(f"Markets are not ready. No market making trades are permitted.")
+                    return
+                for pair_strategy in self._pair_strategies:
+                    pair_strategy._all_markets_ready = True
+
+            if should_report_warnings:
+                if not all([market.network_status is NetworkStatus.CONNECTED for market in self._markets]):
+                    self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
+                                          f"making may be dangerous when markets or networks are unstable.")
+
+            for pair_strategy in self._pair_strategies:
+                proposals.append(pair_strategy.c_create_proposal())
+            budgets = self.c_allocate_budgets(proposals)
+            for pair_strategy, proposal, budget in zip(self._pair_strategies, proposals, budgets):
+                if proposal is not None:
+                    pair_strategy.c_apply_budget_constraint_to_balances(proposal, budget[0], budget[1])
+                    pair_strategy.c_apply_taker_filter(proposal)
+            # The cancels of all the pairs go out before any order is created.
+            for pair_strategy, proposal in zip(self._pair_strategies, proposals):
+                pair_strategy.c_cancel_orders(proposal)
+            for pair_strategy, proposal in zip(self._pair_strategies, proposals):
+                pair_strategy.c_create_orders(proposal)
+        finally:
+            self._last_timestamp = timestamp
+            for pair_strategy in self._pair_strategies:
+                pair_strategy._last_timestamp = timestamp
+
+    cdef list c_allocate_budgets(self, list proposals):
+        """
+        Splits the balance of each asset between the pairs proposing orders that need it, in proportion to the amount
+        their proposals need. The balance of an asset is what is available plus what the active non hanging orders of
+        those pairs hold, as these orders get replaced by the proposals.
+
+        :param proposals: the proposal of each pair strategy, None for those not creating orders on this tick
+        :return: the (base balance, quote balance) budget of each pair strategy
+        """
+        cdef:
+            dict balances = {}
+            dict demands = {}
+            list pair_demands = []
+            list budgets = []
+            PureMarketMakingStrategy pair_strategy
+
+        for pair_strategy, proposal in zip(self._pair_strategies, proposals):
+            if proposal is None:
+                pair_demands.append(None)
+                continue
+            market = pair_strategy.market_info.market
+            base_key = (market, pair_strategy.base_asset)
+            quote_key = (market, pair_strategy.quote_asset)
+            for key in (base_key, quote_key):
+                if key not in balances:
+                    balances[key] = market.get_available_balance(key[1])
+                    demands[key] = s_decimal_zero
+            for order in pair_strategy.active_non_hanging_orders:
+                if order.is_buy:
+                    balances[quote_key] += order.quantity * order.price
+                else:
+                    balances[base_key] += order.quantity
+            base_demand = sum([sell.size for sell in proposal.sells], s_decimal_zero)
+            quote_demand = sum([buy.size * buy.price for buy in proposal.buys], s_decimal_zero)
+            demands[base_key] += base_demand
+            demands[quote_key] += quote_demand
+            pair_demands.append((base_key, base_demand, quote_key, quote_demand))
+
+        for pair_demand in pair_demands:
+            if pair_demand is None:
+                budgets.append((s_decimal_zero, s_decimal_zero))
+                continue
+            base_key, base_demand, quote_key, quote_demand = pair_demand
+            budgets.append((self._budget_share(balances[base_key], base_demand, demands[base_key]),
+                            self._budget_share(balances[quote_key], quote_demand, demands[quote_key])))
+        return budgets
+
+    @staticmethod
+    def _budget_share(balance: Decimal, demand: Decimal, total_demand: Decimal) -> Decimal:
+        if total_demand <= s_decimal_zero:
+            return s_decimal_zero
+        return balance * demand / total_demand
@@ -53,9 +53,18 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         int64_t _logging_options
         object _last_own_trade_price
         list _hanging_aged_order_prices
+        object _level_parameters_key
+        list _buy_level_multipliers
+        list _sell_level_multipliers
+        list _level_sizes
 
     cdef object c_get_mid_price(self)
+    cdef object c_create_proposal(self)
+    cdef c_apply_taker_filter(self, object proposal)
+    cdef c_cancel_orders(self, object proposal)
+    cdef c_create_orders(self, object proposal)
     cdef object c_create_base_proposal(self)
+    cdef c_update_level_parameters(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
     cdef c_apply_price_band(self, object proposal)
@@ -64,11 +73,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_apply_order_size_modifiers(self, object proposal)
     cdef c_apply_inventory_skew(self, object proposal)
     cdef c_apply_budget_constraint(self, object proposal)
+    cdef c_apply_budget_constraint_to_balances(self, object proposal, object base_balance, object quote_balance)
 
     cdef c_filter_out_takers(self, object proposal)
     cdef c_apply_order_optimization(self, object proposal)
     cdef c_apply_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
+    cdef bint c_is_within_tolerance_decimal(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
     cdef c_cancel_hanging_orders(self)
     cdef c_cancel_orders_below_min_spread(self)
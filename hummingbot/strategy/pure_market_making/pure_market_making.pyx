@@ -12,6 +12,9 @@ from math import (
     ceil
 )
 import time
+from libc.math cimport fabs
+from libcpp.algorithm cimport sort
+from libcpp.vector cimport vector
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import TradeType, PriceType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
@@ -149,6 +152,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._last_own_trade_price = Decimal('nan')
+        self._level_parameters_key = None
+        self._buy_level_multipliers = []
+        self._sell_level_multipliers = []
+        self._level_sizes = []
 
         self.c_add_markets([market_info.market])
 
@@ -629,6 +636,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def cancel_order(self, order_id: str):
         return self.c_cancel_order(self._market_info, order_id)
 
+    def create_base_proposal(self) -> Proposal:
+        return self.c_create_base_proposal()
+
+    def is_within_tolerance(self, current_prices: List[Decimal], proposal_prices: List[Decimal]) -> bool:
+        return self.c_is_within_tolerance(current_prices, proposal_prices)
+
     # ---------------------------------------------------------------
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -664,35 +677,54 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
                                           f"making may be dangerous when markets or networks are unstable.")
 
-            proposal = None
-            asset_mid_price = Decimal("0")
-            # asset_mid_price = self.c_set_mid_price(market_info)
-            if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
+            proposal = self.c_create_proposal()
+            if proposal is not None:
                 # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
                 self.c_apply_budget_constraint(proposal)
-
-                if not self._take_if_crossed:
-                    self.c_filter_out_takers(proposal)
-            self.c_cancel_active_orders(proposal)
-            self.c_cancel_hanging_orders()
-            self.c_cancel_orders_below_min_spread()
-            refresh_proposal = self.c_aged_order_refresh()
-            # Firstly restore cancelled aged order
-            if refresh_proposal is not None:
-                self.c_execute_orders_proposal(refresh_proposal)
-            if self.c_to_create_orders(proposal):
-                self.c_execute_orders_proposal(proposal)
+                self.c_apply_taker_filter(proposal)
+            self.c_cancel_orders(proposal)
+            self.c_create_orders(proposal)
         finally:
             self._last_timestamp = timestamp
 
+    cdef object c_create_proposal(self):
+        """
+        Creates the order proposal of this tick, before the budget constraint.
+
+        :return: the proposal, or None when it isn't time to create orders
+        """
+        cdef:
+            object proposal
+
+        if self._create_timestamp > self._current_timestamp:
+            return None
+        # 1. Create base order proposals
+        proposal = self.c_create_base_proposal()
+        # 2. Apply functions that limit numbers of buys and sells proposal
+        self.c_apply_order_levels_modifiers(proposal)
+        # 3. Apply functions that modify orders price
+        self.c_apply_order_price_modifiers(proposal)
+        # 4. Apply functions that modify orders size
+        self.c_apply_order_size_modifiers(proposal)
+        return proposal
+
+    cdef c_apply_taker_filter(self, object proposal):
+        if not self._take_if_crossed:
+            self.c_filter_out_takers(proposal)
+
+    cdef c_cancel_orders(self, object proposal):
+        self.c_cancel_active_orders(proposal)
+        self.c_cancel_hanging_orders()
+        self.c_cancel_orders_below_min_spread()
+
+    cdef c_create_orders(self, object proposal):
+        refresh_proposal = self.c_aged_order_refresh()
+        # Firstly restore cancelled aged order
+        if refresh_proposal is not None:
+            self.c_execute_orders_proposal(refresh_proposal)
+        if self.c_to_create_orders(proposal):
+            self.c_execute_orders_proposal(proposal)
+
     cdef object c_create_base_proposal(self):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -732,23 +764,41 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
-            for level in range(0, self._buy_levels):
-                price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                price = market.c_quantize_order_price(self.trading_pair, price)
-                size = self._order_amount + (self._order_level_amount * level)
-                size = market.c_quantize_order_amount(self.trading_pair, size)
+            self.c_update_level_parameters()
+            # The whole ladder is quantized in one call per side, the sizes are the same for both sides.
+            sizes = market.c_quantize_order_amounts(self.trading_pair, self._level_sizes)
+            buy_prices = market.c_quantize_order_prices(
+                self.trading_pair, [buy_reference_price * multiplier for multiplier in self._buy_level_multipliers])
+            sell_prices = market.c_quantize_order_prices(
+                self.trading_pair, [sell_reference_price * multiplier for multiplier in self._sell_level_multipliers])
+            for price, size in zip(buy_prices, sizes):
                 if size > 0:
                     buys.append(PriceSize(price, size))
-            for level in range(0, self._sell_levels):
-                price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                price = market.c_quantize_order_price(self.trading_pair, price)
-                size = self._order_amount + (self._order_level_amount * level)
-                size = market.c_quantize_order_amount(self.trading_pair, size)
+            for price, size in zip(sell_prices, sizes):
                 if size > 0:
                     sells.append(PriceSize(price, size))
 
         return Proposal(buys, sells)
 
+    cdef c_update_level_parameters(self):
+        """
+        Computes the price multipliers and sizes of the order levels, which only change with the strategy parameters,
+        so that a proposal only multiplies the reference price and quantizes. The Decimal operations are the same as
+        computing them per proposal, the proposals are identical.
+        """
+        cdef:
+            tuple key = (self._bid_spread, self._ask_spread, self._order_level_spread, self._order_amount,
+                         self._order_level_amount, self._buy_levels, self._sell_levels)
+        if key == self._level_parameters_key:
+            return
+        self._buy_level_multipliers = [Decimal("1") - self._bid_spread - (level * self._order_level_spread)
+                                       for level in range(0, self._buy_levels)]
+        self._sell_level_multipliers = [Decimal("1") + self._ask_spread + (level * self._order_level_spread)
+                                        for level in range(0, self._sell_levels)]
+        self._level_sizes = [self._order_amount + (self._order_level_amount * level)
+                             for level in range(0, max(self._buy_levels, self._sell_levels))]
+        self._level_parameters_key = key
+
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
         Calculates the available balance, plus the amount attributed to orders.
@@ -835,14 +885,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             sell.size = size
 
     cdef c_apply_budget_constraint(self, object proposal):
+        base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_non_hanging_orders)
+        self.c_apply_budget_constraint_to_balances(proposal, base_balance, quote_balance)
+
+    cdef c_apply_budget_constraint_to_balances(self, object proposal, object base_balance, object quote_balance):
+        """
+        Limits the proposal orders to the base and quote balances given.
+        """
         cdef:
             ExchangeBase market = self._market_info.market
             object quote_size
             object base_size
             object adjusted_amount
 
-        base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_non_hanging_orders)
-
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
@@ -1073,12 +1128,38 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         )
 
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices):
+        """
+        Compares the price differences to the tolerance in doubles. A difference too close to the tolerance for
+        doubles to tell is compared in Decimal instead, so the result is always the Decimal one.
+        """
+        cdef:
+            vector[double] current_values
+            vector[double] proposal_values
+            double tolerance = float(self._order_refresh_tolerance_pct)
+            double ratio
+            size_t i
+
         if len(current_prices) != len(proposal_prices):
             return False
-        current_prices = sorted(current_prices)
+        for price in current_prices:
+            current_values.push_back(float(price))
+        for price in proposal_prices:
+            proposal_values.push_back(float(price))
+        sort(current_values.begin(), current_values.end())
+        sort(proposal_values.begin(), proposal_values.end())
+        for i in range(current_values.size()):
+            ratio = fabs(proposal_values[i] - current_values[i]) / current_values[i]
+            if fabs(ratio - tolerance) < 1e-12:
+                return self.c_is_within_tolerance_decimal(current_prices, proposal_prices)
+            # if spread diff is more than the tolerance or order quantities are different, return false.
+            if ratio > tolerance:
+                return False
+        return True
+
+    cdef bint c_is_within_tolerance_decimal(self, list current_prices, list proposal_prices):
+        current_prices = sorted([Decimal(str(price)) for price in current_prices])
         proposal_prices = sorted(proposal_prices)
         for current, proposal in zip(current_prices, proposal_prices):
-            # if spread diff is more than the tolerance or order quantities are different, return false.
             if abs(proposal - current)/current > self._order_refresh_tolerance_pct:
                 return False
         return True
@@ -1102,8 +1183,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             return
         if proposal is not None and self._order_refresh_tolerance_pct >= 0:
 
-            active_buy_prices = [Decimal(str(o.price)) for o in active_orders if o.is_buy]
-            active_sell_prices = [Decimal(str(o.price)) for o in active_orders if not o.is_buy]
+            active_buy_prices = [o.price for o in active_orders if o.is_buy]
+            active_sell_prices = [o.price for o in active_orders if not o.is_buy]
             proposal_buys = [buy.price for buy in proposal.buys]
             proposal_sells = [sell.price for sell in proposal.sells]
             if self.c_is_within_tolerance(active_buy_prices, proposal_buys) and \
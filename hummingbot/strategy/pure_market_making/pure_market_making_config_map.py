@@ -354,4 +354,10 @@ pure_market_making_config_map = {
                   required_if=lambda: False,
                   default=None,
                   type_str="json"),
+    "pair_parameters":
+        ConfigVar(key="pair_parameters",
+                  prompt=None,
+                  required_if=lambda: False,
+                  default=None,
+                  type_str="json"),
 }
@@ -1,4 +1,6 @@
 from typing import (
+    Any,
+    Dict,
     List,
     Tuple,
 )
@@ -7,6 +9,7 @@ from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making import (
     PureMarketMakingStrategy,
+    MultiPairPureMarketMakingStrategy,
     OrderBookAssetPriceDelegate,
     APIAssetPriceDelegate,
     InventoryCostPriceDelegate,
@@ -16,6 +19,34 @@ from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from decimal import Decimal
 
+# The parameters pair_parameters can override per trading pair, the value is whether it's a percentage.
+PAIR_PARAMETERS = {
+    "bid_spread": True,
+    "ask_spread": True,
+    "minimum_spread": True,
+    "order_amount": False,
+    "order_levels": False,
+    "order_level_amount": False,
+    "order_level_spread": True,
+    "inventory_target_base_pct": True,
+    "price_ceiling": False,
+    "price_floor": False,
+    "order_refresh_tolerance_pct": True,
+}
+
+
+def pair_strategy_params(strategy_params: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Applies the pair_parameters overrides of a trading pair to the strategy parameters, values are in config units.
+    """
+    params = dict(strategy_params)
+    for key, value in overrides.items():
+        if key == "order_levels":
+            params[key] = int(value)
+        else:
+            params[key] = Decimal(str(value)) / Decimal("100") if PAIR_PARAMETERS[key] else Decimal(str(value))
+    return params
+
 
 def start(self):
     try:
@@ -52,14 +83,24 @@ def start(self):
         order_refresh_tolerance_pct = c_map.get("order_refresh_tolerance_pct").value / Decimal('100')
         order_override = c_map.get("order_override").value
 
-        trading_pair: str = raw_trading_pair
-        maker_assets: Tuple[str, str] = self._initialize_market_assets(exchange, [trading_pair])[0]
-        market_names: List[Tuple[str, List[str]]] = [(exchange, [trading_pair])]
-        self._initialize_wallet(token_trading_pairs=list(set(maker_assets)))
+        pair_parameters = c_map.get("pair_parameters").value or {}
+        for overrides in pair_parameters.values():
+            unknown_parameters = set(overrides or {}) - set(PAIR_PARAMETERS)
+            if len(unknown_parameters) > 0:
+                raise ValueError(f"{', '.join(sorted(unknown_parameters))} can't be set per trading pair.")
+        if len(pair_parameters) > 0 and price_source != "current_market":
+            raise ValueError("External price sources can't be used with pair_parameters, each trading pair is priced "
+                             "off its own market.")
+
+        trading_pairs: List[str] = [raw_trading_pair] + [pair for pair in pair_parameters if pair != raw_trading_pair]
+        maker_assets: List[Tuple[str, str]] = self._initialize_market_assets(exchange, trading_pairs)
+        market_names: List[Tuple[str, List[str]]] = [(exchange, trading_pairs)]
+        self._initialize_wallet(token_trading_pairs=list(set(asset for assets in maker_assets for asset in assets)))
         self._initialize_markets(market_names)
-        self.assets = set(maker_assets)
-        maker_data = [self.markets[exchange], trading_pair] + list(maker_assets)
-        self.market_trading_pair_tuples = [MarketTradingPairTuple(*maker_data)]
+        self.assets = set(asset for assets in maker_assets for asset in assets)
+        maker_data = [[self.markets[exchange], trading_pair] + list(assets)
+                      for trading_pair, assets in zip(trading_pairs, maker_assets)]
+        self.market_trading_pair_tuples = [MarketTradingPairTuple(*data) for data in maker_data]
         asset_price_delegate = None
         if price_source == "external_market":
             asset_trading_pair: str = price_source_market
@@ -68,16 +109,11 @@ def start(self):
             asset_price_delegate = OrderBookAssetPriceDelegate(ext_market, asset_trading_pair)
         elif price_source == "custom_api":
             asset_price_delegate = APIAssetPriceDelegate(price_source_custom_api)
-        inventory_cost_price_delegate = None
-        if price_type == "inventory_cost":
-            db = HummingbotApplication.main_application().trade_fill_db
-            inventory_cost_price_delegate = InventoryCostPriceDelegate(db, trading_pair)
         take_if_crossed = c_map.get("take_if_crossed").value
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
 
-        self.strategy = PureMarketMakingStrategy(
-            market_info=MarketTradingPairTuple(*maker_data),
+        strategy_params = dict(
             bid_spread=bid_spread,
             ask_spread=ask_spread,
             order_levels=order_levels,
@@ -97,7 +133,6 @@ def start(self):
             add_transaction_costs_to_orders=add_transaction_costs_to_orders,
             logging_options=strategy_logging_options,
             asset_price_delegate=asset_price_delegate,
-            inventory_cost_price_delegate=inventory_cost_price_delegate,
             price_type=price_type,
             take_if_crossed=take_if_crossed,
             price_ceiling=price_ceiling,
@@ -109,6 +144,24 @@ def start(self):
             hb_app_notification=True,
             order_override={} if order_override is None else order_override,
         )
+
+        pair_strategies = []
+        for data in maker_data:
+            trading_pair = data[1]
+            inventory_cost_price_delegate = None
+            if price_type == "inventory_cost":
+                db = HummingbotApplication.main_application().trade_fill_db
+                inventory_cost_price_delegate = InventoryCostPriceDelegate(db, trading_pair)
+            pair_strategies.append(PureMarketMakingStrategy(
+                market_info=MarketTradingPairTuple(*data),
+                inventory_cost_price_delegate=inventory_cost_price_delegate,
+                **pair_strategy_params(strategy_params, pair_parameters.get(trading_pair) or {})
+            ))
+
+        if len(pair_strategies) == 1:
+            self.strategy = pair_strategies[0]
+        else:
+            self.strategy = MultiPairPureMarketMakingStrategy(pair_strategies)
     except Exception as e:
         self._notify(str(e))
         self.logger().error("Unknown error during initialization.", exc_info=True)
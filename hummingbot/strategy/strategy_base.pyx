@@ -142,9 +142,8 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
+            past_trades += [event_to_trade(ofe, market.display_name)
+                            for ofe in market.iter_event_logs(OrderFilledEvent)]
 
         return sorted(past_trades, key=lambda x: x.timestamp)
 
@@ -500,6 +499,9 @@ cdef class StrategyBase(TimeIterator):
             list restored_order_ids = []
 
         for order in limit_orders:
+            # The market can be shared with strategies on other trading pairs.
+            if order.trading_pair != market_pair.trading_pair:
+                continue
             restored_order_ids.append(order.client_order_id)
             self.c_start_tracking_limit_order(market_pair,
                                               order.client_order_id,
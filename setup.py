@@ -33,6 +33,7 @@ def main():
     version = "20210406"
     packages = [
         "hummingbot",
+        "hummingbot.backtesting",
         "hummingbot.client",
         "hummingbot.client.command",
         "hummingbot.client.config",
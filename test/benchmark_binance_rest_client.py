@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import statistics
+import time
+from functools import partial
+from typing import (
+    Awaitable,
+    Callable,
+    List,
+    Tuple
+)
+
+from aiohttp import web
+from binance.client import Client as BinanceClient
+
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRestClient
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_session_registry import HttpSessionRegistry
+
+SERVER_LATENCY = 0.02
+NUM_BATCHES = 5
+BATCH_SIZE = 20
+
+
+async def start_mock_server() -> Tuple[web.AppRunner, int]:
+    async def handle(request: web.Request) -> web.Response:
+        await asyncio.sleep(SERVER_LATENCY)
+        return web.json_response({"symbol": request.query.get("symbol"), "status": "NEW"})
+
+    app: web.Application = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+    site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+async def time_batches(label: str, request: Callable[[], Awaitable]):
+    latencies: List[float] = []
+
+    async def timed_request():
+        start = time.perf_counter()
+        await request()
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(NUM_BATCHES):
+        await asyncio.gather(*[timed_request() for _ in range(BATCH_SIZE)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"{label:<40}"
+          f"{statistics.median(latencies) * 1e3:>10.1f} ms p50"
+          f"{latencies[int(len(latencies) * 0.99) - 1] * 1e3:>10.1f} ms p99"
+          f"{NUM_BATCHES * BATCH_SIZE / elapsed:>10.1f} req/s")
+
+
+async def main():
+    runner, port = await start_mock_server()
+    base_url = f"http://127.0.0.1:{port}"
+    print(f"{NUM_BATCHES} batches of {BATCH_SIZE} concurrent signed order status requests, "
+          f"{SERVER_LATENCY * 1e3:.0f} ms server latency")
+
+    # Previous implementation: python-binance calls run on the executor, one at a time, by the AsyncCallScheduler.
+    BinanceClient.API_URL = f"{base_url}/api"
+    # The client pings the server when created, so it can't be created on the event loop thread.
+    binance_client = await asyncio.get_event_loop().run_in_executor(None, BinanceClient, "key", "secret")
+    scheduler = AsyncCallScheduler(call_interval=0.01)
+    await time_batches("python-binance + AsyncCallScheduler",
+                       lambda: scheduler.call_async(partial(binance_client.get_order, symbol="LINKETH",
+                                                            origClientOrderId="1"),
+                                                    timeout_seconds=60))
+    scheduler.stop()
+
+    rest_client = BinanceRestClient("key", "secret", base_url, throttler=Throttler((10000, 1.0)))
+    await time_batches("BinanceRestClient",
+                       lambda: rest_client.request("GET", "/api/v3/order",
+                                                   {"symbol": "LINKETH", "origClientOrderId": "1"},
+                                                   is_signed=True))
+
+    await HttpSessionRegistry.get_instance().close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
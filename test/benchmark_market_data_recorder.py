@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import List
+
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataFileReader,
+    MarketDataRecorder,
+    list_market_data_files,
+)
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+
+# Full depth Binance diff streams: one message per pair every 100ms, with a few dozen changed levels.
+NUM_TRADING_PAIRS = 150
+MESSAGES_PER_PAIR = 200
+LEVELS_PER_SIDE = 20
+START_TIMESTAMP = 1614600000.0
+
+
+def diff_messages() -> List[OrderBookMessage]:
+    messages: List[OrderBookMessage] = []
+    for i in range(MESSAGES_PER_PAIR):
+        for pair in range(NUM_TRADING_PAIRS):
+            mid: float = 100.0 + pair
+            messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": f"PAIR{pair}-USDT",
+                "first_update_id": 2 * i,
+                "update_id": 2 * i + 1,
+                "bids": [[f"{mid - random.random():.8f}", f"{random.random() * 10:.8f}"]
+                         for _ in range(LEVELS_PER_SIDE)],
+                "asks": [[f"{mid + random.random():.8f}", f"{random.random() * 10:.8f}"]
+                         for _ in range(LEVELS_PER_SIDE)]
+            }, timestamp=START_TIMESTAMP + i * 0.1))
+    return messages
+
+
+def main():
+    data_dir: str = tempfile.mkdtemp()
+    messages: List[OrderBookMessage] = diff_messages()
+    stream_seconds: float = MESSAGES_PER_PAIR * 0.1
+    recorder: MarketDataRecorder = MarketDataRecorder(data_dir, "binance")
+    recorder.start()
+
+    start: float = time.perf_counter()
+    for message in messages:
+        recorder.record(message)
+    record_time: float = time.perf_counter() - start
+    recorder.stop()
+    total_time: float = time.perf_counter() - start
+
+    stats = recorder.stats
+    size: int = sum(os.path.getsize(path) for pair in range(NUM_TRADING_PAIRS)
+                    for path in list_market_data_files(data_dir, "binance", f"PAIR{pair}-USDT"))
+    print(f"{len(messages)} diffs of {NUM_TRADING_PAIRS} pairs, {stream_seconds:.0f}s of stream")
+    print(f"record(): {record_time / len(messages) * 1e6:.2f} us per message on the caller's thread")
+    print(f"writer: {stats.written_messages / total_time:.0f} msg/s, {stats.written_levels / total_time:.0f} "
+          f"levels/s, {stream_seconds / total_time:.1f}x real time")
+    print(f"{stats.chunks} chunks, {size / 1e6:.2f} MB on disk, compression ratio {stats.compression_ratio:.2f}, "
+          f"avg chunk write {stats.avg_chunk_write_time * 1e3:.2f} ms")
+
+    start = time.perf_counter()
+    read_messages: int = sum(1 for _ in MarketDataFileReader(
+        list_market_data_files(data_dir, "binance", "PAIR0-USDT")[0]).iter_messages())
+    print(f"reader: {read_messages / (time.perf_counter() - start):.0f} msg/s")
+    shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
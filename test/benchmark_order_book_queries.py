@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import time
+from typing import (
+    Callable,
+    Iterator
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NUM_LEVELS = 5000
+NUM_QUERIES = 2000
+
+
+def scan_price_for_volume(entries: Iterator[OrderBookRow], volume: float) -> float:
+    # Row-walking query, equivalent to the pre-index OrderBook implementation.
+    cumulative_volume = 0
+    for row in entries:
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return math.nan
+
+
+def scan_vwap_for_volume(entries: Iterator[OrderBookRow], volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in entries:
+        if total_volume + row.amount >= volume:
+            return (total_cost + (volume - total_volume) * row.price) / volume
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+    return math.nan
+
+
+def build_order_book(levels: int) -> OrderBook:
+    rng = np.random.RandomState(42)
+    bids = np.column_stack([100.0 - np.arange(levels) * 0.01, rng.uniform(0.1, 2.0, levels), np.ones(levels)])
+    asks = np.column_stack([100.01 + np.arange(levels) * 0.01, rng.uniform(0.1, 2.0, levels), np.ones(levels)])
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def time_queries(label: str, query: Callable[[float], float], volumes: np.ndarray):
+    start = time.perf_counter()
+    for volume in volumes:
+        query(volume)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40}{elapsed / len(volumes) * 1e6:>12.2f} us/query")
+
+
+def main():
+    order_book = build_order_book(NUM_LEVELS)
+    total_volume = sum(row.amount for row in order_book.ask_entries())
+    volumes = np.random.RandomState(7).uniform(0, total_volume, NUM_QUERIES)
+
+    print(f"{NUM_LEVELS} levels per side, {NUM_QUERIES} queries")
+    time_queries("price for volume (row scan)",
+                 lambda v: scan_price_for_volume(order_book.ask_entries(), v), volumes)
+    time_queries("price for volume (depth index)",
+                 lambda v: order_book.get_price_for_volume(True, v).result_price, volumes)
+    time_queries("vwap for volume (row scan)",
+                 lambda v: scan_vwap_for_volume(order_book.ask_entries(), v), volumes)
+    time_queries("vwap for volume (depth index)",
+                 lambda v: order_book.get_vwap_for_volume(True, v).result_price, volumes)
+
+    # Rebuild cost after each diff, i.e. the worst case of one query per update.
+    diff = np.array([[100.01, 1.0, 2]], dtype=np.float64)
+    empty = np.empty((0, 3), dtype=np.float64)
+
+    def diff_then_query(volume: float) -> float:
+        order_book.apply_numpy_diffs(empty, diff)
+        return order_book.get_price_for_volume(True, volume).result_price
+
+    time_queries("diff + query (depth index rebuild)", diff_then_query, volumes)
+
+
+if __name__ == "__main__":
+    main()
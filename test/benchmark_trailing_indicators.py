@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import time
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.average_volatility import AverageVolatilityIndicator
+
+NUM_SAMPLES = 20000
+BUFFER_SIZES = [200, 5000, 50000]
+
+
+class GatherAverageVolatility:
+    # Equivalent to the pre-streaming AverageVolatilityIndicator with a processing length of 1: the sampling window is
+    # gathered through an index array and its variance computed on each sample.
+    def __init__(self, sampling_length: int):
+        self._length = sampling_length
+        self._buffer = np.zeros(sampling_length, dtype=np.float64)
+        self._count = 0
+        self._value = np.nan
+
+    def add_sample(self, value: float):
+        self._buffer[self._count % self._length] = value
+        self._count += 1
+        if self._count < self._length:
+            indexes = np.arange(0, self._count)
+        else:
+            start = self._count % self._length
+            indexes = np.arange(start, start + self._length) % self._length
+        self._value = np.var(self._buffer[indexes])
+
+    @property
+    def current_value(self) -> float:
+        return np.sqrt(self._value)
+
+
+def time_samples(label: str, indicator, samples: np.ndarray):
+    start = time.perf_counter()
+    for sample in samples:
+        indicator.add_sample(sample)
+        indicator.current_value
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40}{elapsed / len(samples) * 1e6:>12.2f} us/sample")
+
+
+def main():
+    # The Avellaneda market making volatility path: one mid price sample and one volatility read per tick.
+    samples = 100 + np.cumsum(np.random.RandomState(42).normal(scale=0.01, size=NUM_SAMPLES))
+    print(f"{NUM_SAMPLES} samples")
+    for buffer_size in BUFFER_SIZES:
+        time_samples(f"gather, buffer size {buffer_size}", GatherAverageVolatility(buffer_size), samples)
+        time_samples(f"streaming, buffer size {buffer_size}", AverageVolatilityIndicator(buffer_size, 1), samples)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,57 @@
 #!/usr/bin/env python
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import copy
 import unittest
 from decimal import Decimal
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
-from hummingbot.core.event.events import OrderType, TradeType
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    SellOrderCreatedEvent,
+    TradeFee,
+    TradeType
+)
 
 from hummingbot.connector.connector_base import ConnectorBase
 
 
 class InFightOrderTest(InFlightOrderBase):
+    cancelled = False
+
     @property
     def is_done(self) -> bool:
-        return False
+        return self.cancelled
 
     @property
     def is_cancelled(self) -> bool:
-        return False
+        return self.cancelled
 
     @property
     def is_failure(self) -> bool:
         return False
 
 
+class SnapshotConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self._real_time_balance_update = False
+        self._in_flight_orders = {}
+
+    @property
+    def in_flight_orders(self):
+        return self._in_flight_orders
+
+    def estimate_fee_pct(self, is_maker: bool) -> Decimal:
+        return Decimal("0.001")
+
+    def take_snapshot(self, timestamp: float):
+        self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self._in_flight_orders.items()}
+        self._in_flight_orders_snapshot_timestamp = timestamp
+
+
 class ConnectorBaseUnitTest(unittest.TestCase):
 
     def test_in_flight_asset_balances(self):
@@ -38,3 +67,55 @@ class ConnectorBaseUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("300"), bals["USDT"])
         self.assertEqual(Decimal("1.5"), bals["HBOT"])
         print(bals)
+
+    def test_available_balance_deltas_since_snapshot(self):
+        connector = SnapshotConnector()
+        connector._account_available_balances = {"HBOT": Decimal("10"), "USDT": Decimal("1000")}
+        snapshot_order = InFightOrderTest("1", "A", "HBOT-USDT", OrderType.LIMIT, TradeType.BUY, Decimal("100"),
+                                          Decimal("1"), "live")
+        connector.in_flight_orders["1"] = snapshot_order
+        connector.take_snapshot(1)
+        self.assertEqual(Decimal("1000"), connector.get_available_balance("USDT"))
+
+        sell_order = InFightOrderTest("2", "B", "HBOT-USDT", OrderType.LIMIT, TradeType.SELL, Decimal("110"),
+                                      Decimal("2"), "live")
+        connector.in_flight_orders["2"] = sell_order
+        connector.trigger_event(MarketEvent.SellOrderCreated,
+                                SellOrderCreatedEvent(2, OrderType.LIMIT, "HBOT-USDT", Decimal("2"), Decimal("110"),
+                                                      "2"))
+        self.assertEqual(Decimal("8"), connector.get_available_balance("HBOT"))
+
+        snapshot_order.executed_amount_base = Decimal("0.5")
+        snapshot_order.executed_amount_quote = Decimal("50")
+        connector.trigger_event(MarketEvent.OrderFilled,
+                                OrderFilledEvent(3, "1", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal("100"),
+                                                 Decimal("0.5"), TradeFee(Decimal(0))))
+        self.assertEqual(Decimal("8.5"), connector.get_available_balance("HBOT"))
+        # 0.5 HBOT bought for 50 USDT, so only the estimated fee of the filled half is released.
+        self.assertEqual(Decimal("1000.05"), connector.get_available_balance("USDT"))
+
+        sell_order.cancelled = True
+        connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(4, "2"))
+        del connector.in_flight_orders["2"]
+        self.assertEqual(Decimal("10.5"), connector.get_available_balance("HBOT"))
+
+        # A new snapshot resets the deltas.
+        connector._account_available_balances = {"HBOT": Decimal("10.5"), "USDT": Decimal("949.95")}
+        connector.take_snapshot(5)
+        self.assertEqual(Decimal("10.5"), connector.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("949.95"), connector.get_available_balance("USDT"))
+
+    def test_available_balance_orders_tracked_without_events(self):
+        connector = SnapshotConnector()
+        connector._account_available_balances = {"HBOT": Decimal("10"), "USDT": Decimal("1000")}
+        connector.take_snapshot(1)
+        self.assertEqual(Decimal("10"), connector.get_available_balance("HBOT"))
+
+        # Tracked before the create order API call returns, no order created event yet.
+        connector.in_flight_orders["1"] = InFightOrderTest("1", None, "HBOT-USDT", OrderType.LIMIT, TradeType.SELL,
+                                                           Decimal("110"), Decimal("2"), "live")
+        self.assertEqual(Decimal("8"), connector.get_available_balance("HBOT"))
+
+        # Dropped after a failed submission, no terminal order event.
+        del connector.in_flight_orders["1"]
+        self.assertEqual(Decimal("10"), connector.get_available_balance("HBOT"))
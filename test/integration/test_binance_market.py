@@ -42,7 +42,6 @@ from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 from hummingbot.connector.exchange.binance.binance_exchange import (
     BinanceExchange,
     BinanceTime,
-    binance_client_module
 )
 from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
 from hummingbot.connector.markets_recorder import MarketsRecorder
@@ -94,7 +93,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
 
         if API_MOCK_ENABLED:
             cls.web_app = HummingWebApp.get_instance()
-            cls.web_app.add_host_to_mock(cls.base_api_url, ["/api/v1/ping", "/api/v1/time", "/api/v1/ticker/24hr"])
+            cls.web_app.add_host_to_mock(cls.base_api_url, ["/api/v3/ping", "/api/v3/time", "/api/v1/ticker/24hr"])
             cls.web_app.start()
             cls.ev_loop.run_until_complete(cls.web_app.wait_til_started())
             cls._patcher = mock.patch("aiohttp.client.URL")
@@ -105,7 +104,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
             cls._req_url_mock = cls._req_patcher.start()
             cls._req_url_mock.side_effect = HummingWebApp.reroute_request
             cls.web_app.update_response("get", cls.base_api_url, "/api/v3/account", FixtureBinance.BALANCES)
-            cls.web_app.update_response("get", cls.base_api_url, "/api/v1/exchangeInfo",
+            cls.web_app.update_response("get", cls.base_api_url, "/api/v3/exchangeInfo",
                                         FixtureBinance.MARKETS)
             cls.web_app.update_response("get", cls.base_api_url, "/wapi/v3/tradeFee.html",
                                         FixtureBinance.TRADE_FEES)
@@ -422,7 +421,6 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         ask_price: Decimal = self.market.get_price(trading_pair, False)
         mid_price: Decimal = (bid_price + ask_price) / 2
         amount: Decimal = Decimal("1.23123216")
-        binance_client = self.market.binance_client
 
         # Make sure there's enough balance to make the limit orders.
         self.assertGreater(self.market.get_balance("ETH"), Decimal("0.05"))
@@ -456,10 +454,11 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         [order_created_event] = self.run_parallel(
             self.market_logger.wait_for(BuyOrderCreatedEvent, timeout_seconds=10)
         )
-        order_data: Dict[str, any] = binance_client.get_order(
-            symbol=trading_pair,
-            origClientOrderId=bid_order_id
-        )
+        order_data: Dict[str, any] = self.run_parallel(self.market.query_api(
+            "GET", "/api/v3/order",
+            {"symbol": convert_to_exchange_trading_pair(trading_pair), "origClientOrderId": bid_order_id},
+            is_signed=True
+        ))
         quantized_bid_price: Decimal = self.market.quantize_order_price(trading_pair, Decimal(bid_price))
         bid_size_quantum: Decimal = self.market.get_order_size_quantum(trading_pair, Decimal(bid_amount))
         self.assertEqual(quantized_bid_price, Decimal(order_data["price"]))
@@ -484,10 +483,11 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         [order_created_event] = self.run_parallel(
             self.market_logger.wait_for(SellOrderCreatedEvent, timeout_seconds=10)
         )
-        order_data = binance_client.get_order(
-            symbol=trading_pair,
-            origClientOrderId=ask_order_id
-        )
+        order_data = self.run_parallel(self.market.query_api(
+            "GET", "/api/v3/order",
+            {"symbol": convert_to_exchange_trading_pair(trading_pair), "origClientOrderId": ask_order_id},
+            is_signed=True
+        ))
         quantized_ask_price: Decimal = self.market.quantize_order_price(trading_pair, Decimal(ask_price))
         quantized_ask_size: Decimal = self.market.quantize_order_amount(trading_pair, Decimal(amount))
         self.assertEqual(quantized_ask_price, Decimal(order_data["price"]))
@@ -506,7 +506,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
             self.assertEqual(cr.success, True)
 
     def test_server_time_offset(self):
-        time_obj: BinanceTime = binance_client_module.time
+        time_obj: BinanceTime = BinanceTime.get_instance()
         old_check_interval: float = time_obj._server_time_offset_check_interval
         time_obj._server_time_offset_check_interval = 1.0
         time_obj.stop()
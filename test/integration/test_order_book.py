@@ -6,6 +6,7 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -53,6 +54,163 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries_match_order_book_rows(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10 - i * 0.5, 1 + i, i + 1] for i in range(10)], dtype=np.float64)
+        asks_array = np.array([[11 + i * 0.5, 1 + i, i + 1] for i in range(10)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for is_buy in (True, False):
+            rows = list(order_book.ask_entries() if is_buy else order_book.bid_entries())
+            for volume in (0.5, 1, 2.5, 10, 54.9, 55, 1000):
+                cumulative_volume = 0
+                cumulative_cost = 0
+                expected_price = float("nan")
+                expected_vwap = float("nan")
+                for row in rows:
+                    if cumulative_volume + row.amount >= volume:
+                        expected_price = row.price
+                        expected_vwap = (cumulative_cost + (volume - cumulative_volume) * row.price) / volume
+                        break
+                    cumulative_volume += row.amount
+                    cumulative_cost += row.amount * row.price
+                result = order_book.get_price_for_volume(is_buy, volume)
+                vwap_result = order_book.get_vwap_for_volume(is_buy, volume)
+                quote_result = order_book.get_quote_volume_for_base_amount(is_buy, volume)
+                if np.isnan(expected_price):
+                    self.assertTrue(np.isnan(result.result_price))
+                    self.assertTrue(np.isnan(vwap_result.result_price))
+                    self.assertAlmostEqual(cumulative_cost, quote_result.result_volume)
+                else:
+                    self.assertEqual(expected_price, result.result_price)
+                    self.assertAlmostEqual(expected_vwap, vwap_result.result_price)
+                    self.assertAlmostEqual(expected_vwap * volume, quote_result.result_volume)
+
+            for price in (9, 10, 11, 11.75, 20, 1):
+                if is_buy:
+                    included = [row for row in rows if row.price <= price]
+                else:
+                    included = [row for row in rows if row.price >= price]
+                result = order_book.get_volume_for_price(is_buy, price)
+                quote_result = order_book.get_quote_volume_for_price(is_buy, price)
+                self.assertAlmostEqual(sum(row.amount for row in included), result.result_volume)
+                self.assertAlmostEqual(sum(row.amount * row.price for row in included), quote_result.result_volume)
+                if len(included) > 0:
+                    self.assertEqual(included[-1].price, result.result_price)
+                else:
+                    self.assertTrue(np.isnan(result.result_price))
+
+    def test_depth_index_invalidated_by_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 1]], dtype=np.float64),
+                                        np.array([[3, 1, 1], [4, 1, 1]], dtype=np.float64))
+        self.assertEqual(4, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(1, order_book.get_price_for_volume(False, 2).result_price)
+
+        order_book.apply_numpy_diffs(np.array([[2, 5, 2]], dtype=np.float64),
+                                     np.array([[3, 0, 2]], dtype=np.float64))
+        self.assertEqual(2, order_book.get_price_for_volume(False, 2).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 2).result_price))
+        self.assertEqual(1, order_book.get_price_for_volume(True, 2).result_volume)
+
+    def test_to_numpy(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 4, 1], [5, 5, 2], [6, 6, 3], [7, 7, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        self.assertEqual(np.float64, bids.dtype)
+        self.assertTrue(bids.flags["C_CONTIGUOUS"])
+        self.assertEqual([[3, 3, 3], [2, 2, 2], [1, 1, 1]], bids.tolist())
+        self.assertEqual([[4, 4, 1], [5, 5, 2], [6, 6, 3], [7, 7, 4]], asks.tolist())
+
+        bids, asks = order_book.to_numpy(depth=2)
+        self.assertEqual([[3, 3, 3], [2, 2, 2]], bids.tolist())
+        self.assertEqual([[4, 4, 1], [5, 5, 2]], asks.tolist())
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(list(order_book.bid_entries()), [tuple(row) for row in bids_df.values.tolist()])
+        self.assertEqual(list(order_book.ask_entries()), [tuple(row) for row in asks_df.values.tolist()])
+
+    def test_to_numpy_into(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 2, 2]], dtype=np.float64),
+                                        np.array([[4, 4, 1], [5, 5, 2], [6, 6, 3]], dtype=np.float64))
+        bids_out = np.zeros((2, 3), dtype=np.float64)
+        asks_out = np.zeros((2, 3), dtype=np.float64)
+        bid_rows, ask_rows = order_book.to_numpy_into(bids_out, asks_out)
+        self.assertEqual((2, 2), (bid_rows, ask_rows))
+        self.assertEqual([[2, 2, 2], [1, 1, 1]], bids_out.tolist())
+        self.assertEqual([[4, 4, 1], [5, 5, 2]], asks_out.tolist())
+
+        bid_rows, ask_rows = order_book.to_numpy_into(bids_out, asks_out, depth=1)
+        self.assertEqual((1, 1), (bid_rows, ask_rows))
+
+        with self.assertRaises(ValueError):
+            order_book.to_numpy_into(np.zeros((2, 2)), np.zeros((2, 2)))
+
+    def test_apply_diffs_batch(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "A-B", "update_id": 1, "bids": [["1", "1"], ["2", "1"]], "asks": [["3", "1"], ["4", "1"]]
+        }, 1)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 2, "bids": [["2", "5"]], "asks": [["3", "0"]]
+            }, 2),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 3, "bids": [["2", "7"], ["1.5", "1"]], "asks": [["3.5", "2"]]
+            }, 3),
+        ]
+        sequential = OrderBook()
+        sequential.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        for diff in diffs:
+            sequential.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+        batched = OrderBook()
+        batched.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        batched.apply_diffs_batch(diffs)
+
+        self.assertEqual(list(sequential.bid_entries()), list(batched.bid_entries()))
+        self.assertEqual(list(sequential.ask_entries()), list(batched.ask_entries()))
+        self.assertEqual(3, batched.last_diff_uid)
+        self.assertEqual(2, batched.get_price(False))
+        self.assertEqual(3.5, batched.get_price(True))
+        # The parsed levels are cached on the message.
+        self.assertIs(diffs[0].cached_bids, diffs[0].cached_bids)
+
+    def test_apply_diffs_batch_crossing_updates(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "A-B", "update_id": 1, "bids": [["1", "1"], ["2", "1"]], "asks": [["3", "1"], ["4", "1"]]
+        }, 1)
+        diffs = [
+            # A bid crossing the asks, that truncates them.
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 2, "bids": [["3.5", "1"]], "asks": []
+            }, 2),
+            # Asks below the previous bids, that truncate them in turn.
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 3, "bids": [], "asks": [["1.5", "2"], ["3", "1"]]
+            }, 3),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "A-B", "update_id": 4, "bids": [["1.2", "3"]], "asks": [["4", "0"]]
+            }, 4),
+        ]
+        sequential = OrderBook()
+        sequential.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        for diff in diffs:
+            sequential.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+        batched = OrderBook()
+        batched.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        batched.apply_diffs_batch(diffs)
+
+        self.assertEqual(list(sequential.bid_entries()), list(batched.bid_entries()))
+        self.assertEqual(list(sequential.ask_entries()), list(batched.ask_entries()))
+        self.assertEqual(sequential.get_price(True), batched.get_price(True))
+        self.assertEqual(sequential.get_price(False), batched.get_price(False))
+        self.assertEqual(4, batched.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,5 +1,6 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import asyncio
 import unittest
 from decimal import Decimal
 
@@ -13,32 +14,33 @@ quote = trading_pair.split("-")[1]
 
 
 class MockConnector1(ConnectorBase):
-    def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         if is_buy:
             return Decimal("105")
         else:
             return Decimal("104")
 
-    def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
-        return self.get_quote_price(trading_pair, is_buy, amount)
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self.get_quote_price(trading_pair, is_buy, amount)
 
 
 class MockConnector2(ConnectorBase):
-    def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         if is_buy:
             return Decimal("103")
         else:
             return Decimal("100")
 
-    def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
-        return self.get_quote_price(trading_pair, is_buy, amount)
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self.get_quote_price(trading_pair, is_buy, amount)
 
 
 class AmmArbUtilsUnitTest(unittest.TestCase):
     def test_create_arb_proposals(self):
         market_info1 = MarketTradingPairTuple(MockConnector1(), trading_pair, base, quote)
         market_info2 = MarketTradingPairTuple(MockConnector2(), trading_pair, base, quote)
-        arb_proposals = utils.create_arb_proposals(market_info1, market_info2, Decimal("1"))
+        arb_proposals = asyncio.get_event_loop().run_until_complete(
+            utils.create_arb_proposals(market_info1, market_info2, Decimal("1")))
         # there are 2 proposal combination possible - (buy_1, sell_2) and (buy_2, sell_1)
         self.assertEqual(2, len(arb_proposals))
         # Each proposal has a buy and a sell proposal sides
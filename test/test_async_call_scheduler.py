@@ -0,0 +1,121 @@
+import asyncio
+import time
+import unittest
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler,
+)
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_concurrent_calls(self):
+        scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=4)
+
+        async def slow_call(i: int) -> int:
+            await asyncio.sleep(0.2)
+            return i
+
+        start = time.perf_counter()
+        results = self.run_async(asyncio.gather(*[scheduler.schedule_async_call(slow_call(i), 1) for i in range(8)]))
+        elapsed = time.perf_counter() - start
+        scheduler.stop()
+        self.assertEqual(list(range(8)), results)
+        # 2 rounds of 4 concurrent calls.
+        self.assertLess(elapsed, 0.6)
+        stats = scheduler.lane_stats[AsyncCallPriority.NORMAL]
+        self.assertEqual(8, stats.calls)
+        self.assertGreaterEqual(stats.max_execution_time, 0.2)
+        self.assertGreaterEqual(stats.max_wait_time, 0.2)
+
+    def test_priority_lanes(self):
+        scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=1)
+        started = []
+
+        async def call(name: str):
+            started.append(name)
+            await asyncio.sleep(0.01)
+
+        async def schedule_all():
+            blocker = asyncio.ensure_future(scheduler.schedule_async_call(call("blocker"), 1))
+            await asyncio.sleep(0)
+            calls = [scheduler.schedule_async_call(call(f"poll_{i}"), 1, priority=AsyncCallPriority.POLLING)
+                     for i in range(3)]
+            calls.append(scheduler.schedule_async_call(call("create"), 1, priority=AsyncCallPriority.CREATE))
+            calls.append(scheduler.schedule_async_call(call("cancel"), 1, priority=AsyncCallPriority.CANCEL))
+            await asyncio.gather(blocker, *calls)
+
+        self.run_async(schedule_all())
+        scheduler.stop()
+        self.assertEqual(["blocker", "cancel", "create", "poll_0", "poll_1", "poll_2"], started)
+
+    def test_timeouts_and_errors(self):
+        scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=1,
+                                       lane_queue_timeouts={AsyncCallPriority.POLLING: 0.05})
+
+        async def slow_call():
+            await asyncio.sleep(0.2)
+
+        async def failing_call():
+            raise ValueError("API error")
+
+        async def schedule_all():
+            return await asyncio.gather(
+                scheduler.schedule_async_call(slow_call(), 0.1),
+                scheduler.schedule_async_call(slow_call(), 1, priority=AsyncCallPriority.POLLING),
+                scheduler.schedule_async_call(failing_call(), 1),
+                return_exceptions=True)
+
+        execution_timeout, queue_timeout, error = self.run_async(schedule_all())
+        scheduler.stop()
+        self.assertIsInstance(execution_timeout, asyncio.TimeoutError)
+        self.assertIsInstance(queue_timeout, asyncio.TimeoutError)
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(1, scheduler.lane_stats[AsyncCallPriority.POLLING].expired)
+        self.assertEqual(0, scheduler.lane_stats[AsyncCallPriority.POLLING].calls)
+        self.assertEqual(2, scheduler.lane_stats[AsyncCallPriority.NORMAL].failures)
+
+    def test_call_async(self):
+        scheduler = AsyncCallScheduler(call_interval=0)
+        result = self.run_async(scheduler.call_async(pow, 2, 10, timeout_seconds=1,
+                                                     priority=AsyncCallPriority.CANCEL))
+        scheduler.stop()
+        self.assertEqual(1024, result)
+        self.assertEqual(1, scheduler.lane_stats[AsyncCallPriority.CANCEL].calls)
+
+    def test_restart_keeps_max_concurrency(self):
+        scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+        running = []
+        max_running = []
+
+        async def call():
+            running.append(1)
+            max_running.append(len(running))
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                running.pop()
+
+        async def schedule_all():
+            calls = [asyncio.ensure_future(scheduler.schedule_async_call(call(), 1)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            # The cancelled calls must not release slots of the restarted scheduler.
+            scheduler.stop()
+            scheduler.start()
+            await asyncio.gather(*calls, return_exceptions=True)
+            max_running.clear()
+            await asyncio.gather(*[scheduler.schedule_async_call(call(), 1) for _ in range(6)])
+
+        self.run_async(schedule_all())
+        scheduler.stop()
+        self.assertEqual(2, max(max_running))
+
+    def test_shared_instance_serializes_calls(self):
+        self.assertEqual(1, AsyncCallScheduler.shared_instance().max_concurrency)
@@ -1,16 +1,26 @@
 import unittest
 import asyncio
 import time
+from decimal import Decimal
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import async_ttl_cache, quote_price_cache_key
 
 
 class AsyncTTLCacheUnitTest(unittest.TestCase):
 
+    calls = 0
+
     @async_ttl_cache(ttl=3, maxsize=1)
     async def get_timestamp(self):
         return time.time()
 
+    @async_ttl_cache(ttl=3, maxsize=10, key=quote_price_cache_key)
+    async def get_quote_price(self, trading_pair, is_buy, amount):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(0.1)
+        return call
+
     def test_async_ttl_cache(self):
         ret_1 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         ret_2 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
@@ -21,3 +31,17 @@ class AsyncTTLCacheUnitTest(unittest.TestCase):
         time.sleep(2)
         ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         self.assertGreater(ret_4, ret_3)
+
+    def test_single_flight(self):
+        async def get_prices():
+            return await asyncio.gather(self.get_quote_price("ETH-USDT", True, 1),
+                                        self.get_quote_price("ETH-USDT", True, Decimal("1.00")),
+                                        self.get_quote_price("ETH-USDT", False, 1))
+        ret = asyncio.get_event_loop().run_until_complete(get_prices())
+        # The concurrent calls for the same quote share a single call.
+        self.assertEqual(2, self.calls)
+        self.assertEqual(ret[0], ret[1])
+        self.assertNotEqual(ret[0], ret[2])
+        ret_2 = asyncio.get_event_loop().run_until_complete(self.get_quote_price("ETH-USDT", True, 1.0))
+        self.assertEqual(ret[0], ret_2)
+        self.assertEqual(2, self.calls)
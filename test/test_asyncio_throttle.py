@@ -0,0 +1,95 @@
+import asyncio
+import time
+import unittest
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallPriority
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    Throttler,
+)
+
+
+class ThrottlerUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    @staticmethod
+    async def run_tasks(throttler: Throttler, requests):
+        started = {}
+        start = time.monotonic()
+
+        async def task(name, **kwargs):
+            async with throttler.weighted_task(**kwargs):
+                started[name] = time.monotonic() - start
+
+        await asyncio.gather(*[task(name, **kwargs) for name, kwargs in requests])
+        return started
+
+    def test_wakes_up_when_weight_is_available(self):
+        throttler = Throttler((3, 0.2), period_safety_margin=0)
+        started = self.run_async(self.run_tasks(throttler, [(i, {}) for i in range(7)]))
+        self.assertEqual(list(range(7)), sorted(started, key=lambda name: started[name]))
+        for i in range(3):
+            self.assertLess(started[i], 0.05)
+        for i in range(3, 6):
+            self.assertGreaterEqual(started[i], 0.19)
+            self.assertLess(started[i], 0.25)
+        self.assertGreaterEqual(started[6], 0.39)
+        self.assertEqual(0, throttler.waiting_requests)
+
+    def test_cancels_go_first(self):
+        throttler = Throttler((1, 0.1), period_safety_margin=0)
+        started = self.run_async(self.run_tasks(throttler, [
+            ("first", {}),
+            ("poll", {"priority": AsyncCallPriority.POLLING}),
+            ("create", {"priority": AsyncCallPriority.CREATE}),
+            ("cancel", {"priority": AsyncCallPriority.CANCEL}),
+        ]))
+        self.assertEqual(["first", "cancel", "create", "poll"], sorted(started, key=lambda name: started[name]))
+
+    def test_multiple_rate_limits(self):
+        throttler = Throttler((10, 0.1), period_safety_margin=0, rate_limits=[
+            RateLimit("minute_weight", 6, 0.3),
+            RateLimit("orders", 1, 0.2, is_global=False),
+        ])
+        started = self.run_async(self.run_tasks(throttler, [
+            ("order_1", {"limit_weights": {"orders": 1}}),
+            ("order_2", {"limit_weights": {"orders": 1}}),
+        ]))
+        self.assertGreaterEqual(started["order_2"] - started["order_1"], 0.19)
+
+        throttler = Throttler((10, 0.1), period_safety_margin=0, rate_limits=[RateLimit("minute_weight", 6, 0.3)])
+        started = self.run_async(self.run_tasks(throttler, [(i, {"request_weight": 2}) for i in range(4)]))
+        self.assertLess(started[2], 0.05)
+        self.assertGreaterEqual(started[3], 0.29)
+        self.assertAlmostEqual(2 / 6, throttler.utilisation("minute_weight"))
+        self.assertAlmostEqual(0.2, throttler.utilisation("default"))
+        # The most used limit.
+        self.assertAlmostEqual(2 / 6, throttler.utilisation())
+
+    def test_cancelled_waiter(self):
+        throttler = Throttler((1, 0.1), period_safety_margin=0)
+
+        async def run():
+            async with throttler.weighted_task():
+                pass
+            waiter = asyncio.ensure_future(throttler.acquire())
+            await asyncio.sleep(0.01)
+            self.assertEqual(1, throttler.waiting_requests)
+            waiter.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(0, throttler.waiting_requests)
+            await asyncio.wait_for(throttler.acquire(), 1)
+
+        self.run_async(run())
+
+    def test_invalid_weights(self):
+        throttler = Throttler((5, 1.0))
+        with self.assertRaises(ValueError):
+            self.run_async(throttler.acquire(6))
+        with self.assertRaises(ValueError):
+            self.run_async(throttler.acquire(1, limit_weights={"unknown": 1}))
@@ -0,0 +1,113 @@
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.backtesting.backtest_engine import BacktestEngine
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+# 2021-03-01 00:00:00 UTC
+START: float = 1614556800.0
+
+
+class LimitBuyStrategy(StrategyPyBase):
+    def __init__(self, market_info: MarketTradingPairTuple, price: Decimal, amount: Decimal):
+        super().__init__()
+        self._market_info = market_info
+        self._price = price
+        self._amount = amount
+        self.order_id = None
+        self.ticks: List[float] = []
+        self.add_markets([market_info.market])
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+        if self.order_id is None and self._market_info.market.ready:
+            self.order_id = self.buy_with_specific_market(self._market_info, self._amount, OrderType.LIMIT,
+                                                          self._price)
+
+
+class BacktestEngineUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = tempfile.mkdtemp()
+        recorder = MarketDataRecorder(cls.data_dir, "binance")
+        recorder.start()
+        for message in [
+            # Recorded before the snapshot, applied on top of it.
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "ETH-USDT", "update_id": 11, "bids": [["99.5", "1"]], "asks": []
+            }, timestamp=START + 0.2),
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "ETH-USDT", "update_id": 10, "bids": [["99", "3"], ["98", "4"]],
+                "asks": [["101", "3"], ["102", "4"]]
+            }, timestamp=START + 0.5),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "ETH-USDT", "update_id": 12, "bids": [], "asks": [["100.5", "2"]]
+            }, timestamp=START + 1.5),
+            # Ten minutes without market data.
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": "ETH-USDT", "trade_type": float(TradeType.SELL.value), "trade_id": 1,
+                "update_id": 1, "price": "98.5", "amount": "5"
+            }, timestamp=START + 600),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "ETH-USDT", "update_id": 13, "bids": [["99.5", "0"]], "asks": []
+            }, timestamp=START + 601),
+        ]:
+            recorder.record(message)
+        recorder.stop()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.data_dir)
+
+    def run_backtest(self, max_idle_time: float):
+        engine = BacktestEngine(self.data_dir, START, START + 3600, max_idle_time=max_idle_time)
+        exchange = engine.add_market("binance", ["ETH-USDT"], {"ETH": Decimal(0), "USDT": Decimal(1000)})
+        strategy = LimitBuyStrategy(MarketTradingPairTuple(exchange, "ETH-USDT", "ETH", "USDT"),
+                                    Decimal("99"), Decimal("2"))
+        return engine, exchange, strategy, engine.run(strategy)
+
+    def test_replay_and_fill(self):
+        engine, exchange, strategy, result = self.run_backtest(60)
+        order_book = exchange.get_order_book("ETH-USDT")
+        self.assertEqual((99.0, 100.5), (order_book.get_price(False), order_book.get_price(True)))
+        self.assertEqual(5, result.messages_replayed)
+
+        # The order is placed on the first tick after the snapshot, and filled by the recorded sell trade.
+        self.assertEqual(START + 1, strategy.ticks[0])
+        self.assertIsNotNone(strategy.order_id)
+        self.assertEqual(1, len(result.trades))
+        market, fill = result.trades[0]
+        self.assertEqual(("binance_PaperTrade", strategy.order_id), (market, fill.order_id))
+        self.assertEqual((Decimal("99"), Decimal("2"), START + 600), (fill.price, fill.amount, fill.timestamp))
+        self.assertEqual(Decimal("2"), result.balances["binance_PaperTrade"]["ETH"])
+        self.assertEqual(1, len(result.trades_data_frame()))
+        metrics = result.performance_metrics[("binance_PaperTrade", "ETH-USDT")]
+        self.assertEqual(Decimal("2"), metrics.b_vol_base)
+
+        # Idle stretches are skipped, a minute at a time at most.
+        self.assertIn(START + 600, strategy.ticks)
+        self.assertLessEqual(max(b - a for a, b in zip(strategy.ticks, strategy.ticks[1:])), 60)
+        self.assertLess(result.ticks, 100)
+        self.assertEqual(START + 3600, strategy.ticks[-1])
+
+    def test_tick_every_second(self):
+        engine, exchange, strategy, result = self.run_backtest(0)
+        self.assertEqual(3600, result.ticks)
+        self.assertEqual(1, len(result.trades))
+
+
+if __name__ == "__main__":
+    unittest.main()
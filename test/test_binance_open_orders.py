@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from aiohttp import web
+
+from hummingbot.connector.exchange.binance.binance_exchange import (
+    BROKER_ID,
+    BinanceExchange,
+)
+from hummingbot.connector.exchange.binance.binance_rest_client import BINANCE_REQUEST_WEIGHT_LIMIT
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_session_registry import HttpSessionRegistry
+
+
+class BinanceOpenOrdersUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.ev_loop.run_until_complete(cls.start_server())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    @classmethod
+    async def start_server(cls):
+        async def handle_open_orders(request: web.Request) -> web.Response:
+            return web.json_response([
+                {"clientOrderId": f"{BROKER_ID}-BHTEH1", "symbol": "HBOTETH", "price": "1.5", "origQty": "10",
+                 "executedQty": "2", "status": "PARTIALLY_FILLED", "type": "LIMIT", "side": "BUY",
+                 "time": 1600000000000, "orderId": 1},
+                {"clientOrderId": "manual", "symbol": "HBOTETH", "price": "1.6", "origQty": "1", "executedQty": "0",
+                 "status": "NEW", "type": "LIMIT", "side": "SELL", "time": 1600000000000, "orderId": 2},
+            ])
+
+        app: web.Application = web.Application()
+        app.router.add_get("/api/v3/openOrders", handle_open_orders)
+        cls.runner = web.AppRunner(app)
+        await cls.runner.setup()
+        site: web.TCPSite = web.TCPSite(cls.runner, "127.0.0.1", 0)
+        await site.start()
+        cls.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    def setUp(self):
+        HttpSessionRegistry._hsr_shared_instance = None
+        with patch("hummingbot.connector.exchange.binance.binance_exchange.BINANCE_REST_URL", self.base_url):
+            self.exchange = BinanceExchange("test_key", "test_secret", trading_pairs=["HBOT-ETH"])
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(HttpSessionRegistry.get_instance().close())
+
+    def test_open_orders_weight_within_rate_limit(self):
+        throttler: Throttler = Throttler(BINANCE_REQUEST_WEIGHT_LIMIT)
+        self.ev_loop.run_until_complete(
+            throttler.acquire(request_weight=BinanceExchange.OPEN_ORDERS_ALL_TRADING_PAIRS_WEIGHT))
+        self.assertAlmostEqual(BinanceExchange.OPEN_ORDERS_ALL_TRADING_PAIRS_WEIGHT / BINANCE_REQUEST_WEIGHT_LIMIT[0],
+                               throttler.utilisation())
+
+    def test_get_open_orders(self):
+        # Goes through the throttler of the exchange with the weight of the open orders of all the trading pairs.
+        open_orders = self.ev_loop.run_until_complete(self.exchange.get_open_orders())
+        self.assertEqual(1, len(open_orders))
+        open_order = open_orders[0]
+        self.assertEqual(f"{BROKER_ID}-BHTEH1", open_order.client_order_id)
+        self.assertEqual("HBOT-ETH", open_order.trading_pair)
+        self.assertEqual(Decimal("1.5"), open_order.price)
+        self.assertEqual(Decimal("2"), open_order.executed_amount)
+        self.assertTrue(open_order.is_buy)
+
+
+if __name__ == "__main__":
+    unittest.main()
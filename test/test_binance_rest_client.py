@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import hmac
+import time
+import unittest
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+from hummingbot.connector.exchange.binance.binance_rest_client import (
+    BinanceAPIError,
+    BinanceRestClient,
+)
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_session_registry import HttpSessionRegistry
+
+API_KEY = "test_key"
+API_SECRET = "test_secret"
+
+
+class BinanceRestClientUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.ev_loop.run_until_complete(cls.start_server())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    @classmethod
+    async def start_server(cls):
+        async def handle_order(request: web.Request) -> web.Response:
+            await asyncio.sleep(0.2)
+            query: str = request.query_string
+            payload, signature = query.rsplit("&signature=", 1)
+            expected: str = hmac.new(API_SECRET.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).hexdigest()
+            if request.headers.get("X-MBX-APIKEY") != API_KEY or signature != expected:
+                return web.json_response({"code": -1022, "msg": "Signature for this request is not valid."},
+                                         status=400)
+            return web.json_response({"method": request.method, **request.query})
+
+        async def handle_missing(request: web.Request) -> web.Response:
+            return web.json_response({"code": -2013, "msg": "Order does not exist."}, status=400)
+
+        async def handle_error(request: web.Request) -> web.Response:
+            return web.Response(text="Bad gateway", status=502)
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/api/v3/order", handle_order)
+        app.router.add_get("/api/v3/missing", handle_missing)
+        app.router.add_get("/api/v3/error", handle_error)
+        cls.runner = web.AppRunner(app)
+        await cls.runner.setup()
+        site: web.TCPSite = web.TCPSite(cls.runner, "127.0.0.1", 0)
+        await site.start()
+        cls.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    def setUp(self):
+        HttpSessionRegistry._hsr_shared_instance = None
+        self.client = BinanceRestClient(API_KEY, API_SECRET, self.base_url,
+                                        throttler=Throttler((1000, 1.0)),
+                                        time_provider=lambda: 1600000000.123,
+                                        recv_window=5000)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(HttpSessionRegistry.get_instance().close())
+
+    def test_build_query(self):
+        query: str = self.client.build_query({"symbol": "LINKETH"}, is_signed=True)
+        payload: str = urlencode([("recvWindow", 5000), ("symbol", "LINKETH"), ("timestamp", 1600000000123)])
+        expected: str = hmac.new(API_SECRET.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).hexdigest()
+        self.assertEqual(f"{payload}&signature={expected}", query)
+        self.assertEqual("symbol=LINKETH", self.client.build_query({"symbol": "LINKETH"}))
+
+    def test_concurrent_signed_requests(self):
+        async def run():
+            return await asyncio.gather(*[
+                self.client.request("POST", "/api/v3/order", {"newClientOrderId": str(i)}, is_signed=True)
+                for i in range(5)
+            ])
+
+        start: float = time.perf_counter()
+        results = self.ev_loop.run_until_complete(run())
+        elapsed: float = time.perf_counter() - start
+        self.assertEqual([str(i) for i in range(5)], [r["newClientOrderId"] for r in results])
+        self.assertTrue(all(r["method"] == "POST" for r in results))
+        # The server takes 0.2s per request, the requests are not serialized.
+        self.assertLess(elapsed, 0.6)
+
+        # Later requests reuse the pooled connections.
+        self.ev_loop.run_until_complete(run())
+        stats = HttpSessionRegistry.get_instance().host_stats["127.0.0.1"]
+        self.assertEqual(10, stats.requests)
+        self.assertGreaterEqual(stats.connections_reused, 5)
+
+    def test_api_errors(self):
+        with self.assertRaises(BinanceAPIError) as context:
+            self.ev_loop.run_until_complete(self.client.request("GET", "/api/v3/missing"))
+        self.assertEqual(-2013, context.exception.code)
+        self.assertEqual("Order does not exist.", context.exception.message)
+        self.assertEqual(400, context.exception.status_code)
+
+        response = self.ev_loop.run_until_complete(self.client.request("GET", "/api/v3/missing", return_err=True))
+        self.assertEqual(-2013, response["code"])
+
+        with self.assertRaises(BinanceAPIError) as context:
+            self.ev_loop.run_until_complete(self.client.request("GET", "/api/v3/error"))
+        self.assertEqual(502, context.exception.status_code)
+        self.assertIn("Bad gateway", context.exception.message)
+
+        bad_client: BinanceRestClient = BinanceRestClient(API_KEY, "wrong_secret", self.base_url)
+        with self.assertRaises(BinanceAPIError) as context:
+            self.ev_loop.run_until_complete(bad_client.request("GET", "/api/v3/order", is_signed=True))
+        self.assertEqual(-1022, context.exception.code)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import unittest
+
+from hummingbot.core.event.event_logger import EventLogger, EventLogRetentionPolicy
+from hummingbot.core.event.events import (
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType
+)
+
+
+def fill(timestamp: float) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp, f"order_{timestamp}", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT,
+                            Decimal("1"), Decimal("1"), TradeFee(Decimal(0)))
+
+
+def cancel(timestamp: float) -> OrderCancelledEvent:
+    return OrderCancelledEvent(timestamp, f"order_{timestamp}")
+
+
+class EventLoggerUnitTest(unittest.TestCase):
+    def test_unbounded_event_log(self):
+        logger = EventLogger()
+        events = [fill(1), cancel(2), fill(3), cancel(4)]
+        for event in events:
+            logger(event)
+        self.assertEqual(events, logger.event_log)
+        self.assertEqual(4, len(logger))
+        self.assertEqual(2, logger.count(OrderFilledEvent))
+        logger.clear()
+        self.assertEqual([], logger.event_log)
+
+    def test_iter_events_by_type_and_timestamp(self):
+        logger = EventLogger()
+        for i in range(10):
+            logger(fill(i) if i % 2 == 0 else cancel(i))
+        self.assertEqual([0, 2, 4, 6, 8], [e.timestamp for e in logger.iter_events(OrderFilledEvent)])
+        self.assertEqual([6, 8], [e.timestamp for e in logger.iter_events(OrderFilledEvent, after=4)])
+        self.assertEqual([5, 6, 7, 8, 9], [e.timestamp for e in logger.iter_events(after=4)])
+        self.assertEqual([], list(logger.iter_events(str)))
+
+        # Views don't change when more events are logged.
+        view = logger.iter_events(OrderFilledEvent)
+        logger(fill(10))
+        self.assertEqual(5, len(list(view)))
+
+    def test_out_of_order_timestamps(self):
+        logger = EventLogger()
+        for timestamp in [5, 1, 7, 3]:
+            logger(fill(timestamp))
+        self.assertEqual([5, 7], [e.timestamp for e in logger.iter_events(OrderFilledEvent, after=3)])
+
+    def test_max_events_retention(self):
+        logger = EventLogger(retention=EventLogRetentionPolicy(max_events=100, exempt_event_types=(OrderFilledEvent,)))
+        for i in range(1000):
+            logger(fill(i) if i % 10 == 0 else cancel(i))
+        self.assertEqual(100, logger.count(OrderFilledEvent))
+        self.assertEqual(100, logger.count(OrderCancelledEvent))
+        self.assertEqual(list(range(889, 1000)),
+                         [e.timestamp for e in logger.iter_events() if e.timestamp >= 887])
+        self.assertEqual(0, logger.event_log[0].timestamp)
+        timestamps = [e.timestamp for e in logger.event_log]
+        self.assertEqual(sorted(timestamps), timestamps)
+
+    def test_max_age_retention(self):
+        logger = EventLogger(retention=EventLogRetentionPolicy(max_age=10))
+        for i in range(100):
+            logger(cancel(i))
+        self.assertEqual(list(range(89, 100)), [e.timestamp for e in logger.iter_events()])
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import unittest
+
+from aiohttp import web
+
+from hummingbot.core.utils.http_session_registry import (
+    HostConnectionStats,
+    HttpSessionRegistry,
+    shared_client_session
+)
+
+
+class HttpSessionRegistryUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.ev_loop.run_until_complete(cls.start_server())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    @classmethod
+    async def start_server(cls):
+        async def handle(request: web.Request) -> web.Response:
+            return web.json_response({"path": request.path})
+
+        app: web.Application = web.Application()
+        app.router.add_get("/{tail:.*}", handle)
+        cls.runner = web.AppRunner(app)
+        await cls.runner.setup()
+        site: web.TCPSite = web.TCPSite(cls.runner, "127.0.0.1", 0)
+        await site.start()
+        cls.port = site._server.sockets[0].getsockname()[1]
+
+    def setUp(self):
+        HttpSessionRegistry._hsr_shared_instance = None
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(HttpSessionRegistry.get_instance().close())
+
+    async def fetch(self, path: str):
+        async with shared_client_session() as client:
+            async with client.get(f"http://127.0.0.1:{self.port}{path}") as response:
+                return await response.json()
+
+    def test_connections_are_reused(self):
+        for i in range(5):
+            result = self.ev_loop.run_until_complete(self.fetch(f"/{i}"))
+            self.assertEqual({"path": f"/{i}"}, result)
+        stats: HostConnectionStats = HttpSessionRegistry.get_instance().host_stats["127.0.0.1"]
+        self.assertEqual(5, stats.requests)
+        self.assertEqual(1, stats.connections_created)
+        self.assertEqual(4, stats.connections_reused)
+        self.assertAlmostEqual(0.8, stats.reuse_ratio)
+
+    def test_session_stays_open_and_close(self):
+        registry: HttpSessionRegistry = HttpSessionRegistry.get_instance()
+
+        async def get_session():
+            return registry.get_session()
+
+        self.ev_loop.run_until_complete(self.fetch("/"))
+        session = self.ev_loop.run_until_complete(get_session())
+        self.assertFalse(session.closed)
+        self.assertIs(session, self.ev_loop.run_until_complete(get_session()))
+        self.ev_loop.run_until_complete(registry.close())
+        self.assertTrue(session.closed)
+        self.assertIsNot(session, self.ev_loop.run_until_complete(get_session()))
+
+    def test_session_of_other_loop_closed(self):
+        registry: HttpSessionRegistry = HttpSessionRegistry.get_instance()
+        other_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        thread: threading.Thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+
+        async def get_session():
+            return registry.get_session()
+
+        try:
+            other_session = asyncio.run_coroutine_threadsafe(get_session(), other_loop).result(5)
+            session = self.ev_loop.run_until_complete(get_session())
+            self.assertIsNot(other_session, session)
+            # The replaced session is closed on its own loop.
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other_loop).result(5)
+            self.assertTrue(other_session.closed)
+            self.assertFalse(session.closed)
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(5)
+            other_loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
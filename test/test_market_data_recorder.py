@@ -0,0 +1,152 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.market_data_recorder import (
+    CHUNK_HEADER,
+    MARKET_DATA_INDEX_EXTENSION,
+    MarketDataFileReader,
+    MarketDataRecorder,
+    MarketDataRecordingQueue,
+    list_market_data_files,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.event.events import TradeType
+
+# 2021-03-01 23:59:50 UTC
+DAY_END: float = 1614643190.0
+
+
+def diff_message(update_id: int, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "ETH-USDT",
+        "first_update_id": update_id - 1,
+        "update_id": update_id,
+        "bids": [["1500.01", "1.5"], ["1499.5", "0"]],
+        "asks": [["1500.5", "2.25", "ignored"]]
+    }, timestamp=timestamp)
+
+
+def trade_message(trade_id: int, trade_type: TradeType, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": "ETH-USDT",
+        "trade_type": float(trade_type.value),
+        "trade_id": trade_id,
+        "update_id": trade_id,
+        "price": "1500.2",
+        "amount": "0.75"
+    }, timestamp=timestamp)
+
+
+class MarketDataRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.data_dir: str = tempfile.mkdtemp()
+        self.recorder: MarketDataRecorder = MarketDataRecorder(self.data_dir, "binance", chunk_size=4)
+        self.recorder.start()
+
+    def tearDown(self):
+        self.recorder.stop()
+        shutil.rmtree(self.data_dir)
+
+    def test_round_trip(self):
+        messages = [diff_message(100 + i, DAY_END + i) for i in range(5)]
+        messages.insert(2, trade_message(7, TradeType.SELL, DAY_END + 1.5))
+        messages.insert(4, trade_message(8, TradeType.BUY, DAY_END + 2.5))
+        for message in messages:
+            self.recorder.record(message)
+        self.assertTrue(self.recorder.flush(5))
+        self.assertEqual(7, self.recorder.stats.written_messages)
+        self.assertEqual(0, self.recorder.stats.failed_messages)
+
+        paths = list_market_data_files(self.data_dir, "binance", "ETH-USDT")
+        self.assertEqual(["2021-03-01.hbmd"], [os.path.basename(path) for path in paths])
+        reader = MarketDataFileReader(paths[0])
+        self.assertEqual([4, 3], [entry.message_count for entry in reader.index])
+        self.assertEqual((100, 102), (reader.index[0].first_update_id, reader.index[0].last_update_id))
+
+        read_messages = list(reader.iter_messages())
+        self.assertEqual([m.type for m in messages], [m.type for m in read_messages])
+        self.assertEqual([m.timestamp for m in messages], [m.timestamp for m in read_messages])
+        diff = read_messages[0]
+        self.assertEqual("ETH-USDT", diff.trading_pair)
+        self.assertEqual((99, 100), (diff.first_update_id, diff.update_id))
+        self.assertEqual([[1500.01, 1.5], [1499.5, 0.0]], diff.content["bids"])
+        self.assertEqual([[1500.5, 2.25]], diff.content["asks"])
+        sell, buy = read_messages[2], read_messages[4]
+        self.assertEqual((7, float(TradeType.SELL.value), 1500.2, 0.75),
+                         (sell.trade_id, sell.content["trade_type"], sell.content["price"], sell.content["amount"]))
+        self.assertEqual(float(TradeType.BUY.value), buy.content["trade_type"])
+
+        # Only the chunks in the time range are read.
+        self.assertEqual([103, 104], [m.update_id for m in reader.iter_messages(start_timestamp=DAY_END + 3)])
+        self.assertEqual(1, len(list(reader.iter_chunks(end_timestamp=DAY_END + 1))))
+
+    def test_day_rollover_and_index_recovery(self):
+        for i in range(6):
+            self.recorder.record(diff_message(100 + i, DAY_END + 4 * i))
+        self.recorder.stop()
+        paths = list_market_data_files(self.data_dir, "binance", "ETH-USDT")
+        self.assertEqual(["2021-03-01.hbmd", "2021-03-02.hbmd"], [os.path.basename(path) for path in paths])
+        self.assertEqual([100, 101, 102], [m.update_id for m in MarketDataFileReader(paths[0]).iter_messages()])
+
+        # Files are appended to. Without the index, the chunks are found by their headers, a partial chunk is ignored.
+        self.recorder.start()
+        for i in range(6, 10):
+            self.recorder.record(diff_message(100 + i, DAY_END + 4 * i))
+        self.recorder.stop()
+        with open(paths[1], "ab") as data_file:
+            data_file.write(CHUNK_HEADER.pack(b"HBMC", 1000, 1000, 10, 10, 0, 0, 0, 0))
+        os.remove(paths[1] + MARKET_DATA_INDEX_EXTENSION)
+        reader = MarketDataFileReader(paths[1])
+        self.assertEqual(2, len(reader.index))
+        self.assertEqual(list(range(103, 110)), [m.update_id for m in reader.iter_messages()])
+
+    def test_millisecond_timestamps(self):
+        self.recorder.record(diff_message(100, DAY_END * 1e3))
+        self.recorder.record(trade_message(7, TradeType.BUY, (DAY_END + 1) * 1e3))
+        self.recorder.record(diff_message(101, DAY_END + 2))
+        self.assertTrue(self.recorder.flush(5))
+
+        # Recorded in seconds, like the messages time stamped in seconds.
+        reader = MarketDataFileReader(list_market_data_files(self.data_dir, "binance", "ETH-USDT")[0])
+        self.assertEqual((DAY_END, DAY_END + 2), (reader.index[0].first_timestamp, reader.index[0].last_timestamp))
+        self.assertEqual([DAY_END, DAY_END + 1, DAY_END + 2], [m.timestamp for m in reader.iter_messages()])
+        self.assertEqual([OrderBookMessageType.TRADE, OrderBookMessageType.DIFF],
+                         [m.type for m in reader.iter_messages(start_timestamp=DAY_END + 1)])
+
+    def test_recorded_order_book_snapshot(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99.0, 1.0, 5], [98.0, 2.0, 5]]), np.array([[101.0, 3.0, 5]]))
+        self.recorder.record_order_book("ETH-USDT", order_book, timestamp=DAY_END)
+        self.recorder.flush(5)
+
+        snapshot = next(MarketDataFileReader(list_market_data_files(self.data_dir, "binance", "ETH-USDT")[0])
+                        .iter_messages())
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(5, snapshot.update_id)
+        restored = OrderBook()
+        restored.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.assertEqual((99.0, 101.0), (restored.get_price(False), restored.get_price(True)))
+
+    def test_recording_queue(self):
+        stream = MarketDataRecordingQueue(self.recorder)
+
+        async def put_messages():
+            await stream.put(diff_message(1, DAY_END))
+            stream.put_nowait(diff_message(2, DAY_END))
+
+        asyncio.get_event_loop().run_until_complete(put_messages())
+        self.assertEqual(2, stream.qsize())
+        self.assertEqual(2, self.recorder.stats.recorded_messages)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+
+
+class MarketsRecorderTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        # The writer thread needs a file database, as each thread gets its own in-memory SQLite database.
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.db_dir.name, "test.sqlite"))
+        self.recorder = MarketsRecorder(self.sql, [], "test_config.yml", "pure_market_making")
+
+    def tearDown(self):
+        self.recorder.stop()
+        self.sql.get_shared_session().close()
+        self.db_dir.cleanup()
+
+    def test_trade_fills_written_on_event_loop_thread(self):
+        written_on = []
+        self.recorder.start()
+        with patch.object(MarketsRecorder, "append_to_csv",
+                          lambda recorder, trade_fill: written_on.append((trade_fill, threading.current_thread()))):
+            self.recorder.db_writer.put(lambda session: None,
+                                        on_commit=lambda: self.recorder._trade_fill_committed("fill_1"))
+            self.assertTrue(self.recorder.db_writer.flush(timeout=5))
+            # Committed on the writer thread, but only written once the event loop runs.
+            self.assertEqual([], written_on)
+            self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual([("fill_1", threading.main_thread())], written_on)
+
+    def test_committed_trade_fills_written_on_stop(self):
+        written = []
+        self.recorder.start()
+        with patch.object(MarketsRecorder, "append_to_csv", lambda recorder, trade_fill: written.append(trade_fill)):
+            self.recorder.db_writer.put(lambda session: None,
+                                        on_commit=lambda: self.recorder._trade_fill_committed("fill_1"))
+            self.recorder.stop()
+        self.assertEqual(["fill_1"], written)
+
+    def test_flush_db_writer(self):
+        market = MagicMock(display_name="binance", tracking_states={"order_1": {}})
+        self.recorder.start()
+        self.recorder.save_market_states("test_config.yml", market)
+        self.ev_loop.run_until_complete(self.recorder.flush_db_writer())
+        self.assertEqual({"order_1": {}}, self.recorder.get_market_states("test_config.yml", market).saved_state)
+
+    def test_flush_db_writer_timeout(self):
+        release = threading.Event()
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        self.recorder.start()
+        self.recorder.db_writer.put(lambda session: release.wait(5))
+        tick_task = self.ev_loop.create_task(tick())
+        with patch.object(MarketsRecorder, "DB_FLUSH_TIMEOUT", 0.2), \
+                self.assertLogs(MarketsRecorder.logger().name, level="WARNING"):
+            self.ev_loop.run_until_complete(self.recorder.flush_db_writer())
+        tick_task.cancel()
+        release.set()
+        # The event loop kept running while waiting for the writer.
+        self.assertGreater(len(ticks), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+from decimal import Decimal
+import unittest
+
+from hummingbot.connector.exchange.binance.binance_in_flight_order import BinanceInFlightOrder
+from hummingbot.connector.open_orders_reconciler import OpenOrdersReconciler
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType
+)
+
+
+def in_flight_order(client_order_id: str, trading_pair: str) -> BinanceInFlightOrder:
+    return BinanceInFlightOrder(client_order_id, f"exchange_{client_order_id}", trading_pair, OrderType.LIMIT,
+                                TradeType.BUY, Decimal("1"), Decimal("1"))
+
+
+def order_record(client_order_id: str, symbol: str):
+    return {"clientOrderId": client_order_id, "symbol": symbol, "status": "NEW"}
+
+
+class OpenOrdersReconcilerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.reconciler = OpenOrdersReconciler(lambda order: order.get("clientOrderId"),
+                                               trading_pair_request_weight=3,
+                                               all_trading_pairs_request_weight=10)
+
+    def test_trading_pairs_to_fetch(self):
+        orders = [in_flight_order(str(i), pair) for i, pair in enumerate(["A-B", "C-D", "A-B", "E-F"])]
+        self.assertEqual(["A-B", "C-D", "E-F"], self.reconciler.trading_pairs_to_fetch(orders))
+        orders.append(in_flight_order("4", "G-H"))
+        # 4 trading pair requests weigh more than one request for all the trading pairs.
+        self.assertIsNone(self.reconciler.trading_pairs_to_fetch(orders))
+        self.assertEqual(["A-B", "C-D", "E-F", "G-H"],
+                         OpenOrdersReconciler(lambda order: order).trading_pairs_to_fetch(orders))
+
+    def test_reconcile(self):
+        tracked = [in_flight_order("open", "A-B"), in_flight_order("filled", "A-B"), in_flight_order("other", "C-D")]
+        open_orders = [order_record("open", "AB"), order_record("manual", "AB"), {"symbol": "AB"}]
+
+        reconciliation = self.reconciler.reconcile(tracked, open_orders)
+        self.assertEqual([(tracked[0], open_orders[0])], reconciliation.open_orders)
+        self.assertEqual([tracked[1], tracked[2]], reconciliation.missing_orders)
+        self.assertEqual([open_orders[1]], reconciliation.untracked_orders)
+
+        # The orders of the trading pairs that weren't fetched are left out.
+        reconciliation = self.reconciler.reconcile(tracked, open_orders, fetched_trading_pairs=["A-B"])
+        self.assertEqual([tracked[1]], reconciliation.missing_orders)
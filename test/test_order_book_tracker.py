@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+def diff_message(update_id: int, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "ETH-USDT", "update_id": update_id, "bids": bids, "asks": asks
+    }, update_id)
+
+
+class MockDataSource:
+    def __init__(self, delays: Dict[str, float]):
+        self.delays: Dict[str, float] = delays
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays[trading_pair])
+        self.in_flight -= 1
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 10)], [OrderBookRow(101, 1, 10)], 10)
+        return order_book
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker = OrderBookTracker(data_source=None, trading_pairs=["ETH-USDT"])
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([], [], 1)
+
+    def test_drain_message_queue(self):
+        queue: asyncio.Queue = asyncio.Queue()
+        for update_id in range(3, 6):
+            queue.put_nowait(diff_message(update_id, [], []))
+        first: OrderBookMessage = diff_message(2, [], [])
+        messages: List[OrderBookMessage] = self.tracker._drain_message_queue(first, queue)
+        self.assertEqual([2, 3, 4, 5], [m.update_id for m in messages])
+        self.assertTrue(queue.empty())
+
+        self.tracker.DIFF_BATCH_MODE = False
+        queue.put_nowait(diff_message(7, [], []))
+        self.assertEqual(1, len(self.tracker._drain_message_queue(diff_message(6, [], []), queue)))
+        self.assertEqual(1, queue.qsize())
+
+    def test_apply_order_book_messages(self):
+        past_diffs_window: Deque[OrderBookMessage] = deque()
+        messages: List[OrderBookMessage] = [
+            diff_message(2, [["100", "1"], ["99", "2"]], [["101", "1"]]),
+            diff_message(3, [["100", "0"]], [["102", "3"]]),
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "ETH-USDT", "update_id": 3, "bids": [["98", "1"]], "asks": [["103", "1"]]
+            }, 3),
+            diff_message(4, [["98.5", "1"]], []),
+        ]
+        applied: int = self.tracker._apply_order_book_messages("ETH-USDT",
+                                                               self.order_book,
+                                                               messages,
+                                                               past_diffs_window,
+                                                               queue_depth=4)
+        self.assertEqual(3, applied)
+        self.assertEqual([(98.5, 1.0, 4), (98.0, 1.0, 3)], list(self.order_book.bid_entries()))
+        self.assertEqual([(103.0, 1.0, 3)], [tuple(row) for row in self.order_book.ask_entries()])
+        self.assertEqual([2, 3, 4], [m.update_id for m in past_diffs_window])
+
+        stats = self.tracker.pair_stats["ETH-USDT"]
+        self.assertEqual(3, stats.messages_applied)
+        self.assertEqual(2, stats.batches_applied)
+        self.assertEqual(2, stats.max_batch_size)
+        self.assertEqual(4, stats.max_queue_depth)
+        self.assertGreaterEqual(stats.avg_apply_latency, 0)
+
+    def test_init_order_books_concurrently(self):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        trading_pairs: List[str] = ["A-USDT", "B-USDT", "C-USDT", "ETH-USDT"]
+        data_source: MockDataSource = MockDataSource({"A-USDT": 0.01, "B-USDT": 0.01, "C-USDT": 0.5, "ETH-USDT": 0.01})
+        tracker: OrderBookTracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        tracker.SNAPSHOT_BOOTSTRAP_CONCURRENCY = 2
+        tracker.SNAPSHOT_RATE_LIMIT = (100, 1.0)
+
+        # Diffs received before the snapshot are saved; the stale one is dropped when tracking starts.
+        tracker._order_book_diff_stream.put_nowait(diff_message(5, [["98", "1"]], []))
+        tracker._order_book_diff_stream.put_nowait(diff_message(11, [["100", "2"]], []))
+        router_task = ev_loop.create_task(tracker._order_book_diff_router())
+        init_task = ev_loop.create_task(tracker._init_order_books())
+        try:
+            ev_loop.run_until_complete(asyncio.sleep(0.2))
+            self.assertFalse(tracker.ready)
+            self.assertEqual(["A-USDT", "B-USDT", "ETH-USDT"], tracker.ready_trading_pairs)
+            self.assertFalse(tracker.is_trading_pair_ready("C-USDT"))
+            self.assertEqual(2, data_source.max_in_flight)
+
+            ev_loop.run_until_complete(init_task)
+            self.assertTrue(tracker.ready)
+            self.assertEqual(trading_pairs, tracker.ready_trading_pairs)
+        finally:
+            router_task.cancel()
+            for task in tracker._tracking_tasks.values():
+                task.cancel()
+        bids = list(tracker.order_books["ETH-USDT"].bid_entries())
+        self.assertEqual([(100.0, 2.0, 11), (99.0, 1.0, 10)], bids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict
+)
+
+from hummingbot.backtesting.backtest_engine import BacktestEngine
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.event.events import OrderType
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+# 2021-03-01 00:00:00 UTC
+START: float = 1614556800.0
+
+
+class ScriptedStrategy(StrategyPyBase):
+    """
+    Calls each action with the exchange on the first tick at or after its time, in seconds from the start.
+    """
+
+    def __init__(self, exchange: PaperTradeExchange, actions: Dict[float, Callable[[PaperTradeExchange], None]]):
+        super().__init__()
+        self._exchange = exchange
+        self._actions = sorted(actions.items())
+        self.add_markets([exchange])
+
+    def tick(self, timestamp: float):
+        while self._actions and self._exchange.ready and self._actions[0][0] <= timestamp - START:
+            self._actions.pop(0)[1](self._exchange)
+
+
+class PaperTradeLimitOrdersUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = tempfile.mkdtemp()
+        recorder = MarketDataRecorder(cls.data_dir, "binance")
+        recorder.start()
+        for message in [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "ETH-USDT", "update_id": 10, "bids": [["99", "3"], ["98", "4"]],
+                "asks": [["101", "3"], ["102", "4"]]
+            }, timestamp=START + 0.5),
+            # The best ask moves down to 100.
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "ETH-USDT", "update_id": 11, "bids": [], "asks": [["101", "0"], ["100", "1"]]
+            }, timestamp=START + 20),
+        ]:
+            recorder.record(message)
+        recorder.stop()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.data_dir)
+
+    def run_backtest(self, end: float, actions: Dict[float, Callable[[PaperTradeExchange], None]]):
+        engine = BacktestEngine(self.data_dir, START, START + end, max_idle_time=0)
+        exchange = engine.add_market("binance", ["ETH-USDT"], {"ETH": Decimal(0), "USDT": Decimal(1000)})
+        return engine.run(ScriptedStrategy(exchange, actions))
+
+    @staticmethod
+    def open_order_ids(exchange: PaperTradeExchange):
+        return {order.client_order_id for order in exchange.limit_orders}
+
+    def test_fill_against_moved_book(self):
+        order_ids = []
+
+        def buy(exchange: PaperTradeExchange):
+            order_ids.append(exchange.buy("ETH-USDT", Decimal("1"), OrderType.LIMIT, Decimal("100.5")))
+
+        def check_open(exchange: PaperTradeExchange):
+            # Checked against the best ask of 101 on every tick so far, the top of book didn't move.
+            self.assertEqual(set(order_ids), self.open_order_ids(exchange))
+
+        def check_filled(exchange: PaperTradeExchange):
+            self.assertEqual(set(), self.open_order_ids(exchange))
+            self.assertEqual(Decimal("1"), exchange.get_balance("ETH"))
+            self.assertEqual(Decimal("899.5"), exchange.get_available_balance("USDT"))
+
+        result = self.run_backtest(25, {1: buy, 10: check_open, 19: check_open, 21: check_filled})
+        self.assertEqual(order_ids, [fill.order_id for _, fill in result.trades])
+        self.assertEqual([Decimal("100.5")], [fill.price for _, fill in result.trades])
+
+    def test_cache_invalidation(self):
+        order_ids = {}
+
+        def place(exchange: PaperTradeExchange):
+            order_ids["a"] = exchange.buy("ETH-USDT", Decimal("1"), OrderType.LIMIT, Decimal("95"))
+            self.assertEqual({order_ids["a"]}, self.open_order_ids(exchange))
+            self.assertEqual(Decimal("905"), exchange.get_available_balance("USDT"))
+            order_ids["b"] = exchange.buy("ETH-USDT", Decimal("1"), OrderType.LIMIT, Decimal("96"))
+            order_ids["c"] = exchange.buy("ETH-USDT", Decimal("1"), OrderType.LIMIT, Decimal("100.5"))
+            self.assertEqual(set(order_ids.values()), self.open_order_ids(exchange))
+            self.assertEqual(Decimal("708.5"), exchange.available_balances["USDT"])
+
+        def cancel(exchange: PaperTradeExchange):
+            exchange.cancel("ETH-USDT", order_ids["a"])
+            self.assertEqual({order_ids["b"], order_ids["c"]}, self.open_order_ids(exchange))
+            self.assertEqual(Decimal("803.5"), exchange.get_available_balance("USDT"))
+
+        def check_filled(exchange: PaperTradeExchange):
+            self.assertEqual({order_ids["b"]}, self.open_order_ids(exchange))
+            self.assertEqual(Decimal("803.5"), exchange.get_available_balance("USDT"))
+            self.assertEqual(Decimal("1"), exchange.available_balances["ETH"])
+
+        result = self.run_backtest(25, {1: place, 2: cancel, 21: check_filled})
+        self.assertEqual([order_ids["c"]], [fill.order_id for _, fill in result.trades])
+
+    def test_last_order_removed(self):
+        order_ids = []
+
+        def buy(price: str):
+            def place(exchange: PaperTradeExchange):
+                order_ids.append(exchange.buy("ETH-USDT", Decimal("1"), OrderType.LIMIT, Decimal(price)))
+            return place
+
+        def cancel_all(exchange: PaperTradeExchange):
+            for order_id in order_ids:
+                exchange.cancel("ETH-USDT", order_id)
+            self.assertEqual(set(), self.open_order_ids(exchange))
+
+        def check_filled(exchange: PaperTradeExchange):
+            self.assertEqual(set(), self.open_order_ids(exchange))
+            self.assertEqual(Decimal("1"), exchange.get_balance("ETH"))
+
+        # The trading pair goes out of the bid limit orders when its last order is cancelled. A new order that the
+        # book, which didn't move since, already crosses is still filled.
+        result = self.run_backtest(5, {1: buy("95"), 2: cancel_all, 3: buy("101.5"), 5: check_filled})
+        self.assertEqual([order_ids[-1]], [fill.order_id for _, fill in result.trades])
+        self.assertEqual([Decimal("101.5")], [fill.price for _, fill in result.trades])
+
+
+if __name__ == "__main__":
+    unittest.main()
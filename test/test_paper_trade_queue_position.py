@@ -0,0 +1,127 @@
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.backtesting.backtest_engine import BacktestEngine
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderType,
+    TradeType
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+# 2021-03-01 00:00:00 UTC
+START: float = 1614556800.0
+
+
+class LimitOrdersStrategy(StrategyPyBase):
+    def __init__(self, market_info: MarketTradingPairTuple, orders):
+        super().__init__()
+        self._market_info = market_info
+        self._orders = orders
+        self.order_ids = []
+        self.add_markets([market_info.market])
+
+    def tick(self, timestamp: float):
+        if len(self.order_ids) == 0 and self._market_info.market.ready:
+            for price, amount in self._orders:
+                self.order_ids.append(self.buy_with_specific_market(self._market_info, amount, OrderType.LIMIT,
+                                                                    price))
+
+
+def trade(timestamp: float, price: str, amount: str) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": "ETH-USDT", "trade_type": float(TradeType.SELL.value), "trade_id": int(timestamp),
+        "update_id": int(timestamp), "price": price, "amount": amount
+    }, timestamp=START + timestamp)
+
+
+class PaperTradeQueuePositionUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = tempfile.mkdtemp()
+        recorder = MarketDataRecorder(cls.data_dir, "binance")
+        recorder.start()
+        for message in [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "ETH-USDT", "update_id": 10, "bids": [["99", "3"], ["98", "4"]],
+                "asks": [["101", "3"], ["102", "4"]]
+            }, timestamp=START + 0.5),
+            # 3 ETH are queued ahead of the paper orders at 99, 1 ETH of them trades.
+            trade(10, "99", "1"),
+            # 1.5 ETH of the 2 ETH left ahead are cancelled.
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "ETH-USDT", "update_id": 11, "bids": [["99", "1.5"]], "asks": []
+            }, timestamp=START + 20),
+            # 0.5 ETH of this trade goes to the first paper order.
+            trade(30, "99", "2"),
+            # Trades through 99 fill what is left of the orders at 99.
+            trade(40, "98", "1"),
+        ]:
+            recorder.record(message)
+        recorder.stop()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.data_dir)
+
+    def run_backtest(self, end: float, queue_position_enabled: bool = True):
+        engine = BacktestEngine(self.data_dir, START, START + end)
+        exchange = engine.add_market("binance", ["ETH-USDT"], {"ETH": Decimal(0), "USDT": Decimal(1000)},
+                                     MarketConfig.default_config()._replace(
+                                         queue_position_enabled=queue_position_enabled))
+        event_logger = EventLogger()
+        exchange.add_listener(MarketEvent.BuyOrderCompleted, event_logger)
+        strategy = LimitOrdersStrategy(MarketTradingPairTuple(exchange, "ETH-USDT", "ETH", "USDT"),
+                                       [(Decimal("99"), Decimal("2")), (Decimal("99"), Decimal("1"))])
+        result = engine.run(strategy)
+        return exchange, strategy, result, event_logger
+
+    def test_partial_fills(self):
+        exchange, strategy, result, event_logger = self.run_backtest(35)
+        first_order, second_order = strategy.order_ids
+        self.assertEqual([(first_order, Decimal("0.5"))],
+                         [(fill.order_id, fill.amount) for _, fill in result.trades])
+        self.assertEqual(Decimal("0.5"), exchange.get_balance("ETH"))
+        self.assertEqual(Decimal("950.5"), exchange.get_balance("USDT"))
+        self.assertEqual({first_order: Decimal("1.5"), second_order: Decimal("1")},
+                         {order.client_order_id: order.quantity for order in exchange.limit_orders})
+
+        # The second order is queued behind what is left of the first one.
+        self.assertEqual(Decimal(0), exchange.get_queue_position(first_order).queue_ahead)
+        self.assertEqual(Decimal("1.5"), exchange.get_queue_position(second_order).queue_ahead)
+        self.assertEqual(0, event_logger.count(BuyOrderCompletedEvent))
+
+    def test_queue_order(self):
+        exchange, strategy, result, event_logger = self.run_backtest(60)
+        first_order, second_order = strategy.order_ids
+        fills = [(fill.order_id, fill.amount) for _, fill in result.trades]
+        self.assertEqual((first_order, Decimal("0.5")), fills[0])
+        self.assertEqual({(first_order, Decimal("1.5")), (second_order, Decimal("1"))}, set(fills[1:]))
+        self.assertEqual(Decimal("3"), exchange.get_balance("ETH"))
+        self.assertEqual(0, len(exchange.limit_orders))
+        self.assertIsNone(exchange.get_queue_position(first_order))
+
+        completed = {event.order_id: event.base_asset_amount
+                     for event in event_logger.iter_events(BuyOrderCompletedEvent)}
+        self.assertEqual({first_order: Decimal("2"), second_order: Decimal("1")}, completed)
+
+    def test_queue_position_disabled(self):
+        exchange, strategy, result, event_logger = self.run_backtest(35, queue_position_enabled=False)
+        # Trades at the order price don't fill the orders, and nothing crossed them.
+        self.assertEqual(0, len(result.trades))
+        self.assertIsNone(exchange.get_queue_position(strategy.order_ids[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
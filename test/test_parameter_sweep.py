@@ -0,0 +1,133 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.backtesting.parameter_sweep import (
+    ParameterSweep,
+    expand_parameter_grid,
+    run_sweep_backtest
+)
+from hummingbot.client.config.config_helpers import get_strategy_template_path
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.event.events import TradeType
+
+# 2021-03-01 00:00:00 UTC
+START: float = 1614556800.0
+CONFIG_VALUES = {
+    "strategy": "pure_market_making",
+    "exchange": "binance",
+    "market": "ETH-USDT",
+    "bid_spread": 0.5,
+    "ask_spread": 0.5,
+    "order_amount": 1,
+    "order_refresh_time": 10,
+}
+
+
+class ParameterSweepUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = tempfile.mkdtemp()
+        recorder = MarketDataRecorder(cls.data_dir, "binance")
+        recorder.start()
+        recorder.record(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "ETH-USDT", "update_id": 10, "bids": [["99", "3"], ["98", "4"]],
+            "asks": [["101", "3"], ["102", "4"]]
+        }, timestamp=START + 0.5))
+        # Sells through the bids of the strategy.
+        recorder.record(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": "ETH-USDT", "trade_type": float(TradeType.SELL.value), "trade_id": 1,
+            "update_id": 11, "price": "98", "amount": "5"
+        }, timestamp=START + 30))
+        recorder.stop()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.data_dir)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.results_path = os.path.join(self.tmp_dir, "sweep.csv")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_config(self) -> str:
+        config_path = os.path.join(self.tmp_dir, "conf_pure_mm_sweep.yml")
+        with open(get_strategy_template_path("pure_market_making")) as template_fd:
+            lines = template_fd.read().splitlines()
+        with open(config_path, "w") as config_fd:
+            for line in lines:
+                key = line.split(":")[0]
+                if key in CONFIG_VALUES:
+                    line = f"{key}: {CONFIG_VALUES[key]}"
+                config_fd.write(line + "\n")
+        return config_path
+
+    def create_sweep(self, parameter_grid) -> ParameterSweep:
+        return ParameterSweep(self.write_config(), parameter_grid, self.data_dir, START, START + 60,
+                              {"ETH": Decimal(10), "USDT": Decimal(1000)}, self.results_path, workers=1)
+
+    def test_expand_parameter_grid(self):
+        runs = expand_parameter_grid({"order_levels": [1, 2, 3], "bid_spread": [0.1, 0.2]}, seed=1)
+        self.assertEqual(6, len(runs))
+        self.assertEqual({"bid_spread": 0.1, "order_levels": 1}, runs[0].parameters)
+        self.assertEqual(6, len({run.run_id for run in runs}))
+
+        # A run keeps its id and seed whatever the grid around it, and the seeds depend on the sweep seed.
+        other_runs = expand_parameter_grid({"bid_spread": [0.2], "order_levels": [3]}, seed=1)
+        self.assertEqual(runs[-1], other_runs[0])
+        reseeded_runs = expand_parameter_grid({"bid_spread": [0.2], "order_levels": [3]}, seed=2)
+        self.assertEqual(runs[-1].run_id, reseeded_runs[0].run_id)
+        self.assertNotEqual(runs[-1].seed, reseeded_runs[0].seed)
+
+    def test_completed_run_ids(self):
+        sweep = ParameterSweep("conf_pure_mm_1.yml", {"bid_spread": [0.1, 0.2, 0.3]}, self.tmp_dir, 0, 3600,
+                               {"ETH": Decimal(10), "USDT": Decimal(1000)}, self.results_path)
+        self.assertEqual(set(), sweep.completed_run_ids())
+        done_run, failed_run, _ = sweep.runs
+        sweep._append_rows([
+            {"run_id": done_run.run_id, "seed": done_run.seed, "status": "done", "bid_spread": 0.1},
+            {"run_id": failed_run.run_id, "seed": failed_run.seed, "status": "failed", "bid_spread": 0.2}
+        ])
+        # Only the runs done are skipped on resume.
+        self.assertEqual({done_run.run_id}, sweep.completed_run_ids())
+
+    def test_run_sweep_backtest(self):
+        ev_loop = asyncio.get_event_loop()
+        sweep = self.create_sweep({"price_type": ["mid_price", "inventory_cost"]})
+        settings = ev_loop.run_until_complete(sweep._load_settings())
+        try:
+            # Serially, in this process.
+            for run in sweep.runs:
+                rows = run_sweep_backtest(settings, run)
+                self.assertEqual(1, len(rows))
+                self.assertEqual("done", rows[0]["status"])
+                self.assertEqual(("binance", "ETH-USDT"), (rows[0]["market"], rows[0]["trading_pair"]))
+                self.assertEqual(run.run_id, rows[0]["run_id"])
+                self.assertGreater(rows[0]["ticks"], 0)
+        finally:
+            asyncio.set_event_loop(ev_loop)
+
+    def test_resume(self):
+        results = self.create_sweep({"bid_spread": [0.5, 1]}).run()
+        self.assertEqual(["done", "done"], list(results["status"]))
+
+        # Resuming with a larger grid only runs the new combination.
+        sweep = self.create_sweep({"bid_spread": [0.5, 1, 2]})
+        results = sweep.run()
+        self.assertEqual(3, len(results))
+        self.assertEqual(["done"] * 3, list(results["status"]))
+        self.assertEqual({run.run_id for run in sweep.runs}, set(results["run_id"]))
+        self.assertEqual(sweep.completed_run_ids(), set(results["run_id"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,8 +6,18 @@ import unittest
 import asyncio
 from unittest.mock import patch
 
-from hummingbot.client.performance import calculate_performance_metrics
+from hummingbot.client.performance import (
+    calculate_performance_metrics,
+    PerformanceMetricsAccumulator,
+    TradePerformanceTracker
+)
 from hummingbot.core.data_type.trade import Trade, TradeType, TradeFee
+from hummingbot.core.event.events import OrderFilledEvent, OrderType
+from hummingbot.model import get_declarative_base
+from hummingbot.model.trade_fill import TradeFill
+
+# Loads all the models, as the TradeFill mapper refers to the other ones.
+get_declarative_base()
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -33,3 +43,62 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
             calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
         self.assertEqual(Decimal("250"), metrics.trade_pnl)
         print(metrics)
+
+    @staticmethod
+    def trade_fill(order_id: str, trade_type: str, price: float, amount: float, position: str) -> TradeFill:
+        return TradeFill(config_file_path="test.yml", strategy="test", market="hbot_exchange", symbol=trading_pair,
+                         base_asset=base, quote_asset=quote, timestamp=1, order_id=order_id, trade_type=trade_type,
+                         order_type="LIMIT", price=price, amount=amount, leverage=1,
+                         trade_fee={"percent": 0.001, "flat_fees": []}, exchange_trade_id="", position=position)
+
+    def test_accumulator_spot_metrics(self):
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        accumulator.add_trade(Trade(trading_pair, TradeType.BUY, 100, 10, None, trading_pair, 1,
+                                    TradeFee(0.0, [(quote, 1)])))
+        accumulator.add_trade(Trade(trading_pair, TradeType.SELL, 120, 15, None, trading_pair, 2,
+                                    TradeFee(0.0, [("HBOT", Decimal("0.1"))])))
+        metrics = accumulator.performance_metrics({base: 100, quote: 10000}, Decimal("110"), {"HBOT": Decimal("110")})
+        self.assertEqual(2, metrics.num_trades)
+        self.assertEqual(Decimal("-5"), metrics.tot_vol_base)
+        self.assertEqual(Decimal("800"), metrics.tot_vol_quote)
+        self.assertEqual(Decimal("100"), metrics.start_price)
+        self.assertEqual(Decimal("250"), metrics.trade_pnl)
+        self.assertEqual({quote: Decimal("1"), "HBOT": Decimal("0.1")}, metrics.fees)
+        self.assertEqual(Decimal("12"), metrics.fee_in_quote)
+        self.assertEqual(Decimal("238"), metrics.total_pnl)
+
+    def test_accumulator_derivative_pnl(self):
+        trades = [self.trade_fill("o1", "BUY", 100, 1, "OPEN"),
+                  self.trade_fill("o2", "SELL", 120, 1, "OPEN"),
+                  self.trade_fill("o1", "BUY", 102, 1, "OPEN"),
+                  self.trade_fill("c1", "SELL", 110, 2, "CLOSE"),
+                  self.trade_fill("c2", "BUY", 115, 1, "CLOSE")]
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade)
+        self.assertTrue(accumulator.derivative)
+        # Long: (110 - 101) * 2, short: (120 - 115) * 1
+        self.assertEqual(Decimal("23"), accumulator.realized_pnl)
+
+        with patch("hummingbot.client.performance.get_last_price", return_value=None):
+            metrics = asyncio.get_event_loop().run_until_complete(
+                calculate_performance_metrics("hbot_exchange", trading_pair, trades, {}))
+        self.assertEqual(Decimal("23"), metrics.trade_pnl)
+        self.assertAlmostEqual(Decimal("0.657"), metrics.fee_in_quote)
+
+    def test_tracker_streams_fill_events(self):
+        class MockMarket:
+            display_name = "hbot_exchange"
+            order_books = {}
+
+        market = MockMarket()
+        tracker = TradePerformanceTracker([market])
+        tracker.add_trade_fills([self.trade_fill("o1", "BUY", 100, 1, "NILL")])
+        tracker._did_fill_order(0, market, OrderFilledEvent(2, "o2", trading_pair, TradeType.SELL, OrderType.LIMIT,
+                                                            Decimal("110"), Decimal("1"), TradeFee(Decimal("0"))))
+        self.assertEqual(2, tracker.num_trades)
+        accumulator = tracker.accumulators[("hbot_exchange", trading_pair)]
+        self.assertFalse(accumulator.derivative)
+        metrics = accumulator.performance_metrics({base: Decimal("1"), quote: Decimal("1000")}, Decimal("110"))
+        self.assertEqual(Decimal("10"), metrics.trade_pnl)
+        self.assertAlmostEqual(Decimal("0.1"), metrics.fee_in_quote)
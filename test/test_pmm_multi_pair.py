@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import pandas as pd
+import unittest
+
+from hummingbot.client.command.config_command import ConfigCommand
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingsim.backtest.backtest_market import BacktestMarket
+from hummingsim.backtest.market import QuantizationParams
+from hummingsim.backtest.mock_order_book_loader import MockOrderBookLoader
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.events import OrderType
+from hummingbot.strategy.pure_market_making import (
+    MultiPairPureMarketMakingStrategy,
+    PureMarketMakingStrategy
+)
+from hummingbot.strategy.pure_market_making.start import pair_strategy_params
+
+
+class MultiPairPMMUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pairs = ["HBOT-ETH", "COINALPHA-ETH"]
+
+    def setUp(self):
+        self.clock_tick_size = 1
+        self.clock: Clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp)
+        self.market: BacktestMarket = BacktestMarket()
+        self.market_infos = []
+        for trading_pair in self.trading_pairs:
+            base_asset, quote_asset = trading_pair.split("-")
+            book_data = MockOrderBookLoader(trading_pair, base_asset, quote_asset)
+            book_data.set_balanced_order_book(mid_price=100, min_price=1, max_price=200, price_step_size=1,
+                                              volume_step_size=10)
+            self.market.add_data(book_data)
+            self.market.set_balance(base_asset, 500)
+            self.market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+            self.market_infos.append(MarketTradingPairTuple(self.market, trading_pair, base_asset, quote_asset))
+        self.clock.add_iterator(self.market)
+
+    def create_strategy(self, pair_overrides=None) -> MultiPairPureMarketMakingStrategy:
+        params = dict(
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+        )
+        pair_overrides = pair_overrides or {}
+        return MultiPairPureMarketMakingStrategy([
+            PureMarketMakingStrategy(market_info,
+                                     **pair_strategy_params(params, pair_overrides.get(market_info.trading_pair, {})))
+            for market_info in self.market_infos
+        ])
+
+    def test_pair_parameters(self):
+        self.market.set_balance("ETH", 5000)
+        strategy = self.create_strategy({"COINALPHA-ETH": {"bid_spread": 2, "order_amount": 2}})
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        hbot_strategy, coinalpha_strategy = strategy.pair_strategies
+        self.assertEqual([(99, 1)], [(o.price, o.quantity) for o in hbot_strategy.active_buys])
+        self.assertEqual([(101, 1)], [(o.price, o.quantity) for o in hbot_strategy.active_sells])
+        self.assertEqual([(98, 2)], [(o.price, o.quantity) for o in coinalpha_strategy.active_buys])
+        self.assertEqual([(101, 2)], [(o.price, o.quantity) for o in coinalpha_strategy.active_sells])
+        self.assertEqual(4, len(strategy.active_orders))
+
+        # After order_refresh_time, a new set of orders is created for both pairs
+        buy_ids = {o.client_order_id for o in strategy.active_orders if o.is_buy}
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(4, len(strategy.active_orders))
+        self.assertEqual(0, len(buy_ids & {o.client_order_id for o in strategy.active_orders}))
+
+    def test_shared_quote_budget(self):
+        # Both pairs want to buy 1 at 99 ETH, the ETH available is split between them.
+        self.market.set_balance("ETH", 150)
+        strategy = self.create_strategy()
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        buys = [pair_strategy.active_buys for pair_strategy in strategy.pair_strategies]
+        self.assertEqual([1, 1], [len(pair_buys) for pair_buys in buys])
+        hbot_buy, coinalpha_buy = buys[0][0], buys[1][0]
+        self.assertEqual(hbot_buy.quantity, coinalpha_buy.quantity)
+        self.assertAlmostEqual(Decimal("0.757575"), hbot_buy.quantity, 5)
+        self.assertLessEqual(hbot_buy.quantity * hbot_buy.price + coinalpha_buy.quantity * coinalpha_buy.price,
+                             Decimal(150))
+
+    def test_restored_orders(self):
+        self.market.set_balance("ETH", 5000)
+        self.clock.backtest_til(self.start_timestamp)
+        hbot_order_id = self.market.buy("HBOT-ETH", Decimal("1"), OrderType.LIMIT, Decimal("90"))
+        coinalpha_order_id = self.market.sell("COINALPHA-ETH", Decimal("1"), OrderType.LIMIT, Decimal("110"))
+        strategy = self.create_strategy()
+        strategy.start(self.clock)
+
+        # Each restored order is only tracked, as a hanging order, by the strategy of its trading pair.
+        hbot_strategy, coinalpha_strategy = strategy.pair_strategies
+        self.assertEqual([hbot_order_id], hbot_strategy.hanging_order_ids)
+        self.assertEqual([hbot_order_id], [o.client_order_id for o in hbot_strategy.active_orders])
+        self.assertEqual([coinalpha_order_id], coinalpha_strategy.hanging_order_ids)
+        self.assertEqual([coinalpha_order_id], [o.client_order_id for o in coinalpha_strategy.active_orders])
+        self.assertEqual(2, len(strategy.active_orders))
+
+    def test_update_running_config(self):
+        pair_parameters = {"COINALPHA-ETH": {"bid_spread": 2}}
+        strategy = self.create_strategy(pair_parameters)
+        hbot_strategy, coinalpha_strategy = strategy.pair_strategies
+
+        # The trading pairs that override the key keep their value.
+        self.assertEqual(["HBOT-ETH"],
+                         ConfigCommand.update_running_multi_pair_mm(strategy, "bid_spread", Decimal("3"),
+                                                                    pair_parameters))
+        self.assertEqual(Decimal("0.03"), hbot_strategy.bid_spread)
+        self.assertEqual(Decimal("0.02"), coinalpha_strategy.bid_spread)
+        self.assertEqual(["HBOT-ETH", "COINALPHA-ETH"],
+                         ConfigCommand.update_running_multi_pair_mm(strategy, "order_amount", Decimal("3"),
+                                                                    pair_parameters))
+        self.assertEqual([Decimal("3"), Decimal("3")], [s.order_amount for s in strategy.pair_strategies])
+        # The other keys need a restart.
+        self.assertIsNone(ConfigCommand.update_running_multi_pair_mm(strategy, "order_refresh_time", 10.0,
+                                                                     pair_parameters))
+
+    def test_pair_strategy_params(self):
+        self.assertEqual({"order_levels": 3, "bid_spread": Decimal("0.005")},
+                         pair_strategy_params({"order_levels": 1}, {"order_levels": 3, "bid_spread": 0.5}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import pandas as pd
+import random
+import unittest
+
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingsim.backtest.backtest_market import BacktestMarket
+from hummingsim.backtest.market import QuantizationParams
+from hummingsim.backtest.mock_order_book_loader import MockOrderBookLoader
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class PMMProposalParityUnitTest(unittest.TestCase):
+    """
+    Checks that the proposals and the order refresh tolerance decisions of the strategy are the same as computing
+    them in Decimal per proposal.
+    """
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def setUp(self):
+        self.random = random.Random(42)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.market: BacktestMarket = BacktestMarket()
+        self.book_data: MockOrderBookLoader = MockOrderBookLoader(self.trading_pair, self.base_asset, self.quote_asset)
+        self.book_data.set_balanced_order_book(mid_price=100,
+                                               min_price=1,
+                                               max_price=200,
+                                               price_step_size=1,
+                                               volume_step_size=10)
+        self.market.add_data(self.book_data)
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("ETH", 5000)
+        self.market.set_quantization_param(QuantizationParams(self.trading_pair, 4, 4, 3, 3))
+        self.market_info = MarketTradingPairTuple(self.market, self.trading_pair,
+                                                  self.base_asset, self.quote_asset)
+        self.clock.add_iterator(self.market)
+        self.strategy = PureMarketMakingStrategy(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            order_refresh_tolerance_pct=Decimal("0.001"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+    def random_decimal(self, low: str, high: str, places: int = 6) -> Decimal:
+        value = Decimal(str(self.random.uniform(float(low), float(high))))
+        return value.quantize(Decimal(10) ** -places)
+
+    def reference_proposal(self):
+        strategy = self.strategy
+        reference_price = strategy.get_price()
+        buys = []
+        sells = []
+        for level in range(strategy.buy_levels):
+            price = reference_price * (Decimal("1") - strategy.bid_spread - (level * strategy.order_level_spread))
+            price = self.market.quantize_order_price(self.trading_pair, price)
+            size = strategy.order_amount + (strategy.order_level_amount * level)
+            size = self.market.quantize_order_amount(self.trading_pair, size)
+            if size > 0:
+                buys.append((price, size))
+        for level in range(strategy.sell_levels):
+            price = reference_price * (Decimal("1") + strategy.ask_spread + (level * strategy.order_level_spread))
+            price = self.market.quantize_order_price(self.trading_pair, price)
+            size = strategy.order_amount + (strategy.order_level_amount * level)
+            size = self.market.quantize_order_amount(self.trading_pair, size)
+            if size > 0:
+                sells.append((price, size))
+        return buys, sells
+
+    def reference_is_within_tolerance(self, current_prices, proposal_prices) -> bool:
+        if len(current_prices) != len(proposal_prices):
+            return False
+        for current, proposal in zip(sorted(current_prices), sorted(proposal_prices)):
+            if abs(proposal - current) / current > self.strategy.order_refresh_tolerance_pct:
+                return False
+        return True
+
+    def test_base_proposal_parity(self):
+        strategy = self.strategy
+        for _ in range(200):
+            strategy.bid_spread = self.random_decimal("0", "0.05")
+            strategy.ask_spread = self.random_decimal("0", "0.05")
+            strategy.order_levels = self.random.randint(1, 5)
+            strategy.buy_levels = self.random.randint(0, strategy.order_levels)
+            strategy.order_level_spread = self.random_decimal("0", "0.02")
+            strategy.order_amount = self.random_decimal("0", "3")
+            strategy.order_level_amount = self.random_decimal("-0.5", "0.5")
+            # The same parameters again use the cached level parameters.
+            for _ in range(2):
+                proposal = strategy.create_base_proposal()
+                buys, sells = self.reference_proposal()
+                self.assertEqual(buys, [(buy.price, buy.size) for buy in proposal.buys])
+                self.assertEqual(sells, [(sell.price, sell.size) for sell in proposal.sells])
+
+    def test_is_within_tolerance_parity(self):
+        strategy = self.strategy
+        for _ in range(500):
+            strategy.order_refresh_tolerance_pct = self.random_decimal("0", "0.01", 4)
+            current_prices = [self.random_decimal("90", "110", 4) for _ in range(self.random.randint(1, 4))]
+            proposal_prices = [price * (1 + self.random_decimal("-0.01", "0.01", 4)) for price in current_prices]
+            self.random.shuffle(proposal_prices)
+            self.assertEqual(self.reference_is_within_tolerance(current_prices, proposal_prices),
+                             strategy.is_within_tolerance(current_prices, proposal_prices))
+
+    def test_is_within_tolerance_at_threshold(self):
+        strategy = self.strategy
+        strategy.order_refresh_tolerance_pct = Decimal("0.001")
+        # Exactly at the tolerance is within it, just over it isn't, the double ratios can't tell these apart.
+        self.assertTrue(strategy.is_within_tolerance([Decimal("100")], [Decimal("100.1")]))
+        self.assertFalse(strategy.is_within_tolerance([Decimal("100")], [Decimal("100.1000000000000001")]))
+        self.assertTrue(strategy.is_within_tolerance([Decimal("100"), Decimal("90")],
+                                                     [Decimal("89.91"), Decimal("99.9")]))
+        self.assertFalse(strategy.is_within_tolerance([Decimal("100")], [Decimal("100"), Decimal("101")]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -95,3 +95,54 @@ class RingBufferTest(unittest.TestCase):
         value = Decimal(3.141592653)
         self.buffer.add_value(value)
         self.assertAlmostEqual(float(value), self.buffer.get_last_value(), 6)
+
+    def test_get_first_value(self):
+        self.assertTrue(np.isnan(self.buffer.get_first_value()))
+        for i in range(self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+        self.assertEqual(5, self.buffer.get_first_value())
+
+    def test_get_first_value_on_eviction(self):
+        buffer = RingBuffer(3)
+        for i in range(3):
+            buffer.add_value(i)
+        self.assertEqual(0, buffer.get_first_value())
+        buffer.add_value(3)
+        self.assertEqual(1, buffer.get_first_value())
+        self.assertEqual([1, 2, 3], list(buffer.get_as_numpy_array()))
+
+    def test_get_views(self):
+        for i in range(self.BUFFER_LENGTH // 2):
+            self.buffer.add_value(i)
+        older, newer = self.buffer.get_views()
+        self.assertEqual(list(range(self.BUFFER_LENGTH // 2)), list(older))
+        self.assertEqual(0, len(newer))
+        for i in range(self.BUFFER_LENGTH // 2, self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+        older, newer = self.buffer.get_views()
+        self.assertEqual(list(range(5, self.BUFFER_LENGTH + 5)), list(older) + list(newer))
+        self.assertEqual(list(range(5, self.BUFFER_LENGTH + 5)), list(self.buffer.get_as_numpy_array()))
+
+    def test_window_statistics(self):
+        self.assertTrue(np.isnan(self.buffer.window_mean))
+        self.assertTrue(np.isnan(self.buffer.window_variance))
+        rng = np.random.RandomState(1)
+        values = 30000 + rng.normal(size=self.BUFFER_LENGTH * 10)
+        for i, value in enumerate(values):
+            self.buffer.add_value(value)
+            window = values[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            self.assertAlmostEqual(np.mean(window), self.buffer.window_mean, 8)
+            self.assertAlmostEqual(np.var(window), self.buffer.window_variance, 8)
+        self.assertAlmostEqual(np.std(values[-self.BUFFER_LENGTH:]), self.buffer.std_dev, 8)
+
+    def test_large_buffer(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+        self.assertTrue(buffer.is_full)
+        array = buffer.get_as_numpy_array()
+        self.assertEqual(length, array.size)
+        self.assertEqual(10, array[0])
+        self.assertEqual(length + 9, array[-1])
+        self.assertAlmostEqual(np.mean(array), buffer.mean_value, 6)
@@ -0,0 +1,53 @@
+import math
+import random
+import unittest
+from statistics import mean
+from typing import List
+
+from hummingbot.strategy.__utils__.rolling_volatility import RollingVolatility
+
+
+def windows_volatility(prices: List[float], window_length: int, window_count: int) -> float:
+    # Recomputes every window, like the list based liquidity mining volatility did.
+    ranges = []
+    end = len(prices)
+    while end > 0 and len(ranges) < window_count:
+        window = prices[max(0, end - window_length):end]
+        if len(window) < window_length and len(ranges) > 0:
+            break
+        ranges.append((max(window) - min(window)) / min(window))
+        end -= window_length
+    return mean(ranges) if ranges else math.nan
+
+
+class RollingVolatilityUnitTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertTrue(math.isnan(RollingVolatility(5, 3).value))
+
+    def test_value(self):
+        volatility = RollingVolatility(5, 3)
+        for price in [10, 12, 11]:
+            volatility.add_sample(price)
+        # The first window isn't complete yet, this is the range so far.
+        self.assertAlmostEqual(0.2, volatility.value)
+        for price in [9, 10, 10, 10, 10, 10, 10]:
+            volatility.add_sample(price)
+        # Windows [12, 11, 9, 10, 10] and [10, 10, 10, 10, 10]
+        self.assertAlmostEqual((3 / 9 + 0) / 2, volatility.value)
+
+    def test_against_windows(self):
+        rng = random.Random(7)
+        for window_length, window_count in [(1, 1), (1, 4), (5, 1), (7, 3), (30, 10)]:
+            volatility = RollingVolatility(window_length, window_count)
+            prices = []
+            price = 100.0
+            for _ in range(window_length * window_count * 3 + 5):
+                price *= math.exp(rng.gauss(0, 0.01))
+                prices.append(price)
+                volatility.add_sample(price)
+                self.assertAlmostEqual(windows_volatility(prices, window_length, window_count), volatility.value, 10)
+            self.assertEqual(len(prices), volatility.sample_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
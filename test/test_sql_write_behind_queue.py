@@ -0,0 +1,98 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTest(unittest.TestCase):
+    def setUp(self):
+        # The writer thread needs a file database, as each thread gets its own in-memory SQLite database.
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.db_dir.name, "test.sqlite"))
+        self.writer = SQLWriteBehindQueue(self.sql, max_queue_size=5, max_batch_size=3, max_commit_latency=0.01)
+
+    def tearDown(self):
+        self.writer.stop()
+        self.sql.get_shared_session().close()
+        self.db_dir.cleanup()
+
+    @staticmethod
+    def add_market_state(market: str):
+        def mutation(session):
+            session.add(MarketState(config_file_path="test_config", market=market, timestamp=1, saved_state={}))
+        return mutation
+
+    def market_names(self):
+        session = self.sql.get_shared_session()
+        return sorted(ms.market for ms in session.query(MarketState).all())
+
+    def test_commits_inline_when_not_started(self):
+        self.writer.put(self.add_market_state("a"))
+        self.assertEqual(["a"], self.market_names())
+        self.assertEqual(1, self.writer.stats.commits)
+
+    def test_flush_commits_in_grouped_transactions(self):
+        committed_on = []
+        self.writer.start()
+        for i in range(7):
+            self.writer.put(self.add_market_state(str(i)),
+                            on_commit=lambda: committed_on.append(threading.current_thread()))
+        self.assertTrue(self.writer.flush(timeout=5))
+
+        self.assertEqual([str(i) for i in range(7)], self.market_names())
+        self.assertEqual(7, self.writer.stats.committed_mutations)
+        self.assertGreaterEqual(self.writer.stats.commits, 3)
+        self.assertLessEqual(self.writer.stats.avg_batch_size, 3)
+        self.assertEqual(0, self.writer.queue_depth)
+        self.assertTrue(all(thread is not threading.main_thread() for thread in committed_on))
+        self.assertEqual(7, len(committed_on))
+
+    def test_async_flush(self):
+        self.writer.start()
+        self.writer.put(self.add_market_state("a"))
+        self.assertTrue(asyncio.get_event_loop().run_until_complete(self.writer.async_flush(timeout=5)))
+        self.assertEqual(["a"], self.market_names())
+
+    def test_failed_mutation_does_not_drop_batch(self):
+        def bad_mutation(session):
+            raise ValueError("bad record")
+
+        self.writer.start()
+        self.writer.put(self.add_market_state("a"))
+        self.writer.put(bad_mutation)
+        self.writer.put(self.add_market_state("b"))
+        self.writer.flush(timeout=5)
+
+        self.assertEqual(["a", "b"], self.market_names())
+        self.assertEqual(1, self.writer.stats.failed_mutations)
+
+    def test_backpressure_and_flush_on_stop(self):
+        release = threading.Event()
+
+        def blocking_mutation(session):
+            release.wait(5)
+
+        self.writer.start()
+        self.writer.put(blocking_mutation)
+        producer = threading.Thread(target=lambda: [self.writer.put(self.add_market_state(str(i))) for i in range(10)])
+        producer.start()
+        producer.join(0.5)
+        # The queue is full while the writer is blocked, so the producer has to wait.
+        self.assertTrue(producer.is_alive())
+        self.assertGreater(self.writer.stats.backpressure_waits, 0)
+        self.assertLessEqual(self.writer.stats.max_queue_depth, 5)
+
+        release.set()
+        producer.join(5)
+        self.writer.stop(timeout=5)
+        self.assertFalse(self.writer.started)
+        self.assertEqual(10, len(self.market_names()))
@@ -0,0 +1,61 @@
+import asyncio
+import csv
+import glob
+import os
+import tempfile
+import unittest
+from typing import List
+
+from hummingbot.connector.trade_csv_writer import TradeCsvWriter
+
+
+class TradeCsvWriterUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.temp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.csv_path: str = os.path.join(self.temp_dir.name, "trades_test.csv")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_rows(self, path: str) -> List[List[str]]:
+        with open(path, newline="") as fd:
+            return list(csv.reader(fd))
+
+    def test_buffered_rows_flushed_at_size_threshold(self):
+        writer: TradeCsvWriter = TradeCsvWriter(self.csv_path, flush_interval=60, flush_size=3)
+        writer.append(("id", "price"), (1, 0.5))
+        writer.append(("id", "price"), (2, None))
+        self.assertEqual([["id", "price"]], self.read_rows(self.csv_path))
+        self.assertEqual(2, writer.pending_rows)
+        writer.append(("id", "price"), (3, 1.25))
+        self.assertEqual([["id", "price"], ["1", "0.5"], ["2", ""], ["3", "1.25"]], self.read_rows(self.csv_path))
+        writer.close()
+
+    def test_flush_on_timer_and_close(self):
+        writer: TradeCsvWriter = TradeCsvWriter(self.csv_path, flush_interval=0.05, flush_size=100)
+        writer.append(("id",), (1,))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual([["id"], ["1"]], self.read_rows(self.csv_path))
+        writer.append(("id",), (2,))
+        writer.close()
+        self.assertEqual([["id"], ["1"], ["2"]], self.read_rows(self.csv_path))
+
+    def test_existing_file_appended_or_rotated(self):
+        with open(self.csv_path, "w") as fd:
+            fd.write("id,price\n1,0.5\n")
+        writer: TradeCsvWriter = TradeCsvWriter(self.csv_path, flush_size=1)
+        writer.append(("id", "price"), (2, 0.75))
+        self.assertEqual([["id", "price"], ["1", "0.5"], ["2", "0.75"]], self.read_rows(self.csv_path))
+
+        # A schema change rotates the file.
+        writer.append(("id", "price", "age"), (3, 1.0, "n/a"))
+        writer.close()
+        self.assertEqual([["id", "price", "age"], ["3", "1.0", "n/a"]], self.read_rows(self.csv_path))
+        old_files: List[str] = glob.glob(os.path.join(self.temp_dir.name, "trades_test_old_*.csv"))
+        self.assertEqual(1, len(old_files))
+        self.assertEqual([["id", "price"], ["1", "0.5"], ["2", "0.75"]], self.read_rows(old_files[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
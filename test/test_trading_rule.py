@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import random
+import unittest
+
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingRuleUnitTest(unittest.TestCase):
+    def test_cached_quanta(self):
+        trading_rule = TradingRule("ETH-USDT", min_price_increment=Decimal("0.01"), min_base_amount_increment="0.001")
+        self.assertEqual(Decimal("0.01"), trading_rule.price_quantum)
+        self.assertEqual(Decimal("0.001"), trading_rule.size_quantum)
+        self.assertIsInstance(trading_rule.size_quantum, Decimal)
+
+    def test_quantize_parity(self):
+        rng = random.Random(7)
+        for price_quantum, size_quantum in [(Decimal("0.01"), Decimal("0.001")),
+                                            (Decimal("0.05"), Decimal("0.25")),
+                                            (Decimal("1E-8"), Decimal("1"))]:
+            trading_rule = TradingRule("ETH-USDT", min_price_increment=price_quantum,
+                                       min_base_amount_increment=size_quantum)
+            prices = [Decimal(str(rng.uniform(0, 1000))) for _ in range(100)]
+            amounts = [Decimal(str(rng.uniform(0, 100))) for _ in range(100)]
+            # The formulas of ConnectorBase.c_quantize_order_price and c_quantize_order_amount
+            self.assertEqual([round(price / price_quantum) * price_quantum for price in prices],
+                             trading_rule.quantize_prices(prices))
+            self.assertEqual([(amount // size_quantum) * size_quantum for amount in amounts],
+                             trading_rule.quantize_amounts(amounts))
+
+    def test_quantize_nan_price(self):
+        trading_rule = TradingRule("ETH-USDT", min_price_increment=Decimal("0.01"))
+        prices = trading_rule.quantize_prices([Decimal("NaN"), Decimal("1.234")])
+        self.assertTrue(prices[0].is_nan())
+        self.assertEqual(Decimal("1.23"), prices[1])
+        self.assertEqual([], trading_rule.quantize_prices([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.average_volatility import AverageVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator
+)
+
+
+class TrailingIndicatorsUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.samples = 100 + np.cumsum(np.random.RandomState(3).normal(size=200))
+
+    def test_average_volatility(self):
+        indicator = AverageVolatilityIndicator(30, 1)
+        for i, sample in enumerate(self.samples):
+            indicator.add_sample(sample)
+            window = self.samples[max(0, i - 29):i + 1]
+            self.assertAlmostEqual(np.sqrt(np.var(window)), indicator.current_value, 8)
+        self.assertTrue(indicator.is_sampling_buffer_full)
+
+    def test_exponential_moving_average(self):
+        indicator = ExponentialMovingAverageIndicator(20)
+        for i, sample in enumerate(self.samples):
+            indicator.add_sample(sample)
+            window = self.samples[max(0, i - 19):i + 1]
+            expected = pd.Series(window).ewm(span=20, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()